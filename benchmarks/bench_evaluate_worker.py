@@ -0,0 +1,128 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Compares the throughput of single point evaluations, each in a new
+``force_bdss --evaluate`` process, with a persistent evaluation worker
+(``force_bdss --evaluate --serve``) answering all the requests.
+
+Usage::
+
+    python -m benchmarks.bench_evaluate_worker [--points N] [--delay S]
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from .benchmark_plugin import write_workflow
+
+
+def worker(workflow_file, serve):
+    """ Runs the BDSS evaluation on `workflow_file`, with the benchmark
+    plugin."""
+    from force_bdss.app.bdss_application import BDSSApplication
+    from .benchmark_plugin import BenchmarkPlugin
+
+    logging.basicConfig(level=logging.WARNING)
+    application = BDSSApplication(
+        evaluate=True,
+        workflow_file=workflow_file,
+        operation_options={"serve": serve},
+        extra_plugins=[BenchmarkPlugin()],
+    )
+    application.run()
+
+
+def worker_command(workflow_file, serve):
+    command = [
+        sys.executable, "-m", "benchmarks.bench_evaluate_worker",
+        "--worker", workflow_file
+    ]
+    if serve:
+        command.append("--serve")
+    return command
+
+
+def requests(n_points):
+    return [f"{0.01 * i} {-0.01 * i}\n" for i in range(n_points)]
+
+
+def run_per_process(workflow_file, n_points):
+    """ Evaluates each point in a new process."""
+    responses = []
+    for request in requests(n_points):
+        result = subprocess.run(
+            worker_command(workflow_file, False),
+            input=request, stdout=subprocess.PIPE,
+            universal_newlines=True, check=True,
+        )
+        responses.append(result.stdout.strip())
+    return responses
+
+
+def run_persistent(workflow_file, n_points):
+    """ Evaluates all the points in a single worker, one round trip per
+    point."""
+    responses = []
+    process = subprocess.Popen(
+        worker_command(workflow_file, True),
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        universal_newlines=True, bufsize=1,
+    )
+    try:
+        for request in requests(n_points):
+            process.stdin.write(request)
+            process.stdin.flush()
+            responses.append(process.stdout.readline().strip())
+    finally:
+        process.stdin.close()
+        process.wait()
+    return responses
+
+
+def run(n_points, delay):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workflow_file = os.path.join(tmpdir, "workflow.json")
+        write_workflow(workflow_file, delay=delay)
+
+        timings = {}
+        results = {}
+        for name, function in [
+            ("per process", run_per_process),
+            ("persistent", run_persistent),
+        ]:
+            start = time.perf_counter()
+            results[name] = function(workflow_file, n_points)
+            timings[name] = time.perf_counter() - start
+
+    if results["per process"] != results["persistent"]:
+        raise RuntimeError("The evaluation results differ")
+
+    print(f"{n_points} evaluations, data source delay {delay} s")
+    for name, timing in timings.items():
+        print(f"{name:>12}: {n_points / timing:10.1f} evaluations/s")
+    print(
+        f"Speedup: {timings['per process'] / timings['persistent']:.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--worker", metavar="WORKFLOW", help=argparse.SUPPRESS)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.serve)
+    else:
+        run(args.points, args.delay)
+
+
+if __name__ == "__main__":
+    main()
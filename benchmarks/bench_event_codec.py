@@ -0,0 +1,86 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Compares the throughput of the JSON and binary serialization of
+BaseDriverEvents.
+
+Usage::
+
+    python -m benchmarks.bench_event_codec [--events N] [--repeat R]
+"""
+
+import argparse
+import timeit
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.events.base_driver_event import BaseDriverEvent
+from force_bdss.events.event_codec import (
+    dumps_binary,
+    dumps_binary_batch,
+    loads_binary,
+    loads_binary_batch,
+)
+from force_bdss.events.mco_events import WeightedMCOProgressEvent
+
+
+def make_events(n_events, n_parameters=5, n_kpis=3):
+    return [
+        WeightedMCOProgressEvent(
+            optimal_point=[
+                DataValue(type="PARAMETER", name=f"p{index}", value=0.1 * i)
+                for index in range(n_parameters)
+            ],
+            optimal_kpis=[
+                DataValue(type="KPI", name=f"k{index}", value=2.0 * i)
+                for index in range(n_kpis)
+            ],
+            weights=[1.0 / n_kpis] * n_kpis,
+        )
+        for i in range(n_events)
+    ]
+
+
+def best_rate(function, n_events, repeat):
+    """ Returns the best events/s rate of `function` over `repeat` runs."""
+    best = min(timeit.repeat(function, number=1, repeat=repeat))
+    return n_events / best
+
+
+def run(n_events, repeat):
+    events = make_events(n_events)
+
+    json_data = [event.dumps_json() for event in events]
+    binary_data = [dumps_binary(event) for event in events]
+    batch_data = dumps_binary_batch(events)
+
+    results = [
+        ("json encode", lambda: [event.dumps_json() for event in events]),
+        ("json decode", lambda: [
+            BaseDriverEvent.loads_json(data) for data in json_data]),
+        ("binary encode", lambda: [dumps_binary(event) for event in events]),
+        ("binary decode", lambda: [
+            loads_binary(data) for data in binary_data]),
+        ("binary batch encode", lambda: dumps_binary_batch(events)),
+        ("binary batch decode", lambda: loads_binary_batch(batch_data)),
+    ]
+
+    print(f"{n_events} WeightedMCOProgressEvents, best of {repeat}")
+    print(
+        f"Mean size: json {sum(map(len, json_data)) / n_events:.0f} B, "
+        f"binary {sum(map(len, binary_data)) / n_events:.0f} B"
+    )
+    for name, function in results:
+        rate = best_rate(function, n_events, repeat)
+        print(f"{name:>20}: {rate:12.0f} events/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.events, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
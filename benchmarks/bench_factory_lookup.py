@@ -0,0 +1,70 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measures the lookup of factories by id in a FactoryRegistry with many
+factories, and the loading of a workflow with many data sources from it.
+
+The indexed lookups of the FactoryRegistry are compared with a scan of the
+factory list.
+
+Usage::
+
+    python -m benchmarks.bench_factory_lookup [--factories N]
+        [--data-sources M] [--repeat R]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from force_bdss.io.workflow_reader import WorkflowReader
+
+from .benchmark_plugin import make_factory_registry, write_workflow
+
+
+def scan_lookup(registry, id):
+    """ Lookup of a data source factory by scanning the factory list."""
+    for factory in registry.data_source_factories:
+        if factory.id == id:
+            return factory
+    raise KeyError(id)
+
+
+def run(n_factories, n_data_sources, repeat):
+    registry = make_factory_registry(n_extra_factories=n_factories)
+    # The factory of the benchmark workflows is the last one registered
+    id = registry.data_source_factories[-1].id
+
+    print(f"{len(registry.data_source_factories)} data source factories")
+    for name, function in [
+        ("indexed lookup", lambda: registry.data_source_factory_by_id(id)),
+        ("list scan", lambda: scan_lookup(registry, id)),
+    ]:
+        best = min(timeit.repeat(function, number=1000, repeat=repeat))
+        print(f"{name:>20}: {best * 1e3:10.2f} us/lookup")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "workflow.json")
+        write_workflow(path, n_data_sources=n_data_sources)
+        reader = WorkflowReader(registry)
+        best = min(timeit.repeat(
+            lambda: reader.read(path), number=1, repeat=repeat
+        ))
+        print(
+            f"{'workflow loading':>20}: {best:10.3f} s "
+            f"({n_data_sources} data sources)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--factories", type=int, default=2000)
+    parser.add_argument("--data-sources", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.factories, args.data_sources, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
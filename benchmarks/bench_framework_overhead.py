@@ -0,0 +1,287 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measures the overhead of the BDSS framework on the evaluation of a
+synthetic workflow, whose data sources do no work: the evaluations per
+second through `BaseOptimizerEngine._score` (which covers
+`Workflow.execute`, the binding of the data values and the propagation
+of the events), the memory allocated per evaluation, and the startup time
+of a process loading the workflow and evaluating a single point.
+
+The results can be saved, by default to ``.benchmarks/<commit>.json``,
+and compared with the results saved for another commit.
+
+Usage::
+
+    python -m benchmarks.bench_framework_overhead [--layers L]
+        [--data-sources N] [--slots S] [--kpis K] [--evaluations E]
+        [--repeat R] [--save [FILE]] [--compare FILE]
+"""
+
+import argparse
+import collections
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from force_bdss.io.workflow_reader import WorkflowReader
+from force_bdss.tests.dummy_classes.optimizer_engine import (
+    DummyOptimizerEngine
+)
+
+from .benchmark_plugin import (
+    make_factory_registry,
+    make_layered_workflow_data,
+    write_workflow,
+)
+
+#: Default directory of the saved results
+RESULTS_DIRECTORY = ".benchmarks"
+
+#: Measurements compared between runs, with True if higher is better
+MEASUREMENTS = {
+    "evaluations_per_second": True,
+    "events_per_evaluation": False,
+    "peak_memory_per_evaluation": False,
+    "retained_memory_per_evaluation": False,
+    "startup_time": False,
+}
+
+
+def count_events(workflow):
+    """ Returns a counter of the events emitted by the `workflow`, by
+    event class, as a listener of the operation would receive them."""
+    events = collections.Counter()
+
+    def count_event(event):
+        events[type(event).__name__] += 1
+
+    workflow.on_trait_change(count_event, "event")
+    return events
+
+
+def make_engine(workflow):
+    """ Returns an optimizer engine evaluating the `workflow`, with an
+    empty cache of KPI values."""
+    return DummyOptimizerEngine(
+        single_point_evaluator=workflow,
+        parameters=workflow.mco_model.parameters,
+        kpis=workflow.mco_model.kpis,
+    )
+
+
+def points(n_points, n_parameters):
+    """ Returns `n_points` distinct input points."""
+    return [
+        [index / n_points] * n_parameters for index in range(n_points)
+    ]
+
+
+def measure_throughput(workflow, n_evaluations, repeat):
+    """ Returns the best number of evaluations per second, and the number
+    of events emitted per evaluation."""
+    n_parameters = len(workflow.mco_model.parameters)
+    events = count_events(workflow)
+    best = float("inf")
+    for _ in range(repeat):
+        events.clear()
+        engine = make_engine(workflow)
+        start = time.perf_counter()
+        for point in points(n_evaluations, n_parameters):
+            engine._score(point)
+        best = min(best, time.perf_counter() - start)
+    return n_evaluations / best, sum(events.values()) / n_evaluations
+
+
+def measure_memory(workflow, n_evaluations):
+    """ Returns the mean peak memory, in bytes, allocated by a single
+    evaluation, and the mean memory retained after each evaluation."""
+    engine = make_engine(workflow)
+    all_points = points(n_evaluations, len(workflow.mco_model.parameters))
+
+    peaks = []
+    for point in all_points:
+        tracemalloc.start()
+        engine._score(point)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+
+    engine = make_engine(workflow)
+    engine._score(all_points[0])
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for point in all_points[1:]:
+        engine._score(point)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return sum(peaks) / len(peaks), (end - start) / (n_evaluations - 1)
+
+
+def worker(workflow_file):
+    """ Loads the `workflow_file` and evaluates a single point, as the
+    startup of an evaluation process."""
+    from force_bdss.api import WorkflowReader
+    from .benchmark_plugin import make_factory_registry
+
+    workflow = WorkflowReader(make_factory_registry()).read(workflow_file)
+    workflow.evaluate([0.0] * len(workflow.mco_model.parameters))
+
+
+def measure_startup(workflow_file, repeat):
+    """ Returns the best time, in seconds, of a new process loading the
+    workflow and evaluating a single point."""
+    command = [
+        sys.executable, "-m", "benchmarks.bench_framework_overhead",
+        "--worker", workflow_file
+    ]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def current_commit():
+    """ Returns the abbreviated hash of the current git commit, or
+    "unknown" outside of a git repository."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
+
+
+def run(n_layers, n_data_sources, n_slots, n_kpis, n_evaluations, repeat):
+    """ Runs the benchmark, and returns the results."""
+    workflow_data = make_layered_workflow_data(
+        n_layers=n_layers,
+        n_data_sources=n_data_sources,
+        n_slots=n_slots,
+        n_kpis=n_kpis,
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workflow_file = os.path.join(tmpdir, "workflow.json")
+        write_workflow(workflow_file, workflow_data)
+        workflow = WorkflowReader(make_factory_registry()).read(
+            workflow_file
+        )
+        if workflow.verify():
+            raise RuntimeError("The benchmark workflow is not valid")
+
+        evaluations_per_second, events_per_evaluation = measure_throughput(
+            workflow, n_evaluations, repeat
+        )
+        peak_memory, retained_memory = measure_memory(
+            workflow, min(n_evaluations, 100)
+        )
+        startup_time = measure_startup(workflow_file, repeat)
+
+    return {
+        "commit": current_commit(),
+        "python": sys.version.split()[0],
+        "parameters": {
+            "layers": n_layers,
+            "data_sources": n_data_sources,
+            "slots": n_slots,
+            "kpis": n_kpis,
+            "evaluations": n_evaluations,
+        },
+        "results": {
+            "evaluations_per_second": evaluations_per_second,
+            "events_per_evaluation": events_per_evaluation,
+            "peak_memory_per_evaluation": peak_memory,
+            "retained_memory_per_evaluation": retained_memory,
+            "startup_time": startup_time,
+        },
+    }
+
+
+def print_results(results, reference=None):
+    """ Prints the `results`, and their relative change with respect to
+    the `reference` results, if any."""
+    parameters = results["parameters"]
+    print(
+        f"{parameters['layers']} layers of {parameters['data_sources']} "
+        f"data sources, {parameters['slots']} slots, "
+        f"{parameters['kpis']} KPIs, commit {results['commit']}"
+    )
+    if reference is not None:
+        if reference["parameters"] != parameters:
+            print("WARNING: the reference results have other parameters")
+        print(f"Compared with commit {reference['commit']}")
+
+    for name, higher_is_better in MEASUREMENTS.items():
+        value = results["results"][name]
+        line = f"{name:>31}: {value:14.6g}"
+        if reference is not None:
+            reference_value = reference["results"].get(name)
+            if reference_value:
+                change = (value - reference_value) / reference_value
+                if not change:
+                    verdict = "same"
+                elif (change > 0) == higher_is_better:
+                    verdict = "better"
+                else:
+                    verdict = "worse"
+                line += f" ({change:+7.1%}, {verdict})"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", type=int, default=3)
+    parser.add_argument("--data-sources", type=int, default=5)
+    parser.add_argument("--slots", type=int, default=2)
+    parser.add_argument("--kpis", type=int, default=1)
+    parser.add_argument("--evaluations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--save", nargs="?", const="", default=None, metavar="FILE",
+        help=f"Saves the results, by default to "
+             f"{RESULTS_DIRECTORY}/<commit>.json",
+    )
+    parser.add_argument(
+        "--compare", metavar="FILE",
+        help="Compares the results with the results saved in FILE",
+    )
+    parser.add_argument("--worker", metavar="WORKFLOW", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker)
+        return
+
+    results = run(
+        args.layers, args.data_sources, args.slots, args.kpis,
+        args.evaluations, args.repeat
+    )
+
+    reference = None
+    if args.compare:
+        with open(args.compare) as fp:
+            reference = json.load(fp)
+    print_results(results, reference)
+
+    if args.save is not None:
+        path = args.save or os.path.join(
+            RESULTS_DIRECTORY, f"{results['commit']}.json"
+        )
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as fp:
+            json.dump(results, fp, indent=4)
+        print(f"Results saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
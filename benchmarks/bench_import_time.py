@@ -0,0 +1,88 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measures the import time of the BDSS entry points with
+``python -X importtime``, and fails if it exceeds the startup time budget,
+or if a headless import pulls in a UI or an optional dependency.
+
+Usage::
+
+    python -m benchmarks.bench_import_time [--repeat R] [--budget MS]
+"""
+
+import argparse
+import subprocess
+import sys
+
+#: Modules measured, with their default import time budget in milliseconds
+MODULES = {
+    "force_bdss.api": 350,
+    "force_bdss.cli.force_bdss": 450,
+}
+
+#: Modules that must not be imported by a headless import of the modules
+FORBIDDEN_MODULES = ["traitsui.api", "scipy.optimize"]
+
+
+def import_times(module):
+    """ Imports `module` in a new interpreter, and returns the cumulative
+    import times, in microseconds, by module name."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            cumulative = int(fields[1])
+        except (IndexError, ValueError):
+            # Header line
+            continue
+        times[fields[2].strip()] = cumulative
+    return times
+
+
+def run(repeat, budget=None):
+    failures = []
+    for module, default_budget in MODULES.items():
+        module_budget = default_budget if budget is None else budget
+        best_times = None
+        for _ in range(repeat):
+            times = import_times(module)
+            if best_times is None or times[module] < best_times[module]:
+                best_times = times
+
+        milliseconds = best_times[module] / 1000
+        print(
+            f"{module:>28}: {milliseconds:8.1f} ms "
+            f"(budget {module_budget} ms, best of {repeat})"
+        )
+        if milliseconds > module_budget:
+            failures.append(f"{module} exceeds its import time budget")
+        for forbidden in FORBIDDEN_MODULES:
+            if forbidden in best_times:
+                failures.append(f"{module} imports {forbidden}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=None,
+        help="Import time budget in milliseconds, overriding the default "
+             "budget of each module",
+    )
+    args = parser.parse_args()
+    if not run(args.repeat, args.budget):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
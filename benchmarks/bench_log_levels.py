@@ -0,0 +1,115 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measures the evaluation throughput of a synthetic workflow at each log
+level of the ``force_bdss --log-level`` option, with and without the
+trace of the evaluations (``--trace`` and ``--trace-file``). The log
+records are formatted and written to the null device, as a log file would
+be, and the JSON lines trace is written to a temporary file.
+
+Usage::
+
+    python -m benchmarks.bench_log_levels [--layers L] [--data-sources N]
+        [--evaluations E] [--repeat R]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from force_bdss.core.evaluation_trace import (
+    TRACE_LOGGER_NAME,
+    EvaluationTraceHandler,
+)
+from force_bdss.core.workflow import Workflow
+
+from .bench_framework_overhead import make_engine, points
+from .benchmark_plugin import make_factory_registry, make_layered_workflow_data
+
+#: Log configurations measured, as (log level, trace), where trace is
+#: None, "text" (--trace) or "file" (--trace-file)
+CONFIGURATIONS = [
+    (logging.WARNING, None),
+    (logging.WARNING, "text"),
+    (logging.WARNING, "file"),
+    (logging.INFO, None),
+    (logging.DEBUG, None),
+]
+
+
+def measure(workflow, n_evaluations, repeat):
+    """ Returns the best number of evaluations per second."""
+    n_parameters = len(workflow.mco_model.parameters)
+    best = float("inf")
+    for _ in range(repeat):
+        engine = make_engine(workflow)
+        start = time.perf_counter()
+        for point in points(n_evaluations, n_parameters):
+            engine._score(point)
+        best = min(best, time.perf_counter() - start)
+    return n_evaluations / best
+
+
+def run(n_layers, n_data_sources, n_evaluations, repeat):
+    workflow = Workflow.from_json(
+        make_factory_registry(),
+        make_layered_workflow_data(
+            n_layers=n_layers, n_data_sources=n_data_sources
+        )["workflow"],
+    )
+
+    root_logger = logging.getLogger()
+    trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+    print(
+        f"{n_layers} layers of {n_data_sources} data sources, "
+        f"{n_evaluations} evaluations"
+    )
+    with open(os.devnull, "w") as devnull, \
+            tempfile.TemporaryDirectory() as tmpdir:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+        )
+        root_logger.addHandler(handler)
+        try:
+            for level, trace in CONFIGURATIONS:
+                root_logger.setLevel(level)
+                trace_logger.setLevel(
+                    logging.DEBUG if trace else logging.INFO
+                )
+                trace_handler = None
+                if trace == "file":
+                    trace_handler = EvaluationTraceHandler(
+                        os.path.join(tmpdir, "trace.jsonl")
+                    )
+                    trace_logger.addHandler(trace_handler)
+                    trace_logger.propagate = False
+                try:
+                    throughput = measure(workflow, n_evaluations, repeat)
+                finally:
+                    if trace_handler is not None:
+                        trace_logger.removeHandler(trace_handler)
+                        trace_handler.close()
+                        trace_logger.propagate = True
+                name = logging.getLevelName(level) + (
+                    f" + trace {trace}" if trace else ""
+                )
+                print(f"{name:>20}: {throughput:10.1f} evaluations/s")
+        finally:
+            root_logger.removeHandler(handler)
+            trace_logger.setLevel(logging.INFO)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", type=int, default=3)
+    parser.add_argument("--data-sources", type=int, default=5)
+    parser.add_argument("--evaluations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.layers, args.data_sources, args.evaluations, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measures the verification time of a large synthetic workflow, whose
+data sources are expensive to create.
+
+The first verification retrieves the slots of the data sources from their
+factory, which creates a single data source. The following verifications
+use the slots cached by the models. For reference, the time needed to
+create a data source for each model, as done by the verification before,
+is also reported.
+
+Finally, the verification of the workflow after editing one of its data
+sources is measured, both in full and with the incremental
+`WorkflowVerifier`.
+
+Usage::
+
+    python -m benchmarks.bench_verification [--data-sources N]
+        [--creation-delay SECONDS] [--repeat R]
+"""
+
+import argparse
+import time
+import timeit
+from unittest import mock
+
+from force_bdss.core.verifier import WorkflowVerifier
+from force_bdss.core.workflow import Workflow
+
+from .benchmark_plugin import (
+    SumOfSquaresFactory,
+    make_factory_registry,
+    make_workflow_data,
+)
+
+
+def run(n_data_sources, creation_delay, repeat):
+    registry = make_factory_registry()
+    workflow_data = make_workflow_data(n_data_sources=n_data_sources)
+    workflow = Workflow.from_json(registry, workflow_data["workflow"])
+    factory = workflow.execution_layers[0].data_sources[0].factory
+    create_data_source = factory.create_data_source
+
+    def slow_create_data_source(self):
+        time.sleep(creation_delay)
+        return create_data_source()
+
+    with mock.patch.object(
+            SumOfSquaresFactory, "create_data_source",
+            slow_create_data_source):
+        start = time.perf_counter()
+        errors = workflow.verify()
+        first = time.perf_counter() - start
+        if errors:
+            raise RuntimeError("The benchmark workflow has errors")
+        best = min(timeit.repeat(workflow.verify, number=1, repeat=repeat))
+
+        start = time.perf_counter()
+        for layer in workflow.execution_layers:
+            for model in layer.data_sources:
+                model.factory.create_data_source().slots(model)
+        per_model = time.perf_counter() - start
+
+        model = workflow.execution_layers[0].data_sources[-1]
+        verifier = WorkflowVerifier(workflow)
+        verifier.verify()
+
+        def edit_and_verify(verify):
+            model.output_slot_info[0].name += "x"
+            verify()
+
+        full_edit = min(timeit.repeat(
+            lambda: edit_and_verify(workflow.verify), number=1,
+            repeat=repeat))
+        incremental_edit = min(timeit.repeat(
+            lambda: edit_and_verify(verifier.verify), number=1,
+            repeat=repeat))
+        verifier.clear()
+
+    print(
+        f"{n_data_sources} data sources, "
+        f"{creation_delay * 1000:.1f} ms to create a data source"
+    )
+    for name, value in [
+        ("first verification", first),
+        ("cached verification", best),
+        ("one data source per model", per_model),
+        ("full, after an edit", full_edit),
+        ("incremental, after an edit", incremental_edit),
+    ]:
+        print(f"{name:>26}: {value * 1000:9.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-sources", type=int, default=1000)
+    parser.add_argument("--creation-delay", type=float, default=0.001)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.data_sources, args.creation_delay, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measures the time and the peak memory needed to load a large
+synthetic workflow, made of many data sources with large configurations.
+
+The workflow is loaded by the `WorkflowReader`, which transfers the
+ownership of the parsed JSON data to the workflow, by the incremental
+reading of the `WorkflowReader`, which parses one data source at a time,
+and by `Workflow.from_json` on the parsed data, which copies it.
+
+Usage::
+
+    python -m benchmarks.bench_workflow_loading [--data-sources N]
+        [--configuration-size M] [--repeat R]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from force_bdss.core.workflow import Workflow
+from force_bdss.io.workflow_reader import WorkflowReader
+
+from .benchmark_plugin import make_factory_registry, write_workflow
+
+
+def load_with_reader(registry, path):
+    # Large files are read incrementally by default
+    reader = WorkflowReader(registry, incremental_size=2 ** 62)
+    return reader.read(path)
+
+
+def load_incrementally(registry, path):
+    return WorkflowReader(registry).read_incremental(path)
+
+
+def load_with_copy(registry, path):
+    json_data = WorkflowReader.load_data(path)
+    workflow_data = WorkflowReader.parse_data(json_data)
+    return Workflow.from_json(registry, workflow_data)
+
+
+def measure(function, registry, path, repeat):
+    """ Returns the best time, in seconds, and the peak traced memory, in
+    bytes, of `function`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(registry, path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function(registry, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(n_data_sources, configuration_size, repeat):
+    registry = make_factory_registry()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "workflow.json")
+        write_workflow(
+            path,
+            n_data_sources=n_data_sources,
+            configuration_size=configuration_size,
+        )
+        file_size = os.path.getsize(path)
+
+        print(
+            f"{n_data_sources} data sources, {configuration_size} "
+            f"configuration entries each, {file_size / 2**20:.1f} MiB"
+        )
+        for name, function in [
+            ("WorkflowReader.read", load_with_reader),
+            ("read_incremental", load_incrementally),
+            ("Workflow.from_json", load_with_copy),
+        ]:
+            best, peak = measure(function, registry, path, repeat)
+            print(
+                f"{name:>20}: {best:8.3f} s, "
+                f"peak memory {peak / 2**20:8.1f} MiB"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-sources", type=int, default=1000)
+    parser.add_argument("--configuration-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.data_sources, args.configuration_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Compares the reading and verification of a large synthetic workflow
+from its JSON file, and from its compiled snapshot.
+
+Usage::
+
+    python -m benchmarks.bench_workflow_snapshot [--data-sources N]
+        [--configuration-size M] [--repeat R]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from force_bdss.app.workflow_file import WorkflowFile
+from force_bdss.io.workflow_reader import WorkflowReader
+from force_bdss.io.workflow_snapshot import default_snapshot_file
+
+from .benchmark_plugin import make_factory_registry, write_workflow
+
+
+def read_and_verify(reader, path, snapshot_path=""):
+    workflow_file = WorkflowFile(
+        path=path, reader=reader, snapshot_path=snapshot_path
+    )
+    workflow_file.read()
+    workflow_file.verify()
+    if workflow_file.errors:
+        raise RuntimeError("The benchmark workflow has errors")
+    return workflow_file
+
+
+def run(n_data_sources, configuration_size, repeat):
+    reader = WorkflowReader(make_factory_registry())
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "workflow.json")
+        write_workflow(
+            path,
+            n_data_sources=n_data_sources,
+            configuration_size=configuration_size,
+        )
+        snapshot_path = default_snapshot_file(path)
+        # Writes the snapshot
+        read_and_verify(reader, path, snapshot_path)
+
+        print(
+            f"{n_data_sources} data sources, {configuration_size} "
+            f"configuration entries each, JSON "
+            f"{os.path.getsize(path) / 2**20:.1f} MiB, snapshot "
+            f"{os.path.getsize(snapshot_path) / 2**20:.1f} MiB"
+        )
+        for name, function in [
+            ("JSON", lambda: read_and_verify(reader, path)),
+            ("snapshot", lambda: read_and_verify(
+                reader, path, snapshot_path)),
+        ]:
+            best = min(timeit.repeat(function, number=1, repeat=repeat))
+            print(f"{name:>10}: {best:8.3f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-sources", type=int, default=2000)
+    parser.add_argument("--configuration-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.data_sources, args.configuration_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measures the time needed to write a large synthetic workflow, made of
+many data sources with large configurations.
+
+The `WorkflowWriter`, in its default indented and compact modes, is
+compared with the previous implementation, which serialized the workflow
+with `Workflow.__getstate__` and `json.dump`.
+
+Usage::
+
+    python -m benchmarks.bench_workflow_writing [--data-sources N]
+        [--configuration-size M] [--repeat R]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import timeit
+
+from force_bdss.core.workflow import Workflow
+from force_bdss.io.workflow_writer import WorkflowWriter
+
+from .benchmark_plugin import make_factory_registry, make_workflow_data
+
+
+def write_with_getstate(workflow, path):
+    data = {"version": "1.1", "workflow": workflow.__getstate__()}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def run(n_data_sources, configuration_size, repeat):
+    registry = make_factory_registry()
+    workflow_data = make_workflow_data(
+        n_data_sources=n_data_sources,
+        configuration_size=configuration_size,
+    )
+    workflow = Workflow.from_json(registry, workflow_data["workflow"])
+
+    print(
+        f"{n_data_sources} data sources, {configuration_size} "
+        f"configuration entries each"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "workflow.json")
+        for name, function in [
+            ("__getstate__ and json.dump", write_with_getstate),
+            ("WorkflowWriter", WorkflowWriter().write),
+            ("WorkflowWriter, compact", WorkflowWriter(compact=True).write),
+        ]:
+            best = min(timeit.repeat(
+                lambda: function(workflow, path), number=1, repeat=repeat
+            ))
+            print(
+                f"{name:>26}: {best:8.3f} s, "
+                f"{os.path.getsize(path) / 2**20:6.1f} MiB"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-sources", type=int, default=1000)
+    parser.add_argument("--configuration-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.data_sources, args.configuration_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
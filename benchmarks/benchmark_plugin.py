@@ -0,0 +1,361 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Minimal BDSS plugin used by the benchmarks, so that they do not
+depend on any installed plugin.
+
+The plugin provides an MCO evaluating a grid of points, whose communicator
+implements the line protocol of the `StreamMCOCommunicator`, and a data
+source computing the sum of the squares of its inputs.
+"""
+
+import itertools
+import json
+import time
+
+from traits.api import Dict, Float
+
+from force_bdss.api import (
+    BaseDataSource,
+    BaseDataSourceFactory,
+    BaseDataSourceModel,
+    BaseExtensionPlugin,
+    BaseMCO,
+    BaseMCOFactory,
+    BaseMCOModel,
+    DataValue,
+    FactoryRegistry,
+    PositiveInt,
+    RangedMCOParameterFactory,
+    Slot,
+    StreamMCOCommunicator,
+    plugin_id,
+)
+
+#: Id of the benchmark plugin
+BENCHMARK_PLUGIN_ID = plugin_id("force", "benchmark", 0)
+
+
+class GridMCOModel(BaseMCOModel):
+    """ Model of the GridMCO."""
+
+
+class GridMCO(BaseMCO):
+    """ Evaluates the workflow on the grid of the sample values of the
+    (ranged) MCO parameters."""
+
+    def run(self, evaluator):
+        model = evaluator.mco_model
+        samples = [parameter.sample_values for parameter in model.parameters]
+        for point in itertools.product(*samples):
+            kpis = evaluator.evaluate(point)
+            model.notify_progress_event(
+                [DataValue(value=value) for value in point],
+                [DataValue(value=value) for value in kpis],
+            )
+
+
+class GridMCOFactory(BaseMCOFactory):
+
+    def get_identifier(self):
+        return "grid_mco"
+
+    def get_name(self):
+        return "Grid MCO"
+
+    def get_model_class(self):
+        return GridMCOModel
+
+    def get_optimizer_class(self):
+        return GridMCO
+
+    def get_communicator_class(self):
+        return StreamMCOCommunicator
+
+    def get_parameter_factory_classes(self):
+        return [RangedMCOParameterFactory]
+
+
+class SumOfSquaresModel(BaseDataSourceModel):
+    """ Model of the SumOfSquares data source."""
+
+    #: Number of inputs
+    n_inputs = PositiveInt(2, changes_slots=True)
+
+    #: Time, in seconds, spent on each evaluation, simulating an
+    #: expensive calculation
+    delay = Float(0.0)
+
+    #: Unused configuration data, simulating the large configurations of
+    #: some data sources
+    configuration = Dict()
+
+
+class SumOfSquares(BaseDataSource):
+    """ Returns the sum of the squares of its inputs."""
+
+    def run(self, model, parameters):
+        if model.delay:
+            time.sleep(model.delay)
+        return [
+            DataValue(
+                type="VALUE",
+                value=sum(parameter.value ** 2 for parameter in parameters)
+            )
+        ]
+
+    def slots(self, model):
+        return (
+            tuple(Slot(type="VALUE") for _ in range(model.n_inputs)),
+            (Slot(type="VALUE"),),
+        )
+
+
+class SumOfSquaresFactory(BaseDataSourceFactory):
+
+    def get_identifier(self):
+        return "sum_of_squares"
+
+    def get_name(self):
+        return "Sum of squares"
+
+    def get_model_class(self):
+        return SumOfSquaresModel
+
+    def get_data_source_class(self):
+        return SumOfSquares
+
+
+class PassThroughModel(BaseDataSourceModel):
+    """ Model of the PassThrough data source."""
+
+    #: Number of inputs
+    n_inputs = PositiveInt(1, changes_slots=True)
+
+    #: Number of outputs
+    n_outputs = PositiveInt(1, changes_slots=True)
+
+
+class PassThrough(BaseDataSource):
+    """ Returns the value of its first input on each output, so that the
+    time spent in a workflow made of these data sources is the overhead of
+    the framework."""
+
+    def run(self, model, parameters):
+        value = parameters[0].value
+        return [
+            DataValue(type="VALUE", value=value)
+            for _ in range(model.n_outputs)
+        ]
+
+    def slots(self, model):
+        return (
+            tuple(Slot(type="VALUE") for _ in range(model.n_inputs)),
+            tuple(Slot(type="VALUE") for _ in range(model.n_outputs)),
+        )
+
+
+class PassThroughFactory(BaseDataSourceFactory):
+
+    def get_identifier(self):
+        return "pass_through"
+
+    def get_name(self):
+        return "Pass through"
+
+    def get_model_class(self):
+        return PassThroughModel
+
+    def get_data_source_class(self):
+        return PassThrough
+
+
+class BenchmarkPlugin(BaseExtensionPlugin):
+    id = BENCHMARK_PLUGIN_ID
+
+    def get_name(self):
+        return "Benchmark plugin"
+
+    def get_description(self):
+        return "Synthetic workflow components for the BDSS benchmarks"
+
+    def get_version(self):
+        return 0
+
+    def get_factory_classes(self):
+        return [
+            GridMCOFactory,
+            SumOfSquaresFactory,
+            PassThroughFactory,
+        ]
+
+
+def make_factory_registry(n_extra_factories=0):
+    """ Returns a FactoryRegistry containing the factories of the
+    BenchmarkPlugin, for benchmarks that do not need the application.
+
+    `n_extra_factories` additional data source factories, never used by
+    the benchmark workflows, are registered before the factories of the
+    plugin, simulating a large set of installed plugins.
+    """
+    plugin = BenchmarkPlugin()
+    extra_factories = [
+        type(
+            f"ExtraFactory{index}",
+            (SumOfSquaresFactory,),
+            {"get_identifier": lambda self, index=index: f"extra{index}"},
+        )(plugin)
+        for index in range(n_extra_factories)
+    ]
+    return FactoryRegistry(
+        mco_factories=plugin.mco_factories,
+        data_source_factories=extra_factories + plugin.data_source_factories,
+    )
+
+
+def make_workflow_data(n_parameters=2, n_samples=5, delay=0.0,
+                       n_data_sources=1, configuration_size=0):
+    """ Returns the JSON data of a workflow made of a GridMCO with
+    `n_parameters` ranged parameters, and `n_data_sources` SumOfSquares
+    data sources in a single execution layer. The first data source
+    computes the KPI. Each data source has a configuration of
+    `configuration_size` entries."""
+    mco_id = f"{BENCHMARK_PLUGIN_ID}.factory.grid_mco"
+    names = [f"x{index}" for index in range(n_parameters)]
+    configuration = {
+        f"option{index}": [index, 0.5 * index, f"value{index}"]
+        for index in range(configuration_size)
+    }
+    return {
+        "version": "1.1",
+        "workflow": {
+            "mco_model": {
+                "id": mco_id,
+                "model_data": {
+                    "parameters": [
+                        {
+                            "id": f"{mco_id}.parameter.ranged",
+                            "model_data": {
+                                "name": name,
+                                "type": "VALUE",
+                                "lower_bound": -1.0,
+                                "upper_bound": 1.0,
+                                "n_samples": n_samples,
+                            },
+                        }
+                        for name in names
+                    ],
+                    "kpis": [{"name": "f", "objective": "MINIMISE"}],
+                },
+            },
+            "notification_listeners": [],
+            "execution_layers": [
+                {
+                    "data_sources": [
+                        {
+                            "id": (
+                                f"{BENCHMARK_PLUGIN_ID}.factory."
+                                "sum_of_squares"
+                            ),
+                            "model_data": {
+                                "n_inputs": n_parameters,
+                                "delay": delay,
+                                "configuration": configuration,
+                                "input_slot_info": [
+                                    {"name": name} for name in names
+                                ],
+                                "output_slot_info": [
+                                    {"name": f"y{index}" if index else "f"}
+                                ],
+                            },
+                        }
+                        for index in range(n_data_sources)
+                    ]
+                }
+            ],
+        },
+    }
+
+
+def make_layered_workflow_data(n_layers=3, n_data_sources=5, n_slots=2,
+                               n_kpis=1):
+    """ Returns the JSON data of a workflow made of `n_layers` execution
+    layers of `n_data_sources` PassThrough data sources, each with
+    `n_slots` inputs and outputs. The MCO has `n_slots` ranged parameters,
+    which are the inputs of the first layer, and the inputs of the other
+    layers are the outputs of the previous layer. The `n_kpis` KPIs are
+    the first outputs of the last layer."""
+    if n_kpis > n_data_sources * n_slots:
+        raise ValueError("More KPIs than outputs of the last layer")
+
+    mco_id = f"{BENCHMARK_PLUGIN_ID}.factory.grid_mco"
+    input_names = [f"x{index}" for index in range(n_slots)]
+    execution_layers = []
+    for layer_index in range(n_layers):
+        output_names = [
+            [
+                f"l{layer_index}d{data_source_index}o{slot_index}"
+                for slot_index in range(n_slots)
+            ]
+            for data_source_index in range(n_data_sources)
+        ]
+        execution_layers.append({
+            "data_sources": [
+                {
+                    "id": f"{BENCHMARK_PLUGIN_ID}.factory.pass_through",
+                    "model_data": {
+                        "n_inputs": n_slots,
+                        "n_outputs": n_slots,
+                        "input_slot_info": [
+                            {"name": name} for name in input_names[index]
+                        ] if layer_index else [
+                            {"name": name} for name in input_names
+                        ],
+                        "output_slot_info": [
+                            {"name": name} for name in names
+                        ],
+                    },
+                }
+                for index, names in enumerate(output_names)
+            ]
+        })
+        input_names = output_names
+    kpi_names = [name for names in input_names for name in names][:n_kpis]
+
+    return {
+        "version": "1.1",
+        "workflow": {
+            "mco_model": {
+                "id": mco_id,
+                "model_data": {
+                    "parameters": [
+                        {
+                            "id": f"{mco_id}.parameter.ranged",
+                            "model_data": {
+                                "name": f"x{index}",
+                                "type": "VALUE",
+                                "lower_bound": -1.0,
+                                "upper_bound": 1.0,
+                            },
+                        }
+                        for index in range(n_slots)
+                    ],
+                    "kpis": [
+                        {"name": name, "objective": "MINIMISE"}
+                        for name in kpi_names
+                    ],
+                },
+            },
+            "notification_listeners": [],
+            "execution_layers": execution_layers,
+        },
+    }
+
+
+def write_workflow(path, workflow_data=None, **kwargs):
+    """ Writes the `workflow_data`, by default the benchmark workflow (see
+    `make_workflow_data`), to `path`."""
+    if workflow_data is None:
+        workflow_data = make_workflow_data(**kwargs)
+    with open(path, "w") as fp:
+        json.dump(workflow_data, fp, indent=4)
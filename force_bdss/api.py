@@ -1,9 +1,14 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import importlib
+import sys
+import types
+
 from .core.base_factory import BaseFactory  # noqa
 from .core.base_model import BaseModel  # noqa
 from .core.data_value import DataValue  # noqa
+from .core.failed_evaluation import FailedEvaluation  # noqa
 from .core.workflow import Workflow  # noqa
 from .core.slot import Slot  # noqa
 from .core.factory_registry import FactoryRegistry  # noqa
@@ -15,15 +20,18 @@ from .core.kpi_specification import KPISpecification  # noqa
 from .core.execution_layer import ExecutionLayer  # noqa
 from .core.verifier import verify_workflow  # noqa
 from .core.verifier import VerifierError  # noqa
+from .core.verifier import WorkflowVerifier  # noqa
+from .core.evaluation_trace import EvaluationTraceHandler, read_evaluation_trace  # noqa
 
 from .core_plugins.base_extension_plugin import BaseExtensionPlugin  # noqa
 
 from .data_sources.base_data_source_model import BaseDataSourceModel  # noqa
-from .data_sources.base_data_source import BaseDataSource  # noqa
+from .data_sources.base_data_source import BaseDataSource, DataSourceTimeoutError  # noqa
 from .data_sources.base_data_source_factory import BaseDataSourceFactory  # noqa
 from .data_sources.i_data_source_factory import IDataSourceFactory  # noqa
 
 from .events.mco_events import *  # noqa
+from .events.execution_events import *  # noqa
 from .events.base_driver_event import BaseDriverEvent, DriverEventDeserializationError, DriverEventTypeError # noqa
 
 from .io.workflow_reader import WorkflowReader  # noqa
@@ -36,6 +44,7 @@ from .local_traits import Identifier, PositiveInt  # noqa
 
 from .mco.base_mco_model import BaseMCOModel  # noqa
 from .mco.base_mco_communicator import BaseMCOCommunicator  # noqa
+from .mco.stream_mco_communicator import StreamMCOCommunicator  # noqa
 from .mco.base_mco import BaseMCO  # noqa
 from .mco.base_mco_factory import BaseMCOFactory  # noqa
 from .mco.i_evaluator import IEvaluator  # noqa
@@ -47,6 +56,7 @@ from .mco.parameters.mco_parameters import FixedMCOParameterFactory, RangedMCOPa
 from .mco.parameters.mco_parameters import FixedMCOParameter, RangedMCOParameter, ListedMCOParameter, CategoricalMCOParameter, RangedVectorMCOParameter  # noqa
 from .mco.optimizer_engines.base_optimizer_engine import BaseOptimizerEngine  # noqa
 from .mco.optimizer_engines.weighted_optimizer_engine import WeightedOptimizerEngine  # noqa
+from .mco.optimizer_engines.optimizer_checkpoint import OptimizerCheckpoint, OptimizerCheckpointError  # noqa
 from .mco.optimizers.scipy_optimizer import ScipyOptimizer # noqa
 from .mco.optimizers.scipy_optimizer import SCIPY_ALGORITHMS_KEYS # noqa
 
@@ -62,3 +72,65 @@ from .ui_hooks.base_ui_hooks_manager import BaseUIHooksManager  # noqa
 from .ui_hooks.ui_notification_mixins import UIEventNotificationMixin, UIEventMixin  # noqa
 
 from .utilities import pop_recursive, pop_dunder_recursive  # noqa
+
+#: Names that are only imported when accessed, since their modules are not
+#: needed by most plugins and headless runs, and import sockets and threads.
+_LAZY_ATTRIBUTES = {
+    "EventStreamListenerFactory": (
+        ".notification_listeners.event_stream_listener"
+    ),
+    "EventStreamListenerModel": (
+        ".notification_listeners.event_stream_listener"
+    ),
+    "EventStreamListener": ".notification_listeners.event_stream_listener",
+    "EventStreamSubscriber": (
+        ".notification_listeners.event_stream_subscriber"
+    ),
+    "MetricsListenerFactory": ".notification_listeners.metrics_listener",
+    "MetricsListenerModel": ".notification_listeners.metrics_listener",
+    "MetricsListener": ".notification_listeners.metrics_listener",
+    "DistributedEvaluator": ".mco.distributed.distributed_evaluator",
+    "RemoteEvaluationError": ".mco.distributed.distributed_evaluator",
+    "EvaluationWorker": ".mco.distributed.evaluation_worker",
+}
+
+
+def _is_exported(name, value):
+    if name.startswith("_") or isinstance(value, types.ModuleType):
+        return False
+    if isinstance(value, (type, types.FunctionType)):
+        # Skip the traits and functions that the wildcard imports of the
+        # event modules bring along
+        return value.__module__.startswith("force_bdss.")
+    return True
+
+
+__all__ = sorted(
+    [name for name, value in globals().items() if _is_exported(name, value)]
+    + list(_LAZY_ATTRIBUTES)
+)
+
+
+class _LazyModule(types.ModuleType):
+    """ Module type of force_bdss.api, importing the `_LAZY_ATTRIBUTES`
+    on first access. The module level __getattr__ of PEP 562 is not
+    available in Python 3.6."""
+
+    def __getattr__(self, name):
+        try:
+            module_name = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(
+            importlib.import_module(module_name, self.__package__), name
+        )
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_LAZY_ATTRIBUTES))
+
+
+sys.modules[__name__].__class__ = _LazyModule
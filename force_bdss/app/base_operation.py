@@ -1,11 +1,13 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from threading import Event as ThreadingEvent
+from threading import Event as ThreadingEvent, RLock, Thread
 import logging
 import sys
 
 from traits.api import (
+    Any,
+    Dict,
     List,
     DelegatesTo,
     HasStrictTraits,
@@ -13,12 +15,17 @@ from traits.api import (
     provides,
     on_trait_change
 )
+from force_bdss.events.mco_events import MCOProgressEvent
 from force_bdss.notification_listeners.base_notification_listener import (
     BaseNotificationListener,
 )
+from force_bdss.notification_listeners.progress_event_coalescer import (
+    ProgressEventCoalescer
+)
 from force_bdss.ui_hooks.ui_notification_mixins import (
     UIEventNotificationMixin
 )
+from .execution_statistics import ExecutionStatistics
 from .i_operation import IOperation
 from .workflow_file import WorkflowFile
 
@@ -47,8 +54,33 @@ class BaseOperation(HasStrictTraits):
     #: should be paused and then resumed.
     _pause_event = Instance(ThreadingEvent, visible=False, transient=True)
 
+    #: The resources used by the workflow execution, summarized at the end
+    #: of the MCO run
+    execution_statistics = Instance(ExecutionStatistics, ())
+
+    #: Progress event coalescers, for each of the listeners that accept
+    #: batches of progress events
+    _progress_coalescers = Dict(
+        Instance(BaseNotificationListener),
+        Instance(ProgressEventCoalescer)
+    )
+
+    #: Lock held while delivering events to the listeners, which are
+    #: also delivered the due progress batches by the `_batch_flusher`
+    _delivery_lock = Any(visible=False, transient=True)
+
+    #: Thread delivering the pending progress batches once they are due,
+    #: so that they are not held back until the next event
+    _batch_flusher = Instance(Thread, visible=False, transient=True)
+
+    #: Threading Event instance that stops the `_batch_flusher`
+    _batch_flusher_stop = Instance(
+        ThreadingEvent, visible=False, transient=True
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._delivery_lock = RLock()
         self._stop_event = ThreadingEvent()
         self._pause_event = ThreadingEvent()
         self._pause_event.set()
@@ -81,23 +113,131 @@ class BaseOperation(HasStrictTraits):
         Delivers an event to the listeners, and performs the
         control events check after the `event` is delivered.
         """
-        for listener in self.listeners[:]:
-            try:
-                listener.deliver(event)
-            except Exception:
-                log.exception(
-                    (
-                        f"Exception while delivering to listener "
-                        f"'{listener.factory.id}' in plugin "
-                        f"'{listener.factory.plugin_id}'. The listener will "
-                        f"be dropped and computation will continue."
-                    )
-                )
-                self._finalize_listener(listener)
-                self.listeners.remove(listener)
+        self.execution_statistics.record(event)
+
+        with self._delivery_lock:
+            for listener in self.listeners[:]:
+                try:
+                    self._deliver_to_listener(listener, event)
+                except Exception:
+                    self._drop_listener(listener)
 
         self.ui_event_response()
 
+    def _drop_listener(self, listener):
+        """ Logs the exception raised by the delivery of an event to the
+        `listener`, and finalizes and removes the listener."""
+        log.exception(
+            (
+                f"Exception while delivering to listener "
+                f"'{listener.factory.id}' in plugin "
+                f"'{listener.factory.plugin_id}'. The listener will "
+                f"be dropped and computation will continue."
+            )
+        )
+        self._finalize_listener(listener)
+        self.listeners.remove(listener)
+        self._progress_coalescers.pop(listener, None)
+
+    def _deliver_to_listener(self, listener, event):
+        """ Delivers an event to a single listener. MCOProgressEvents are
+        coalesced into MCOProgressBatchEvents for listeners that accept
+        them, and any pending batch is delivered ahead of other events,
+        so that the order of events is preserved.
+        """
+        if not listener.accepts_progress_batches:
+            listener.deliver(event)
+            return
+
+        coalescer = self._progress_coalescer(listener)
+        if isinstance(event, MCOProgressEvent):
+            batch = coalescer.add(event)
+            if batch is not None:
+                listener.deliver(batch)
+        else:
+            batch = coalescer.flush()
+            if batch is not None:
+                listener.deliver(batch)
+            listener.deliver(event)
+
+    def _progress_coalescer(self, listener):
+        """ Returns the ProgressEventCoalescer of the `listener`, creating
+        it if necessary."""
+        try:
+            return self._progress_coalescers[listener]
+        except KeyError:
+            coalescer = ProgressEventCoalescer(
+                interval=listener.progress_batch_interval
+            )
+            self._progress_coalescers[listener] = coalescer
+            if self._batch_flusher is None:
+                self._start_batch_flusher()
+            return coalescer
+
+    def _start_batch_flusher(self):
+        """ Starts the thread delivering the due progress batches."""
+        self._batch_flusher_stop = ThreadingEvent()
+        self._batch_flusher = Thread(
+            target=self._flush_due_progress_batches,
+            args=(self._batch_flusher_stop,),
+            name="BDSS progress batch flusher",
+            daemon=True,
+        )
+        self._batch_flusher.start()
+
+    def _stop_batch_flusher(self):
+        """ Stops the thread delivering the due progress batches."""
+        if self._batch_flusher is None:
+            return
+        self._batch_flusher_stop.set()
+        self._batch_flusher.join()
+        self._batch_flusher = None
+
+    def _flush_due_progress_batches(self, stop_event):
+        """ Delivers the pending progress batches that are due, every
+        `progress_batch_interval` of the listeners, until `stop_event` is
+        set."""
+        while True:
+            with self._delivery_lock:
+                intervals = [
+                    coalescer.interval
+                    for coalescer in self._progress_coalescers.values()
+                ]
+            if stop_event.wait(max(min(intervals, default=0.1), 0.01)):
+                return
+            with self._delivery_lock:
+                for listener, coalescer in list(
+                        self._progress_coalescers.items()):
+                    if not coalescer.is_due():
+                        continue
+                    try:
+                        listener.deliver(coalescer.flush())
+                    except Exception:
+                        self._drop_listener(listener)
+
+    def _flush_progress_batch(self, listener):
+        """ Delivers any pending batch of progress events to the
+        `listener`. Exceptions are logged, since the listener is about
+        to be finalized anyway."""
+        coalescer = self._progress_coalescers.pop(listener, None)
+        if coalescer is None:
+            return
+
+        batch = coalescer.flush()
+        if batch is None:
+            return
+
+        try:
+            listener.deliver(batch)
+        except Exception:
+            log.exception(
+                (
+                    f"Exception while delivering pending progress events "
+                    f"to listener '{listener.factory.id}' in plugin "
+                    f"'{listener.factory.plugin_id}'."
+                )
+            )
+
     def ui_event_response(self):
         """ Checks the status of the _pause_event and _stop_event
         attributes. Pauses the BDSS execution until the _pause_event is set.
@@ -166,7 +306,10 @@ class BaseOperation(HasStrictTraits):
             )
 
     def _finalize_listeners(self):
+        self._stop_batch_flusher()
         # finalize listeners
         for listener in self.listeners:
+            self._flush_progress_batch(listener)
             self._finalize_listener(listener)
         self.listeners[:] = []
+        self._progress_coalescers = {}
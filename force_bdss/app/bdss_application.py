@@ -5,8 +5,7 @@ import functools
 import logging
 import sys
 
-from stevedore.extension import ExtensionManager
-from stevedore.exception import NoMatches
+from stevedore.named import NamedExtensionManager
 
 from envisage.api import Application
 from envisage.core_plugin import CorePlugin
@@ -14,16 +13,28 @@ from traits.api import Instance
 from traits.etsconfig.api import ETSConfig
 
 from force_bdss.core.i_factory_registry import IFactoryRegistry
+from force_bdss.core_plugins.core_listeners_plugin import (
+    CORE_LISTENERS_PLUGIN_ID,
+    CoreListenersPlugin,
+)
 from force_bdss.core_plugins.factory_registry_plugin import (
     FactoryRegistryPlugin
 )
 from force_bdss.io.workflow_reader import WorkflowReader
+from force_bdss.io.workflow_snapshot import default_snapshot_file
+from .operation_profiler import OperationProfiler, default_profile_file
+from .plugin_index import (
+    PluginIndex, default_plugin_index_path, workflow_plugin_ids
+)
 from .workflow_file import WorkflowFile
 from .i_operation import IOperation
 
 
 log = logging.getLogger(__name__)
 
+#: Entry point namespace of the BDSS plugins
+PLUGIN_NAMESPACE = "force.bdss.extensions"
+
 
 class BDSSApplication(Application):
     """Main application for the BDSS, performs an operation defined
@@ -41,17 +52,44 @@ class BDSSApplication(Application):
     #: The operation to be performed.
     operation = Instance(IOperation)
 
-    def __init__(self, evaluate, workflow_file, toolkit='null', **traits):
-        self._set_ets_toolkit(toolkit)
+    #: If set, profiles the run of the operation
+    profiler = Instance(OperationProfiler)
 
+    def __init__(self, evaluate, workflow_file, toolkit='null',
+                 operation_options=None, load_all_plugins=False,
+                 extra_plugins=(), snapshot=False, profile=False,
+                 profile_data_sources=False, plugin_index=True, **traits):
         if isinstance(workflow_file, str):
             workflow_file = WorkflowFile(path=workflow_file)
 
-        operation = self._create_operation(evaluate)
+        options = dict(operation_options or {})
+        if options.get("resume") and not options.get("checkpoint_file"):
+            options["checkpoint_file"] = default_checkpoint_file(
+                workflow_file.path
+            )
+        operation = self._create_operation(evaluate, options)
         operation.workflow_file = workflow_file
 
+        self._set_ets_toolkit(toolkit)
+
+        if snapshot and not workflow_file.snapshot_path:
+            workflow_file.snapshot_path = default_snapshot_file(
+                workflow_file.path
+            )
+        if profile or profile_data_sources:
+            traits.setdefault("profiler", OperationProfiler(
+                path=default_profile_file(workflow_file.path),
+                per_data_source=profile_data_sources,
+            ))
+
         plugins = [CorePlugin(), FactoryRegistryPlugin()]
-        self._load_plugins(plugins)
+        plugins.extend(extra_plugins)
+        if load_all_plugins:
+            self._load_plugins(plugins, plugin_index=plugin_index)
+        else:
+            self._load_plugins(
+                plugins, workflow_file.path, plugin_index=plugin_index
+            )
 
         super(BDSSApplication, self).__init__(
             workflow_file=workflow_file,
@@ -77,7 +115,10 @@ class BDSSApplication(Application):
 
     def _run_workflow(self):
         try:
-            self.operation.run()
+            if self.profiler is None:
+                self.operation.run()
+            else:
+                self.profiler.profile(self.operation)
         except Exception:
             log.exception("Error running workflow.")
             raise
@@ -109,33 +150,134 @@ class BDSSApplication(Application):
             else:
                 log.debug("ETS toolkit set to '%s'", toolkit)
 
-    def _create_operation(self, evaluate):
-        """ Create the appropriate operation instance. """
+    def _create_operation(self, evaluate, options=None):
+        """ Create the appropriate operation instance, with the given
+        `options` as values of its traits.
+
+        Raises
+        ------
+        ValueError
+            If some of the `options` are not supported by the operation.
+        """
         if evaluate:
             from .evaluate_operation import EvaluateOperation
-            return EvaluateOperation()
+            operation_class, name = EvaluateOperation, "evaluate"
         else:
             from .optimize_operation import OptimizeOperation
-            return OptimizeOperation()
+            operation_class, name = OptimizeOperation, "optimize"
+
+        options = options or {}
+        supported = {
+            name for name in operation_class.class_visible_traits()
+            if not name.startswith("_")
+        }
+        unsupported = sorted(set(options) - supported)
+        if unsupported:
+            raise ValueError(
+                "Options not supported by the {} operation: {}".format(
+                    name, ", ".join(unsupported))
+            )
+        return operation_class(**options)
+
+    def _load_plugins(self, plugins, workflow_path=None, plugin_index=True):
+        """ Load plugins via Stevedore.
+
+        If `workflow_path` is given, only the plugins providing the
+        factories referenced in the workflow are imported, as far as they
+        are known from the `PluginIndex`. Plugins missing from the index
+        are imported as well if some required plugin is not indexed, and
+        all plugins are imported if the workflow can not be read or a
+        required plugin is still missing.
+
+        If `plugin_index` is False, the index file is neither read nor
+        written, so all the plugins are imported.
+
+        The CoreListenersPlugin is added to the `plugins` only if the
+        workflow uses its listeners, or if all the plugins are imported.
+        """
+        index_path = default_plugin_index_path() if plugin_index else ""
+        index = PluginIndex.from_path(index_path)
+        entry_points = NamedExtensionManager(
+            PLUGIN_NAMESPACE, names=[]
+        ).list_entry_points()
+        all_names = [entry_point.name for entry_point in entry_points]
+
+        required_ids = None
+        if workflow_path is not None:
+            required_ids = workflow_plugin_ids(workflow_path)
+        if required_ids is None or CORE_LISTENERS_PLUGIN_ID in required_ids:
+            plugins.append(CoreListenersPlugin())
+        if required_ids is not None:
+            # The plugins already given, e.g. the core plugins, are not
+            # looked up in the entry points
+            required_ids -= {plugin.id for plugin in plugins}
+
+        if required_ids is None:
+            names = all_names
+        else:
+            names = [
+                entry_point.name for entry_point in entry_points
+                if index.get(entry_point) in required_ids
+            ]
+            indexed_ids = {
+                index.get(entry_point) for entry_point in entry_points
+            }
+            if not required_ids.issubset(indexed_ids):
+                names += [
+                    entry_point.name for entry_point in entry_points
+                    if index.get(entry_point) is None
+                ]
+            log.info(
+                "Loading {} of {} installed plugins".format(
+                    len(names), len(all_names))
+            )
+
+        n_loaded = self._load_named_plugins(plugins, names, index)
+
+        if required_ids is not None:
+            loaded_ids = {plugin.id for plugin in plugins}
+            if not required_ids.issubset(loaded_ids):
+                remaining_names = [
+                    name for name in all_names if name not in names
+                ]
+                n_loaded += self._load_named_plugins(
+                    plugins, remaining_names, index
+                )
+
+        index.save()
+
+        if n_loaded == 0:
+            log.info("No extensions found")
+
+    def _load_named_plugins(self, plugins, names, index):
+        """ Imports and instantiates the plugins of the entry points with
+        the given `names`, appends them to `plugins` and records their ids
+        in the plugin `index`. Returns the number of loaded plugins."""
+        if not names:
+            return 0
 
-    def _load_plugins(self, plugins):
-        """ Load plugins via Stevedore. """
-        mgr = ExtensionManager(
-            namespace='force.bdss.extensions',
+        mgr = NamedExtensionManager(
+            namespace=PLUGIN_NAMESPACE,
+            names=names,
             invoke_on_load=True,
             on_load_failure_callback=functools.partial(_load_failure_callback,
                                                        plugins)
         )
-
-        try:
-            mgr.map(functools.partial(_import_extensions, plugins))
-        except NoMatches:
-            log.info("No extensions found")
+        for ext in mgr.extensions:
+            _import_extensions(plugins, ext)
+            index.update(ext.entry_point, ext.obj.id)
+        return len(mgr.extensions)
 
     def _factory_registry_default(self):
         return self.get_service(IFactoryRegistry)
 
 
+def default_checkpoint_file(workflow_path):
+    """ Returns the default path of the checkpoint file of the
+    optimization of a workflow."""
+    return workflow_path + ".checkpoint"
+
+
 def _import_extensions(plugins, ext):
     """Service routine extracted for testing.
     Imports the extension in the plugins argument.
@@ -2,8 +2,13 @@
 #  All rights reserved.
 
 import logging
+import os
+import socket
 
-from traits.api import provides
+from traits.api import Bool, Float, Str, provides
+
+from force_bdss.core.failed_evaluation import FailedEvaluation
+from force_bdss.mco.stream_mco_communicator import StreamMCOCommunicator
 from .i_operation import IOperation
 from .base_operation import BaseOperation
 
@@ -14,8 +19,29 @@ log = logging.getLogger(__name__)
 class EvaluateOperation(BaseOperation):
     """Performs the evaluation of a single point in an MCO,
     based on the system described by a `Workflow` object.
+
+    If `serve` is True, the operation acts as a persistent evaluation
+    worker: the workflow is loaded and verified once, and points are
+    evaluated as long as the MCO communicator receives requests, which
+    requires a `StreamMCOCommunicator`. A request that can not be evaluated
+    is answered with the failure KPI values of the MCO model, and the
+    following requests are served. A request that can not be received or
+    parsed stops the operation.
     """
 
+    #: Whether to keep evaluating points until the MCO communicator raises
+    #: EOFError, instead of evaluating a single point
+    serve = Bool(False)
+
+    #: Path of a Unix socket to serve the requests on, when `serve` is
+    #: True. If empty, the requests are received by the MCO communicator
+    #: directly (e.g. from the standard input).
+    serve_address = Str()
+
+    #: Time interval, in seconds, between checks of the stop event when
+    #: waiting for socket connections
+    poll_interval = Float(0.5)
+
     def run(self):
         """ Evaluate the workflow.
         """
@@ -31,9 +57,19 @@ class EvaluateOperation(BaseOperation):
         self._initialize_listeners()
 
         try:
-            mco_data_values = mco_communicator.receive_from_mco(mco_model)
-            kpi_results = self.workflow.execute(mco_data_values)
-            mco_communicator.send_to_mco(mco_model, kpi_results)
+            if not self.serve:
+                self._evaluate_point(mco_communicator, mco_model)
+                return
+            if not isinstance(mco_communicator, StreamMCOCommunicator):
+                raise TypeError(
+                    "Serving evaluations requires a StreamMCOCommunicator, "
+                    "but the MCO factory created a "
+                    f"{type(mco_communicator).__name__}."
+                )
+            if self.serve_address:
+                self._serve_socket(mco_communicator, mco_model)
+            else:
+                self._serve_requests(mco_communicator, mco_model)
         except Exception:
             # Simply propagate any error message that is raised, and
             # ensure that listener and event objects are correctly
@@ -43,6 +79,83 @@ class EvaluateOperation(BaseOperation):
             # Tear down listeners
             self._finalize_listeners()
 
+    def _evaluate_point(self, mco_communicator, mco_model):
+        """ Receives a single point from the MCO, and sends back the
+        resulting KPIs."""
+        mco_data_values = mco_communicator.receive_from_mco(mco_model)
+        kpi_results = self.workflow.execute(mco_data_values)
+        mco_communicator.send_to_mco(mco_model, kpi_results)
+
+    def _serve_requests(self, mco_communicator, mco_model):
+        """ Evaluates points until the MCO communicator raises EOFError,
+        or the stop event is set. Returns the number of evaluated points."""
+        n_points = 0
+        n_failures = 0
+        while not self._stop_event.is_set():
+            try:
+                mco_data_values = mco_communicator.receive_from_mco(
+                    mco_model
+                )
+            except EOFError:
+                break
+            try:
+                kpi_results = self.workflow.execute(mco_data_values)
+            except Exception:
+                log.exception(
+                    "Unable to evaluate the MCO request. Sending the "
+                    "failure KPI values."
+                )
+                kpi_results = FailedEvaluation(mco_model.failure_kpis())
+            if isinstance(kpi_results, FailedEvaluation):
+                n_failures += 1
+            mco_communicator.send_to_mco(mco_model, kpi_results)
+            n_points += 1
+        log.info(f"Evaluated {n_points} points ({n_failures} failed)")
+        self.execution_statistics.log_summary()
+        return n_points
+
+    def _serve_socket(self, mco_communicator, mco_model):
+        """ Accepts connections on the `serve_address` Unix socket, one at
+        a time, and serves the requests of each connection until it is
+        closed. Stops when the stop event is set."""
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.serve_address)
+            server.listen()
+            server.settimeout(self.poll_interval)
+            log.info(f"Serving evaluations on '{self.serve_address}'")
+            while not self._stop_event.is_set():
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    continue
+                with connection:
+                    connection.settimeout(None)
+                    try:
+                        self._serve_connection(
+                            connection, mco_communicator, mco_model
+                        )
+                    except (BrokenPipeError, ConnectionResetError):
+                        log.warning("MCO connection closed unexpectedly")
+        finally:
+            server.close()
+            try:
+                os.unlink(self.serve_address)
+            except OSError:
+                pass
+
+    def _serve_connection(self, connection, mco_communicator, mco_model):
+        """ Serves the requests received on a socket connection."""
+        with connection.makefile("r") as input_stream, \
+                connection.makefile("w") as output_stream:
+            mco_communicator.input_stream = input_stream
+            mco_communicator.output_stream = output_stream
+            try:
+                self._serve_requests(mco_communicator, mco_model)
+            finally:
+                mco_communicator.input_stream = None
+                mco_communicator.output_stream = None
+
     def create_mco_communicator(self):
         """Create BaseMCOCommunicator instance associated with
         the BaseMCOModel subclass in the Workflow"""
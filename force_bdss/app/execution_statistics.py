@@ -0,0 +1,185 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import math
+import random
+
+from traits.api import Any, Dict, Float, HasStrictTraits, Int, Property
+
+from force_bdss.events.data_source_events import DataSourceFinishEvent
+from force_bdss.events.execution_events import (
+    ExecutionLayerFinishEvent,
+    WorkflowExecutionFinishEvent,
+)
+from force_bdss.events.mco_events import MCOFinishEvent, MCOStartEvent
+from force_bdss.local_traits import PositiveInt
+
+log = logging.getLogger(__name__)
+
+
+class RunningDistribution(HasStrictTraits):
+    """ Running aggregates of a series of values: their count, sum,
+    minimum and maximum, and a uniform random sample of at most
+    `reservoir_size` of the values (reservoir sampling), from which the
+    quantiles are estimated. The memory used is bounded, whatever the
+    number of values; the quantiles are exact as long as the number of
+    values does not exceed `reservoir_size`.
+    """
+
+    #: Maximum number of values kept to estimate the quantiles
+    reservoir_size = PositiveInt(1000)
+
+    #: Number of values added
+    count = Int()
+
+    #: Sum of the values added
+    total = Float()
+
+    #: Minimum and maximum of the values added
+    minimum = Float(math.inf)
+    maximum = Float(-math.inf)
+
+    #: Mean of the values added
+    mean = Property(Float, depends_on="count,total")
+
+    #: The sample of the values added
+    reservoir = Any()
+
+    #: Random generator of the sample, seeded so that the estimates are
+    #: reproducible
+    _random = Any()
+
+    def _reservoir_default(self):
+        return []
+
+    def __random_default(self):
+        return random.Random(0)
+
+    def _get_mean(self):
+        if self.count == 0:
+            return math.nan
+        return self.total / self.count
+
+    def add(self, value):
+        """ Adds a value to the distribution."""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+        if len(self.reservoir) < self.reservoir_size:
+            self.reservoir.append(value)
+        else:
+            index = self._random.randrange(self.count)
+            if index < self.reservoir_size:
+                self.reservoir[index] = value
+
+    def quantile(self, percent):
+        """ Returns the estimate of the `percent` percentile of the values
+        added, with the nearest rank method."""
+        return percentile(sorted(self.reservoir), percent)
+
+
+class ExecutionStatistics(HasStrictTraits):
+    """ Aggregates the resources used by the data sources, the execution
+    layers and the whole workflow, as reported by the ResourceUsageEvents
+    of the workflow execution, and logs a summary of them at the end of
+    the MCO run.
+
+    Only running aggregates are kept for each part of the workflow
+    execution, so that the memory used does not grow with the number of
+    evaluations of the workflow.
+    """
+
+    #: Maximum number of samples kept for each part of the workflow
+    #: execution, to estimate the percentiles of the wall and CPU times
+    reservoir_size = PositiveInt(1000)
+
+    #: The RunningDistributions of the wall time, CPU time and peak RSS
+    #: increase of each part of the workflow execution, by label
+    aggregates = Dict()
+
+    def record(self, event):
+        """ Records the resource usage reported by an event. The
+        aggregates are cleared by an MCOStartEvent, and summarized by an
+        MCOFinishEvent."""
+        if isinstance(event, DataSourceFinishEvent):
+            label = "Data source '{}' ({})".format(
+                event.data_source_name, ", ".join(event.output_names)
+            )
+        elif isinstance(event, ExecutionLayerFinishEvent):
+            label = f"Execution layer {event.layer_index}"
+        elif isinstance(event, WorkflowExecutionFinishEvent):
+            label = "Workflow"
+        elif isinstance(event, MCOStartEvent):
+            self.aggregates = {}
+            return
+        elif isinstance(event, MCOFinishEvent):
+            self.log_summary()
+            return
+        else:
+            return
+
+        try:
+            wall_times, cpu_times, rss_deltas = self.aggregates[label]
+        except KeyError:
+            wall_times, cpu_times, rss_deltas = self.aggregates[label] = [
+                RunningDistribution(reservoir_size=self.reservoir_size)
+                for _ in range(3)
+            ]
+        wall_times.add(event.wall_time)
+        cpu_times.add(event.cpu_time)
+        rss_deltas.add(event.peak_rss_delta)
+
+    def summary(self):
+        """ Returns the summary of the recorded resource usage, with the
+        mean, median (p50), 95th percentile (p95) and maximum of the wall
+        and CPU times, and the maximum increase of the peak RSS, of each
+        part of the workflow execution.
+
+        Returns
+        -------
+        lines: list of str
+            The lines of the summary
+        """
+        lines = []
+        for label, aggregates in self.aggregates.items():
+            wall_times, cpu_times, rss_deltas = aggregates
+            lines.append(
+                "{}: {} calls, wall time {}, CPU time {}, "
+                "peak RSS increase max {:.1f} MiB".format(
+                    label,
+                    wall_times.count,
+                    _format_distribution(wall_times),
+                    _format_distribution(cpu_times),
+                    rss_deltas.maximum / 2 ** 20,
+                )
+            )
+        return lines
+
+    def log_summary(self):
+        """ Logs the summary of the recorded resource usage."""
+        if not self.aggregates:
+            return
+        log.info("Resource usage of the workflow execution:")
+        for line in self.summary():
+            log.info(line)
+
+
+def percentile(values, percent):
+    """ Returns the `percent` percentile of the sorted `values`, with the
+    nearest rank method."""
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def _format_distribution(distribution):
+    return "mean {:.4g} s, p50 {:.4g} s, p95 {:.4g} s, max {:.4g} s".format(
+        distribution.mean,
+        distribution.quantile(50),
+        distribution.quantile(95),
+        distribution.maximum,
+    )
@@ -0,0 +1,178 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import tracemalloc
+
+from traits.api import Any, Bool, Float, HasStrictTraits, Int, List, Tuple
+
+from force_bdss.core.resource_usage import current_rss
+from force_bdss.events.execution_events import WorkflowExecutionFinishEvent
+from force_bdss.local_traits import PositiveInt
+
+log = logging.getLogger(__name__)
+
+#: Allocations that are not reported: those of tracemalloc itself, and of
+#: the import system
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryDiagnostics(HasStrictTraits):
+    """ Diagnoses the growth of the memory during a long MCO run.
+
+    The memory allocations are traced with `tracemalloc` once `start` is
+    called. Every `interval` evaluations of the workflow, a snapshot of
+    the allocations is taken, and the allocation sites whose memory grew
+    the most since the previous snapshot are logged, together with the
+    growth of the resident set size (RSS) of the process. A warning is
+    logged if the RSS grew by more than `rss_growth_threshold` per
+    evaluation. When `stop` is called, the sites that grew the most since
+    the start are logged.
+
+    Tracing the allocations slows down the evaluations significantly, so
+    that the diagnostics are meant for the investigation of memory leaks
+    only.
+    """
+
+    #: Number of evaluations of the workflow between two snapshots
+    interval = PositiveInt(1000)
+
+    #: Number of allocation sites reported at each snapshot
+    n_top = PositiveInt(10)
+
+    #: Number of frames of the traceback of each allocation site
+    n_frames = PositiveInt(1)
+
+    #: Growth of the RSS, in bytes per evaluation, above which a warning
+    #: is logged
+    rss_growth_threshold = Float(10 * 1024)
+
+    #: The samples taken, as tuples of the number of evaluations, the size
+    #: of the traced memory and the RSS, in bytes
+    samples = List(Tuple(Int, Int, Int))
+
+    #: Number of evaluations of the workflow since the start
+    n_evaluations = Int()
+
+    #: The tracemalloc snapshots taken at the start, and at the last sample
+    _first_snapshot = Any()
+    _last_snapshot = Any()
+
+    #: Whether tracemalloc was started by the diagnostics, and must be
+    #: stopped by them
+    _owns_tracing = Bool(False)
+
+    def start(self, workflow):
+        """ Starts tracing the memory allocations, and counting the
+        evaluations of the `workflow`."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.n_frames)
+            self._owns_tracing = True
+        self.n_evaluations = 0
+        self.samples = []
+        self._first_snapshot = self._last_snapshot = self._take_snapshot()
+        self._add_sample()
+        workflow.on_trait_change(self._record_event, "event")
+        log.info(
+            f"Memory diagnostics started: a snapshot is taken every "
+            f"{self.interval} evaluations"
+        )
+
+    def stop(self, workflow):
+        """ Stops counting the evaluations of the `workflow`, logs the
+        allocation sites that grew the most since the start, and stops
+        tracing the memory allocations."""
+        workflow.on_trait_change(self._record_event, "event", remove=True)
+        if self._first_snapshot is None:
+            return
+        try:
+            if self.n_evaluations != self.samples[-1][0]:
+                self.sample()
+            self._log_top_growth(
+                f"since the start of the run ({self.n_evaluations} "
+                f"evaluations)",
+                self._take_snapshot(),
+                self._first_snapshot,
+            )
+        finally:
+            self._first_snapshot = self._last_snapshot = None
+            if self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+
+    def sample(self):
+        """ Takes a snapshot of the memory allocations, and reports the
+        growth since the previous one."""
+        snapshot = self._take_snapshot()
+        previous = self.samples[-1]
+        sample = self._add_sample()
+
+        n_evaluations = sample[0] - previous[0]
+        traced_growth = sample[1] - previous[1]
+        rss_growth = sample[2] - previous[2]
+        log.info(
+            "Memory after %d evaluations: traced %.1f KiB (%+.1f KiB), "
+            "RSS %.1f MiB (%+.1f KiB)",
+            sample[0], sample[1] / 1024, traced_growth / 1024,
+            sample[2] / 2 ** 20, rss_growth / 1024,
+        )
+        self._log_top_growth(
+            f"in the last {n_evaluations} evaluations",
+            snapshot,
+            self._last_snapshot,
+        )
+        self._last_snapshot = snapshot
+
+        if n_evaluations and (
+                rss_growth / n_evaluations > self.rss_growth_threshold):
+            log.warning(
+                "The RSS grew by %.1f KiB per evaluation in the last %d "
+                "evaluations, above the threshold of %.1f KiB. This may "
+                "indicate a memory leak.",
+                rss_growth / n_evaluations / 1024, n_evaluations,
+                self.rss_growth_threshold / 1024,
+            )
+
+    def _record_event(self, event):
+        if isinstance(event, WorkflowExecutionFinishEvent):
+            self.n_evaluations += 1
+            if self.n_evaluations % self.interval == 0:
+                self.sample()
+
+    def _add_sample(self):
+        sample = (
+            self.n_evaluations,
+            tracemalloc.get_traced_memory()[0],
+            current_rss(),
+        )
+        self.samples.append(sample)
+        return sample
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    def _log_top_growth(self, period, snapshot, reference):
+        """ Logs the allocation sites whose memory grew the most between
+        the `reference` snapshot and the `snapshot`."""
+        key_type = "traceback" if self.n_frames > 1 else "lineno"
+        statistics = [
+            statistic
+            for statistic in snapshot.compare_to(reference, key_type)
+            if statistic.size_diff > 0
+        ][:self.n_top]
+        if not statistics:
+            log.info(f"No allocation site grew {period}")
+            return
+        lines = [f"Top {len(statistics)} growing allocation sites {period}:"]
+        for statistic in statistics:
+            lines.append(f"  {statistic}")
+            if self.n_frames > 1:
+                lines.extend(
+                    f"    {line}" for line in statistic.traceback.format()
+                )
+        log.info("\n".join(lines))
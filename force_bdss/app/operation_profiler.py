@@ -0,0 +1,224 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import re
+import time
+
+from traits.api import (
+    Bool, Dict, Float, HasStrictTraits, Instance, Int, List, Str
+)
+
+from force_bdss.events.data_source_events import (
+    DataSourceFinishEvent,
+    DataSourceStartEvent,
+)
+from force_bdss.events.execution_events import (
+    ExecutionLayerFinishEvent,
+    WorkflowExecutionFinishEvent,
+)
+
+log = logging.getLogger(__name__)
+
+#: Schema of the speedscope file format
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class OperationProfiler(HasStrictTraits):
+    """ Profiles the run of an operation with cProfile, excluding the
+    start of the application and the loading of the workflow.
+
+    The profile is written to `path` in the pstats format, which can be
+    read with the `pstats` module, or tools such as snakeviz.
+
+    With `per_data_source`, only the runs of the data sources are
+    profiled instead, and the profile of each data source is written to
+    ``<path without extension>.<data source name>.prof``. A timeline of
+    the evaluations, of their execution layers and of the data source
+    runs is also written to ``<path without extension>.speedscope.json``,
+    in the format of the speedscope profile viewer. The runs of a data
+    source that fail are not profiled. As cProfile only profiles the
+    thread it is enabled in, neither are the runs of the data sources with
+    a `run_timeout`, which run in a separate thread.
+    """
+
+    #: Path of the pstats file of the operation
+    path = Str()
+
+    #: Whether the runs of each data source are profiled separately
+    per_data_source = Bool(False)
+
+    #: Profile of the operation, unless the data sources are profiled
+    _profile = Instance(cProfile.Profile)
+
+    #: Profile of the current data source run
+    _data_source_profile = Instance(cProfile.Profile)
+
+    #: Start time of the current data source run
+    _data_source_start = Float()
+
+    #: Profiles of the runs of each data source, by name
+    _data_source_profiles = Dict(Str, List)
+
+    #: Number of execution layers finished in the current evaluation
+    _n_layers = Int()
+
+    #: Names of the frames of the timeline
+    _frames = List(Str)
+
+    #: Events of the timeline, as (type, frame index, time)
+    _events = List()
+
+    #: Frame indices of the open frames of the timeline
+    _open_frames = List()
+
+    def profile(self, operation):
+        """ Runs the `operation`, and writes its profile.
+
+        Parameters
+        ----------
+        operation: BaseOperation
+            The operation, whose workflow is loaded.
+        """
+        if not self.per_data_source:
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.runcall(operation.run)
+            finally:
+                self.write()
+            return
+
+        # Only one profiler can be active at a time, so that the data
+        # sources are not profiled within the profile of the operation.
+        # The events are received before the listeners of the operation,
+        # so that the profiles do not include their delivery.
+        operation.workflow.on_trait_change(
+            self._record_event, "event", priority=True
+        )
+        try:
+            operation.run()
+        finally:
+            self._discard_data_source_profile()
+            operation.workflow.on_trait_change(
+                self._record_event, "event", remove=True
+            )
+            self.write()
+
+    def write(self):
+        """ Writes the profiles and the timeline."""
+        if not self.per_data_source:
+            self._profile.dump_stats(self.path)
+            log.info(f"Profile of the operation written to '{self.path}'")
+            return
+
+        root = os.path.splitext(self.path)[0]
+        for name, profiles in self._data_source_profiles.items():
+            path = f"{root}.{_file_name(name)}.prof"
+            pstats.Stats(*profiles).dump_stats(path)
+            log.info(f"Profile of the data source '{name}' written to "
+                     f"'{path}'")
+
+        path = f"{root}.speedscope.json"
+        with open(path, "w") as fp:
+            json.dump(self.speedscope_data(), fp)
+        log.info(f"Timeline of the evaluations written to '{path}'")
+
+    def speedscope_data(self):
+        """ Returns the timeline of the evaluations, as an evented profile
+        in the speedscope format."""
+        while self._open_frames:
+            self._close_frame()
+        start = self._events[0][2] if self._events else 0.0
+        end = self._events[-1][2] if self._events else 0.0
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "exporter": "force_bdss",
+            "name": os.path.basename(self.path),
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [{"name": name} for name in self._frames]
+            },
+            "profiles": [{
+                "type": "evented",
+                "name": "Evaluations",
+                "unit": "seconds",
+                "startValue": 0.0,
+                "endValue": end - start,
+                "events": [
+                    {"type": type_, "frame": frame, "at": at - start}
+                    for type_, frame, at in self._events
+                ],
+            }],
+        }
+
+    def _record_event(self, event):
+        """ Profiles the runs of the data sources, and records the
+        timeline."""
+        if isinstance(event, DataSourceStartEvent):
+            if not self._open_frames:
+                self._open_frame("Evaluation")
+            if len(self._open_frames) == 1:
+                self._open_frame(f"Layer {self._n_layers}")
+            # The profile of a data source that failed is still enabled
+            self._discard_data_source_profile()
+            self._data_source_start = time.perf_counter()
+            self._data_source_profile = cProfile.Profile()
+            self._data_source_profile.enable()
+        elif isinstance(event, DataSourceFinishEvent):
+            self._data_source_profile.disable()
+            self._data_source_profiles.setdefault(
+                event.data_source_name, []
+            ).append(self._data_source_profile)
+            self._data_source_profile = None
+            # The frame is opened once its name is known
+            self._open_frame(event.data_source_name, self._data_source_start)
+            self._close_frame()
+        elif isinstance(event, ExecutionLayerFinishEvent):
+            if len(self._open_frames) == 2:
+                self._close_frame()
+            self._n_layers = event.layer_index + 1
+        elif isinstance(event, WorkflowExecutionFinishEvent):
+            self._discard_data_source_profile()
+            while self._open_frames:
+                self._close_frame()
+            self._n_layers = 0
+
+    def _discard_data_source_profile(self):
+        """ Disables and discards the profile of a data source run that
+        did not finish, because the data source failed."""
+        if self._data_source_profile is not None:
+            self._data_source_profile.disable()
+            self._data_source_profile = None
+
+    def _open_frame(self, name, at=None):
+        try:
+            frame = self._frames.index(name)
+        except ValueError:
+            frame = len(self._frames)
+            self._frames.append(name)
+        if at is None:
+            at = time.perf_counter()
+        if self._events:
+            at = max(at, self._events[-1][2])
+        self._events.append(("O", frame, at))
+        self._open_frames.append(frame)
+
+    def _close_frame(self):
+        at = max(time.perf_counter(), self._events[-1][2])
+        self._events.append(("C", self._open_frames.pop(), at))
+
+
+def default_profile_file(workflow_path):
+    """ Returns the default path of the profile of an operation on a
+    workflow."""
+    return workflow_path + ".prof"
+
+
+def _file_name(name):
+    """ Returns `name` with the characters that are not valid in file
+    names replaced by underscores."""
+    return re.sub(r"[^\w.-]", "_", name) or "data_source"
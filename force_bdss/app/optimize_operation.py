@@ -3,7 +3,16 @@
 
 import logging
 
-from traits.api import provides
+from traits.api import Bool, File, Float, Instance, List, provides
+
+from force_bdss.mco.optimizer_engines.evaluation_history import (
+    read_evaluation_history
+)
+from force_bdss.mco.optimizer_engines.optimizer_checkpoint import (
+    OptimizerCheckpoint,
+    optimization_fingerprint,
+)
+from .memory_diagnostics import MemoryDiagnostics
 from .i_operation import IOperation
 from .base_operation import BaseOperation
 
@@ -17,6 +26,32 @@ class OptimizeOperation(BaseOperation):
     optional `NotificationListener` classes in order to broadcast
     information during the MCO run."""
 
+    #: Path of the file where the optimization state is checkpointed.
+    #: If empty, no checkpoint is saved.
+    checkpoint_file = File()
+
+    #: Minimum time interval, in seconds, between two checkpoints
+    checkpoint_interval = Float(60.0)
+
+    #: Whether to resume the optimization from the state saved in
+    #: `checkpoint_file`
+    resume = Bool(False)
+
+    #: Result files of previous runs, whose evaluated points are reused
+    #: by the MCO. They are loaded in the checkpoint of the optimization,
+    #: which restores them in the optimizer engine of the MCO.
+    evaluation_history = List(File)
+
+    #: If set, diagnoses the growth of the memory during the MCO run
+    memory_diagnostics = Instance(MemoryDiagnostics)
+
+    #: If set, the workflow is evaluated by the remote workers of this
+    #: evaluator
+    distributed_evaluator = Instance(
+        "force_bdss.mco.distributed.distributed_evaluator."
+        "DistributedEvaluator"
+    )
+
     def run(self):
         """ Create and run the optimizer.
         """
@@ -26,13 +61,24 @@ class OptimizeOperation(BaseOperation):
 
         # Create the optimizer
         mco = self.create_mco()
+        mco.checkpoint = self.create_checkpoint()
+        mco.evaluation_history = self.evaluation_history
 
         # Set up listeners
         self._initialize_listeners()
         self._deliver_start_event()
 
+        if self.memory_diagnostics is not None:
+            self.memory_diagnostics.start(self.workflow)
+
+        evaluator = self.workflow
+        if self.distributed_evaluator is not None:
+            evaluator = self.distributed_evaluator
+            evaluator.workflow = self.workflow
+            evaluator.start()
+
         try:
-            mco.run(self.workflow)
+            mco.run(evaluator)
         except Exception:
             log.exception(
                 (
@@ -43,10 +89,93 @@ class OptimizeOperation(BaseOperation):
             )
             raise
         finally:
+            if self.distributed_evaluator is not None:
+                self.distributed_evaluator.stop()
+            if self.memory_diagnostics is not None:
+                self.memory_diagnostics.stop(self.workflow)
             # Tear down listeners
             self._deliver_finish_event()
             self._finalize_listeners()
 
+        if mco.checkpoint is not None and mco.checkpoint.state and not (
+                mco.checkpoint.restored):
+            if self.evaluation_history:
+                message = (
+                    "The evaluated points of the evaluation history were "
+                    "not reused"
+                )
+            else:
+                message = (
+                    "The optimization was not resumed from the checkpoint"
+                )
+            log.warning(
+                "{}: MCO with id '{}' from plugin '{}' does not pass its "
+                "checkpoint to an optimizer engine.".format(
+                    message, mco.factory.id, mco.factory.plugin_id)
+            )
+
+    def create_checkpoint(self):
+        """ Create the checkpoint of the optimization, loading the saved
+        state if the optimization is resumed, and the evaluated points of
+        the `evaluation_history`. Returns None if no `checkpoint_file` nor
+        `evaluation_history` is defined.
+
+        Without a `checkpoint_file`, the checkpoint only hands the
+        evaluation history over to the optimizer engine, and is never
+        saved.
+
+        Raises
+        ------
+        OptimizerCheckpointError
+            If the saved state can not be loaded, e.g. because it was
+            saved for different MCO parameters or KPIs.
+        """
+        if not self.checkpoint_file:
+            if self.resume:
+                raise RuntimeError(
+                    "A checkpoint file is required to resume the "
+                    "optimization."
+                )
+            if not self.evaluation_history:
+                return None
+
+        mco_model = self.workflow.mco_model
+        checkpoint = OptimizerCheckpoint(
+            path=self.checkpoint_file,
+            interval=self.checkpoint_interval,
+            fingerprint=optimization_fingerprint(
+                mco_model.parameters, mco_model.kpis
+            ),
+        )
+        if self.resume:
+            checkpoint.load()
+        if self.evaluation_history:
+            self._load_evaluation_history(checkpoint)
+        return checkpoint
+
+    def _load_evaluation_history(self, checkpoint):
+        """ Adds the evaluated points of the `evaluation_history` to the
+        KPI values restored from the `checkpoint`."""
+        mco_model = self.workflow.mco_model
+        parameter_names = [
+            parameter.name for parameter in mco_model.parameters
+        ]
+        kpi_names = [kpi.name for kpi in mco_model.kpis]
+
+        kpi_cache = list(checkpoint.state.get("kpi_cache", []))
+        for path in self.evaluation_history:
+            history = read_evaluation_history(
+                path, parameter_names, kpi_names
+            )
+            log.info(
+                f"Loaded {len(history)} evaluated points from '{path}'"
+            )
+            kpi_cache.extend(
+                [input_point, kpi_values]
+                for input_point, kpi_values in history
+            )
+        checkpoint.state = dict(checkpoint.state, kpi_cache=kpi_cache)
+
     def create_mco(self):
         """ Create the MCO from the model's factory. """
         mco_factory = self.workflow.mco_model.factory
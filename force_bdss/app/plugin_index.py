@@ -0,0 +1,154 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import logging
+import os
+
+from traits.api import Bool, Dict, HasStrictTraits, Str
+
+from force_bdss.io.json_stream import JSONStream
+
+log = logging.getLogger(__name__)
+
+#: Environment variable overriding the path of the plugin index file.
+#: If set to an empty string, the index is not persisted.
+PLUGIN_INDEX_ENV_VAR = "FORCE_BDSS_PLUGIN_INDEX"
+
+#: Separator between the plugin id and the identifier in factory ids
+_FACTORY_ID_SEPARATOR = ".factory."
+
+
+def default_plugin_index_path():
+    """ Returns the path of the plugin index file, which can be overridden
+    by the FORCE_BDSS_PLUGIN_INDEX environment variable."""
+    try:
+        return os.environ[PLUGIN_INDEX_ENV_VAR]
+    except KeyError:
+        cache_home = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+        return os.path.join(cache_home, "force_bdss", "plugin_index.json")
+
+
+def entry_point_key(entry_point):
+    """ Returns a string identifying an entry point, including the object
+    it refers to, so that changes to the entry point invalidate the
+    index entry."""
+    value = getattr(entry_point, "value", None)
+    if value is None:
+        value = str(entry_point)
+    return f"{entry_point.name}={value}"
+
+
+def workflow_plugin_ids(path):
+    """ Returns the ids of the plugins providing the factories referenced
+    in a workflow file, without loading any plugin.
+
+    The file is parsed incrementally: only the factory ids are collected,
+    and the data of the workflow is never held in memory.
+
+    Parameters
+    ----------
+    path: str
+        Path of the workflow JSON file
+
+    Returns
+    -------
+    plugin_ids: set of str or None
+        The plugin ids, or None if the workflow file can not be read.
+    """
+    plugin_ids = set()
+    try:
+        with open(path) as fp:
+            _collect_plugin_ids(JSONStream(fp), plugin_ids)
+    except (OSError, ValueError):
+        return None
+    return plugin_ids
+
+
+def _collect_plugin_ids(stream, plugin_ids):
+    """ Walks the next value of the workflow JSON `stream`, and collects
+    the plugin ids of all the factory ids."""
+    character = stream.peek()
+    if character == "{":
+        for key in stream.iter_object():
+            if key == "id" and stream.peek() == '"':
+                plugin_id, separator, _ = stream.read_value().partition(
+                    _FACTORY_ID_SEPARATOR
+                )
+                if separator:
+                    plugin_ids.add(plugin_id)
+            else:
+                _collect_plugin_ids(stream, plugin_ids)
+    elif character == "[":
+        for _ in stream.iter_array():
+            _collect_plugin_ids(stream, plugin_ids)
+    else:
+        stream.read_value()
+
+
+class PluginIndex(HasStrictTraits):
+    """ Persistent mapping between the `force.bdss.extensions` entry
+    points and the ids of the plugins they provide.
+
+    Plugin ids are only known once the plugin is imported and instantiated.
+    The index remembers them between executions, so that the application
+    can load only the plugins required by a workflow.
+    """
+
+    #: Path of the index file. If empty, the index is not persisted.
+    path = Str()
+
+    #: Plugin ids, by entry point key (see `entry_point_key`)
+    plugin_ids = Dict(Str, Str)
+
+    #: Whether the index was modified since it was loaded
+    modified = Bool(False)
+
+    @classmethod
+    def from_path(cls, path):
+        """ Loads the index from `path`. A missing or invalid index file
+        results in an empty index."""
+        index = cls(path=path)
+        if not path:
+            return index
+        try:
+            with open(path) as fp:
+                plugin_ids = json.load(fp)
+            index.plugin_ids = {
+                str(key): str(value) for key, value in plugin_ids.items()
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            log.warning(f"Ignoring invalid plugin index '{path}': {e}")
+        return index
+
+    def get(self, entry_point):
+        """ Returns the plugin id provided by `entry_point`, or None if
+        the entry point is not indexed."""
+        return self.plugin_ids.get(entry_point_key(entry_point))
+
+    def update(self, entry_point, plugin_id):
+        """ Records the plugin id provided by `entry_point`."""
+        key = entry_point_key(entry_point)
+        if self.plugin_ids.get(key) != plugin_id:
+            self.plugin_ids[key] = plugin_id
+            self.modified = True
+
+    def save(self):
+        """ Writes the index file, if the index was modified. Failures are
+        logged, since the index is only an optimization."""
+        if not self.path or not self.modified:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w") as fp:
+                json.dump(self.plugin_ids, fp, indent=4, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            log.debug(f"Unable to save plugin index '{self.path}': {e}")
+            return
+        self.modified = False
@@ -1,6 +1,7 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import threading
 from unittest import TestCase, mock
 
 import testfixtures
@@ -12,9 +13,12 @@ from force_bdss.tests.probe_classes.workflow_file import (
 )
 from force_bdss.tests.probe_classes.notification_listener import (
     ProbeUIEventNotificationListener)
+from force_bdss.core.data_value import DataValue
 from force_bdss.events.mco_events import (
     MCOStartEvent,
-    MCOFinishEvent
+    MCOFinishEvent,
+    MCOProgressEvent,
+    MCOProgressBatchEvent
 )
 
 
@@ -169,3 +173,114 @@ class TestBaseOperation(TestCase):
                     "will continue.",
                 )
             )
+
+    def test_deliver_progress_batches(self):
+        delivered = []
+
+        def deliver_function(event):
+            delivered.append(event)
+
+        factory = self.registry.notification_listener_factories[0]
+        factory.deliver_function = deliver_function
+
+        self.operation._initialize_listeners()
+        listener = self.operation.listeners[0]
+        listener.accepts_progress_batches = True
+        listener.progress_batch_interval = 1000
+
+        mco_model = self.operation.workflow.mco_model
+        self.operation._deliver_start_event()
+        for index in range(3):
+            mco_model.notify_progress_event(
+                [DataValue(value=index)], [DataValue(value=index)]
+            )
+
+        # The first progress event is released straight away, the
+        # following are held back by the rate limit
+        self.assertEqual(2, len(delivered))
+        self.assertIsInstance(delivered[0], MCOStartEvent)
+        self.assertIsInstance(delivered[1], MCOProgressBatchEvent)
+        self.assertEqual(1, len(delivered[1].progress_events))
+
+        # Pending progress events are delivered before any other event
+        self.operation._deliver_finish_event()
+        self.assertEqual(4, len(delivered))
+        self.assertIsInstance(delivered[2], MCOProgressBatchEvent)
+        self.assertEqual(
+            [1, 2],
+            [event.optimal_point[0].value
+             for event in delivered[2].progress_events]
+        )
+        self.assertIsInstance(delivered[3], MCOFinishEvent)
+
+        # Pending progress events are delivered upon finalization
+        mco_model.notify_progress_event(
+            [DataValue(value=3)], [DataValue(value=3)]
+        )
+        self.assertEqual(4, len(delivered))
+        self.operation._finalize_listeners()
+        self.assertEqual(5, len(delivered))
+        self.assertIsInstance(delivered[4], MCOProgressBatchEvent)
+        self.assertTrue(listener.finalize_called)
+        self.assertEqual({}, self.operation._progress_coalescers)
+
+    def test_deliver_due_progress_batches(self):
+        delivered = []
+        batch_delivered = threading.Event()
+
+        def deliver_function(event):
+            delivered.append(event)
+            if len(delivered) == 2:
+                batch_delivered.set()
+
+        factory = self.registry.notification_listener_factories[0]
+        factory.deliver_function = deliver_function
+
+        self.operation._initialize_listeners()
+        listener = self.operation.listeners[0]
+        listener.accepts_progress_batches = True
+        listener.progress_batch_interval = 0.05
+
+        mco_model = self.operation.workflow.mco_model
+        for index in range(2):
+            mco_model.notify_progress_event(
+                [DataValue(value=index)], [DataValue(value=index)]
+            )
+
+        # The pending progress event is delivered once it is due, without
+        # waiting for the next event
+        self.assertTrue(batch_delivered.wait(5.0))
+        self.assertIsInstance(delivered[1], MCOProgressBatchEvent)
+        self.assertEqual(
+            [1],
+            [event.optimal_point[0].value
+             for event in delivered[1].progress_events]
+        )
+
+        flusher = self.operation._batch_flusher
+        self.operation._finalize_listeners()
+        self.assertFalse(flusher.is_alive())
+        self.assertIsNone(self.operation._batch_flusher)
+        self.assertEqual(2, len(delivered))
+
+    def test_deliver_progress_events_no_batches(self):
+        delivered = []
+
+        def deliver_function(event):
+            delivered.append(event)
+
+        factory = self.registry.notification_listener_factories[0]
+        factory.deliver_function = deliver_function
+
+        self.operation._initialize_listeners()
+        mco_model = self.operation.workflow.mco_model
+        for index in range(3):
+            mco_model.notify_progress_event(
+                [DataValue(value=index)], [DataValue(value=index)]
+            )
+
+        self.assertEqual(3, len(delivered))
+        for event in delivered:
+            self.assertIsInstance(event, MCOProgressEvent)
+        self.assertEqual({}, self.operation._progress_coalescers)
+        self.assertIsNone(self.operation._batch_flusher)
@@ -1,8 +1,11 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import os
+import tempfile
 import unittest
 import warnings
+from types import SimpleNamespace
 
 import testfixtures
 
@@ -11,9 +14,27 @@ from traits.etsconfig.api import ETSConfig
 from force_bdss.app.bdss_application import (
     BDSSApplication, _load_failure_callback, _import_extensions
 )
+from force_bdss.app.memory_diagnostics import MemoryDiagnostics
+from force_bdss.app.operation_profiler import OperationProfiler
 from force_bdss.app.optimize_operation import OptimizeOperation
+from force_bdss.app.plugin_index import PLUGIN_INDEX_ENV_VAR, PluginIndex
 from force_bdss.core.workflow import Workflow
+from force_bdss.core_plugins.core_listeners_plugin import (
+    CORE_LISTENERS_PLUGIN_ID
+)
+from force_bdss.mco.distributed.distributed_evaluator import (
+    DistributedEvaluator
+)
+from force_bdss.notification_listeners.event_stream_listener import (
+    EventStreamListenerModel
+)
+from force_bdss.notification_listeners.metrics_listener import (
+    MetricsListenerModel
+)
 from force_bdss.tests import fixtures
+from force_bdss.tests.probe_classes.probe_extension_plugin import (
+    ProbeExtensionPlugin
+)
 
 from unittest import mock
 
@@ -23,6 +44,37 @@ def clear_toolkit():
     ETSConfig._toolkit = None
 
 
+class FakeExtensionManager:
+    """ Replaces the stevedore NamedExtensionManager, recording the names
+    of the loaded entry points."""
+
+    #: Installed plugin ids, by entry point name
+    plugin_ids = {}
+
+    #: Names of the entry points loaded by each manager
+    loaded_names = []
+
+    def __init__(self, namespace, names, **kwargs):
+        self.extensions = []
+        if not names:
+            return
+        self.loaded_names.append(sorted(names))
+        for entry_point in self.list_entry_points():
+            if entry_point.name in names:
+                self.extensions.append(SimpleNamespace(
+                    entry_point=entry_point,
+                    obj=SimpleNamespace(
+                        id=self.plugin_ids[entry_point.name]
+                    )
+                ))
+
+    def list_entry_points(self):
+        return [
+            SimpleNamespace(name=name, value=f"{name}:Plugin")
+            for name in sorted(self.plugin_ids)
+        ]
+
+
 class TestBDSSApplication(unittest.TestCase):
 
     def setUp(self):
@@ -53,6 +105,109 @@ class TestBDSSApplication(unittest.TestCase):
                 BDSSApplication(False, "foo/bar")
         self.assertEqual(ETSConfig.toolkit, 'null')
 
+    def test_lazy_plugin_loading(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        index_path = os.path.join(temp_dir.name, "index.json")
+        FakeExtensionManager.plugin_ids = {
+            "other": "force.bdss.enthought.plugin.other.v0",
+            "test": "force.bdss.enthought.plugin.test.v0",
+        }
+        FakeExtensionManager.loaded_names = loaded_names = []
+
+        def load_plugins(workflow_path):
+            del loaded_names[:]
+            plugins = []
+            with mock.patch.dict(
+                    os.environ, {PLUGIN_INDEX_ENV_VAR: index_path}), \
+                    mock.patch(
+                        "force_bdss.app.bdss_application."
+                        "NamedExtensionManager", FakeExtensionManager), \
+                    testfixtures.LogCapture():
+                app = BDSSApplication.__new__(BDSSApplication)
+                app._load_plugins(plugins, workflow_path)
+            return sorted(plugin.id for plugin in plugins)
+
+        # Without index, all plugins are loaded and indexed
+        probe_workflow = fixtures.get("test_probe.json")
+        self.assertEqual(2, len(load_plugins(probe_workflow)))
+        self.assertEqual([["other", "test"]], loaded_names)
+        self.assertEqual(
+            "force.bdss.enthought.plugin.test.v0",
+            PluginIndex.from_path(index_path).plugin_ids["test=test:Plugin"]
+        )
+
+        # Only the plugins referenced in the workflow are then loaded
+        self.assertEqual(
+            ["force.bdss.enthought.plugin.test.v0"],
+            load_plugins(probe_workflow)
+        )
+        self.assertEqual([["test"]], loaded_names)
+        self.assertEqual([], load_plugins(fixtures.get("test_empty.json")))
+        self.assertEqual([], loaded_names)
+
+        # The core listeners are only loaded if the workflow uses them
+        self.assertEqual(
+            [CORE_LISTENERS_PLUGIN_ID],
+            load_plugins(fixtures.get("test_core_listeners.json"))
+        )
+        self.assertEqual([], loaded_names)
+
+        # Unreadable workflows load all the plugins
+        self.assertEqual(3, len(load_plugins("foo/bar")))
+        self.assertIn(CORE_LISTENERS_PLUGIN_ID, load_plugins(None))
+
+        # Plugins missing from the index are loaded when a required
+        # plugin is not indexed
+        FakeExtensionManager.plugin_ids["new"] = (
+            "force.bdss.enthought.plugin.new.v0"
+        )
+        new_workflow = os.path.join(temp_dir.name, "workflow.json")
+        with open(new_workflow, "w") as fp:
+            fp.write(
+                '{"mco": {"id": '
+                '"force.bdss.enthought.plugin.new.v0.factory.mco"}}'
+            )
+        self.assertEqual(
+            ["force.bdss.enthought.plugin.new.v0"],
+            load_plugins(new_workflow)
+        )
+        self.assertEqual([["new"]], loaded_names)
+
+        # All plugins are loaded when the index is outdated
+        FakeExtensionManager.plugin_ids["test"] = (
+            "force.bdss.enthought.plugin.test.v1"
+        )
+        self.assertEqual(3, len(load_plugins(probe_workflow)))
+        self.assertEqual([["test"], ["new", "other"]], loaded_names)
+
+    def test_no_plugin_index(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        index_path = os.path.join(temp_dir.name, "index.json")
+        FakeExtensionManager.plugin_ids = {
+            "other": "force.bdss.enthought.plugin.other.v0",
+            "test": "force.bdss.enthought.plugin.test.v0",
+        }
+        FakeExtensionManager.loaded_names = loaded_names = []
+
+        with mock.patch.dict(
+                os.environ, {PLUGIN_INDEX_ENV_VAR: index_path}), \
+                mock.patch(
+                    "force_bdss.app.bdss_application."
+                    "NamedExtensionManager", FakeExtensionManager), \
+                testfixtures.LogCapture():
+            app = BDSSApplication.__new__(BDSSApplication)
+            for _ in range(2):
+                app._load_plugins(
+                    [], fixtures.get("test_probe.json"),
+                    plugin_index=False
+                )
+
+        # Without index, all the plugins are always loaded
+        self.assertEqual([["other", "test"], ["other", "test"]], loaded_names)
+        self.assertFalse(os.path.exists(index_path))
+
     def test_extension_load_failure(self):
         plugins = []
         with testfixtures.LogCapture() as log:
@@ -99,6 +254,201 @@ class TestBDSSApplication(unittest.TestCase):
 
         self.assertIsInstance(app.workflow_file.workflow, Workflow)
 
+    def test_workflow_core_listeners(self):
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    False, fixtures.get("test_core_listeners.json")
+                )
+                app.start()
+                self.addCleanup(app.stop)
+                app._load_workflow()
+
+        listeners = app.workflow_file.workflow.notification_listeners
+        self.assertEqual(2, len(listeners))
+        self.assertIsInstance(listeners[0], EventStreamListenerModel)
+        self.assertEqual("binary", listeners[0].serialization)
+        self.assertIsInstance(listeners[1], MetricsListenerModel)
+        self.assertEqual(0, listeners[1].port)
+
+    def test_checkpoint(self):
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    False, fixtures.get("test_empty.json"),
+                    operation_options={"checkpoint_file": "foo.checkpoint"}
+                )
+        self.assertEqual("foo.checkpoint", app.operation.checkpoint_file)
+        self.assertFalse(app.operation.resume)
+
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    False, fixtures.get("test_empty.json"),
+                    operation_options={"resume": True}
+                )
+        self.assertEqual(
+            fixtures.get("test_empty.json") + ".checkpoint",
+            app.operation.checkpoint_file
+        )
+        self.assertTrue(app.operation.resume)
+
+        with self.assertRaisesRegex(
+                ValueError, "evaluate operation: checkpoint_file, resume"):
+            BDSSApplication(
+                True, fixtures.get("test_empty.json"),
+                operation_options={"resume": True}
+            )
+
+    def test_evaluation_history(self):
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    False, fixtures.get("test_empty.json"),
+                    operation_options={
+                        "evaluation_history": ["foo.csv", "bar.csv"]
+                    }
+                )
+        self.assertEqual(
+            ["foo.csv", "bar.csv"], app.operation.evaluation_history
+        )
+
+        with self.assertRaisesRegex(
+                ValueError, "evaluate operation: evaluation_history"):
+            BDSSApplication(
+                True, fixtures.get("test_empty.json"),
+                operation_options={"evaluation_history": ["foo.csv"]}
+            )
+
+    def test_snapshot(self):
+        path = fixtures.get("test_empty.json")
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(False, path, snapshot=True)
+        self.assertEqual(
+            path + ".snapshot", app.workflow_file.snapshot_path
+        )
+
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(False, path)
+        self.assertEqual("", app.workflow_file.snapshot_path)
+
+    def test_profile(self):
+        path = fixtures.get("test_empty.json")
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(False, path)
+                self.assertIsNone(app.profiler)
+
+                app = BDSSApplication(False, path, profile=True)
+                self.assertEqual(path + ".prof", app.profiler.path)
+                self.assertFalse(app.profiler.per_data_source)
+
+                app = BDSSApplication(
+                    False, path, profile=True, profile_data_sources=True
+                )
+                self.assertTrue(app.profiler.per_data_source)
+
+    def test_memory_diagnostics(self):
+        path = fixtures.get("test_empty.json")
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(False, path)
+                self.assertIsNone(app.operation.memory_diagnostics)
+
+                diagnostics = MemoryDiagnostics(interval=100)
+                app = BDSSApplication(
+                    False, path,
+                    operation_options={"memory_diagnostics": diagnostics}
+                )
+                self.assertIs(diagnostics, app.operation.memory_diagnostics)
+
+                with self.assertRaisesRegex(
+                        ValueError, "evaluate operation: memory_diagnostics"):
+                    BDSSApplication(
+                        True, path,
+                        operation_options={"memory_diagnostics": diagnostics}
+                    )
+
+    def test_distributed_evaluator(self):
+        path = fixtures.get("test_empty.json")
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                evaluator = DistributedEvaluator(host="node1", port=9000)
+                app = BDSSApplication(
+                    False, path,
+                    operation_options={"distributed_evaluator": evaluator}
+                )
+                self.assertIs(evaluator, app.operation.distributed_evaluator)
+
+                with self.assertRaises(ValueError):
+                    BDSSApplication(
+                        True, path,
+                        operation_options={"distributed_evaluator": evaluator}
+                    )
+
+    def test_run_workflow_profile(self):
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    False, fixtures.get("test_empty.json"), profile=True
+                )
+        with mock.patch.object(
+                OperationProfiler, "profile", autospec=True) as profile:
+            app._run_workflow()
+        profile.assert_called_once_with(app.profiler, app.operation)
+
+    def test_serve(self):
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    True, fixtures.get("test_empty.json"),
+                    operation_options={"serve": True}
+                )
+        self.assertTrue(app.operation.serve)
+        self.assertEqual("", app.operation.serve_address)
+
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    True, fixtures.get("test_empty.json"),
+                    operation_options={
+                        "serve": True, "serve_address": "worker.sock"
+                    }
+                )
+        self.assertTrue(app.operation.serve)
+        self.assertEqual("worker.sock", app.operation.serve_address)
+
+        with self.assertRaisesRegex(ValueError, "optimize operation: serve"):
+            BDSSApplication(
+                False, fixtures.get("test_empty.json"),
+                operation_options={"serve": True}
+            )
+
+    def test_extra_plugins(self):
+        plugin = ProbeExtensionPlugin()
+        with testfixtures.LogCapture():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                app = BDSSApplication(
+                    False, fixtures.get("test_probe.json"),
+                    extra_plugins=[plugin]
+                )
+        self.assertIs(plugin, app.get_plugin(plugin.id))
+
     def test_run_workflow_error(self):
 
         with testfixtures.LogCapture() as capture:
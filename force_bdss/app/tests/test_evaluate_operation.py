@@ -1,12 +1,20 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from unittest import TestCase
+import io
+import logging
+import os
+import socket
+import tempfile
+import threading
+from unittest import TestCase, mock
 
 import testfixtures
 
 from force_bdss.app.evaluate_operation import EvaluateOperation
 from force_bdss.core.data_value import DataValue
+from force_bdss.core.workflow import Workflow
+from force_bdss.mco.stream_mco_communicator import StreamMCOCommunicator
 from force_bdss.tests import fixtures
 from force_bdss.tests.probe_classes.workflow_file import (
     ProbeWorkflowFile
@@ -45,7 +53,8 @@ class TestEvaluateOperation(TestCase):
         self.assertIsNotNone(operation.workflow)
 
     def test_run(self):
-        with testfixtures.LogCapture() as capture:
+        # The trace of the evaluation is not enabled at the INFO level
+        with testfixtures.LogCapture(level=logging.INFO) as capture:
             self.operation.run()
             capture.check(
                 ('force_bdss.app.evaluate_operation',
@@ -67,6 +76,157 @@ class TestEvaluateOperation(TestCase):
                  'INFO', 'Aggregating KPI data')
             )
 
+    def stream_communicator(self, requests=""):
+        communicator = StreamMCOCommunicator(
+            self.registry.mco_factories[0],
+            input_stream=io.StringIO(requests),
+            output_stream=io.StringIO(),
+        )
+        patcher = mock.patch.object(
+            EvaluateOperation, "create_mco_communicator",
+            return_value=communicator
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return communicator
+
+    def test_run_serve(self):
+        communicator = self.stream_communicator("1.0\n2.0\n3.0\n")
+        self.operation.serve = True
+        with mock.patch.object(
+                Workflow, "execute",
+                side_effect=lambda data_values: [
+                    DataValue(value=2 * data_values[0].value)
+                ]) as execute, \
+                testfixtures.LogCapture() as capture:
+            self.operation.run()
+
+        self.assertEqual(3, execute.call_count)
+        self.assertEqual(
+            "2.0\n4.0\n6.0\n", communicator.output_stream.getvalue()
+        )
+        capture.check_present(
+            ('force_bdss.app.evaluate_operation',
+             'INFO', 'Evaluated 3 points (0 failed)')
+        )
+
+    def test_run_serve_failed_request(self):
+        communicator = self.stream_communicator("-1.0\n3.0\n")
+        self.operation.serve = True
+
+        def execute(data_values):
+            if data_values[0].value < 0:
+                raise ValueError("Negative value")
+            return [DataValue(value=2 * data_values[0].value)]
+
+        with mock.patch.object(
+                Workflow, "execute", side_effect=execute) as execute, \
+                testfixtures.LogCapture() as capture:
+            self.operation.run()
+
+        # The first request can not be evaluated: it is answered with the
+        # failure KPI values
+        self.assertEqual(2, execute.call_count)
+        self.assertEqual(
+            "nan\n6.0\n", communicator.output_stream.getvalue()
+        )
+        capture.check_present(
+            ('force_bdss.app.evaluate_operation',
+             'ERROR',
+             'Unable to evaluate the MCO request. Sending the failure KPI '
+             'values.'),
+            ('force_bdss.app.evaluate_operation',
+             'INFO', 'Evaluated 2 points (1 failed)')
+        )
+
+    def test_run_serve_invalid_request(self):
+        communicator = self.stream_communicator("1.0\n1.0 2.0\n3.0\n")
+        self.operation.serve = True
+
+        # A request that can not be parsed stops the operation
+        with mock.patch.object(
+                Workflow, "execute",
+                return_value=[DataValue(value=2.0)]) as execute, \
+                testfixtures.LogCapture():
+            with self.assertRaisesRegex(ValueError, "2 values"):
+                self.operation.run()
+        self.assertEqual(1, execute.call_count)
+        self.assertEqual("2.0\n", communicator.output_stream.getvalue())
+
+    def test_run_serve_stop_event(self):
+        communicator = self.stream_communicator("1.0\n2.0\n")
+        self.operation.serve = True
+
+        def execute(data_values):
+            self.operation._stop_event.set()
+            return [DataValue(value=2 * data_values[0].value)]
+
+        with mock.patch.object(
+                Workflow, "execute", side_effect=execute) as execute, \
+                testfixtures.LogCapture():
+            self.operation.run()
+
+        self.assertEqual(1, execute.call_count)
+        self.assertEqual("2.0\n", communicator.output_stream.getvalue())
+
+    def test_run_single_point(self):
+        communicator = self.stream_communicator("1.0\n2.0\n")
+        with testfixtures.LogCapture():
+            self.operation.run()
+        self.assertEqual("None\n", communicator.output_stream.getvalue())
+
+        # Without requests, a single point evaluation fails
+        self.stream_communicator()
+        with testfixtures.LogCapture():
+            with self.assertRaises(EOFError):
+                self.operation.run()
+
+    def test_run_serve_socket(self):
+        self.stream_communicator()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "worker.sock")
+
+        self.operation.serve = True
+        self.operation.serve_address = path
+        self.operation.poll_interval = 0.05
+
+        thread = threading.Thread(target=self.operation.run)
+        with testfixtures.LogCapture():
+            thread.start()
+            try:
+                for _ in range(2):
+                    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    client.settimeout(5.0)
+                    for _ in range(100):
+                        try:
+                            client.connect(path)
+                            break
+                        except (FileNotFoundError, ConnectionRefusedError):
+                            threading.Event().wait(0.01)
+                    with client, client.makefile("rw") as stream:
+                        for value in ["1.0", "2.0"]:
+                            stream.write(value + "\n")
+                            stream.flush()
+                            self.assertEqual("None\n", stream.readline())
+            finally:
+                self.operation._stop_event.set()
+                thread.join(5.0)
+
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(path))
+
+    def test_serve_requires_stream_communicator(self):
+        self.operation.serve = True
+        with testfixtures.LogCapture():
+            with self.assertRaisesRegex(TypeError, "StreamMCOCommunicator"):
+                self.operation.run()
+
+        self.operation.serve_address = "worker.sock"
+        with testfixtures.LogCapture():
+            with self.assertRaisesRegex(TypeError, "StreamMCOCommunicator"):
+                self.operation.run()
+
     def test_run_missing_mco(self):
         # Test for missing MCO
         self.operation.workflow.mco_model = None
@@ -177,7 +337,7 @@ class TestEvaluateOperation(TestCase):
             with self.assertRaises(Exception):
                 self.operation.run()
             capture.check(
-                 ('force_bdss.data_sources.base_data_source_model',
+                 ('force_bdss.data_sources.base_data_source_factory',
                   'ERROR',
                   'Unable to create data source from factory '
                   "'force.bdss.enthought.plugin.test.v0.factory."
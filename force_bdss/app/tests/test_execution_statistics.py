@@ -0,0 +1,111 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import math
+import random
+import unittest
+
+import testfixtures
+
+from force_bdss.app.execution_statistics import (
+    ExecutionStatistics,
+    RunningDistribution,
+    percentile,
+)
+from force_bdss.events.data_source_events import DataSourceFinishEvent
+from force_bdss.events.execution_events import (
+    ExecutionLayerFinishEvent,
+    WorkflowExecutionFinishEvent,
+)
+from force_bdss.events.mco_events import (
+    MCOFinishEvent,
+    MCOProgressEvent,
+    MCOStartEvent,
+)
+
+
+class TestExecutionStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.statistics = ExecutionStatistics()
+
+    def record_evaluation(self, wall_time):
+        for event in [
+            DataSourceFinishEvent(
+                data_source_name="Adder", output_names=["a", "b"],
+                wall_time=wall_time, cpu_time=wall_time / 2,
+                peak_rss_delta=2 ** 20,
+            ),
+            ExecutionLayerFinishEvent(layer_index=0, wall_time=wall_time),
+            WorkflowExecutionFinishEvent(wall_time=wall_time),
+            MCOProgressEvent(),
+        ]:
+            self.statistics.record(event)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(50, percentile(values, 50))
+        self.assertEqual(95, percentile(values, 95))
+        self.assertEqual(100, percentile(values, 100))
+        self.assertEqual(1, percentile(values, 0))
+        self.assertEqual(7, percentile([7], 95))
+
+    def test_running_distribution(self):
+        distribution = RunningDistribution(reservoir_size=100)
+        self.assertTrue(math.isnan(distribution.mean))
+
+        values = list(range(1, 10001))
+        random.Random(1).shuffle(values)
+        for value in values:
+            distribution.add(value)
+
+        self.assertEqual(10000, distribution.count)
+        self.assertEqual(sum(values), distribution.total)
+        self.assertEqual(1, distribution.minimum)
+        self.assertEqual(10000, distribution.maximum)
+        self.assertEqual(5000.5, distribution.mean)
+        # The memory used is bounded, and the quantiles estimated from a
+        # uniform sample of the values
+        self.assertEqual(100, len(distribution.reservoir))
+        self.assertAlmostEqual(5000, distribution.quantile(50), delta=1500)
+        self.assertAlmostEqual(9500, distribution.quantile(95), delta=500)
+
+    def test_record(self):
+        self.statistics.record(MCOStartEvent())
+        for index in range(20):
+            self.record_evaluation(0.1 * (index + 1))
+
+        self.assertEqual(
+            ["Data source 'Adder' (a, b)", "Execution layer 0", "Workflow"],
+            list(self.statistics.aggregates)
+        )
+        summary = self.statistics.summary()
+        self.assertEqual(3, len(summary))
+        self.assertEqual(
+            "Data source 'Adder' (a, b): 20 calls, "
+            "wall time mean 1.05 s, p50 1 s, p95 1.9 s, max 2 s, "
+            "CPU time mean 0.525 s, p50 0.5 s, p95 0.95 s, max 1 s, "
+            "peak RSS increase max 1.0 MiB",
+            summary[0]
+        )
+
+        # A new MCO run clears the aggregates
+        self.statistics.record(MCOStartEvent())
+        self.assertEqual({}, self.statistics.aggregates)
+
+    def test_summary_logged_at_mco_finish(self):
+        self.record_evaluation(0.5)
+        with testfixtures.LogCapture() as capture:
+            self.statistics.record(MCOFinishEvent())
+        messages = [record.getMessage() for record in capture.records]
+        self.assertEqual(
+            ["Resource usage of the workflow execution:"]
+            + self.statistics.summary(),
+            messages
+        )
+
+        # Nothing is logged without aggregates
+        self.statistics.record(MCOStartEvent())
+        with testfixtures.LogCapture() as capture:
+            self.statistics.record(MCOFinishEvent())
+        capture.check()
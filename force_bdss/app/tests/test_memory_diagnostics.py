@@ -0,0 +1,102 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import tracemalloc
+import unittest
+from unittest import mock
+
+import testfixtures
+
+from force_bdss.app.memory_diagnostics import MemoryDiagnostics
+from force_bdss.core.data_value import DataValue
+from force_bdss.tests import fixtures
+from force_bdss.tests.probe_classes.workflow_file import ProbeWorkflowFile
+
+LOGGER = "force_bdss.app.memory_diagnostics"
+
+
+class TestMemoryDiagnostics(unittest.TestCase):
+
+    def setUp(self):
+        workflow_file = ProbeWorkflowFile(path=fixtures.get("test_probe.json"))
+        workflow_file.read()
+        self.workflow = workflow_file.workflow
+
+        # A leaking data source
+        leaked = []
+
+        def leaking_run(model, parameters):
+            leaked.append(bytearray(100000))
+            return [DataValue()]
+
+        factory = self.workflow.execution_layers[0].data_sources[0].factory
+        factory.run_function = leaking_run
+
+        self.diagnostics = MemoryDiagnostics(
+            interval=5, n_top=3, rss_growth_threshold=1024.0
+        )
+
+    def test_samples(self):
+        with testfixtures.LogCapture(LOGGER) as capture:
+            self.diagnostics.start(self.workflow)
+            self.assertTrue(tracemalloc.is_tracing())
+            for index in range(12):
+                self.workflow.evaluate([float(index)])
+            self.diagnostics.stop(self.workflow)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        self.assertEqual(12, self.diagnostics.n_evaluations)
+        self.assertEqual(
+            [0, 5, 10, 12],
+            [sample[0] for sample in self.diagnostics.samples]
+        )
+        traced = [sample[1] for sample in self.diagnostics.samples]
+        self.assertGreater(traced[1] - traced[0], 5 * 100000)
+
+        messages = [record.getMessage() for record in capture.records]
+        self.assertIn("Memory after 5 evaluations: traced", messages[1])
+        lines = messages[2].split("\n")
+        self.assertEqual(
+            "Top 3 growing allocation sites in the last 5 evaluations:",
+            lines[0]
+        )
+        # The leaking line is the top growing site
+        self.assertIn("test_memory_diagnostics.py", lines[1])
+        self.assertIn(
+            "growing allocation sites since the start of the run (12 "
+            "evaluations):",
+            messages[-1]
+        )
+
+        # Evaluations after the stop are not counted
+        self.workflow.evaluate([1.0])
+        self.assertEqual(12, self.diagnostics.n_evaluations)
+
+    def test_rss_growth_warning(self):
+        rss_values = iter([0, 1000, 2 * 2 ** 20])
+        with mock.patch(
+                "force_bdss.app.memory_diagnostics.current_rss",
+                side_effect=lambda: next(rss_values)), \
+                testfixtures.LogCapture(LOGGER) as capture:
+            self.diagnostics.start(self.workflow)
+            for index in range(10):
+                self.workflow.evaluate([float(index)])
+            self.diagnostics.stop(self.workflow)
+
+        warnings = [
+            record.getMessage() for record in capture.records
+            if record.levelname == "WARNING"
+        ]
+        self.assertEqual(1, len(warnings))
+        self.assertIn(
+            "The RSS grew by 409.4 KiB per evaluation in the last 5 "
+            "evaluations", warnings[0]
+        )
+
+    def test_tracing_already_started(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        with testfixtures.LogCapture(LOGGER):
+            self.diagnostics.start(self.workflow)
+            self.diagnostics.stop(self.workflow)
+        self.assertTrue(tracemalloc.is_tracing())
@@ -0,0 +1,161 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import cProfile
+import json
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from types import SimpleNamespace
+
+import testfixtures
+
+from force_bdss.app.operation_profiler import (
+    OperationProfiler,
+    SPEEDSCOPE_SCHEMA,
+    default_profile_file,
+)
+from force_bdss.tests import fixtures
+from force_bdss.tests.probe_classes.workflow_file import ProbeWorkflowFile
+
+
+def profiled_function():
+    pass
+
+
+class TestOperationProfiler(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.path = os.path.join(tmpdir, "workflow.json.prof")
+
+        workflow_file = ProbeWorkflowFile(path=fixtures.get("test_probe.json"))
+        workflow_file.read()
+        self.workflow = workflow_file.workflow
+
+        def run():
+            profiled_function()
+            for _ in range(3):
+                self.workflow.evaluate([1.0])
+
+        self.operation = SimpleNamespace(workflow=self.workflow, run=run)
+
+    def test_default_profile_file(self):
+        self.assertEqual("foo.json.prof", default_profile_file("foo.json"))
+
+    def test_profile(self):
+        profiler = OperationProfiler(path=self.path)
+        with testfixtures.LogCapture():
+            profiler.profile(self.operation)
+
+        stats = pstats.Stats(self.path)
+        functions = [function for _, _, function in stats.stats]
+        self.assertIn("profiled_function", functions)
+        self.assertIn("run", functions)
+        self.assertEqual([self.path], [
+            os.path.join(os.path.dirname(self.path), name)
+            for name in os.listdir(os.path.dirname(self.path))
+        ])
+
+    def test_profile_per_data_source(self):
+        profiler = OperationProfiler(path=self.path, per_data_source=True)
+        with testfixtures.LogCapture():
+            profiler.profile(self.operation)
+
+        # Only the data source runs are profiled
+        root = os.path.splitext(self.path)[0]
+        self.assertFalse(os.path.exists(self.path))
+        data_source_stats = pstats.Stats(f"{root}.test_data_source.prof")
+        run_stats = [
+            value for (filename, _, function), value
+            in data_source_stats.stats.items()
+            if function == "run" and "probe_classes" in filename
+        ]
+        # Number of calls of the run method of the probe data source
+        self.assertEqual(3, run_stats[0][1])
+        self.assertNotIn(
+            "profiled_function",
+            [function for _, _, function in data_source_stats.stats]
+        )
+
+        with open(f"{root}.speedscope.json") as fp:
+            data = json.load(fp)
+        self.assertEqual(SPEEDSCOPE_SCHEMA, data["$schema"])
+        frames = [frame["name"] for frame in data["shared"]["frames"]]
+        self.assertEqual(
+            ["Evaluation", "Layer 0", "test_data_source"], frames
+        )
+        events = data["profiles"][0]["events"]
+        self.assertEqual(
+            ["O", "O", "O", "C", "C", "C"] * 3,
+            [event["type"] for event in events]
+        )
+        # The frames are properly nested, in chronological order
+        times = [event["at"] for event in events]
+        self.assertEqual(sorted(times), times)
+        open_frames = []
+        for event in events:
+            if event["type"] == "O":
+                open_frames.append(event["frame"])
+            else:
+                self.assertEqual(open_frames.pop(), event["frame"])
+        self.assertEqual(
+            times[-1], data["profiles"][0]["endValue"]
+        )
+
+    def test_profile_per_data_source_failure(self):
+        factory = self.workflow.execution_layers[0].data_sources[0].factory
+        calls = []
+
+        class RecordingProfile(cProfile.Profile):
+            def enable(self):
+                calls.append(("enable", self))
+                super().enable()
+
+            def disable(self):
+                calls.append(("disable", self))
+                super().disable()
+
+        def run():
+            factory.raises_on_data_source_run = True
+            with self.assertRaises(Exception):
+                self.workflow.evaluate([1.0])
+            factory.raises_on_data_source_run = False
+            for _ in range(2):
+                self.workflow.evaluate([1.0])
+
+        self.operation.run = run
+        profiler = OperationProfiler(path=self.path, per_data_source=True)
+        with mock.patch.object(cProfile, "Profile", RecordingProfile):
+            with testfixtures.LogCapture():
+                profiler.profile(self.operation)
+
+        # The profile of the failed run is disabled before the next run is
+        # profiled. The profiles are disabled again when written.
+        profiles = []
+        for method, profile in calls:
+            if profile not in profiles:
+                profiles.append(profile)
+        self.assertEqual(3, len(profiles))
+        self.assertEqual(
+            [("enable", profiles[0]), ("disable", profiles[0])]
+            + [("enable", profiles[1]), ("disable", profiles[1])]
+            + [("enable", profiles[2]), ("disable", profiles[2])],
+            calls[:6]
+        )
+        self.assertIsNone(sys.getprofile())
+
+        root = os.path.splitext(self.path)[0]
+        data_source_stats = pstats.Stats(f"{root}.test_data_source.prof")
+        run_stats = [
+            value for (filename, _, function), value
+            in data_source_stats.stats.items()
+            if function == "run" and "probe_classes" in filename
+        ]
+        # Only the successful runs are profiled
+        self.assertEqual(2, run_stats[0][1])
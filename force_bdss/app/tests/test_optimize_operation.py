@@ -1,17 +1,33 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import os
+import tempfile
+import threading
 from unittest import TestCase, mock
 
 import testfixtures
 
+from force_bdss.app.memory_diagnostics import MemoryDiagnostics
 from force_bdss.app.optimize_operation import OptimizeOperation
 from force_bdss.core.data_value import DataValue
 from force_bdss.events.mco_events import (
     MCOProgressEvent,
 )
 from force_bdss.mco.base_mco import BaseMCO
+from force_bdss.mco.distributed.distributed_evaluator import (
+    DistributedEvaluator
+)
+from force_bdss.mco.distributed.evaluation_worker import EvaluationWorker
+from force_bdss.mco.optimizer_engines.optimizer_checkpoint import (
+    OptimizerCheckpoint,
+    OptimizerCheckpointError,
+    optimization_fingerprint,
+)
 from force_bdss.tests import fixtures
+from force_bdss.tests.probe_classes.factory_registry import (
+    ProbeFactoryRegistry
+)
 from force_bdss.tests.probe_classes.workflow_file import ProbeWorkflowFile
 from force_bdss.tests.probe_classes.notification_listener import (
     ProbeUIEventNotificationListener)
@@ -26,6 +42,16 @@ class TestOptimizeOperation(TestCase):
         self.operation.workflow_file.read()
         self.registry = self.operation.workflow_file.reader.factory_registry
 
+    def write_checkpoint(self, path, state):
+        mco_model = self.operation.workflow.mco_model
+        checkpoint = OptimizerCheckpoint(
+            path=path,
+            fingerprint=optimization_fingerprint(
+                mco_model.parameters, mco_model.kpis
+            ),
+        )
+        checkpoint.save(state, force=True)
+
     def test__init__(self):
 
         operation = OptimizeOperation()
@@ -85,6 +111,107 @@ class TestOptimizeOperation(TestCase):
                 )
             )
 
+    def test_create_checkpoint(self):
+        self.assertIsNone(self.operation.create_checkpoint())
+
+        self.operation.resume = True
+        with self.assertRaisesRegex(RuntimeError, "checkpoint file"):
+            self.operation.create_checkpoint()
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "checkpoint.json")
+        self.write_checkpoint(path, {"a": 1})
+
+        self.operation.checkpoint_file = path
+        self.operation.checkpoint_interval = 5.0
+        checkpoint = self.operation.create_checkpoint()
+        self.assertIsInstance(checkpoint, OptimizerCheckpoint)
+        self.assertEqual(path, checkpoint.path)
+        self.assertEqual(5.0, checkpoint.interval)
+        self.assertEqual({"a": 1}, checkpoint.state)
+
+        self.operation.resume = False
+        checkpoint = self.operation.create_checkpoint()
+        self.assertEqual({}, checkpoint.state)
+
+    def test_create_checkpoint_changed_workflow(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "checkpoint.json")
+        self.write_checkpoint(path, {"a": 1})
+
+        self.operation.checkpoint_file = path
+        self.operation.resume = True
+        self.operation.workflow.mco_model.kpis[0].objective = "MAXIMISE"
+        with self.assertRaisesRegex(
+                OptimizerCheckpointError, "different MCO parameters"):
+            self.operation.create_checkpoint()
+
+    def test_run_checkpoint_not_restored(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "checkpoint.json")
+        self.write_checkpoint(path, {"a": 1})
+
+        self.operation.checkpoint_file = path
+        self.operation.resume = True
+        with self.assertLogs("force_bdss.app.optimize_operation") as logs:
+            self.operation.run()
+        self.assertIn(
+            "The optimization was not resumed from the checkpoint",
+            logs.output[0]
+        )
+
+    def test_create_checkpoint_evaluation_history(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        history_path = os.path.join(temp_dir.name, "output.csv")
+        with open(history_path, "w") as fp:
+            fp.write("bar,foo\n4.0,2.0\n9.0,3.0\n")
+
+        self.operation.evaluation_history = [history_path]
+        with testfixtures.LogCapture():
+            checkpoint = self.operation.create_checkpoint()
+        self.assertEqual("", checkpoint.path)
+        self.assertEqual(
+            {"kpi_cache": [[[2.0], [4.0]], [[3.0], [9.0]]]},
+            checkpoint.state
+        )
+
+        # The history is added to the state of a resumed optimization
+        path = os.path.join(temp_dir.name, "checkpoint.json")
+        self.write_checkpoint(path, {"kpi_cache": [[[1.0], [1.0]]], "a": 1})
+        self.operation.checkpoint_file = path
+        self.operation.resume = True
+        with testfixtures.LogCapture():
+            checkpoint = self.operation.create_checkpoint()
+        self.assertEqual(path, checkpoint.path)
+        self.assertEqual(
+            {
+                "kpi_cache": [[[1.0], [1.0]], [[2.0], [4.0]], [[3.0], [9.0]]],
+                "a": 1,
+            },
+            checkpoint.state
+        )
+
+    def test_run_evaluation_history_not_reused(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        history_path = os.path.join(temp_dir.name, "output.csv")
+        with open(history_path, "w") as fp:
+            fp.write("foo,bar\n2.0,4.0\n")
+
+        self.operation.evaluation_history = [history_path]
+        with self.assertLogs(
+                "force_bdss.app.optimize_operation", "WARNING") as logs:
+            self.operation.run()
+        self.assertIn(
+            "The evaluated points of the evaluation history were not "
+            "reused",
+            logs.output[0]
+        )
+
     def test_mco_run_exception(self):
         def run_func(*args, **kwargs):
             raise Exception("run_func")
@@ -110,6 +237,78 @@ class TestOptimizeOperation(TestCase):
                 )
             )
 
+    def test_resource_usage_summary(self):
+        def run_func(evaluator):
+            for value in [1.0, 2.0, 3.0]:
+                evaluator.evaluate([value])
+
+        mco_factory = self.registry.mco_factories[0]
+        mco_factory.optimizer.run_function = run_func
+
+        with testfixtures.LogCapture(
+                "force_bdss.app.execution_statistics") as capture:
+            self.operation.run()
+
+        messages = [record.getMessage() for record in capture.records]
+        self.assertEqual(
+            "Resource usage of the workflow execution:", messages[0]
+        )
+        self.assertEqual(4, len(messages))
+        self.assertIn("Data source 'test_data_source' (bar): 3 calls",
+                      messages[1])
+        self.assertIn("Execution layer 0: 3 calls", messages[2])
+        self.assertIn("Workflow: 3 calls", messages[3])
+
+    def test_memory_diagnostics(self):
+        def run_func(evaluator):
+            for value in [1.0, 2.0, 3.0]:
+                evaluator.evaluate([value])
+
+        mco_factory = self.registry.mco_factories[0]
+        mco_factory.optimizer.run_function = run_func
+        self.operation.memory_diagnostics = MemoryDiagnostics(interval=2)
+
+        with testfixtures.LogCapture("force_bdss.app.memory_diagnostics"):
+            self.operation.run()
+
+        self.assertEqual(
+            [0, 2, 3],
+            [sample[0] for sample in
+             self.operation.memory_diagnostics.samples]
+        )
+
+    def test_distributed_evaluator(self):
+        registry = ProbeFactoryRegistry()
+        registry.data_source_factories[0].run_function = (
+            lambda model, parameters: [
+                DataValue(value=2 * parameters[0].value)
+            ]
+        )
+        results = []
+
+        def run_func(evaluator):
+            self.assertIsInstance(evaluator, DistributedEvaluator)
+            worker = EvaluationWorker(
+                factory_registry=registry, address=evaluator.address
+            )
+            thread = threading.Thread(target=worker.run)
+            thread.start()
+            self.addCleanup(thread.join)
+            results.append(evaluator.evaluate([1.0]))
+            results.append(evaluator.evaluate([2.0]))
+
+        mco_factory = self.registry.mco_factories[0]
+        mco_factory.optimizer.run_function = run_func
+        self.operation.distributed_evaluator = DistributedEvaluator(
+            heartbeat_interval=0.1
+        )
+
+        with testfixtures.LogCapture():
+            self.operation.run()
+
+        self.assertEqual([[2.0], [4.0]], results)
+        self.assertEqual(0, len(self.operation.distributed_evaluator.workers))
+
     def test_progress_event_handling(self):
 
         self.operation._initialize_listeners()
@@ -0,0 +1,103 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from force_bdss.app.plugin_index import (
+    PLUGIN_INDEX_ENV_VAR,
+    PluginIndex,
+    default_plugin_index_path,
+    entry_point_key,
+    workflow_plugin_ids
+)
+from force_bdss.tests import fixtures
+
+
+def entry_point(name, value):
+    return SimpleNamespace(name=name, value=value)
+
+
+class TestPluginIndex(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.path = os.path.join(self.temp_dir, "cache", "index.json")
+
+    def test_default_plugin_index_path(self):
+        with mock.patch.dict(os.environ, {PLUGIN_INDEX_ENV_VAR: "foo"}):
+            self.assertEqual("foo", default_plugin_index_path())
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "cache"}):
+            os.environ.pop(PLUGIN_INDEX_ENV_VAR, None)
+            self.assertEqual(
+                os.path.join("cache", "force_bdss", "plugin_index.json"),
+                default_plugin_index_path()
+            )
+
+    def test_entry_point_key(self):
+        self.assertEqual(
+            "example=package.plugin:Plugin",
+            entry_point_key(entry_point("example", "package.plugin:Plugin"))
+        )
+
+    def test_workflow_plugin_ids(self):
+        self.assertEqual(
+            {"force.bdss.enthought.plugin.test.v0"},
+            workflow_plugin_ids(fixtures.get("test_probe.json"))
+        )
+        self.assertEqual(
+            set(), workflow_plugin_ids(fixtures.get("test_empty.json"))
+        )
+        self.assertIsNone(
+            workflow_plugin_ids(fixtures.get("test_nonexistent.json"))
+        )
+        path = os.path.join(self.temp_dir, "corrupted.json")
+        with open(path, "w") as fp:
+            fp.write("{")
+        self.assertIsNone(workflow_plugin_ids(path))
+
+    def test_save_load(self):
+        index = PluginIndex.from_path(self.path)
+        self.assertEqual({}, index.plugin_ids)
+        self.assertFalse(index.modified)
+
+        first = entry_point("first", "first:Plugin")
+        index.update(first, "force.bdss.first.plugin.a.v0")
+        self.assertTrue(index.modified)
+        index.save()
+        self.assertFalse(index.modified)
+
+        index.update(first, "force.bdss.first.plugin.a.v0")
+        self.assertFalse(index.modified)
+
+        index = PluginIndex.from_path(self.path)
+        self.assertEqual("force.bdss.first.plugin.a.v0", index.get(first))
+        self.assertIsNone(index.get(entry_point("first", "moved:Plugin")))
+
+    def test_not_persisted(self):
+        index = PluginIndex.from_path("")
+        index.update(entry_point("first", "first:Plugin"), "id")
+        index.save()
+        self.assertTrue(index.modified)
+
+    def test_invalid_index(self):
+        with open(os.path.join(self.temp_dir, "index.json"), "w") as fp:
+            json.dump([1, 2], fp)
+        with self.assertLogs("force_bdss.app.plugin_index", "WARNING"):
+            index = PluginIndex.from_path(
+                os.path.join(self.temp_dir, "index.json")
+            )
+        self.assertEqual({}, index.plugin_ids)
+
+    def test_save_failure(self):
+        index = PluginIndex(path=self.temp_dir)
+        index.update(entry_point("first", "first:Plugin"), "id")
+        with self.assertLogs("force_bdss.app.plugin_index", "DEBUG"):
+            index.save()
+        self.assertTrue(index.modified)
@@ -0,0 +1,46 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import threading
+import unittest
+
+import testfixtures
+
+from force_bdss.app.worker_application import WorkerApplication
+from force_bdss.mco.distributed.distributed_evaluator import (
+    DistributedEvaluator
+)
+from force_bdss.tests import fixtures
+from force_bdss.tests.probe_classes.probe_extension_plugin import (
+    ProbeExtensionPlugin
+)
+from force_bdss.tests.probe_classes.workflow_file import ProbeWorkflowFile
+
+
+class TestWorkerApplication(unittest.TestCase):
+
+    def test_run(self):
+        workflow_file = ProbeWorkflowFile(path=fixtures.get("test_probe.json"))
+        workflow_file.read()
+        evaluator = DistributedEvaluator(
+            workflow=workflow_file.workflow, heartbeat_interval=0.1
+        )
+
+        with testfixtures.LogCapture():
+            evaluator.start()
+            app = WorkerApplication(
+                evaluator.address, extra_plugins=[ProbeExtensionPlugin()]
+            )
+            thread = threading.Thread(target=app.run)
+            thread.start()
+            try:
+                self.assertEqual([None], evaluator.evaluate([1.0]))
+            finally:
+                evaluator.stop()
+                thread.join()
+
+        self.assertIs(app.factory_registry, app.worker.factory_registry)
+        self.assertEqual(1, app.worker.n_evaluations)
+        self.assertEqual(
+            "foo", app.worker.workflow.mco_model.parameters[0].name
+        )
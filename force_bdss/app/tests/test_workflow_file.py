@@ -1,10 +1,21 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from unittest import TestCase
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
 
+import testfixtures
+
+from force_bdss.app.workflow_file import WorkflowFile
+from force_bdss.core.verifier import VerifierError
 from force_bdss.core.workflow import Workflow
+from force_bdss.io.workflow_reader import WorkflowReader
 from force_bdss.tests import fixtures
+from force_bdss.tests.dummy_classes.factory_registry import (
+    DummyFactoryRegistry,
+)
 from force_bdss.tests.probe_classes.workflow_file import ProbeWorkflowFile
 
 
@@ -58,3 +69,86 @@ class TestWorkflowFile(TestCase):
             AttributeError, "No workflow writer specified."
         ):
             self.workflow_file.write()
+
+    def test_snapshot(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "workflow.json")
+        shutil.copy(fixtures.get("test_workflow_reader.json"), path)
+        snapshot_path = path + ".snapshot"
+        reader = WorkflowReader(DummyFactoryRegistry())
+
+        def read_and_verify():
+            workflow_file = WorkflowFile(
+                path=path, reader=reader, snapshot_path=snapshot_path
+            )
+            with mock.patch.object(
+                    Workflow, "verify", return_value=[]) as mock_verify, \
+                    mock.patch.object(
+                        WorkflowReader, "read",
+                        side_effect=WorkflowReader.read,
+                        autospec=True) as mock_read:
+                workflow_file.read()
+                workflow_file.verify()
+            self.assertEqual([], workflow_file.errors)
+            return mock_read.call_count, mock_verify.call_count
+
+        # The snapshot is written after the first verification, and used
+        # while the workflow file is unchanged. The workflow read from the
+        # snapshot is still verified.
+        self.assertEqual((1, 1), read_and_verify())
+        self.assertTrue(os.path.exists(snapshot_path))
+        self.assertEqual((0, 1), read_and_verify())
+
+        with open(path, "a") as fp:
+            fp.write("\n")
+        self.assertEqual((1, 1), read_and_verify())
+        self.assertEqual((0, 1), read_and_verify())
+
+    def test_snapshot_verified_on_load(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        snapshot_path = os.path.join(tmpdir, "workflow.json.snapshot")
+        self.workflow_file.path = fixtures.get("test_probe.json")
+        self.workflow_file.snapshot_path = snapshot_path
+        self.workflow_file.read()
+        self.workflow_file.verify()
+        self.assertTrue(os.path.exists(snapshot_path))
+
+        workflow_file = WorkflowFile(
+            path=self.workflow_file.path,
+            reader=self.workflow_file.reader,
+            snapshot_path=snapshot_path,
+        )
+        workflow_file.read()
+        self.assertTrue(workflow_file._from_snapshot)
+        error = VerifierError(subject=None, global_error="Plugin changed")
+        with mock.patch.object(
+                Workflow, "verify", return_value=[error]), \
+                mock.patch.object(WorkflowFile, "write_snapshot") as write:
+            workflow_file.verify()
+        self.assertEqual([error], workflow_file.errors)
+        write.assert_not_called()
+
+    def test_snapshot_not_written_with_errors(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        snapshot_path = os.path.join(tmpdir, "workflow.json.snapshot")
+
+        self.workflow_file.path = fixtures.get("test_empty.json")
+        self.workflow_file.snapshot_path = snapshot_path
+        self.workflow_file.read()
+        self.workflow_file.verify()
+
+        self.assertNotEqual([], self.workflow_file.errors)
+        self.assertFalse(os.path.exists(snapshot_path))
+
+    def test_snapshot_write_failure(self):
+        self.workflow_file.path = fixtures.get("test_probe.json")
+        self.workflow_file.snapshot_path = "foo/bar/workflow.json.snapshot"
+        self.workflow_file.read()
+        with testfixtures.LogCapture() as capture:
+            self.workflow_file.verify()
+        self.assertEqual([], self.workflow_file.errors)
+        message = capture.records[0].getMessage()
+        self.assertIn("Unable to write workflow snapshot", message)
@@ -0,0 +1,73 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import functools
+import logging
+
+from stevedore.extension import ExtensionManager
+
+from envisage.api import Application
+from envisage.core_plugin import CorePlugin
+from traits.api import Instance
+
+from force_bdss.core.i_factory_registry import IFactoryRegistry
+from force_bdss.core_plugins.factory_registry_plugin import (
+    FactoryRegistryPlugin
+)
+from force_bdss.mco.distributed.evaluation_worker import EvaluationWorker
+from .bdss_application import (
+    PLUGIN_NAMESPACE,
+    _import_extensions,
+    _load_failure_callback,
+)
+
+log = logging.getLogger(__name__)
+
+
+class WorkerApplication(Application):
+    """Application evaluating the workflow of a `DistributedEvaluator` in
+    an `EvaluationWorker`. All the installed BDSS plugins are loaded, since
+    the workflow is only known once it is received from the evaluator."""
+
+    id = "force.bdss_core.worker_application"
+
+    #: The factory registry for workflow components.
+    factory_registry = Instance(IFactoryRegistry)
+
+    #: The worker evaluating the workflow
+    worker = Instance(EvaluationWorker)
+
+    def __init__(self, address, extra_plugins=(), **traits):
+        plugins = [CorePlugin(), FactoryRegistryPlugin()]
+        plugins.extend(extra_plugins)
+        self._load_plugins(plugins)
+
+        super(WorkerApplication, self).__init__(
+            plugins=plugins,
+            worker=EvaluationWorker(address=address),
+            **traits
+        )
+
+    def run(self):
+        if self.start():
+            try:
+                self.worker.factory_registry = self.factory_registry
+                self.worker.run()
+            finally:
+                self.stop()
+
+    def _load_plugins(self, plugins):
+        """ Load all the installed plugins via Stevedore."""
+        mgr = ExtensionManager(
+            namespace=PLUGIN_NAMESPACE,
+            invoke_on_load=True,
+            on_load_failure_callback=functools.partial(_load_failure_callback,
+                                                       plugins)
+        )
+        for ext in mgr.extensions:
+            _import_extensions(plugins, ext)
+        if not mgr.extensions:
+            log.info("No extensions found")
+
+    def _factory_registry_default(self):
+        return self.get_service(IFactoryRegistry)
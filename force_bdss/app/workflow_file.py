@@ -1,13 +1,18 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from traits.api import File, HasStrictTraits, Instance, List
+import logging
+
+from traits.api import Bool, File, HasStrictTraits, Instance, List, Str
 
 from force_bdss.core.workflow import Workflow
 from force_bdss.core.verifier import VerifierError
 from force_bdss.io.workflow_reader import WorkflowReader
+from force_bdss.io.workflow_snapshot import source_hash
 from force_bdss.io.workflow_writer import WorkflowWriter
 
+log = logging.getLogger(__name__)
+
 
 class WorkflowFile(HasStrictTraits):
     """ A file which contains a serialized workflow. """
@@ -27,6 +32,19 @@ class WorkflowFile(HasStrictTraits):
     #: The workflow model writer for this file.
     writer = Instance(WorkflowWriter)
 
+    #: The path of the compiled snapshot of the workflow. If set, the
+    #: workflow is read from the snapshot when it is up to date, skipping
+    #: the parsing of the workflow, and the snapshot is written after a
+    #: successful verification.
+    snapshot_path = Str()
+
+    #: Hash of the content of the file, when the workflow was read
+    _source_hash = Str()
+
+    #: Whether the workflow was read from an up to date snapshot, and so
+    #: does not need to be written again
+    _from_snapshot = Bool(False)
+
     @classmethod
     def from_path(cls, path, **traits):
         workflow_file = cls(path=path, **traits)
@@ -38,6 +56,18 @@ class WorkflowFile(HasStrictTraits):
         if self.reader is None:
             raise AttributeError("No workflow reader specified.")
 
+        self._from_snapshot = False
+        if self.snapshot_path:
+            self._source_hash = source_hash(self.path)
+            workflow = self.reader.read_snapshot(
+                self.snapshot_path, self._source_hash
+            )
+            if workflow is not None:
+                log.info(f"Loaded workflow snapshot '{self.snapshot_path}'")
+                self.workflow = workflow
+                self._from_snapshot = True
+                return
+
         self.workflow = self.reader.read(self.path)
 
     def write(self):
@@ -48,5 +78,27 @@ class WorkflowFile(HasStrictTraits):
         self.writer.write(self.workflow, self.path)
 
     def verify(self):
-        """ Find any errors in the workflow. """
+        """ Find any errors in the workflow. A workflow read from a snapshot
+        is verified as well, since the snapshot does not track every change
+        of the plugins which could invalidate it."""
         self.errors = self.workflow.verify()
+        if self.errors or self._from_snapshot:
+            return
+        if self.snapshot_path:
+            self.write_snapshot()
+
+    def write_snapshot(self):
+        """ Write the compiled snapshot of the verified workflow. Failures
+        are logged, since the snapshot is only an optimization."""
+        writer = self.writer
+        if writer is None:
+            writer = WorkflowWriter()
+        try:
+            writer.write_snapshot(
+                self.workflow, self.snapshot_path, self._source_hash
+            )
+        except Exception as e:
+            log.warning(
+                f"Unable to write workflow snapshot "
+                f"'{self.snapshot_path}': {e}"
+            )
@@ -7,6 +7,11 @@ import click
 from traits.api import push_exception_handler
 
 from force_bdss.app.bdss_application import BDSSApplication
+from force_bdss.app.memory_diagnostics import MemoryDiagnostics
+from force_bdss.core.evaluation_trace import (
+    TRACE_LOGGER_NAME,
+    EvaluationTraceHandler,
+)
 
 # Makes the application rethrow the exception so that it exits return code
 # different from zero.
@@ -19,23 +24,164 @@ push_exception_handler(reraise_exceptions=True)
               type=click.Path(exists=False),
               help="If specified, the log filename. "
                    " If unspecified, the log will be written to stdout.")
+@click.option("--log-level",
+              type=click.Choice(
+                  ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                  case_sensitive=False),
+              default="INFO", show_default=True,
+              help="The minimum level of the logged messages. The messages "
+                   "logged at each evaluation of the workflow require the "
+                   "INFO level.")
+@click.option("--trace", is_flag=True,
+              help="Log a single line for each evaluation of the workflow, "
+                   "with its parameters, KPIs and duration, whatever the "
+                   "log level.")
+@click.option("--trace-file",
+              type=click.Path(exists=False, dir_okay=False),
+              help="Write a JSON line for each evaluation of the "
+                   "workflow to this file, with its parameters, KPIs, "
+                   "duration, data source durations and error, whatever "
+                   "the log level.")
+@click.option("--checkpoint",
+              type=click.Path(exists=False, dir_okay=False),
+              help="If specified, the file where the state of the "
+                   "optimization is periodically saved. Defaults to "
+                   "WORKFLOW_FILEPATH.checkpoint if --resume is set.")
+@click.option("--resume", is_flag=True,
+              help="Resume the optimization from the last checkpoint, "
+                   "without evaluating again the points evaluated "
+                   "before the interruption.")
+@click.option("--history", multiple=True,
+              type=click.Path(exists=True, dir_okay=False),
+              help="Result file (CSV or binary events) of a previous run. "
+                   "Its evaluated points are reused by the optimization. "
+                   "Can be given multiple times.")
+@click.option("--serve", is_flag=True,
+              help="With --evaluate, keep evaluating points until the "
+                   "end of the MCO requests, instead of a single point.")
+@click.option("--socket", "socket_path",
+              type=click.Path(exists=False, dir_okay=False),
+              help="With --evaluate --serve, receive the MCO requests on "
+                   "the Unix socket at this path.")
+@click.option("--snapshot", is_flag=True,
+              help="Use a compiled snapshot of the verified workflow, "
+                   "written to WORKFLOW_FILEPATH.snapshot, to skip the "
+                   "parsing of an unchanged workflow.")
+@click.option("--profile", is_flag=True,
+              help="Profile the operation, excluding the start up of the "
+                   "application, and write the profile in the pstats "
+                   "format to WORKFLOW_FILEPATH.prof.")
+@click.option("--profile-data-sources", is_flag=True,
+              help="With --profile, profile the runs of each data source "
+                   "instead of the whole operation, and write a timeline "
+                   "of the evaluations in the speedscope format. The runs "
+                   "of the data sources with a run_timeout, which run in a "
+                   "separate thread, are not profiled.")
+@click.option("--memory-diagnostics", type=click.IntRange(min=1),
+              metavar="N",
+              help="Trace the memory allocations during the optimization, "
+                   "and log the allocation sites that grew the most every "
+                   "N evaluations. Slows down the evaluations.")
+@click.option("--rss-growth-threshold", type=click.FloatRange(min=0.0),
+              default=10.0, show_default=True, metavar="KIB",
+              help="With --memory-diagnostics, warn when the resident "
+                   "memory grows by more than KIB kibibytes per "
+                   "evaluation.")
+@click.option("--distributed", metavar="HOST:PORT",
+              help="Evaluate the workflow on the force_bdss_worker "
+                   "processes connecting to this address, instead of "
+                   "in this process. Unless HOST is a loopback interface, "
+                   "the workers must share the token of the "
+                   "FORCE_BDSS_TOKEN environment variable.")
+@click.option("--no-plugin-index", "plugin_index", is_flag=True,
+              flag_value=False, default=True,
+              help="Do not read nor write the plugin index, which records "
+                   "the ids of the installed plugins in "
+                   "~/.cache/force_bdss, and import all the plugins.")
 @click.argument('workflow_filepath', type=click.Path(exists=True))
-def run(evaluate, logfile, workflow_filepath):
+def run(evaluate, logfile, log_level, trace, trace_file, checkpoint, resume,
+        history, serve, socket_path, snapshot, profile, profile_data_sources,
+        memory_diagnostics, rss_growth_threshold, distributed, plugin_index,
+        workflow_filepath):
+    if socket_path is not None and not serve:
+        raise click.UsageError("--socket requires --serve")
+    if profile_data_sources and not profile:
+        raise click.UsageError("--profile-data-sources requires --profile")
+
+    # The options of the operation, validated by the BDSSApplication
+    operation_options = {}
+    if checkpoint is not None:
+        operation_options["checkpoint_file"] = checkpoint
+    if resume:
+        operation_options["resume"] = True
+    if history:
+        operation_options["evaluation_history"] = list(history)
+    if serve:
+        operation_options["serve"] = True
+    if socket_path is not None:
+        operation_options["serve_address"] = socket_path
+    if memory_diagnostics is not None:
+        operation_options["memory_diagnostics"] = MemoryDiagnostics(
+            interval=memory_diagnostics,
+            rss_growth_threshold=rss_growth_threshold * 1024,
+        )
+    if distributed is not None:
+        from force_bdss.mco.distributed.distributed_evaluator import (
+            DistributedEvaluator
+        )
+        from force_bdss.mco.distributed.protocol import parse_address
+
+        try:
+            host, port = parse_address(distributed)
+        except ValueError as error:
+            raise click.BadParameter(
+                str(error), param_hint="--distributed"
+            )
+        operation_options["distributed_evaluator"] = DistributedEvaluator(
+            host=host, port=port
+        )
+
     logging_config = {}
-    logging_config["level"] = logging.INFO
+    logging_config["level"] = getattr(logging, log_level.upper())
 
     if logfile is not None:
         logging_config["filename"] = logfile
 
     logging.basicConfig(**logging_config)
+    # The trace is disabled unless requested, also at the DEBUG log level
+    trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+    if trace or trace_file is not None:
+        trace_logger.setLevel(logging.DEBUG)
+    else:
+        trace_logger.setLevel(logging.INFO)
+    trace_handler = None
+    if trace_file is not None:
+        trace_handler = EvaluationTraceHandler(trace_file)
+        trace_logger.addHandler(trace_handler)
+        # The trace is only logged as text with --trace
+        trace_logger.propagate = trace
     log = logging.getLogger(__name__)
 
     try:
-        application = BDSSApplication(
-            evaluate=evaluate,
-            workflow_file=workflow_filepath
-        )
+        try:
+            application = BDSSApplication(
+                evaluate=evaluate,
+                workflow_file=workflow_filepath,
+                operation_options=operation_options,
+                snapshot=snapshot,
+                profile=profile,
+                profile_data_sources=profile_data_sources,
+                plugin_index=plugin_index,
+            )
+        except ValueError as error:
+            raise click.UsageError(str(error))
 
         application.run()
+    except click.UsageError:
+        raise
     except Exception as e:
         log.exception(e)
+    finally:
+        if trace_handler is not None:
+            trace_logger.removeHandler(trace_handler)
+            trace_handler.close()
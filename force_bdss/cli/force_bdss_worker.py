@@ -0,0 +1,52 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import click
+
+from traits.api import push_exception_handler
+
+from force_bdss.app.worker_application import WorkerApplication
+from force_bdss.mco.distributed.protocol import parse_address
+
+push_exception_handler(reraise_exceptions=True)
+
+
+@click.command()
+@click.option("--logfile",
+              type=click.Path(exists=False),
+              help="If specified, the log filename. "
+                   " If unspecified, the log will be written to stdout.")
+@click.option("--log-level",
+              type=click.Choice(
+                  ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                  case_sensitive=False),
+              default="WARNING", show_default=True,
+              help="The minimum level of the logged messages.")
+@click.option("--connect-timeout", type=click.FloatRange(min=0.0),
+              default=60.0, show_default=True,
+              help="Time, in seconds, during which the connection to the "
+                   "evaluator is retried.")
+@click.argument("address", metavar="HOST:PORT")
+def run(logfile, log_level, connect_timeout, address):
+    """Evaluates the workflow of the force_bdss --distributed HOST:PORT
+    process, until it finishes. The token of the evaluator is read from
+    the FORCE_BDSS_TOKEN environment variable."""
+    try:
+        address = parse_address(address)
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="HOST:PORT")
+
+    logging_config = {"level": getattr(logging, log_level.upper())}
+    if logfile is not None:
+        logging_config["filename"] = logfile
+    logging.basicConfig(**logging_config)
+    log = logging.getLogger(__name__)
+
+    try:
+        application = WorkerApplication(address)
+        application.worker.connect_timeout = connect_timeout
+        application.run()
+    except Exception as e:
+        log.exception(e)
+        raise SystemExit(1)
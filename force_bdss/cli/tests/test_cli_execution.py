@@ -40,6 +40,57 @@ class TestCLIExecution(unittest.TestCase):
             retcode = proc.wait()
             self.assertEqual(retcode, 1)
 
+    def test_resume_evaluate(self):
+        with cd(fixtures.dirpath()):
+            with self.assertRaises(subprocess.CalledProcessError) as cm:
+                subprocess.check_output(
+                    ["force_bdss", "--evaluate", "--resume",
+                     "test_empty.json"],
+                    stderr=subprocess.STDOUT)
+            self.assertEqual(2, cm.exception.returncode)
+
+    def test_serve_optimize(self):
+        with cd(fixtures.dirpath()):
+            with self.assertRaises(subprocess.CalledProcessError) as cm:
+                subprocess.check_output(
+                    ["force_bdss", "--serve", "test_empty.json"],
+                    stderr=subprocess.STDOUT)
+            self.assertEqual(2, cm.exception.returncode)
+
+    def test_distributed_evaluate(self):
+        with cd(fixtures.dirpath()):
+            with self.assertRaises(subprocess.CalledProcessError) as cm:
+                subprocess.check_output(
+                    ["force_bdss", "--evaluate", "--distributed", ":9000",
+                     "test_empty.json"],
+                    stderr=subprocess.STDOUT)
+            self.assertEqual(2, cm.exception.returncode)
+
+    def test_distributed_invalid_address(self):
+        with cd(fixtures.dirpath()):
+            with self.assertRaises(subprocess.CalledProcessError) as cm:
+                subprocess.check_output(
+                    ["force_bdss", "--distributed", "localhost",
+                     "test_empty.json"],
+                    stderr=subprocess.STDOUT)
+            self.assertEqual(2, cm.exception.returncode)
+
+    def test_worker_invalid_address(self):
+        with self.assertRaises(subprocess.CalledProcessError) as cm:
+            subprocess.check_output(
+                ["force_bdss_worker", "localhost"],
+                stderr=subprocess.STDOUT)
+        self.assertEqual(2, cm.exception.returncode)
+
+    def test_invalid_log_level(self):
+        with cd(fixtures.dirpath()):
+            with self.assertRaises(subprocess.CalledProcessError) as cm:
+                subprocess.check_output(
+                    ["force_bdss", "--log-level", "verbose",
+                     "test_empty.json"],
+                    stderr=subprocess.STDOUT)
+            self.assertEqual(2, cm.exception.returncode)
+
     def test_unsupported_file_input(self):
         with cd(fixtures.dirpath()):
             with self.assertRaises(subprocess.CalledProcessError):
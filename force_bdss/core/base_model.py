@@ -1,6 +1,9 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import functools
+import inspect
+
 from traits.api import ABCHasStrictTraits, Instance
 
 from force_bdss.core.base_factory import BaseFactory
@@ -26,3 +29,46 @@ class BaseModel(EventNotifierMixin, ABCHasStrictTraits):
         state = nested_getstate(state)
         state = {"id": self.factory.id, "model_data": state}
         return state
+
+
+def model_from_json(model_class, factory, json_data):
+    """ Creates a model from the `json_data` with `model_class.from_json`,
+    transferring the ownership of `json_data` to the model if possible.
+
+    The `from_json` methods of the models accept a `copy` argument, but
+    plugins may override them with the former signature
+    ``from_json(cls, factory, json_data)``. The argument is only passed to
+    the methods that accept it, and the others copy the data as they
+    always did.
+
+    Parameters
+    ----------
+    model_class: type
+        The class of the model, usually `factory.model_class`
+    factory: BaseFactory
+        The factory creating the model
+    json_data: dict
+        The serialized data of the model, which may be modified
+
+    Returns
+    -------
+    model: BaseModel
+        The created model
+    """
+    from_json = model_class.from_json
+    if _accepts_copy(getattr(from_json, "__func__", from_json)):
+        return from_json(factory, json_data, copy=False)
+    return from_json(factory, json_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts_copy(function):
+    """ Whether the `function` accepts a `copy` keyword argument."""
+    try:
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+    return "copy" in parameters or any(
+        parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters.values()
+    )
@@ -0,0 +1,210 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Trace of the evaluations of the workflow.
+
+Each evaluation is logged at the DEBUG level on the trace logger (see
+`TRACE_LOGGER_NAME`), both as a line of text and as a structured record,
+held in the `evaluation` attribute of the log record. The
+`EvaluationTraceHandler` writes the structured records to a JSON lines
+file, one line per evaluation, which can be loaded in columns with
+`read_evaluation_trace`, or e.g. with ``pandas.read_json(path,
+lines=True)``.
+"""
+
+import json
+import logging
+import queue
+import socket
+import threading
+
+log = logging.getLogger(__name__)
+
+#: Name of the logger of the trace of the evaluations, which logs each
+#: evaluation of the workflow at the DEBUG level. The logger is not
+#: configured by the library: the trace is enabled whenever DEBUG messages
+#: are enabled on this logger. The force_bdss command sets its level, so
+#: that the trace only depends on the ``--trace`` options.
+TRACE_LOGGER_NAME = "force_bdss.trace"
+
+trace_log = logging.getLogger(TRACE_LOGGER_NAME)
+
+#: Maximum number of records written at once by the EvaluationTraceHandler
+MAX_BATCH_SIZE = 1000
+
+
+def trace_enabled():
+    """ Returns whether the evaluations are traced."""
+    return trace_log.isEnabledFor(logging.DEBUG)
+
+
+def trace_evaluation(parameters, kpis=None, wall_time=None,
+                     data_sources=None, error=None, cached=False,
+                     worker=None):
+    """ Logs an evaluation of the workflow on the trace logger. The caller
+    is expected to check `trace_enabled` first.
+
+    Parameters
+    ----------
+    parameters: list
+        The values of the MCO parameters
+    kpis: list or None
+        The values of the KPIs, or None if the evaluation failed
+    wall_time: float or None
+        The wall clock time of the evaluation, in seconds, or None if the
+        workflow was not executed
+    data_sources: dict or None
+        The wall clock time of the runs of the data sources, by data
+        source name. The times of the data sources with the same name are
+        summed.
+    error: Exception or None
+        The exception raised by the evaluation, if it failed
+    cached: bool
+        Whether the KPI values were reused instead of evaluating the
+        workflow
+    worker: str or None
+        The worker that evaluated the workflow, if not the current process
+    """
+    if error is not None:
+        error = f"{type(error).__name__}: {error}"
+    evaluation = {
+        "parameters": parameters,
+        "kpis": kpis,
+        "wall_time": wall_time,
+        "data_sources": data_sources or {},
+        "error": error,
+        "cached": cached,
+    }
+    if worker is not None:
+        evaluation["worker"] = worker
+    extra = {"evaluation": evaluation}
+    if error is not None:
+        trace_log.debug(
+            "Failed evaluation of parameters %s: %s", parameters, error,
+            extra=extra
+        )
+    elif cached:
+        trace_log.debug(
+            "Reused KPIs %s of parameters %s", kpis, parameters, extra=extra
+        )
+    else:
+        trace_log.debug(
+            "Evaluated parameters %s, KPIs %s in %.6f s",
+            parameters, kpis, wall_time, extra=extra
+        )
+
+
+class EvaluationTraceHandler(logging.Handler):
+    """ Logging handler writing the evaluations logged on the trace logger
+    to a JSON lines file.
+
+    The records are only queued by the thread of the evaluations. They are
+    serialized and written in batches by a background thread, so that the
+    trace does not slow down the evaluations. Each line holds the time of
+    the evaluation, the worker that logged it (``host:pid``, unless given
+    by the evaluation), and the fields of the structured record (see
+    `trace_evaluation`). The values that are not JSON serializable are
+    converted to lists if they are arrays, or else to their repr.
+    """
+
+    def __init__(self, path, level=logging.DEBUG):
+        super().__init__(level)
+        self.path = path
+        self._worker_prefix = f"{socket.gethostname()}:"
+        self._queue = queue.Queue()
+        self._file = open(path, "w")
+        self._thread = threading.Thread(
+            target=self._write_records,
+            name="BDSS evaluation trace writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def emit(self, record):
+        evaluation = getattr(record, "evaluation", None)
+        if evaluation is None:
+            return
+        entry = {
+            "time": record.created,
+            "worker": f"{self._worker_prefix}{record.process}",
+        }
+        entry.update(evaluation)
+        self._queue.put(entry)
+
+    def close(self):
+        """ Writes the queued records, and closes the file."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            self._file.close()
+        super().close()
+
+    def _write_records(self):
+        """ Writes the queued records in batches, until the None sentinel
+        queued by `close` is received."""
+        while True:
+            entry = self._queue.get()
+            entries = []
+            while entry is not None:
+                entries.append(entry)
+                if len(entries) >= MAX_BATCH_SIZE:
+                    break
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if entries:
+                self._write(entries)
+            if entry is None:
+                return
+
+    def _write(self, entries):
+        try:
+            self._file.write("".join(
+                json.dumps(entry, default=_json_default) + "\n"
+                for entry in entries
+            ))
+            self._file.flush()
+        except Exception:
+            # A failure of the trace must not stop the evaluations
+            log.exception(
+                f"Unable to write the evaluation trace to '{self.path}'"
+            )
+
+
+def read_evaluation_trace(path):
+    """ Reads a trace written by the `EvaluationTraceHandler`.
+
+    Parameters
+    ----------
+    path: str
+        Path of the trace file
+
+    Returns
+    -------
+    columns: dict
+        The list of the values of each field, by field name. The records
+        are in the order they were written.
+    """
+    columns = {}
+    n_records = 0
+    with open(path) as fp:
+        for line in fp:
+            entry = json.loads(line)
+            for name in entry:
+                if name not in columns:
+                    columns[name] = [None] * n_records
+            for name, column in columns.items():
+                column.append(entry.get(name))
+            n_records += 1
+    return columns
+
+
+def _json_default(value):
+    """ Converts values that are not JSON serializable, such as numpy
+    arrays and scalars."""
+    try:
+        return value.tolist()
+    except AttributeError:
+        return repr(value)
@@ -3,10 +3,13 @@
 
 from copy import deepcopy
 import logging
+from operator import methodcaller
 
 from traits.api import HasStrictTraits, List, on_trait_change
 
+from force_bdss.core.base_model import model_from_json
 from force_bdss.core.data_value import DataValue
+from force_bdss.core.factory_registry import lookup_data_source_factories
 from force_bdss.core.verifier import VerifierError
 from force_bdss.data_sources.base_data_source_model import BaseDataSourceModel
 from force_bdss.events.event_notifier_mixin import EventNotifierMixin
@@ -69,10 +72,11 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
             )
 
             # execute data source, passing only relevant data values.
-            log.info("Evaluating for Data Source {}".format(factory.name))
-            log.info("Passed values:")
-            for idx, dv in enumerate(passed_data_values):
-                log.info("{}: {}".format(idx, dv))
+            # The values are only logged, and formatted, if INFO is enabled
+            log_values = log.isEnabledFor(logging.INFO)
+            if log_values:
+                log.info("Evaluating for Data Source %s", factory.name)
+                _log_data_values("Passed values:", passed_data_values)
 
             try:
                 res = data_source._run(model, passed_data_values)
@@ -126,9 +130,8 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
             res = [r for r in res if r.name != ""]
             results.extend(res)
 
-            log.info("Returned values:")
-            for idx, dv in enumerate(res):
-                log.info("{}: {}".format(idx, dv))
+            if log_values:
+                _log_data_values("Returned values:", res)
 
         # Finally, return all the computed data values from all evaluators,
         # properly named.
@@ -146,6 +149,11 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
         errors : list of VerifierErrors
             The list of all detected errors in the execution layer.
         """
+        return self._verify(methodcaller("verify"))
+
+    def _verify(self, verify_model):
+        """ Verifies the execution layer, using the `verify_model`
+        function to verify the data source models."""
         errors = []
 
         if not self.data_sources:
@@ -159,7 +167,7 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
                 )
             )
         for data_source in self.data_sources:
-            errors += data_source.verify()
+            errors += verify_model(data_source)
 
         return errors
 
@@ -169,7 +177,7 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
         return state
 
     @classmethod
-    def from_json(cls, factory_registry, json_data):
+    def from_json(cls, factory_registry, json_data, copy=True):
         """ Instantiate an ExecutionLayer object from a `json_data`
         dictionary and the generating `factory_registry`.
         If the `json_data` is an empty dict, the `data_sources`
@@ -181,6 +189,10 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
             Generating factory registry
         json_data: dict
             Dictionary with an execution layer serialized data
+        copy: bool
+            If True (default), `json_data` is deep copied before use. If
+            False, the ownership of `json_data` is transferred: the created
+            objects use its content directly, and it may be modified.
 
         Returns
         ----------
@@ -188,16 +200,21 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
             ExecutionLayer instance with attributes values from
             the `json_data` dict
         """
-        data = deepcopy(json_data)
+        data = deepcopy(json_data) if copy else json_data
+
+        data_sources = data.get("data_sources", [])
+        factories = lookup_data_source_factories(
+            factory_registry,
+            [data_source["id"] for data_source in data_sources],
+        )
 
         models = []
-        for data_source in data.get("data_sources", []):
-            id = data_source["id"]
-            data_source_factory = factory_registry.data_source_factory_by_id(
-                id
-            )
-            model = data_source_factory.model_class.from_json(
-                data_source_factory, data_source["model_data"]
+        for data_source in data_sources:
+            data_source_factory = factories[data_source["id"]]
+            model = model_from_json(
+                data_source_factory.model_class,
+                data_source_factory,
+                data_source["model_data"],
             )
             models.append(model)
         data["data_sources"] = models
@@ -217,6 +234,13 @@ class ExecutionLayer(EventNotifierMixin, HasStrictTraits):
         self.notify(event)
 
 
+def _log_data_values(title, data_values):
+    """ Logs the `data_values`, at the INFO level, after the `title`."""
+    log.info(title)
+    for idx, dv in enumerate(data_values):
+        log.info("%d: %s", idx, dv)
+
+
 def _bind_data_values(available_data_values, model_slot_map, slots):
     """
     Given the named data values in the environment, the slots a given
@@ -1,7 +1,9 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from traits.api import HasStrictTraits, Instance, List, provides
+from traits.api import (
+    HasStrictTraits, Instance, List, Property, cached_property, provides
+)
 
 from force_bdss.core.i_factory_registry import IFactoryRegistry
 from force_bdss.data_sources.i_data_source_factory import IDataSourceFactory
@@ -34,6 +36,20 @@ class FactoryRegistry(HasStrictTraits):
     #: to inject special behaviors at those moments.
     ui_hooks_factories = List(Instance(IUIHooksFactory))
 
+    #: Indexes of the factories by id, so that the lookups by id do not
+    #: scan the factory lists. They are rebuilt when the lists change.
+    _mco_factories_by_id = Property(
+        depends_on="mco_factories[]", transient=True
+    )
+
+    _data_source_factories_by_id = Property(
+        depends_on="data_source_factories[]", transient=True
+    )
+
+    _notification_listener_factories_by_id = Property(
+        depends_on="notification_listener_factories[]", transient=True
+    )
+
     def data_source_factory_by_id(self, id):
         """Finds a given data source factory by means of its id.
         The ID is as obtained by the function factory_id() in the
@@ -48,13 +64,47 @@ class FactoryRegistry(HasStrictTraits):
         ------
         KeyError: if the entry is not found.
         """
-        for ds in self.data_source_factories:
-            if ds.id == id:
-                return ds
-        raise KeyError(
-            f"Invalid DataSource Factory id {id}. "
-            "No plugin responsible for the id is found."
-        )
+        try:
+            return self._data_source_factories_by_id[id]
+        except KeyError:
+            raise KeyError(
+                f"Invalid DataSource Factory id {id}. "
+                "No plugin responsible for the id is found."
+            ) from None
+
+    def data_source_factories_by_id(self, ids):
+        """Finds the data source factories of all the given ids at once.
+
+        Parameters
+        ----------
+        ids: iterable of str
+            The identifiers returned by the factory_id() function.
+
+        Returns
+        -------
+        factories: dict
+            The data source factories, by id.
+
+        Raises
+        ------
+        KeyError: if any of the entries is not found. The error lists all
+            the missing ids.
+        """
+        index = self._data_source_factories_by_id
+        factories = {}
+        missing = []
+        for id in ids:
+            try:
+                factories[id] = index[id]
+            except KeyError:
+                if id not in missing:
+                    missing.append(id)
+        if missing:
+            raise KeyError(
+                f"Invalid DataSource Factory ids {', '.join(missing)}. "
+                "No plugin responsible for the ids is found."
+            )
+        return factories
 
     def mco_factory_by_id(self, id):
         """Finds a given Multi Criteria Optimizer (MCO) factory by means of
@@ -70,13 +120,13 @@ class FactoryRegistry(HasStrictTraits):
         ------
         KeyError: if the entry is not found.
         """
-        for mco in self.mco_factories:
-            if mco.id == id:
-                return mco
-        raise KeyError(
-            f"Invalid MCO Factory id {id}. "
-            "No plugin responsible for the id is found."
-        )
+        try:
+            return self._mco_factories_by_id[id]
+        except KeyError:
+            raise KeyError(
+                f"Invalid MCO Factory id {id}. "
+                "No plugin responsible for the id is found."
+            ) from None
 
     def mco_parameter_factory_by_id(self, mco_id, parameter_id):
         """Retrieves the MCO parameter factory for a given MCO id and
@@ -100,15 +150,14 @@ class FactoryRegistry(HasStrictTraits):
         """
         mco_factory = self.mco_factory_by_id(mco_id)
 
-        for factory in mco_factory.parameter_factories:
-            if factory.id == parameter_id:
-                return factory
-
-        raise KeyError(
-            f"Invalid Parameter Factory id {parameter_id} for "
-            f"the specified MCO Factory {mco_id}. "
-            "No plugin responsible for the id is found."
-        )
+        try:
+            return mco_factory.parameter_factory_by_id(parameter_id)
+        except KeyError:
+            raise KeyError(
+                f"Invalid Parameter Factory id {parameter_id} for "
+                f"the specified MCO Factory {mco_id}. "
+                "No plugin responsible for the id is found."
+            ) from None
 
     def notification_listener_factory_by_id(self, id):
         """Finds a given notification listener by means of its id.
@@ -124,11 +173,64 @@ class FactoryRegistry(HasStrictTraits):
         ------
         KeyError: if the entry is not found.
         """
-        for nl in self.notification_listener_factories:
-            if nl.id == id:
-                return nl
-
-        raise KeyError(
-            f"Invalid Notification Listener Factory id {id}. "
-            "No plugin responsible for the id is found."
-        )
+        try:
+            return self._notification_listener_factories_by_id[id]
+        except KeyError:
+            raise KeyError(
+                f"Invalid Notification Listener Factory id {id}. "
+                "No plugin responsible for the id is found."
+            ) from None
+
+    @cached_property
+    def _get__mco_factories_by_id(self):
+        return index_by_id(self.mco_factories)
+
+    @cached_property
+    def _get__data_source_factories_by_id(self):
+        return index_by_id(self.data_source_factories)
+
+    @cached_property
+    def _get__notification_listener_factories_by_id(self):
+        return index_by_id(self.notification_listener_factories)
+
+
+def index_by_id(factories):
+    """ Returns a dictionary of the `factories` by id. If several factories
+    have the same id, the first one is kept, as a scan of the list would
+    do."""
+    index = {}
+    for factory in factories:
+        index.setdefault(factory.id, factory)
+    return index
+
+
+def lookup_data_source_factories(factory_registry, ids):
+    """ Finds the data source factories of all the given ids, with the
+    `data_source_factories_by_id` method of the `factory_registry`.
+    Registries that do not implement this method, which was added to the
+    IFactoryRegistry interface later, are queried one id at a time.
+
+    Parameters
+    ----------
+    factory_registry: IFactoryRegistry
+        The registry of the factories
+    ids: iterable of str
+        The identifiers returned by the factory_id() function.
+
+    Returns
+    -------
+    factories: dict
+        The data source factories, by id.
+
+    Raises
+    ------
+    KeyError: if any of the entries is not found.
+    """
+    try:
+        lookup = factory_registry.data_source_factories_by_id
+    except AttributeError:
+        return {
+            id: factory_registry.data_source_factory_by_id(id)
+            for id in ids
+        }
+    return lookup(ids)
@@ -0,0 +1,14 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+
+class FailedEvaluation(list):
+    """ The KPIs of an evaluation of the workflow that failed, returned
+    instead of raising the error when the `on_evaluation_failure` of the
+    MCO model is "CONTINUE".
+
+    It is a list of the failure values of the KPIs (see
+    `BaseMCOModel.failure_kpis`), so that the MCOs use it as any other KPI
+    values, but it can be told apart from the KPIs of a successful
+    evaluation, e.g. so that it is not reused for the same parameters.
+    """
@@ -22,6 +22,28 @@ class IFactoryRegistry(Interface):
         KeyError: if the entry is not found.
         """
 
+    def data_source_factories_by_id(self, ids):
+        """Finds the data source factories of all the given ids at once.
+
+        This method is optional: the BDSS looks up the factories of
+        registries that do not implement it with `data_source_factory_by_id`
+        (see `force_bdss.core.factory_registry.lookup_data_source_factories`).
+
+        Parameters
+        ----------
+        ids: iterable of str
+            The identifiers returned by the factory_id() function.
+
+        Returns
+        -------
+        factories: dict
+            The data source factories, by id.
+
+        Raises
+        ------
+        KeyError: if any of the entries is not found.
+        """
+
     def mco_factory_by_id(self, id):
         """Finds a given Multi Criteria Optimizer (MCO) factory by means of
         its id. The ID is as obtained by the function factory_id() in the
@@ -1,7 +1,7 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from traits.api import Enum, HasStrictTraits, Float, Bool
+from traits.api import Either, Enum, HasStrictTraits, Float, Bool
 
 from force_bdss.local_traits import Identifier
 from force_bdss.utilities import pop_dunder_recursive
@@ -39,6 +39,10 @@ class KPISpecification(HasStrictTraits):
     #: Upper threshold of KPI; may be used by some MCO engines
     upper_bound = Float(1)
 
+    #: Value of the KPI for the evaluations of the workflow that failed,
+    #: when the MCO model continues after failed evaluations. NaN if None.
+    failure_value = Either(None, Float)
+
     def __getstate__(self):
         return pop_dunder_recursive(super().__getstate__())
 
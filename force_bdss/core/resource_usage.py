@@ -0,0 +1,83 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Measurement of the resources used by the parts of a workflow
+execution: wall clock time, CPU time of the process, and increase of the
+peak resident set size (RSS) of the process.
+
+Example
+-------
+::
+
+    counters = resource_counters()
+    ...
+    usage = resource_usage_since(counters)
+"""
+
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    resource = None
+
+#: Size, in bytes, of the unit of `ru_maxrss`: bytes on macOS, and
+#: kilobytes on the other platforms
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+#: Size, in bytes, of a memory page
+_PAGE_SIZE = (
+    os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+)
+
+
+def peak_rss():
+    """ Returns the peak resident set size of the process, in bytes, or 0
+    if it is not available on the platform."""
+    if resource is None:  # pragma: no cover
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def current_rss():
+    """ Returns the current resident set size of the process, in bytes.
+    It is only available on Linux: the peak resident set size is returned
+    instead on the other platforms."""
+    try:
+        with open("/proc/self/statm") as fp:
+            pages = int(fp.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return peak_rss()
+    return pages * _PAGE_SIZE
+
+
+def resource_counters():
+    """ Returns the current values of the resource counters, to be passed
+    to `resource_usage_since`."""
+    return time.perf_counter(), time.process_time(), peak_rss()
+
+
+def resource_usage_since(counters):
+    """ Returns the resources used since the `counters` were taken.
+
+    Parameters
+    ----------
+    counters: tuple
+        The resource counters, as returned by `resource_counters`
+
+    Returns
+    -------
+    usage: dict
+        The wall clock time (`wall_time`) and CPU time (`cpu_time`), in
+        seconds, and the increase of the peak RSS (`peak_rss_delta`), in
+        bytes, as accepted by the `ResourceUsageEvent` classes.
+    """
+    wall_time, cpu_time, rss = counters
+    return {
+        "wall_time": time.perf_counter() - wall_time,
+        "cpu_time": time.process_time() - cpu_time,
+        "peak_rss_delta": peak_rss() - rss,
+    }
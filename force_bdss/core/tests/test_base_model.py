@@ -5,7 +5,7 @@ from unittest import TestCase
 
 from traits.testing.unittest_tools import UnittestTools
 
-from force_bdss.core.base_model import BaseModel
+from force_bdss.core.base_model import BaseModel, model_from_json
 from force_bdss.events.base_driver_event import BaseDriverEvent
 from force_bdss.tests.dummy_classes.mco import DummyMCOFactory
 
@@ -22,3 +22,33 @@ class TestBaseModel(TestCase, UnittestTools):
         with self.assertTraitChanges(
                 self.model, 'event', count=1):
             self.model.notify(BaseDriverEvent())
+
+    def test_model_from_json(self):
+        calls = []
+
+        class Model:
+            @classmethod
+            def from_json(cls, factory, json_data, copy=True):
+                calls.append((factory, json_data, copy))
+
+        class FormerModel:
+            @classmethod
+            def from_json(cls, factory, json_data):
+                calls.append((factory, json_data))
+
+        class KeywordsModel:
+            @classmethod
+            def from_json(cls, factory, json_data, **kwargs):
+                calls.append((factory, json_data, kwargs["copy"]))
+
+        data = {"a": 1}
+        for model_class in [Model, FormerModel, KeywordsModel]:
+            model_from_json(model_class, self.factory, data)
+        self.assertEqual(
+            [
+                (self.factory, data, False),
+                (self.factory, data),
+                (self.factory, data, False),
+            ],
+            calls
+        )
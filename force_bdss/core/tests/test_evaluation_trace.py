@@ -0,0 +1,90 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from force_bdss.core.evaluation_trace import (
+    TRACE_LOGGER_NAME,
+    EvaluationTraceHandler,
+    read_evaluation_trace,
+    trace_enabled,
+    trace_evaluation,
+)
+
+
+class TestEvaluationTrace(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.path = os.path.join(tmpdir, "trace.jsonl")
+
+        self.logger = logging.getLogger(TRACE_LOGGER_NAME)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.handler = EvaluationTraceHandler(self.path)
+        self.logger.addHandler(self.handler)
+
+        self.addCleanup(self.logger.setLevel, logging.NOTSET)
+        self.addCleanup(setattr, self.logger, "propagate", True)
+        self.addCleanup(self.handler.close)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_trace_enabled(self):
+        self.assertTrue(trace_enabled())
+        self.logger.setLevel(logging.INFO)
+        self.assertFalse(trace_enabled())
+
+    def test_write_and_read(self):
+        trace_evaluation(
+            [1.0, np.array([2.0, 3.0])],
+            [np.float64(4.0)],
+            wall_time=0.5,
+            data_sources={"ds": 0.25},
+        )
+        trace_evaluation([5.0], [6.0], cached=True, worker="node:1")
+        trace_evaluation([7.0], error=ValueError("bad"))
+        # Records without an evaluation are ignored
+        self.logger.debug("foo")
+        self.handler.close()
+
+        with open(self.path) as fp:
+            lines = fp.readlines()
+        self.assertEqual(3, len(lines))
+        entry = json.loads(lines[0])
+        self.assertEqual(
+            {
+                "parameters": [1.0, [2.0, 3.0]],
+                "kpis": [4.0],
+                "wall_time": 0.5,
+                "data_sources": {"ds": 0.25},
+                "error": None,
+                "cached": False,
+            },
+            {name: entry[name] for name in entry
+             if name not in ("time", "worker")}
+        )
+        self.assertEqual(str(os.getpid()), entry["worker"].split(":")[-1])
+
+        columns = read_evaluation_trace(self.path)
+        self.assertEqual(
+            [[1.0, [2.0, 3.0]], [5.0], [7.0]], columns["parameters"]
+        )
+        self.assertEqual([[4.0], [6.0], None], columns["kpis"])
+        self.assertEqual([False, True, False], columns["cached"])
+        self.assertEqual("node:1", columns["worker"][1])
+        self.assertEqual([None, None, "ValueError: bad"], columns["error"])
+        self.assertEqual(3, len(columns["time"]))
+
+    def test_close(self):
+        self.handler.close()
+        # Closing twice does nothing
+        self.handler.close()
+        self.assertEqual([], read_evaluation_trace(self.path).get("time", []))
@@ -2,6 +2,7 @@
 #  All rights reserved.
 
 import json
+import logging
 from unittest import TestCase, mock
 
 import testfixtures
@@ -67,6 +68,22 @@ class TestExecutionLayer(TestCase, UnittestTools):
                 )
             )
 
+    def test_data_values_not_formatted(self):
+        data_values = [DataValue(name="foo")]
+        for model in self.layer.data_sources:
+            model.input_slot_info = [InputSlotInfo(name="foo")]
+            model.output_slot_info = [OutputSlotInfo(name="bar")]
+
+        logger = logging.getLogger("force_bdss.core.execution_layer")
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.WARNING)
+
+        with mock.patch.object(
+                DataValue, "__str__", autospec=True,
+                side_effect=DataValue.__str__) as mock_str:
+            self.layer.execute_layer(data_values)
+        mock_str.assert_not_called()
+
     def test_data_source_run_error(self):
 
         data_values = [DataValue(name="foo")]
@@ -245,6 +262,9 @@ class TestExecutionLayer(TestCase, UnittestTools):
                 "output_slots_type": "PRESSURE",
                 "input_slots_size": 1,
                 "output_slots_size": 1,
+                "run_timeout": 0.0,
+                "run_max_retries": 0,
+                "run_retry_delay": 0.0,
             }
         )
         self.assertDictEqual(layer.__getstate__(), layer_data)
@@ -9,7 +9,19 @@ from force_bdss.tests.dummy_classes.extension_plugin import (
     DummyNotificationListenerFactory
 )
 
-from force_bdss.core.factory_registry import FactoryRegistry
+from force_bdss.core.factory_registry import (
+    FactoryRegistry, index_by_id, lookup_data_source_factories
+)
+
+
+class FormerFactoryRegistry:
+    """ Registry implementing the lookups of a single factory only."""
+
+    def __init__(self, factories):
+        self.factories = factories
+
+    def data_source_factory_by_id(self, id):
+        return self.factories[id]
 
 
 class TestFactoryRegistry(unittest.TestCase):
@@ -79,3 +91,60 @@ class TestFactoryRegistryWithContent(unittest.TestCase):
             self.registry.notification_listener_factory_by_id(
                 factory_id(self.plugin.id, "foo")
             )
+
+    def test_bulk_lookup(self):
+        id = factory_id(self.plugin.id, "dummy_data_source")
+        factories = self.registry.data_source_factories_by_id([id, id])
+        self.assertEqual([id], list(factories))
+        self.assertEqual(id, factories[id].id)
+
+        self.assertEqual({}, self.registry.data_source_factories_by_id([]))
+
+        missing = [
+            factory_id(self.plugin.id, "foo"),
+            factory_id(self.plugin.id, "bar"),
+        ]
+        with self.assertRaisesRegex(KeyError, "foo.*bar"):
+            self.registry.data_source_factories_by_id([id] + missing)
+
+    def test_lookup_data_source_factories(self):
+        id = factory_id(self.plugin.id, "dummy_data_source")
+        factory = self.registry.data_source_factories[0]
+        former_registry = FormerFactoryRegistry({id: factory})
+        for registry in [self.registry, former_registry]:
+            self.assertEqual(
+                {id: factory},
+                lookup_data_source_factories(registry, [id, id])
+            )
+            with self.assertRaises(KeyError):
+                lookup_data_source_factories(
+                    registry, [factory_id(self.plugin.id, "foo")]
+                )
+
+    def test_index_by_id(self):
+        factories = [
+            self.registry.mco_factories[0],
+            self.registry.data_source_factories[0],
+            DummyDataSourceFactory(plugin=self.plugin),
+        ]
+        index = index_by_id(factories)
+        self.assertEqual(2, len(index))
+        # The first factory of an id is kept
+        self.assertIs(factories[1], index[factories[1].id])
+
+    def test_index_updated(self):
+        id = factory_id(self.plugin.id, "dummy_data_source")
+        factory = self.registry.data_source_factory_by_id(id)
+
+        self.registry.data_source_factories.remove(factory)
+        with self.assertRaises(KeyError):
+            self.registry.data_source_factory_by_id(id)
+
+        self.registry.data_source_factories = [factory]
+        self.assertIs(factory, self.registry.data_source_factory_by_id(id))
+
+        mco_factory = self.registry.mco_factories[0]
+        parameter_factory = mco_factory.parameter_factories[0]
+        mco_factory.parameter_factories = []
+        with self.assertRaises(KeyError):
+            mco_factory.parameter_factory_by_id(parameter_factory.id)
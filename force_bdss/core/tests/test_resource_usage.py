@@ -0,0 +1,41 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import time
+import unittest
+
+from force_bdss.core.resource_usage import (
+    current_rss,
+    peak_rss,
+    resource_counters,
+    resource_usage_since,
+)
+
+
+class TestResourceUsage(unittest.TestCase):
+
+    def test_peak_rss(self):
+        self.assertGreater(peak_rss(), 0)
+
+    def test_current_rss(self):
+        rss = current_rss()
+        self.assertGreater(rss, 0)
+        # Allocates and touches about 50 MiB
+        data = bytearray(50 * 2 ** 20)
+        self.assertGreater(current_rss() - rss, 40 * 2 ** 20)
+        del data
+
+    def test_resource_usage_since(self):
+        counters = resource_counters()
+        time.sleep(0.01)
+        # Allocates and touches about 50 MiB
+        data = bytearray(50 * 2 ** 20)
+        usage = resource_usage_since(counters)
+        del data
+
+        self.assertEqual(
+            {"wall_time", "cpu_time", "peak_rss_delta"}, set(usage)
+        )
+        self.assertGreaterEqual(usage["wall_time"], 0.01)
+        self.assertGreaterEqual(usage["cpu_time"], 0.0)
+        self.assertGreaterEqual(usage["peak_rss_delta"], 0)
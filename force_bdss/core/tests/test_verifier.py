@@ -2,13 +2,17 @@
 #  All rights reserved.
 
 import unittest
+from unittest import mock
 
 from force_bdss.core.execution_layer import ExecutionLayer
 from force_bdss.core.input_slot_info import InputSlotInfo
 from force_bdss.core.output_slot_info import OutputSlotInfo
-from force_bdss.core.verifier import verify_workflow
+from force_bdss.core.verifier import verify_workflow, WorkflowVerifier
 from force_bdss.core.workflow import Workflow
 from force_bdss.core.kpi_specification import KPISpecification
+from force_bdss.data_sources.base_data_source_model import (
+    BaseDataSourceModel
+)
 from force_bdss.tests.dummy_classes.extension_plugin import \
     DummyExtensionPlugin
 
@@ -146,3 +150,131 @@ class TestVerifier(unittest.TestCase):
                       errors[1].local_error)
         self.assertIn("An output variable has an undefined name",
                       errors[2].local_error)
+
+
+class TestWorkflowVerifier(unittest.TestCase):
+    def setUp(self):
+        self.plugin = DummyExtensionPlugin()
+        mco_factory = self.plugin.mco_factories[0]
+        parameter = mco_factory.parameter_factories[0].create_model()
+        parameter.name = "name"
+        parameter.type = "type"
+        mco_model = mco_factory.create_model()
+        mco_model.parameters.append(parameter)
+        mco_model.kpis.append(KPISpecification(name="name"))
+
+        self.workflow = Workflow(
+            mco_model=mco_model,
+            execution_layers=[
+                ExecutionLayer(
+                    data_sources=[self.create_data_source() for _ in range(3)]
+                )
+                for _ in range(2)
+            ],
+        )
+        self.verifier = WorkflowVerifier(self.workflow)
+        self.addCleanup(self.verifier.clear)
+
+        patcher = mock.patch.object(
+            BaseDataSourceModel, "verify", autospec=True,
+            side_effect=BaseDataSourceModel.verify
+        )
+        self.mock_verify = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_data_source(self):
+        factory = self.plugin.data_source_factories[0]
+        return factory.create_model({
+            "input_slot_info": [InputSlotInfo(name="name")],
+            "output_slot_info": [OutputSlotInfo(name="name")],
+        })
+
+    def check_errors(self):
+        """ Checks that the verifier returns the same errors as a full
+        verification, and returns them."""
+        errors = self.verifier.verify()
+        self.assertEqual(
+            [(error.subject, error.local_error)
+             for error in self.workflow.verify()],
+            [(error.subject, error.local_error) for error in errors],
+        )
+        return errors
+
+    def test_verify_once(self):
+        self.assertEqual([], self.verifier.verify())
+        self.assertEqual(6, self.mock_verify.call_count)
+
+        self.assertEqual([], self.verifier.verify())
+        self.assertEqual(6, self.mock_verify.call_count)
+
+    def test_data_source_changes(self):
+        self.verifier.verify()
+        self.mock_verify.reset_mock()
+
+        model = self.workflow.execution_layers[1].data_sources[0]
+        model.input_slot_info[0].name = ""
+        self.workflow.execution_layers[0].data_sources[2].changes_slots = True
+        model.notify_start_event()
+
+        self.mock_verify.reset_mock()
+        errors = self.verifier.verify()
+        self.assertEqual(2, self.mock_verify.call_count)
+        self.assertEqual(1, len(errors))
+        self.assertIs(model.input_slot_info[0], errors[0].subject)
+
+        # Objects added to a model are listened to
+        model.output_slot_info.append(OutputSlotInfo(name="other"))
+        self.assertEqual(2, len(self.check_errors()))
+        model.output_slot_info[1].name = ""
+        self.assertEqual(3, len(self.check_errors()))
+
+        model.input_slot_info[0].name = "name"
+        model.output_slot_info.pop()
+        self.mock_verify.reset_mock()
+        self.assertEqual([], self.check_errors())
+        self.assertEqual(7, self.mock_verify.call_count)
+
+    def test_mco_changes(self):
+        self.verifier.verify()
+
+        self.workflow.mco_model.kpis[0].name = ""
+        errors = self.check_errors()
+        self.assertEqual(1, len(errors))
+        self.assertIn("KPI is not named", errors[0].local_error)
+
+        self.workflow.mco_model = None
+        self.assertEqual(1, len(self.check_errors()))
+
+    def test_structure_changes(self):
+        self.verifier.verify()
+
+        removed = self.workflow.execution_layers[0].data_sources.pop()
+        self.workflow.execution_layers[1].data_sources.append(
+            self.create_data_source()
+        )
+        self.workflow.execution_layers.append(ExecutionLayer())
+        self.mock_verify.reset_mock()
+        self.assertEqual(1, len(self.check_errors()))
+        self.assertEqual(7, self.mock_verify.call_count)
+
+        # Removed models are no longer listened to
+        self.assertNotIn(removed, self.verifier._errors)
+        self.assertNotIn(removed, self.verifier._watched_objects)
+
+        self.workflow.execution_layers = []
+        self.assertEqual(1, len(self.check_errors()))
+
+    def test_clear(self):
+        self.verifier.verify()
+        self.verifier.clear()
+        self.assertEqual({}, self.verifier._watched_models)
+
+        self.mock_verify.reset_mock()
+        self.verifier.verify()
+        self.assertEqual(6, self.mock_verify.call_count)
+
+    def test_change_workflow(self):
+        self.verifier.verify()
+        self.verifier.workflow = Workflow()
+        self.assertEqual({}, self.verifier._watched_models)
+        self.assertEqual(2, len(self.verifier.verify()))
@@ -3,12 +3,24 @@
 
 from copy import deepcopy
 import json
+import logging
+import math
 import unittest
+from unittest import mock
 
+import testfixtures
 from traits.testing.api import UnittestTools
 
 from force_bdss.events.base_driver_event import BaseDriverEvent
+from force_bdss.events.data_source_events import DataSourceFinishEvent
+from force_bdss.events.execution_events import (
+    ExecutionLayerFinishEvent,
+    ResourceUsageEvent,
+    WorkflowExecutionFinishEvent,
+)
 from force_bdss.core.execution_layer import ExecutionLayer
+from force_bdss.core.failed_evaluation import FailedEvaluation
+from force_bdss.core.evaluation_trace import TRACE_LOGGER_NAME
 from force_bdss.core.kpi_specification import KPISpecification
 from force_bdss.core.output_slot_info import OutputSlotInfo
 from force_bdss.core.workflow import Workflow
@@ -157,10 +169,34 @@ class TestWorkflow(unittest.TestCase, UnittestTools):
         model.output_slot_info = [OutputSlotInfo(name="out1")]
         wf.execution_layers[3].data_sources.append(model)
 
+        events = []
+        wf.on_trait_change(lambda event: events.append(event), "event")
         kpi_results = wf.execute(data_values)
         self.assertEqual(1, len(kpi_results))
         self.assertEqual(8750, kpi_results[0].value)
 
+        # Resources used by each data source, layer, and the workflow
+        usage_events = [
+            event for event in events
+            if isinstance(event, ResourceUsageEvent)
+        ]
+        expected_types = []
+        for layer in wf.execution_layers:
+            expected_types += [DataSourceFinishEvent] * len(layer.data_sources)
+            expected_types.append(ExecutionLayerFinishEvent)
+        expected_types.append(WorkflowExecutionFinishEvent)
+        self.assertEqual(
+            expected_types, [type(event) for event in usage_events]
+        )
+        self.assertEqual(
+            [0, 1, 2, 3],
+            [event.layer_index for event in usage_events
+             if isinstance(event, ExecutionLayerFinishEvent)]
+        )
+        self.assertGreaterEqual(
+            usage_events[-1].wall_time, usage_events[-2].wall_time
+        )
+
     def test_kpi_specification_adherence(self):
         # Often the user may only wish to treat a subset of DataSource
         # output slots as KPIs. This test makes sure they get what they
@@ -268,6 +304,108 @@ class TestWorkflow(unittest.TestCase, UnittestTools):
         self.assertEqual(1, len(kpi_results))
         self.assertIsNone(kpi_results[0])
 
+    def test_trace(self):
+        workflow_file = ProbeWorkflowFile(path=fixtures.get("test_probe.json"))
+        workflow_file.read()
+        workflow = workflow_file.workflow
+
+        trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+        self.addCleanup(trace_logger.setLevel, logging.NOTSET)
+        trace_logger.setLevel(logging.INFO)
+        with testfixtures.LogCapture() as capture:
+            workflow.evaluate([1.0])
+            self.assertNotIn(
+                TRACE_LOGGER_NAME,
+                [record.name for record in capture.records]
+            )
+
+            trace_logger.setLevel(logging.DEBUG)
+            capture.clear()
+            workflow.evaluate([1.0])
+
+        records = [
+            record for record in capture.records
+            if record.name == TRACE_LOGGER_NAME
+        ]
+        self.assertEqual(1, len(records))
+        record = records[0]
+        self.assertEqual(TRACE_LOGGER_NAME, record.name)
+        self.assertIn(
+            "Evaluated parameters [1.0], KPIs [None] in", record.getMessage()
+        )
+        evaluation = record.evaluation
+        self.assertEqual([1.0], evaluation["parameters"])
+        self.assertEqual([None], evaluation["kpis"])
+        self.assertGreater(evaluation["wall_time"], 0.0)
+        self.assertEqual(
+            ["test_data_source"], list(evaluation["data_sources"])
+        )
+        self.assertIsNone(evaluation["error"])
+        self.assertFalse(evaluation["cached"])
+
+    def test_trace_error(self):
+        workflow_file = ProbeWorkflowFile(path=fixtures.get("test_probe.json"))
+        workflow_file.read()
+        workflow = workflow_file.workflow
+        factory = workflow.execution_layers[0].data_sources[0].factory
+        factory.raises_on_data_source_run = True
+
+        trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+        trace_logger.setLevel(logging.DEBUG)
+        self.addCleanup(trace_logger.setLevel, logging.NOTSET)
+        with testfixtures.LogCapture() as capture:
+            with self.assertRaises(Exception):
+                workflow.evaluate([1.0])
+
+        records = [
+            record for record in capture.records
+            if record.name == TRACE_LOGGER_NAME
+        ]
+        self.assertEqual(1, len(records))
+        evaluation = records[0].evaluation
+        self.assertEqual([1.0], evaluation["parameters"])
+        self.assertIsNone(evaluation["kpis"])
+        self.assertIn("Exception: ", evaluation["error"])
+        self.assertIsNone(workflow._data_source_times)
+
+    def test_continue_on_evaluation_failure(self):
+        workflow_file = ProbeWorkflowFile(path=fixtures.get("test_probe.json"))
+        workflow_file.read()
+        workflow = workflow_file.workflow
+        factory = workflow.execution_layers[0].data_sources[0].factory
+        factory.raises_on_data_source_run = True
+
+        events = []
+        workflow.on_trait_change(lambda event: events.append(event), "event")
+        with testfixtures.LogCapture(), self.assertRaises(Exception):
+            workflow.evaluate([1.0])
+        # The failed execution is reported
+        self.assertIsInstance(events[-1], WorkflowExecutionFinishEvent)
+        self.assertTrue(events[-1].failed)
+
+        workflow.mco_model.on_evaluation_failure = "CONTINUE"
+        with testfixtures.LogCapture() as capture:
+            kpis = workflow.evaluate([1.0])
+        self.assertIsInstance(kpis, FailedEvaluation)
+        self.assertEqual(1, len(kpis))
+        self.assertTrue(math.isnan(kpis[0]))
+        self.assertTrue(events[-1].failed)
+        self.assertIn(
+            "Evaluation of the workflow failed (Exception: ).",
+            capture.records[-1].getMessage()
+        )
+        self.assertEqual("force_bdss.core.workflow", capture.records[-1].name)
+
+        workflow.mco_model.kpis[0].failure_value = 1e6
+        with testfixtures.LogCapture():
+            self.assertEqual([1e6], workflow.evaluate([1.0]))
+
+        factory.raises_on_data_source_run = False
+        with testfixtures.LogCapture():
+            kpis = workflow.evaluate([1.0])
+        self.assertNotIsInstance(kpis, FailedEvaluation)
+        self.assertFalse(events[-1].failed)
+
     def test_from_json(self):
         registry = DummyFactoryRegistry()
         json_path = fixtures.get("test_workflow_reader.json")
@@ -291,6 +429,7 @@ class TestWorkflow(unittest.TestCase, UnittestTools):
                             }
                         ],
                         "kpis": [],
+                        "on_evaluation_failure": "ABORT",
                     },
                 },
                 "notification_listeners": [
@@ -316,6 +455,9 @@ class TestWorkflow(unittest.TestCase, UnittestTools):
                                     "output_slot_info": [
                                         {"name": "output_slot_name"}
                                     ],
+                                    "run_timeout": 0.0,
+                                    "run_max_retries": 0,
+                                    "run_retry_delay": 0.0,
                                 },
                             }
                         ]
@@ -333,6 +475,24 @@ class TestWorkflow(unittest.TestCase, UnittestTools):
         _ = Workflow.from_json(registry, data["workflow"])
         self.assertDictEqual(data, reference_data)
 
+    def test_from_json_without_copy(self):
+        registry = DummyFactoryRegistry()
+        json_path = fixtures.get("test_workflow_reader.json")
+        with open(json_path) as f:
+            data = json.load(f)
+        reference_state = Workflow.from_json(
+            registry, data["workflow"]
+        ).__getstate__()
+
+        with mock.patch("force_bdss.core.workflow.deepcopy") as mock_copy:
+            workflow = Workflow.from_json(
+                registry, data["workflow"], copy=False
+            )
+        mock_copy.assert_not_called()
+        self.assertDictEqual(reference_state, workflow.__getstate__())
+        # The data is consumed by the workflow
+        self.assertIs(workflow.mco_model, data["workflow"]["mco_model"])
+
     def test__extract_mco_model(self):
         registry = DummyFactoryRegistry()
         with open(fixtures.get("test_workflow_reader.json")) as f:
@@ -3,7 +3,9 @@
 
 import logging
 
-from traits.api import Any, Enum, HasStrictTraits, Str
+from traits.api import (
+    Any, Enum, HasStrictTraits, HasTraits, Instance, Str
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,3 +40,115 @@ def verify_workflow(workflow):
     """
     result = workflow.verify()
     return result
+
+
+class WorkflowVerifier(HasStrictTraits):
+    """ Verifies a workflow incrementally, as it is edited.
+
+    The errors of the MCO model and of each data source model are cached,
+    and only verified again when the model, or an object it contains (for
+    instance its parameters, KPIs or slot information), changes. The
+    remaining checks of the workflow and its execution layers are cheap,
+    and performed on every verification, so that `verify` returns the
+    same errors as `Workflow.verify`.
+
+    The verifier listens to the changes of the verified models: `clear`
+    must be called when it is no longer needed.
+    """
+
+    #: The workflow to verify
+    workflow = Instance("force_bdss.core.workflow.Workflow")
+
+    #: The errors of the verified models, by model
+    _errors = Instance(dict, ())
+
+    #: The errors of the models during a verification, before it reaches
+    #: them, by model
+    _previous_errors = Instance(dict, ())
+
+    #: The objects whose changes are listened to, by verified model
+    _watched_objects = Instance(dict, ())
+
+    #: The verified model containing each listened object
+    _watched_models = Instance(dict, ())
+
+    def __init__(self, workflow, **traits):
+        super(WorkflowVerifier, self).__init__(workflow=workflow, **traits)
+
+    def verify(self):
+        """ Verifies the workflow, only verifying again the models that
+        changed since the previous verification.
+
+        Returns
+        -------
+        errors : list of VerifierErrors
+            The list of all detected errors in the workflow.
+        """
+        self._previous_errors, self._errors = self._errors, {}
+        try:
+            return self.workflow._verify(self._verify_model)
+        finally:
+            # Models removed from the workflow
+            for model in self._previous_errors:
+                self._unwatch(model)
+            self._previous_errors = {}
+
+    def clear(self):
+        """ Removes the cached errors, and stops listening to the changes
+        of the models."""
+        for model in list(self._errors):
+            self._unwatch(model)
+        self._errors = {}
+
+    def _verify_model(self, model):
+        errors = self._previous_errors.pop(model, None)
+        if errors is None:
+            errors = model.verify()
+            self._watch(model)
+        self._errors[model] = errors
+        return list(errors)
+
+    def _watch(self, model):
+        objects = _contained_objects(model)
+        for obj in objects:
+            obj.on_trait_change(self._object_changed, "anytrait")
+            self._watched_models[obj] = model
+        self._watched_objects[model] = objects
+
+    def _unwatch(self, model):
+        for obj in self._watched_objects.pop(model, []):
+            obj.on_trait_change(
+                self._object_changed, "anytrait", remove=True
+            )
+            self._watched_models.pop(obj, None)
+
+    def _object_changed(self, obj, name, old, new):
+        # Notifications and private traits do not change the errors
+        if name == "event" or name.startswith("_"):
+            return
+        model = self._watched_models.get(obj)
+        if model is None:
+            return
+        self._unwatch(model)
+        self._errors.pop(model, None)
+        self._previous_errors.pop(model, None)
+
+    def _workflow_changed(self):
+        self.clear()
+
+
+def _contained_objects(model):
+    """ Returns the `model` and the objects held by its non transient
+    traits, recursively."""
+    objects = [model]
+    seen = {id(model)}
+    for obj in objects:
+        values = obj.trait_get(transient=lambda transient: not transient)
+        for value in values.values():
+            if not isinstance(value, (list, tuple)):
+                value = [value]
+            for item in value:
+                if isinstance(item, HasTraits) and id(item) not in seen:
+                    seen.add(id(item))
+                    objects.append(item)
+    return objects
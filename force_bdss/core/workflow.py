@@ -3,8 +3,11 @@
 
 from copy import deepcopy
 import logging
+from operator import methodcaller
+import time
 
 from traits.api import (
+    Any,
     HasStrictTraits,
     Instance,
     List,
@@ -12,14 +15,29 @@ from traits.api import (
     on_trait_change,
 )
 
+from force_bdss.core.base_model import model_from_json
+from force_bdss.core.evaluation_trace import (
+    trace_enabled,
+    trace_evaluation,
+)
 from force_bdss.core.execution_layer import ExecutionLayer
+from force_bdss.core.resource_usage import (
+    resource_counters,
+    resource_usage_since,
+)
 from force_bdss.core.verifier import VerifierError
+from force_bdss.events.data_source_events import DataSourceFinishEvent
 from force_bdss.events.event_notifier_mixin import EventNotifierMixin
+from force_bdss.events.execution_events import (
+    ExecutionLayerFinishEvent,
+    WorkflowExecutionFinishEvent,
+)
 from force_bdss.mco.base_mco_model import BaseMCOModel
 from force_bdss.notification_listeners.base_notification_listener_model \
     import BaseNotificationListenerModel
 from force_bdss.mco.i_evaluator import IEvaluator
 from force_bdss.core.data_value import DataValue
+from force_bdss.core.failed_evaluation import FailedEvaluation
 from force_bdss.utilities import pop_dunder_recursive, nested_getstate
 
 
@@ -42,6 +60,10 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
     #: Contains information about the listeners to be setup
     notification_listeners = List(BaseNotificationListenerModel)
 
+    #: Wall clock time of the data source runs of the traced evaluation,
+    #: by data source name, or None if the evaluation is not traced
+    _data_source_times = Any(transient=True)
+
     def execute(self, data_values):
         """Executes the given workflow using the list of data values.
         Returns a list of data values for the KPI results
@@ -54,19 +76,103 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         Returns
         -------
         kpis : list of DataValues
-            The DataValues containing the KPI results.
+            The DataValues containing the KPI results, or a
+            FailedEvaluation of the failure values of the KPIs.
+
+        Notes
+        -----
+        The resources used by each execution layer, and by the whole
+        execution, are reported with ExecutionLayerFinishEvent and
+        WorkflowExecutionFinishEvent events. The latter is emitted, with
+        its `failed` flag, also when the execution fails. If DEBUG
+        messages are enabled on the trace logger (see
+        `force_bdss.core.evaluation_trace.TRACE_LOGGER_NAME`), each
+        execution is also logged there, with its parameters, KPIs, wall
+        time, the wall time of each data source and the error raised, if
+        any.
+
+        If the execution fails and the `on_evaluation_failure` of the MCO
+        model is "CONTINUE", the failure values of the KPIs are returned
+        in a FailedEvaluation instead of raising the error.
         """
+        try:
+            if trace_enabled():
+                return self._traced_execute(data_values)
+            return self._execute(data_values)
+        except Exception as error:
+            if self.mco_model.on_evaluation_failure != "CONTINUE":
+                raise
+            log.warning(
+                "Evaluation of the workflow failed (%s: %s). The failure "
+                "values of the KPIs are returned instead.",
+                type(error).__name__, error,
+            )
+            return FailedEvaluation(self.mco_model.failure_kpis())
+
+    def _traced_execute(self, data_values):
+        """ Executes the workflow, and logs the execution on the trace
+        logger."""
+        parameters = [data_value.value for data_value in data_values]
+        self._data_source_times = data_source_times = {}
+        start = time.perf_counter()
+        try:
+            kpi_results = self._execute(data_values)
+        except Exception as error:
+            trace_evaluation(
+                parameters,
+                wall_time=time.perf_counter() - start,
+                data_sources=data_source_times,
+                error=error,
+            )
+            raise
+        finally:
+            self._data_source_times = None
+        trace_evaluation(
+            parameters,
+            [data_value.value for data_value in kpi_results],
+            wall_time=time.perf_counter() - start,
+            data_sources=data_source_times,
+        )
+        return kpi_results
+
+    def _execute(self, data_values):
+        """ Executes the workflow, without tracing (see `execute`)."""
+        workflow_counters = resource_counters()
+        try:
+            kpi_results = self._execute_layers(data_values)
+        except Exception:
+            self.notify(
+                WorkflowExecutionFinishEvent(
+                    failed=True, **resource_usage_since(workflow_counters)
+                )
+            )
+            raise
+
+        self.notify(
+            WorkflowExecutionFinishEvent(
+                **resource_usage_since(workflow_counters)
+            )
+        )
+        return kpi_results
+
+    def _execute_layers(self, data_values):
+        """ Executes the execution layers, and returns the KPI results."""
         available_data_values = self.mco_model.bind_parameters(data_values)
 
         for index, layer in enumerate(self.execution_layers):
-            log.info("Computing data layer {}".format(index))
+            log.info("Computing data layer %d", index)
+            layer_counters = resource_counters()
             ds_results = layer.execute_layer(available_data_values)
             available_data_values += ds_results
+            self.notify(
+                ExecutionLayerFinishEvent(
+                    layer_index=index,
+                    **resource_usage_since(layer_counters)
+                )
+            )
 
         log.info("Aggregating KPI data")
-        kpi_results = self.mco_model.bind_kpis(available_data_values)
-
-        return kpi_results
+        return self.mco_model.bind_kpis(available_data_values)
 
     def verify(self):
         """ Verify the workflow.
@@ -81,6 +187,12 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         errors : list of VerifierErrors
             The list of all detected errors in the workflow.
         """
+        return self._verify(methodcaller("verify"))
+
+    def _verify(self, verify_model):
+        """ Verifies the workflow, using the `verify_model` function to
+        verify the MCO model and the data source models, so that their
+        errors can be cached by the `WorkflowVerifier`."""
         errors = []
 
         if not self.mco_model:
@@ -88,7 +200,7 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
                 VerifierError(subject=self, global_error="Workflow has no MCO")
             )
         else:
-            errors += self.mco_model.verify()
+            errors += verify_model(self.mco_model)
 
         if not self.execution_layers:
             errors.append(
@@ -99,7 +211,7 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
             )
         else:
             for layer in self.execution_layers:
-                errors += layer.verify()
+                errors += layer._verify(verify_model)
 
         return errors
 
@@ -117,7 +229,7 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         -------
         kpi_results: list
             List of values corresponding to each MCO KPI in the
-            workflow
+            workflow, or a FailedEvaluation of their failure values
         """
         return self._internal_evaluate(parameter_values)
 
@@ -137,6 +249,8 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         # Return just the values to the MCO, since the DataValue
         # class is not specific to the BaseMCO classes
         kpi_values = [kpi.value for kpi in kpi_results]
+        if isinstance(kpi_results, FailedEvaluation):
+            return FailedEvaluation(kpi_values)
 
         return kpi_values
 
@@ -149,7 +263,7 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         return state
 
     @classmethod
-    def from_json(cls, factory_registry, json_data):
+    def from_json(cls, factory_registry, json_data, copy=True):
         """ Generates the `Workflow` instance from the `json_data` dictionary.
         Explicitly populates the workflow attributes with instances from the
         `factory_registry` and data from `json_data`.
@@ -164,20 +278,29 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         json_data: dict
             Dictionary with the content of the `Workflow`'s in serialized
             format
+        copy: bool
+            If True (default), `json_data` is deep copied before use. If
+            False, the ownership of `json_data` is transferred: the created
+            objects use its content directly, and it may be modified.
 
         Returns
         -------
         workflow: Workflow
             `Workflow` instance corresponding to the `json_data`
         """
-        workflow_data = deepcopy(json_data)
+        # A single deep copy of the whole workflow data is made here, if
+        # any: the nested models are created without copying again.
+        if copy:
+            workflow_data = deepcopy(json_data)
+        else:
+            workflow_data = json_data
 
         workflow_data["mco_model"] = cls._extract_mco_model(
-            factory_registry, workflow_data
+            factory_registry, workflow_data, copy=False
         )
 
         workflow_data["execution_layers"] = cls._extract_execution_layers(
-            factory_registry, workflow_data
+            factory_registry, workflow_data, copy=False
         )
 
         workflow_data[
@@ -190,7 +313,7 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         return workflow
 
     @staticmethod
-    def _extract_mco_model(factory_registry, workflow_data):
+    def _extract_mco_model(factory_registry, workflow_data, copy=True):
         """ Generates the BaseMCOModel from the `workflow_data` dictionary.
 
         Parameters
@@ -201,6 +324,8 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         workflow_data: dict
             Dictionary with the content of the `BaseMCOModel`s in
             serialized format
+        copy: bool
+            Whether the MCO model data is copied before use
 
         Returns
         -------
@@ -211,12 +336,16 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         if mco_data is None:
             return None
         mco_factory = factory_registry.mco_factory_by_id(mco_data["id"])
-        return mco_factory.model_class.from_json(
-            mco_factory, mco_data["model_data"]
+        if copy:
+            return mco_factory.model_class.from_json(
+                mco_factory, mco_data["model_data"]
+            )
+        return model_from_json(
+            mco_factory.model_class, mco_factory, mco_data["model_data"]
         )
 
     @staticmethod
-    def _extract_execution_layers(factory_registry, workflow_data):
+    def _extract_execution_layers(factory_registry, workflow_data, copy=True):
         """ Generates the List(ExecutionLayer) from the `workflow_data` dictionary.
 
         Parameters
@@ -227,6 +356,8 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         workflow_data: dict
             Dictionary with the content of the `ExecutionLayer`s in
             serialized format
+        copy: bool
+            Whether the execution layers data is copied before use
 
         Returns
         -------
@@ -235,7 +366,9 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         """
         execution_layers = []
         for layer_data in workflow_data["execution_layers"]:
-            layer = ExecutionLayer.from_json(factory_registry, layer_data)
+            layer = ExecutionLayer.from_json(
+                factory_registry, layer_data, copy=copy
+            )
             execution_layers.append(layer)
 
         return execution_layers
@@ -277,4 +410,9 @@ class Workflow(EventNotifierMixin, HasStrictTraits):
         event: BaseDriverEvent
             The BaseDriverEvent that has been changed
         """
+        if (self._data_source_times is not None
+                and isinstance(event, DataSourceFinishEvent)):
+            times = self._data_source_times
+            name = event.data_source_name
+            times[name] = times.get(name, 0.0) + event.wall_time
         self.notify(event)
@@ -0,0 +1,45 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from force_bdss.core_plugins.base_extension_plugin import (
+    BaseExtensionPlugin
+)
+from force_bdss.ids import plugin_id
+
+
+CORE_LISTENERS_PLUGIN_ID = plugin_id("enthought", "core_listeners", 0)
+
+
+class CoreListenersPlugin(BaseExtensionPlugin):
+    """Plugin contributing the notification listeners shipped with the
+    BDSS, so that any workflow can use them.
+
+    The listener modules, which import the socket and HTTP servers, are
+    only imported when the factories are created."""
+
+    id = CORE_LISTENERS_PLUGIN_ID
+
+    def get_name(self):
+        return "BDSS core listeners"
+
+    def get_version(self):
+        return 0
+
+    def get_description(self):
+        return (
+            "Notification listeners for the monitoring of the MCO: event "
+            "streaming and Prometheus metrics."
+        )
+
+    def get_factory_classes(self):
+        from force_bdss.notification_listeners.event_stream_listener import (
+            EventStreamListenerFactory
+        )
+        from force_bdss.notification_listeners.metrics_listener import (
+            MetricsListenerFactory
+        )
+
+        return [
+            EventStreamListenerFactory,
+            MetricsListenerFactory,
+        ]
@@ -2,9 +2,9 @@
 #  All rights reserved.
 
 from envisage.api import ExtensionPoint, Plugin, ServiceOffer
-from traits.api import List, Instance, provides
+from traits.api import List, Instance, Property, provides
 
-from force_bdss.core.factory_registry import FactoryRegistry
+from force_bdss.core.factory_registry import FactoryRegistry, index_by_id
 from force_bdss.core.i_factory_registry import IFactoryRegistry
 from force_bdss.ids import ExtensionPointID
 from force_bdss.notification_listeners.i_notification_listener_factory import \
@@ -57,6 +57,16 @@ class FactoryRegistryPlugin(Plugin, FactoryRegistry):
         id=ExtensionPointID.UI_HOOKS_FACTORIES
     )
 
+    # The extension points do not notify the changes of their contributions,
+    # so the indexes of the factories can not be cached: they are rebuilt
+    # at each lookup. The application uses the FactoryRegistry service
+    # instead, whose indexes are cached.
+    _mco_factories_by_id = Property(transient=True)
+
+    _data_source_factories_by_id = Property(transient=True)
+
+    _notification_listener_factories_by_id = Property(transient=True)
+
     #: Service offers provided by this plugin.
     service_offers = List(
         Instance(ServiceOffer),
@@ -71,6 +81,15 @@ class FactoryRegistryPlugin(Plugin, FactoryRegistry):
             ui_hooks_factories=self.ui_hooks_factories,  # noqa: E501
         )
 
+    def _get__mco_factories_by_id(self):
+        return index_by_id(self.mco_factories)
+
+    def _get__data_source_factories_by_id(self):
+        return index_by_id(self.data_source_factories)
+
+    def _get__notification_listener_factories_by_id(self):
+        return index_by_id(self.notification_listener_factories)
+
     def _service_offers_default(self):
         factory_registry_offer = ServiceOffer(
             protocol=IFactoryRegistry,
@@ -0,0 +1,36 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+
+from force_bdss.core_plugins.core_listeners_plugin import (
+    CoreListenersPlugin
+)
+from force_bdss.notification_listeners.event_stream_listener import (
+    EventStreamListenerFactory
+)
+from force_bdss.notification_listeners.metrics_listener import (
+    MetricsListenerFactory
+)
+
+
+class TestCoreListenersPlugin(unittest.TestCase):
+    def test_factories(self):
+        plugin = CoreListenersPlugin()
+        self.assertFalse(plugin.broken)
+        factories = plugin.notification_listener_factories
+        self.assertEqual(2, len(factories))
+        self.assertIsInstance(factories[0], EventStreamListenerFactory)
+        self.assertIsInstance(factories[1], MetricsListenerFactory)
+        self.assertEqual(
+            "force.bdss.enthought.plugin.core_listeners.v0.factory."
+            "event_stream_listener",
+            factories[0].id
+        )
+        self.assertEqual(
+            "force.bdss.enthought.plugin.core_listeners.v0.factory."
+            "metrics_listener",
+            factories[1].id
+        )
+        self.assertEqual([], plugin.data_source_factories)
+        self.assertEqual([], plugin.mco_factories)
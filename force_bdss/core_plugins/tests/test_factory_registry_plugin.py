@@ -78,3 +78,37 @@ class TestFactoryRegistryWithContent(unittest.TestCase):
             self.registry.notification_listener_factory_by_id(
                 factory_id(self.plugin.id, "foo")
             )
+
+    def test_bulk_lookup(self):
+        id = factory_id(self.plugin.id, "dummy_data_source")
+        factories = self.registry.data_source_factories_by_id([id, id])
+        self.assertEqual([id], list(factories))
+        self.assertEqual(id, factories[id].id)
+
+        self.assertEqual({}, self.registry.data_source_factories_by_id([]))
+
+        missing = [
+            factory_id(self.plugin.id, "foo"),
+            factory_id(self.plugin.id, "bar"),
+        ]
+        with self.assertRaisesRegex(KeyError, "foo.*bar"):
+            self.registry.data_source_factories_by_id([id] + missing)
+
+
+class TestFactoryRegistryContributions(unittest.TestCase):
+
+    def test_lookup_after_contribution(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            registry = FactoryRegistryPlugin()
+            app = Application([registry])
+            app.start()
+            self.addCleanup(app.stop)
+
+            plugin = DummyExtensionPlugin()
+            id = factory_id(plugin.id, "dummy_data_source")
+            with self.assertRaises(KeyError):
+                registry.data_source_factory_by_id(id)
+
+            app.add_plugin(plugin)
+            self.assertEqual(id, registry.data_source_factory_by_id(id).id)
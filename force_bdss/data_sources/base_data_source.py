@@ -2,10 +2,25 @@
 #  All rights reserved.
 
 import abc
+import logging
+import threading
+import time
+
 from traits.api import ABCHasStrictTraits, Instance
 
+from force_bdss.core.resource_usage import (
+    resource_counters,
+    resource_usage_since,
+)
 from force_bdss.data_sources.i_data_source_factory import IDataSourceFactory
 
+log = logging.getLogger(__name__)
+
+
+class DataSourceTimeoutError(Exception):
+    """ Raised when a run of a data source exceeds the timeout of its
+    model."""
+
 
 class BaseDataSource(ABCHasStrictTraits):
     """Base class for the DataSource, any computational engine/retriever
@@ -24,12 +39,85 @@ class BaseDataSource(ABCHasStrictTraits):
         """ Private method to execute the DataSource from the ExecutionLayer.
         Sends BaseDriverEvent event before and after the DataSource execution,
         such that the Workflow can be interacted with during its execution.
+        The finish event reports the resources used by the execution.
+
+        The run is timed out and retried as defined by the `run_timeout`,
+        `run_max_retries` and `run_retry_delay` of the model. A run that
+        timed out is not retried, since it continues in the background: a
+        retry would run concurrently with it.
         """
         model.notify_start_event()
-        result = self.run(model, parameters)
-        model.notify_finish_event()
+        counters = resource_counters()
+        attempt = 0
+        while True:
+            try:
+                result = self._run_once(model, parameters)
+                break
+            except DataSourceTimeoutError:
+                raise
+            except Exception as error:
+                if attempt >= model.run_max_retries:
+                    raise
+                attempt += 1
+                log.warning(
+                    "Run of data source %s failed (%s: %s). Retrying "
+                    "(%d/%d).", self.factory.name, type(error).__name__,
+                    error, attempt, model.run_max_retries,
+                )
+                if model.run_retry_delay > 0:
+                    time.sleep(model.run_retry_delay)
+        model.notify_finish_event(**resource_usage_since(counters))
         return result
 
+    def _run_once(self, model, parameters):
+        """ Runs the data source, in a separate thread if the model
+        defines a timeout.
+
+        Python threads can not be interrupted: a run that times out is
+        abandoned, but continues in the background until it returns. Until
+        then, the next runs of the data source fail immediately with a
+        DataSourceTimeoutError, so that the runs of a data source never
+        overlap, and that at most one abandoned thread is left per data
+        source model. Data sources running external programs should
+        terminate them themselves.
+        """
+        abandoned_run = model._abandoned_run
+        if abandoned_run is not None:
+            if abandoned_run.is_alive():
+                raise DataSourceTimeoutError(
+                    f"A previous run of data source {self.factory.name} "
+                    "timed out and is still running"
+                )
+            model._abandoned_run = None
+
+        if model.run_timeout <= 0:
+            return self.run(model, parameters)
+
+        outcome = {}
+
+        def run():
+            try:
+                outcome["result"] = self.run(model, parameters)
+            except BaseException as error:
+                outcome["error"] = error
+
+        thread = threading.Thread(
+            target=run,
+            name=f"BDSS data source {self.factory.name}",
+            daemon=True,
+        )
+        thread.start()
+        thread.join(model.run_timeout)
+        if thread.is_alive():
+            model._abandoned_run = thread
+            raise DataSourceTimeoutError(
+                f"The run of data source {self.factory.name} did not "
+                f"finish within {model.run_timeout} seconds"
+            )
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
     @abc.abstractmethod
     def run(self, model, parameters):
         """
@@ -2,7 +2,7 @@
 #  All rights reserved.
 
 import logging
-from traits.api import provides, Type
+from traits.api import Instance, provides, Type
 
 from force_bdss.core.base_factory import BaseFactory
 from force_bdss.data_sources.base_data_source import BaseDataSource
@@ -41,6 +41,10 @@ class BaseDataSourceFactory(BaseFactory):
     #: Define this to your DataSourceModel
     model_class = Type(BaseDataSourceModel, allow_none=False)
 
+    #: The data source used to retrieve the slots of the models, created
+    #: on the first call to `slots`
+    _slots_data_source = Instance(BaseDataSource, transient=True)
+
     def __init__(self, plugin, *args, **kwargs):
         super(BaseDataSourceFactory, self).__init__(
             plugin=plugin,
@@ -75,6 +79,49 @@ class BaseDataSourceFactory(BaseFactory):
         """
         return self.data_source_class(self)
 
+    def slots(self, model):
+        """Returns the input and output slots of the data source for the
+        given `model`, as returned by `BaseDataSource.slots`.
+
+        By default, a single data source is created by `create_data_source`
+        and used for all the models of this factory. Reimplement this method
+        if the slots can be determined from the model alone, so that no data
+        source is created to verify a workflow.
+
+        Parameters
+        ----------
+        model: BaseDataSourceModel
+            The model of the data source
+
+        Returns
+        -------
+        (input_slots, output_slots): tuple[tuple, tuple]
+            The input and output slots of the data source
+        """
+        if self._slots_data_source is None:
+            try:
+                self._slots_data_source = self.create_data_source()
+            except Exception:
+                log.exception(
+                    "Unable to create data source from factory '%s', plugin "
+                    "'%s'. This might indicate a programming error",
+                    self.id,
+                    self.plugin_id,
+                )
+                raise
+
+        try:
+            return self._slots_data_source.slots(model)
+        except Exception:
+            log.exception(
+                "Unable to retrieve slot information from data source"
+                " created by factory '%s', plugin '%s'. This might "
+                "indicate a programming error.",
+                self.id,
+                self.plugin_id
+            )
+            raise
+
     def create_model(self, model_data=None):
         """Factory method.
         Creates the model object (or network of model objects) of the KPI
@@ -2,10 +2,10 @@
 #  All rights reserved.
 
 from copy import deepcopy
-from logging import getLogger
+import threading
 
 from traits.api import (
-    Instance, List, Event, on_trait_change, Type
+    Any, Float, Instance, Int, List, Event, on_trait_change, Type
 )
 
 from force_bdss.core.base_model import BaseModel
@@ -19,9 +19,6 @@ from force_bdss.events.data_source_events import (
 )
 
 
-logger = getLogger(__name__)
-
-
 class BaseDataSourceModel(BaseModel):
     """Base class for the factory specific DataSource models.
     This model will also provide, through traits/traitsui magic the View
@@ -53,6 +50,24 @@ class BaseDataSourceModel(BaseModel):
     #: this and adapt the visual entries.
     changes_slots = Event()
 
+    #: Time, in seconds, after which a run of the data source is abandoned,
+    #: and fails. If 0, the runs are not timed out.
+    run_timeout = Float(0.0)
+
+    #: Number of times a failed run of the data source is retried
+    run_max_retries = Int(0)
+
+    #: Time, in seconds, waited before retrying a failed run
+    run_retry_delay = Float(0.0)
+
+    #: The input and output slots returned by the factory for the current
+    #: state of the model, or None if they must be retrieved again
+    _slots = Any(visible=False, transient=True)
+
+    #: The thread of the last run of the data source that timed out, which
+    #: may still be running
+    _abandoned_run = Instance(threading.Thread, visible=False, transient=True)
+
     #: Type of the Data Source Start event
     _start_event_type = Type(DataSourceStartEvent,
                              visible=False, transient=True)
@@ -74,28 +89,7 @@ class BaseDataSourceModel(BaseModel):
         errors : list of VerifierErrors
             The list of all detected errors in the data source model.
         """
-        try:
-            data_source = self.factory.create_data_source()
-        except Exception:
-            logger.exception(
-                "Unable to create data source from factory '%s', plugin "
-                "'%s'. This might indicate a programming error",
-                self.factory.id,
-                self.factory.plugin_id,
-            )
-            raise
-
-        try:
-            input_slots, output_slots = data_source.slots(self)
-        except Exception:
-            logger.exception(
-                "Unable to retrieve slot information from data source"
-                " created by factory '%s', plugin '%s'. This might "
-                "indicate a programming error.",
-                self.factory.id,
-                self.factory.plugin_id
-            )
-            raise
+        input_slots, output_slots = self.slots()
 
         factory = self.factory
         errors = []
@@ -154,8 +148,47 @@ class BaseDataSourceModel(BaseModel):
         for output_slot in self.output_slot_info:
             errors += output_slot.verify()
 
+        for trait_name in (
+                "run_timeout", "run_max_retries", "run_retry_delay"):
+            if getattr(self, trait_name) < 0:
+                error_txt = f"The {trait_name} must not be negative"
+                errors.append(
+                    VerifierError(
+                        subject=self,
+                        trait_name=trait_name,
+                        local_error=error_txt,
+                        global_error=(
+                            "A data source model has an invalid failure "
+                            "policy"
+                        ),
+                    )
+                )
+
         return errors
 
+    def slots(self):
+        """ Returns the input and output slots of the data source for this
+        model.
+
+        The slots are retrieved from the factory, and cached until a trait
+        of the model changes, or `changes_slots` is fired, so that
+        repeated verifications of a workflow are cheap.
+
+        Returns
+        -------
+        (input_slots, output_slots): tuple[tuple, tuple]
+            The input and output slots of the data source
+        """
+        if self._slots is None:
+            self._slots = self.factory.slots(self)
+        return self._slots
+
+    def _anytrait_changed(self, name, old, new):
+        # Any change of the model, including the notifications of
+        # `changes_slots`, may change the slots.
+        if name not in ("_slots", "_abandoned_run", "event"):
+            self._slots = None
+
     def notify_start_event(self):
         """ Creates base event indicating the start of the MCO."""
         self.notify(
@@ -164,11 +197,20 @@ class BaseDataSourceModel(BaseModel):
             )
         )
 
-    def notify_finish_event(self):
-        """ Creates base event indicating the finished MCO."""
+    def notify_finish_event(self, **resource_usage):
+        """ Creates base event indicating the finished MCO.
+
+        Parameters
+        ----------
+        resource_usage: dict
+            The resources used by the data source, as returned by
+            `force_bdss.core.resource_usage.resource_usage_since`
+        """
         self.notify(
             self._finish_event_type(
-                output_names=list(p.name for p in self.output_slot_info)
+                output_names=list(p.name for p in self.output_slot_info),
+                data_source_name=self.factory.name,
+                **resource_usage
             )
         )
 
@@ -180,7 +222,7 @@ class BaseDataSourceModel(BaseModel):
             self.changes_slots = True
 
     @classmethod
-    def from_json(cls, factory, json_data):
+    def from_json(cls, factory, json_data, copy=True):
         """ Instantiate an BaseMCOModel object from a `json_data`
         dictionary and the generating `factory` object.
 
@@ -190,6 +232,10 @@ class BaseDataSourceModel(BaseModel):
             Generating factory object
         json_data: dict
             Dictionary with a DataSourceModel serialized data
+        copy: bool
+            If True (default), `json_data` is deep copied before use. If
+            False, the ownership of `json_data` is transferred: the created
+            objects use its content directly, and it may be modified.
 
         Returns
         ----------
@@ -197,7 +243,7 @@ class BaseDataSourceModel(BaseModel):
             BaseDataSourceModel instance with attributes values from
             the `json_data` dict
         """
-        data = deepcopy(json_data)
+        data = deepcopy(json_data) if copy else json_data
 
         input_slots = [InputSlotInfo(**d) for d in data["input_slot_info"]]
         data["input_slot_info"] = input_slots
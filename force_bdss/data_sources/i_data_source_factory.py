@@ -36,6 +36,11 @@ class IDataSourceFactory(IFactory):
         """Returns an instance of subclass BaseDataSource
         """
 
+    def slots(self, model):
+        """Returns the input and output slots of the data source for the
+        given model
+        """
+
     def create_model(self):
         """Returns an instance of subclass BaseDataSourceModel
         """
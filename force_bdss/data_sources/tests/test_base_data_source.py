@@ -1,10 +1,14 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import threading
 import unittest
 
+import testfixtures
 from traits.testing.api import UnittestTools
 
+from force_bdss.core.data_value import DataValue
+from force_bdss.data_sources.base_data_source import DataSourceTimeoutError
 from force_bdss.data_sources.i_data_source_factory import IDataSourceFactory
 from force_bdss.tests.dummy_classes.data_source import (
     DummyDataSource,
@@ -17,6 +21,7 @@ from unittest import mock
 class TestBaseDataSource(unittest.TestCase, UnittestTools):
     def setUp(self):
         self.factory = mock.Mock(spec=IDataSourceFactory)
+        self.factory.name = "Dummy data source"
         self.ds = DummyDataSource(self.factory)
         self.model = DummyDataSourceModel(self.factory)
 
@@ -29,3 +34,124 @@ class TestBaseDataSource(unittest.TestCase, UnittestTools):
             with self.assertTraitChanges(self.model, "event", count=2):
                 ds._run(self.model, [])
         self.assertEqual(1, mock_run.call_count)
+
+    def test__run_resource_usage(self):
+        events = []
+        self.model.on_trait_change(lambda event: events.append(event), "event")
+        self.ds._run(self.model, [])
+
+        finish_event = events[1]
+        self.assertEqual("Dummy data source", finish_event.data_source_name)
+        self.assertGreater(finish_event.wall_time, 0.0)
+        self.assertGreaterEqual(finish_event.cpu_time, 0.0)
+        self.assertGreaterEqual(finish_event.peak_rss_delta, 0)
+
+    def test__run_retries(self):
+        results = iter([ValueError("first"), ValueError("second"), [1.0]])
+
+        def run(model, parameters):
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        self.model.run_max_retries = 2
+        with mock.patch.object(DummyDataSource, "run", side_effect=run), \
+                testfixtures.LogCapture() as capture:
+            self.assertEqual([1.0], self.ds._run(self.model, []))
+        messages = [record.getMessage() for record in capture.records]
+        self.assertEqual(2, len(messages))
+        self.assertEqual(
+            "Run of data source Dummy data source failed (ValueError: "
+            "second). Retrying (2/2).",
+            messages[1]
+        )
+
+        # The error of the last attempt is raised
+        self.model.run_max_retries = 1
+        with mock.patch.object(
+                DummyDataSource, "run",
+                side_effect=[ValueError("first"), ValueError("second")]), \
+                testfixtures.LogCapture(), \
+                self.assertRaisesRegex(ValueError, "second"):
+            self.ds._run(self.model, [])
+
+    def test__run_timeout(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def run(model, parameters):
+            if parameters:
+                release.wait()
+            return [DataValue(value=1.0)]
+
+        self.model.run_timeout = 0.1
+        with mock.patch.object(DummyDataSource, "run", side_effect=run):
+            result = self.ds._run(self.model, [])
+            self.assertEqual(1.0, result[0].value)
+
+            with self.assertRaisesRegex(
+                    DataSourceTimeoutError,
+                    "Dummy data source did not finish within 0.1 seconds"):
+                self.ds._run(self.model, ["hang"])
+
+        # The data source is not run again while the abandoned run is alive
+        with mock.patch.object(DummyDataSource, "run") as mock_run, \
+                self.assertRaisesRegex(
+                    DataSourceTimeoutError,
+                    "A previous run of data source Dummy data source timed "
+                    "out and is still running"):
+            self.ds._run(self.model, [])
+        mock_run.assert_not_called()
+
+        release.set()
+        self.model._abandoned_run.join(5.0)
+
+        # Errors are raised in the calling thread
+        with mock.patch.object(
+                DummyDataSource, "run", side_effect=ValueError("error")), \
+                self.assertRaisesRegex(ValueError, "error"):
+            self.ds._run(self.model, [])
+
+    def test__run_timeout_not_retried(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def run(model, parameters):
+            calls.append(parameters)
+            release.wait()
+            return [DataValue(value=1.0)]
+
+        self.model.run_timeout = 0.1
+        self.model.run_max_retries = 2
+        with mock.patch.object(DummyDataSource, "run", side_effect=run), \
+                testfixtures.LogCapture() as capture:
+            with self.assertRaises(DataSourceTimeoutError):
+                self.ds._run(self.model, [])
+        # The abandoned run is not run again concurrently
+        self.assertEqual(1, len(calls))
+        capture.check()
+
+    def test__run_abandoned_run_finished(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def run(model, parameters):
+            release.wait()
+            return [DataValue(value=1.0)]
+
+        self.model.run_timeout = 0.1
+        with mock.patch.object(DummyDataSource, "run", side_effect=run):
+            with self.assertRaises(DataSourceTimeoutError):
+                self.ds._run(self.model, [])
+            thread = self.model._abandoned_run
+            self.assertTrue(thread.is_alive())
+
+            release.set()
+            thread.join(5.0)
+            result = self.ds._run(self.model, [])
+
+        self.assertEqual(1.0, result[0].value)
+        self.assertIsNone(self.model._abandoned_run)
+        self.assertTrue(self.model.trait("_abandoned_run").transient)
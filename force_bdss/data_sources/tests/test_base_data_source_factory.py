@@ -2,6 +2,7 @@
 #  All rights reserved.
 
 import unittest
+from unittest import mock
 
 import testfixtures
 
@@ -13,6 +14,11 @@ from force_bdss.data_sources.tests.test_base_data_source_model import \
 from force_bdss.tests.dummy_classes.data_source import DummyDataSourceFactory
 
 
+class BadDataSource(DummyDataSource):
+    def slots(self, model):
+        raise Exception("bad slots")
+
+
 class TestBaseDataSourceFactory(unittest.TestCase):
     def setUp(self):
         self.plugin = {'id': "pid", 'name': 'Plugin'}
@@ -63,3 +69,46 @@ class TestBaseDataSourceFactory(unittest.TestCase):
         with testfixtures.LogCapture():
             with self.assertRaises(TraitError):
                 Broken(self.plugin)
+
+    def test_slots(self):
+        factory = DummyDataSourceFactory(self.plugin)
+        models = [factory.create_model() for _ in range(3)]
+        with mock.patch.object(
+            DummyDataSourceFactory, "create_data_source", autospec=True,
+            side_effect=DummyDataSourceFactory.create_data_source
+        ) as create_data_source:
+            for model in models:
+                input_slots, output_slots = factory.slots(model)
+                self.assertEqual("TYPE1", input_slots[0].type)
+                self.assertEqual("TYPE2", output_slots[0].type)
+        # A single data source is created for all the models
+        self.assertEqual(1, create_data_source.call_count)
+
+    def test_slots_bad_factory(self):
+        class Broken(DummyDataSourceFactory):
+            def create_data_source(self):
+                raise Exception("Bad data source factory")
+
+        factory = Broken(self.plugin)
+        with testfixtures.LogCapture() as capture:
+            with self.assertRaisesRegex(
+                    Exception, "Bad data source factory"):
+                factory.slots(factory.create_model())
+            capture.check(
+                ("force_bdss.data_sources.base_data_source_factory",
+                 "ERROR",
+                 "Unable to create data source from factory "
+                 "'pid.factory.dummy_data_source', plugin 'pid'. This "
+                 "might indicate a programming error")
+            )
+
+    def test_slots_bad_data_source(self):
+        class Broken(DummyDataSourceFactory):
+            def get_data_source_class(self):
+                return BadDataSource
+
+        factory = Broken(self.plugin)
+        with testfixtures.LogCapture() as capture:
+            with self.assertRaisesRegex(Exception, "bad slots"):
+                factory.slots(factory.create_model())
+            self.assertEqual("ERROR", capture.records[0].levelname)
@@ -2,15 +2,14 @@
 #  All rights reserved.
 
 import unittest
-import testfixtures
 
 from traits.api import Int
 from traits.testing.api import UnittestTools
 from force_bdss.core.input_slot_info import InputSlotInfo
 from force_bdss.core.output_slot_info import OutputSlotInfo
+from force_bdss.core.slot import Slot
 from force_bdss.data_sources.base_data_source_model import BaseDataSourceModel
 from force_bdss.tests.dummy_classes.data_source import (
-    DummyDataSource,
     DummyDataSourceModel,
 )
 from force_bdss.tests.dummy_classes.factory_registry import (
@@ -30,11 +29,6 @@ class ChangesSlotsModel(BaseDataSourceModel):
     c = Int(changes_slots=False)
 
 
-class BadDataSource(DummyDataSource):
-    def slots(self, model):
-        raise Exception("bad slots")
-
-
 class TestBaseDataSourceModel(unittest.TestCase, UnittestTools):
     def setUp(self):
         self.mock_factory = mock.Mock(
@@ -47,7 +41,13 @@ class TestBaseDataSourceModel(unittest.TestCase, UnittestTools):
             model.__getstate__(),
             {
                 "id": "id",
-                "model_data": {"input_slot_info": [], "output_slot_info": []},
+                "model_data": {
+                    "input_slot_info": [],
+                    "output_slot_info": [],
+                    "run_timeout": 0.0,
+                    "run_max_retries": 0,
+                    "run_retry_delay": 0.0,
+                },
             },
         )
 
@@ -70,10 +70,29 @@ class TestBaseDataSourceModel(unittest.TestCase, UnittestTools):
                         {"source": "Environment", "name": "bar"},
                     ],
                     "output_slot_info": [{"name": "baz"}, {"name": "quux"}],
+                    "run_timeout": 0.0,
+                    "run_max_retries": 0,
+                    "run_retry_delay": 0.0,
                 },
             },
         )
 
+    def test_verify_failure_policy(self):
+        self.mock_factory.slots.return_value = ((), ())
+        model = DummyDataSourceModel(self.mock_factory)
+        self.assertEqual([], model.verify())
+
+        model.run_timeout = -1.0
+        model.run_max_retries = -1
+        errors = model.verify()
+        self.assertEqual(
+            ["run_timeout", "run_max_retries"],
+            [error.trait_name for error in errors]
+        )
+        self.assertEqual(
+            "The run_timeout must not be negative", errors[0].local_error
+        )
+
     def test_changes_slots(self):
         model = ChangesSlotsModel(self.mock_factory)
 
@@ -86,33 +105,39 @@ class TestBaseDataSourceModel(unittest.TestCase, UnittestTools):
         with self.assertTraitDoesNotChange(model, "changes_slots"):
             model.c = 5
 
-    def test_bad_factory(self):
-        def create_data_source():
-            raise Exception("Bad data source factory")
-
-        self.mock_factory.create_data_source = create_data_source
-        model = DummyDataSourceModel(self.mock_factory)
-        with testfixtures.LogCapture() as capture:
-            with self.assertRaisesRegex(
-                    Exception, "Bad data source factory"):
-                model.verify()
-            capture.check(
-                ("force_bdss.data_sources.base_data_source_model",
-                 "ERROR",
-                 "Unable to create data source from factory "
-                 "'id', plugin 'dummy_id'. This "
-                 "might indicate a programming error")
-            )
-
     def test_bad_slots(self):
-        self.mock_factory.create_data_source = mock.MagicMock(
-            return_value=BadDataSource(self.mock_factory)
-        )
+        self.mock_factory.slots.side_effect = Exception("bad slots")
         model = DummyDataSourceModel(self.mock_factory)
-        with testfixtures.LogCapture():
-            with self.assertRaisesRegex(
-                    Exception, "bad slots"):
-                model.verify()
+        with self.assertRaisesRegex(Exception, "bad slots"):
+            model.verify()
+
+    def test_slots_cache(self):
+        slots = ((Slot(),), (Slot(),))
+        self.mock_factory.slots.return_value = slots
+        model = ChangesSlotsModel(
+            self.mock_factory,
+            input_slot_info=[InputSlotInfo(name="foo")],
+            output_slot_info=[OutputSlotInfo(name="bar")],
+        )
+
+        self.assertEqual([], model.verify())
+        model.verify()
+        self.assertIs(slots, model.slots())
+        self.assertEqual(1, self.mock_factory.slots.call_count)
+
+        # Notifications of the model do not change the slots
+        model.notify_start_event()
+        model.slots()
+        self.assertEqual(1, self.mock_factory.slots.call_count)
+
+        for name in ["a", "b", "c"]:
+            setattr(model, name, 1)
+            model.slots()
+        self.assertEqual(4, self.mock_factory.slots.call_count)
+
+        model.changes_slots = True
+        model.slots()
+        self.assertEqual(5, self.mock_factory.slots.call_count)
 
     def test_from_json(self):
         registry = DummyFactoryRegistry()
@@ -129,7 +154,10 @@ class TestBaseDataSourceModel(unittest.TestCase, UnittestTools):
         self.assertDictEqual(
             model.__getstate__(),
             {
-                "model_data": model_data,
+                "model_data": dict(
+                    model_data, run_timeout=0.0, run_max_retries=0,
+                    run_retry_delay=0.0
+                ),
                 "id": "force.bdss.enthought.plugin.test.v0.factory."
                       "dummy_data_source",
             },
@@ -8,6 +8,10 @@ from traits.api import HasStrictTraits, TraitError
 
 from force_bdss.utilities import pop_dunder_recursive, nested_getstate
 
+#: Cache of the event classes retrieved by BaseDriverEvent.get_event_class,
+#: by id string
+_EVENT_CLASS_CACHE = {}
+
 
 class DriverEventTypeError(TypeError):
     """Raised when a BaseDriverEvent is attempted to be instantiated with a
@@ -42,9 +46,22 @@ class BaseDriverEvent(HasStrictTraits):
         """
         return json.dumps(self.__getstate__())
 
+    def dumps_binary(self):
+        """ Returns the state of the BaseDriverEvent subclass instance,
+        serialized in the compact binary format of the
+        `force_bdss.events.event_codec` module.
+
+        Returns
+        ----------
+        bytes
+        """
+        from .event_codec import dumps_binary
+        return dumps_binary(self)
+
     @staticmethod
     def get_event_class(id_string):
-        """Retrieve the class object from the id_string
+        """Retrieve the class object from the id_string. Class objects
+        are cached, so that the module is imported only once per id.
 
         Parameters
         ----------
@@ -64,6 +81,11 @@ class BaseDriverEvent(HasStrictTraits):
             If the class from the `id_string` is not a subclass of
             BaseDriverEvent
         """
+        try:
+            return _EVENT_CLASS_CACHE[id_string]
+        except KeyError:
+            pass
+
         class_module, class_name = id_string.rsplit(".", 1)
         module = importlib.import_module(class_module)
         try:
@@ -79,6 +101,7 @@ class BaseDriverEvent(HasStrictTraits):
             raise DriverEventTypeError(
                 f"Class {cls} must be a subclass of BaseDriverEvent"
             )
+        _EVENT_CLASS_CACHE[id_string] = cls
         return cls
 
     @classmethod
@@ -149,3 +172,16 @@ class BaseDriverEvent(HasStrictTraits):
                 f"with the json.loads method and raises {e}"
             )
         return cls.from_json(json_data)
+
+    @classmethod
+    def loads_binary(cls, data):
+        """ Create a BaseDriverEvent subclass object from `data` in
+        the compact binary format, as generated by `dumps_binary`.
+
+        Parameters
+        ----------
+        data: `bytes`, `bytearray` or `memoryview`
+            Binary representation of the event
+        """
+        from .event_codec import loads_binary
+        return loads_binary(data)
@@ -1,6 +1,7 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+from .execution_events import ResourceUsageEvent
 from .mco_events import MCORuntimeEvent
 
 from traits.api import (
@@ -27,13 +28,17 @@ class DataSourceStartEvent(MCORuntimeEvent):
         return self.input_names
 
 
-class DataSourceFinishEvent(MCORuntimeEvent):
+class DataSourceFinishEvent(ResourceUsageEvent):
     """ The Data Source driver should emit this event when the
-    DataSource.run method finishes."""
+    DataSource.run method finishes, with the resources used by the
+    method."""
 
     #: The names assigned to the inputs.
     output_names = List(Str())
 
+    #: The name of the factory of the data source
+    data_source_name = Str()
+
     def serialize(self):
         """ Provides serialized form of DataSourceStartEvent
         for further data storage
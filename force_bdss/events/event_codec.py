@@ -0,0 +1,560 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Compact binary serialization of BaseDriverEvent objects.
+
+The binary format is a tagged, msgpack-style encoding that avoids the
+`__getstate__` / JSON round trip of `BaseDriverEvent.dumps_json`.
+Events are identified by a numeric code taken from a registry of event
+types, so that no module import is required to resolve the event class
+upon decoding. Events whose class is not registered are identified by
+their full class path instead, as in the JSON format.
+
+A stream starts with a 4 bytes header (magic and format version),
+followed either by a single encoded event (`dumps_binary`), or by the
+number of events and the encoded events (`dumps_binary_batch`).
+"""
+
+import numbers
+import struct
+
+from traits.api import HasTraits, TraitError
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.utilities import pop_dunder_recursive
+
+from .base_driver_event import (
+    BaseDriverEvent,
+    DriverEventDeserializationError,
+    DriverEventTypeError,
+)
+from .data_source_events import DataSourceStartEvent, DataSourceFinishEvent
+from .execution_events import (
+    CachedEvaluationEvent,
+    ExecutionLayerFinishEvent,
+    ResourceUsageEvent,
+    WorkflowExecutionFinishEvent,
+)
+from .mco_events import (
+    MCOStartEvent,
+    MCOFinishEvent,
+    MCOProgressEvent,
+    MCOProgressBatchEvent,
+    MCORuntimeEvent,
+    WeightedMCOStartEvent,
+    WeightedMCOProgressEvent,
+)
+
+#: Stream header: magic bytes and format version
+BINARY_FORMAT_VERSION = 1
+_HEADER = b"FBE" + bytes([BINARY_FORMAT_VERSION])
+
+#: Value tags
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_BIGINT = 0x04
+_FLOAT = 0x05
+_SHORT_STR = 0x06
+_STR = 0x07
+_BYTES = 0x08
+_LIST = 0x09
+_DICT = 0x0A
+_DATA_VALUE = 0x0B
+_EVENT = 0x0C
+
+_DATA_VALUE_QUALITIES = ("AVERAGE", "POOR", "GOOD")
+_QUALITY_INDEX = {
+    quality: index for index, quality in enumerate(_DATA_VALUE_QUALITIES)
+}
+
+_B = struct.Struct("<B")
+_H = struct.Struct("<H")
+_I = struct.Struct("<I")
+_Q = struct.Struct("<q")
+_D = struct.Struct("<d")
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+#: Numeric code reserved to events identified by their class path
+_UNREGISTERED_CODE = 0
+
+#: Registry of event classes by numeric code, and vice versa
+_EVENT_CLASSES = {}
+_EVENT_CODES = {}
+
+#: Cache of the serializable trait names, by event class
+_EVENT_TRAIT_NAMES = {}
+
+
+class BinaryEventCodecError(ValueError):
+    """Raised when data can not be encoded in, or decoded from,
+    the binary event format."""
+
+
+def register_event_type(klass, code):
+    """ Registers a BaseDriverEvent subclass with a numeric code, that
+    identifies it in the binary format. Both the encoding and the decoding
+    ends must register the same classes with the same codes.
+
+    Parameters
+    ----------
+    klass: BaseDriverEvent subclass
+        The event class to register
+    code: int
+        A unique integer between 1 and 65535. Codes up to 255 are
+        reserved to the BDSS core events.
+
+    Raises
+    ------
+    DriverEventTypeError
+        If `klass` is not a subclass of BaseDriverEvent
+    ValueError
+        If the `code` is out of range, or already assigned to another
+        event class
+    """
+    if not (isinstance(klass, type) and issubclass(klass, BaseDriverEvent)):
+        raise DriverEventTypeError(
+            f"Class {klass} must be a subclass of BaseDriverEvent"
+        )
+    if not 0 < code <= 0xFFFF:
+        raise ValueError(
+            f"Event type code {code} must be between 1 and {0xFFFF}"
+        )
+    registered = _EVENT_CLASSES.get(code)
+    if registered is not None and registered is not klass:
+        raise ValueError(
+            f"Event type code {code} is already assigned to {registered}"
+        )
+
+    _EVENT_CLASSES[code] = klass
+    _EVENT_CODES[klass] = code
+
+
+def event_type_code(klass):
+    """ Returns the numeric code of a registered event class, or None
+    if the class is not registered."""
+    return _EVENT_CODES.get(klass)
+
+
+def is_binary_data(data):
+    """ Returns True if `data` starts with the header of the binary
+    format, of any version."""
+    return bytes(data[:len(_HEADER) - 1]) == _HEADER[:-1]
+
+
+def dumps_binary(event):
+    """ Serializes a BaseDriverEvent into bytes.
+
+    Parameters
+    ----------
+    event: BaseDriverEvent
+        The event to serialize
+
+    Returns
+    -------
+    data: bytes
+        The binary representation of the event
+    """
+    buffer = bytearray(_HEADER)
+    _write_event(buffer, event)
+    return bytes(buffer)
+
+
+def loads_binary(data):
+    """ Deserializes a BaseDriverEvent from bytes generated by
+    `dumps_binary`.
+
+    Parameters
+    ----------
+    data: bytes, bytearray or memoryview
+        The binary representation of the event
+
+    Returns
+    -------
+    event: BaseDriverEvent
+        The deserialized event
+    """
+    reader = _Reader(data)
+    reader.read_header()
+    event = reader.read_event()
+    reader.check_consumed()
+    return event
+
+
+def dumps_binary_batch(events):
+    """ Serializes a sequence of BaseDriverEvents into bytes.
+
+    Parameters
+    ----------
+    events: iterable of BaseDriverEvent
+        The events to serialize
+
+    Returns
+    -------
+    data: bytes
+        The binary representation of the events
+    """
+    events = list(events)
+    buffer = bytearray(_HEADER)
+    buffer += _I.pack(len(events))
+    for event in events:
+        _write_event(buffer, event)
+    return bytes(buffer)
+
+
+def loads_binary_batch(data):
+    """ Deserializes a list of BaseDriverEvents from bytes generated by
+    `dumps_binary_batch`.
+
+    Parameters
+    ----------
+    data: bytes, bytearray or memoryview
+        The binary representation of the events
+
+    Returns
+    -------
+    events: list of BaseDriverEvent
+        The deserialized events, in their original order
+    """
+    reader = _Reader(data)
+    reader.read_header()
+    n_events = reader.read_struct(_I)
+    events = [reader.read_event() for _ in range(n_events)]
+    reader.check_consumed()
+    return events
+
+
+def _event_trait_names(klass):
+    """ Returns the (cached) names of the traits of an event class that
+    are serialized, i.e. the non transient traits."""
+    try:
+        return _EVENT_TRAIT_NAMES[klass]
+    except KeyError:
+        names = tuple(
+            name for name in klass.class_trait_names(transient=_is_none)
+            if not (name.startswith("__") and name.endswith("__"))
+        )
+        _EVENT_TRAIT_NAMES[klass] = names
+        return names
+
+
+def _is_none(value):
+    return value is None
+
+
+def _write_str(buffer, value):
+    encoded = value.encode("utf-8")
+    length = len(encoded)
+    if length < 256:
+        buffer.append(_SHORT_STR)
+        buffer.append(length)
+    else:
+        buffer.append(_STR)
+        buffer += _I.pack(length)
+    buffer += encoded
+
+
+def _write_event(buffer, event):
+    klass = event.__class__
+    buffer.append(_EVENT)
+    code = _EVENT_CODES.get(klass, _UNREGISTERED_CODE)
+    buffer += _H.pack(code)
+    if code == _UNREGISTERED_CODE:
+        _write_str(buffer, ".".join((klass.__module__, klass.__name__)))
+
+    names = _event_trait_names(klass)
+    buffer += _H.pack(len(names))
+    for name in names:
+        _write_str(buffer, name)
+        _write_value(buffer, getattr(event, name))
+
+
+def _write_data_value(buffer, data_value):
+    buffer.append(_DATA_VALUE)
+    _write_str(buffer, data_value.type)
+    _write_str(buffer, data_value.name)
+    _write_value(buffer, data_value.value)
+    _write_value(buffer, data_value.accuracy)
+    buffer.append(_QUALITY_INDEX[data_value.quality])
+
+
+def _write_value(buffer, value):
+    value_type = type(value)
+
+    if value is None:
+        buffer.append(_NONE)
+    elif value_type is bool:
+        buffer.append(_TRUE if value else _FALSE)
+    elif value_type is float:
+        buffer.append(_FLOAT)
+        buffer += _D.pack(value)
+    elif value_type is str:
+        _write_str(buffer, value)
+    elif value_type is int:
+        if _INT64_MIN <= value <= _INT64_MAX:
+            buffer.append(_INT)
+            buffer += _Q.pack(value)
+        else:
+            buffer.append(_BIGINT)
+            _write_str(buffer, str(value))
+    elif isinstance(value, DataValue):
+        _write_data_value(buffer, value)
+    elif isinstance(value, BaseDriverEvent):
+        _write_event(buffer, value)
+    elif isinstance(value, (list, tuple)):
+        buffer.append(_LIST)
+        buffer += _I.pack(len(value))
+        for element in value:
+            _write_value(buffer, element)
+    elif isinstance(value, dict):
+        buffer.append(_DICT)
+        buffer += _I.pack(len(value))
+        for key, element in value.items():
+            if type(key) is not str:
+                raise BinaryEventCodecError(
+                    f"Unable to encode dictionary with non string "
+                    f"key {key!r}"
+                )
+            _write_str(buffer, key)
+            _write_value(buffer, element)
+    elif isinstance(value, (bytes, bytearray)):
+        buffer.append(_BYTES)
+        buffer += _I.pack(len(value))
+        buffer += value
+    elif isinstance(value, HasTraits):
+        # Generic traits objects are stored with their state dictionary,
+        # as they would be in the JSON format.
+        _write_value(buffer, pop_dunder_recursive(value.__getstate__()))
+    elif isinstance(value, numbers.Integral):
+        # Integer types other than int, e.g. numpy scalar types
+        _write_value(buffer, int(value))
+    elif isinstance(value, numbers.Real):
+        _write_value(buffer, float(value))
+    else:
+        raise BinaryEventCodecError(
+            f"Unable to encode value {value!r} of type {value_type}"
+        )
+
+
+class _Reader:
+    """ Sequential reader of the binary format."""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+        self.readers = {
+            _NONE: self._read_none,
+            _FALSE: self._read_false,
+            _TRUE: self._read_true,
+            _INT: self._read_int,
+            _BIGINT: self._read_bigint,
+            _FLOAT: self._read_float,
+            _SHORT_STR: self._read_short_str,
+            _STR: self._read_long_str,
+            _BYTES: self._read_bytes,
+            _LIST: self._read_list,
+            _DICT: self._read_dict,
+            _DATA_VALUE: self._read_data_value,
+            _EVENT: self._read_event_body,
+        }
+
+    def read_header(self):
+        header = bytes(self.data[:len(_HEADER)])
+        if header[:3] != _HEADER[:3]:
+            raise BinaryEventCodecError(
+                "Data is not in the binary event format"
+            )
+        if header != _HEADER:
+            raise BinaryEventCodecError(
+                f"Unsupported binary event format version {header[3]}. "
+                f"Supported version is {BINARY_FORMAT_VERSION}"
+            )
+        self.offset = len(_HEADER)
+
+    def check_consumed(self):
+        if self.offset != len(self.data):
+            raise BinaryEventCodecError(
+                f"Unexpected trailing data after offset {self.offset}"
+            )
+
+    def read_struct(self, fmt):
+        try:
+            value, = fmt.unpack_from(self.data, self.offset)
+        except struct.error as e:
+            raise BinaryEventCodecError(
+                f"Truncated data at offset {self.offset}: {e}"
+            )
+        self.offset += fmt.size
+        return value
+
+    def read_tag(self):
+        try:
+            tag = self.data[self.offset]
+        except IndexError:
+            raise BinaryEventCodecError(
+                f"Truncated data at offset {self.offset}"
+            )
+        self.offset += 1
+        return tag
+
+    def read_value(self):
+        tag = self.read_tag()
+        try:
+            reader = self.readers[tag]
+        except KeyError:
+            raise BinaryEventCodecError(
+                f"Invalid tag {tag} at offset {self.offset - 1}"
+            )
+        return reader()
+
+    def read_event(self):
+        tag = self.read_tag()
+        if tag != _EVENT:
+            raise BinaryEventCodecError(
+                f"Expected an event at offset {self.offset - 1}, "
+                f"found tag {tag}"
+            )
+        return self._read_event_body()
+
+    def read_str(self):
+        tag = self.read_tag()
+        if tag == _SHORT_STR:
+            return self._read_short_str()
+        if tag == _STR:
+            return self._read_long_str()
+        raise BinaryEventCodecError(
+            f"Expected a string at offset {self.offset - 1}, found tag {tag}"
+        )
+
+    def _read_raw(self, length):
+        end = self.offset + length
+        if end > len(self.data):
+            raise BinaryEventCodecError(
+                f"Truncated data at offset {self.offset}"
+            )
+        raw = self.data[self.offset:end]
+        self.offset = end
+        return raw
+
+    def _read_none(self):
+        return None
+
+    def _read_false(self):
+        return False
+
+    def _read_true(self):
+        return True
+
+    def _read_int(self):
+        return self.read_struct(_Q)
+
+    def _read_bigint(self):
+        return int(self.read_str())
+
+    def _read_float(self):
+        return self.read_struct(_D)
+
+    def _read_short_str(self):
+        length = self.read_struct(_B)
+        return str(self._read_raw(length), "utf-8")
+
+    def _read_long_str(self):
+        length = self.read_struct(_I)
+        return str(self._read_raw(length), "utf-8")
+
+    def _read_bytes(self):
+        length = self.read_struct(_I)
+        return bytes(self._read_raw(length))
+
+    def _read_list(self):
+        length = self.read_struct(_I)
+        return [self.read_value() for _ in range(length)]
+
+    def _read_dict(self):
+        length = self.read_struct(_I)
+        return {self.read_str(): self.read_value() for _ in range(length)}
+
+    def _read_data_value(self):
+        type_ = self.read_str()
+        name = self.read_str()
+        value = self.read_value()
+        accuracy = self.read_value()
+        quality_index = self.read_struct(_B)
+        try:
+            quality = _DATA_VALUE_QUALITIES[quality_index]
+        except IndexError:
+            raise BinaryEventCodecError(
+                f"Invalid DataValue quality {quality_index}"
+            )
+        return DataValue(
+            type=type_, name=name, value=value,
+            accuracy=accuracy, quality=quality
+        )
+
+    def _read_event_body(self):
+        code = self.read_struct(_H)
+        if code == _UNREGISTERED_CODE:
+            klass = BaseDriverEvent.get_event_class(self.read_str())
+        else:
+            try:
+                klass = _EVENT_CLASSES[code]
+            except KeyError:
+                raise BinaryEventCodecError(
+                    f"Unknown event type code {code}"
+                )
+
+        n_traits = self.read_struct(_H)
+        model_data = {}
+        for _ in range(n_traits):
+            name = self.read_str()
+            model_data[name] = self.read_value()
+
+        try:
+            return klass(**model_data)
+        except TraitError:
+            pass
+
+        # Fall back to the JSON deserialization, in case the event
+        # class customizes it.
+        json_data = _json_compatible(model_data)
+        try:
+            return klass.from_json(json_data)
+        except Exception:
+            raise DriverEventDeserializationError(
+                f"Unable to instantiate a {klass} instance "
+                f"with data {json_data}: the "
+                f"`__init__` and `from_json` methods failed "
+                f"to create an instance."
+            )
+
+
+def _json_compatible(value):
+    """ Converts decoded DataValues and events back to the form they
+    have in the JSON format."""
+    if isinstance(value, dict):
+        return {key: _json_compatible(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_compatible(item) for item in value]
+    if isinstance(value, (DataValue, BaseDriverEvent)):
+        return value.__getstate__()
+    return value
+
+
+#: Numeric codes of the BDSS core events
+register_event_type(BaseDriverEvent, 1)
+register_event_type(MCOStartEvent, 2)
+register_event_type(MCOFinishEvent, 3)
+register_event_type(MCOProgressEvent, 4)
+register_event_type(MCORuntimeEvent, 5)
+register_event_type(WeightedMCOStartEvent, 6)
+register_event_type(WeightedMCOProgressEvent, 7)
+register_event_type(MCOProgressBatchEvent, 8)
+register_event_type(DataSourceStartEvent, 9)
+register_event_type(DataSourceFinishEvent, 10)
+register_event_type(ResourceUsageEvent, 11)
+register_event_type(ExecutionLayerFinishEvent, 12)
+register_event_type(WorkflowExecutionFinishEvent, 13)
+register_event_type(CachedEvaluationEvent, 14)
@@ -0,0 +1,52 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from traits.api import Bool, Float, Int
+
+from .mco_events import MCORuntimeEvent
+
+
+class ResourceUsageEvent(MCORuntimeEvent):
+    """ Base class of the events reporting the resources used by a part
+    of the workflow execution (see `force_bdss.core.resource_usage`)."""
+
+    #: The wall clock time, in seconds
+    wall_time = Float()
+
+    #: The CPU time used by the process, in seconds
+    cpu_time = Float()
+
+    #: The increase of the peak resident set size of the process, in bytes
+    peak_rss_delta = Int()
+
+    def serialize(self):
+        """ Provides serialized form of ResourceUsageEvent for further data
+        storage (e.g. in csv format) or processing.
+
+        Returns:
+            List: wall time, CPU time and peak RSS increase
+        """
+        return [self.wall_time, self.cpu_time, self.peak_rss_delta]
+
+
+class ExecutionLayerFinishEvent(ResourceUsageEvent):
+    """ The Workflow emits this event when an execution layer has been
+    executed, with the resources used by the layer."""
+
+    #: The index of the execution layer in the workflow
+    layer_index = Int()
+
+
+class WorkflowExecutionFinishEvent(ResourceUsageEvent):
+    """ The Workflow emits this event when it has been executed for a set
+    of parameter values, with the resources used by the execution. The
+    event is also emitted when the execution failed."""
+
+    #: Whether the execution of the workflow failed
+    failed = Bool(False)
+
+
+class CachedEvaluationEvent(MCORuntimeEvent):
+    """ The optimizer engine emits this event when the KPI values of a
+    point are reused from a checkpoint or from the results of a previous
+    run, instead of evaluating the workflow."""
@@ -101,6 +101,35 @@ class MCOProgressEvent(BaseDriverEvent, UIEventMixin):
         return cls(**data)
 
 
+class MCOProgressBatchEvent(BaseDriverEvent, UIEventMixin):
+    """ Carries a sequence of coalesced MCOProgressEvents, so that
+    listeners receiving a high volume of progress notifications can
+    process them in a single delivery. Only listeners that opt in
+    (see `BaseNotificationListener.accepts_progress_batches`) receive
+    this event in place of the individual MCOProgressEvents.
+    """
+
+    #: The coalesced progress events, in order of emission
+    progress_events = List(Instance(MCOProgressEvent))
+
+    def serialize(self):
+        """ Provides serialized form of MCOProgressBatchEvent, as a list
+        containing the serialized form of each contained MCOProgressEvent.
+
+        Returns:
+            List(List): serialized data of each progress event
+        """
+        return [event.serialize() for event in self.progress_events]
+
+    @classmethod
+    def from_json(cls, json_data):
+        progress_events = [
+            BaseDriverEvent.from_json(data)
+            for data in json_data["progress_events"]
+        ]
+        return cls(progress_events=progress_events)
+
+
 class MCORuntimeEvent(BaseDriverEvent):
     """ The base class for the MCO events fired during the workflow
     execution. This is a supplementary event type that is used to
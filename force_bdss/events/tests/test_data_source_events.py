@@ -28,7 +28,13 @@ class TestDataSourceEvents(TestCase):
         self.assertDictEqual(
             event.__getstate__(),
             {
-                "model_data": {"output_names": []},
+                "model_data": {
+                    "output_names": [],
+                    "data_source_name": "",
+                    "wall_time": 0.0,
+                    "cpu_time": 0.0,
+                    "peak_rss_delta": 0,
+                },
                 "id": "force_bdss.events.data_source_events."
                 "DataSourceFinishEvent",
             },
@@ -0,0 +1,228 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+
+import numpy as np
+from traits.api import Dict, HasStrictTraits, Int, List, Str
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.events.base_driver_event import (
+    BaseDriverEvent,
+    DriverEventDeserializationError,
+    DriverEventTypeError
+)
+from force_bdss.events.data_source_events import DataSourceStartEvent
+from force_bdss.events.event_codec import (
+    BinaryEventCodecError,
+    dumps_binary,
+    dumps_binary_batch,
+    event_type_code,
+    loads_binary,
+    loads_binary_batch,
+    register_event_type
+)
+from force_bdss.events.mco_events import (
+    MCOStartEvent,
+    MCOFinishEvent,
+    MCOProgressEvent,
+    MCOProgressBatchEvent,
+    WeightedMCOProgressEvent
+)
+from force_bdss.tests.dummy_classes.notification_listener import DummyEvent
+
+
+class Settings(HasStrictTraits):
+    tolerance = Int(3)
+
+
+class CustomEvent(BaseDriverEvent):
+    values = List()
+    mapping = Dict(Str)
+    label = Str()
+
+
+class RegisteredEvent(BaseDriverEvent):
+    label = Str()
+
+
+class SettingsEvent(BaseDriverEvent):
+    settings = List(Settings)
+
+    @classmethod
+    def from_json(cls, json_data):
+        return cls(
+            settings=[Settings(**data) for data in json_data["settings"]]
+        )
+
+
+class TestEventCodec(unittest.TestCase):
+
+    def assertRoundTrip(self, event):
+        data = dumps_binary(event)
+        self.assertIsInstance(data, bytes)
+        new_event = loads_binary(data)
+        self.assertIs(type(event), type(new_event))
+        self.assertDictEqual(event.__getstate__(), new_event.__getstate__())
+        return new_event
+
+    def test_round_trip_core_events(self):
+        self.assertRoundTrip(
+            MCOStartEvent(parameter_names=["p1", "p2"], kpi_names=["k1"])
+        )
+        self.assertRoundTrip(MCOFinishEvent())
+        self.assertRoundTrip(DataSourceStartEvent(input_names=["a", "b"]))
+        new_event = self.assertRoundTrip(
+            MCOProgressEvent(
+                optimal_point=[
+                    DataValue(type="PRESSURE", name="p1", value=1.5),
+                    DataValue(name="p2", value=[1, 2.0], quality="GOOD"),
+                ],
+                optimal_kpis=[
+                    DataValue(name="k1", value=-3, accuracy=0.1),
+                ],
+            )
+        )
+        self.assertEqual("PRESSURE", new_event.optimal_point[0].type)
+        self.assertEqual("GOOD", new_event.optimal_point[1].quality)
+        self.assertEqual(0.1, new_event.optimal_kpis[0].accuracy)
+        self.assertRoundTrip(
+            WeightedMCOProgressEvent(
+                optimal_point=[DataValue(value=1.0)],
+                optimal_kpis=[DataValue(value=2.0), DataValue(value=3.0)],
+                weights=[0.25, 0.75],
+            )
+        )
+
+    def test_round_trip_batch_event(self):
+        event = MCOProgressBatchEvent(
+            progress_events=[
+                MCOProgressEvent(
+                    optimal_point=[DataValue(value=index)],
+                    optimal_kpis=[DataValue(value=index ** 2)],
+                )
+                for index in range(3)
+            ]
+        )
+        new_event = self.assertRoundTrip(event)
+        self.assertListEqual(event.serialize(), new_event.serialize())
+
+    def test_round_trip_values(self):
+        values = [
+            None, True, False, 0, -1, 2 ** 40, 2 ** 80, -2 ** 70, 1.5,
+            float("inf"), "", "text", "ü" * 300, b"\x00\x01",
+            [1, [2, "a"]], {"a": {"b": None}},
+        ]
+        event = CustomEvent(
+            values=values, mapping={"x": [1, 2]}, label="label"
+        )
+        new_event = loads_binary(dumps_binary(event))
+        self.assertListEqual(values, new_event.values)
+        self.assertDictEqual({"x": [1, 2]}, new_event.mapping)
+        self.assertEqual("label", new_event.label)
+
+    def test_numpy_scalars(self):
+        event = CustomEvent(values=[np.int64(3), np.float64(2.5)])
+        new_event = loads_binary(dumps_binary(event))
+        self.assertListEqual([3, 2.5], new_event.values)
+        self.assertIs(int, type(new_event.values[0]))
+        self.assertIs(float, type(new_event.values[1]))
+
+    def test_unregistered_event(self):
+        self.assertIsNone(event_type_code(DummyEvent))
+        event = DummyEvent(
+            stateless_data=5, stateful_data=DataValue(value=1)
+        )
+        data = dumps_binary(event)
+        self.assertIn(b"force_bdss.tests.dummy_classes", data)
+        new_event = loads_binary(data)
+        self.assertIsInstance(new_event, DummyEvent)
+        self.assertEqual(5, new_event.stateless_data)
+        self.assertEqual(1, new_event.stateful_data.value)
+
+    def test_from_json_fallback(self):
+        event = SettingsEvent(settings=[Settings(tolerance=5)])
+        new_event = loads_binary(dumps_binary(event))
+        self.assertEqual(5, new_event.settings[0].tolerance)
+
+    def test_register_event_type(self):
+        self.assertEqual(4, event_type_code(MCOProgressEvent))
+
+        with self.assertRaises(DriverEventTypeError):
+            register_event_type(Settings, 1000)
+        with self.assertRaises(ValueError):
+            register_event_type(CustomEvent, 0)
+        with self.assertRaises(ValueError):
+            register_event_type(CustomEvent, 2 ** 16)
+        with self.assertRaises(ValueError):
+            register_event_type(CustomEvent, 4)
+
+        unregistered_size = len(dumps_binary(RegisteredEvent()))
+        register_event_type(RegisteredEvent, 1000)
+        self.assertEqual(1000, event_type_code(RegisteredEvent))
+        self.assertLess(
+            len(dumps_binary(RegisteredEvent())), unregistered_size
+        )
+        self.assertIsInstance(
+            loads_binary(dumps_binary(RegisteredEvent())), RegisteredEvent
+        )
+
+    def test_batch(self):
+        events = [
+            MCOStartEvent(parameter_names=["p1"], kpi_names=["k1"]),
+            MCOProgressEvent(
+                optimal_point=[DataValue(value=1)],
+                optimal_kpis=[DataValue(value=2)],
+            ),
+            MCOFinishEvent(),
+        ]
+        data = dumps_binary_batch(iter(events))
+        new_events = loads_binary_batch(data)
+        self.assertEqual(3, len(new_events))
+        for event, new_event in zip(events, new_events):
+            self.assertIs(type(event), type(new_event))
+            self.assertDictEqual(
+                event.__getstate__(), new_event.__getstate__()
+            )
+
+        self.assertListEqual([], loads_binary_batch(dumps_binary_batch([])))
+
+    def test_base_driver_event_methods(self):
+        event = MCOStartEvent(parameter_names=["p1"], kpi_names=["k1"])
+        data = event.dumps_binary()
+        self.assertEqual(dumps_binary(event), data)
+        new_event = BaseDriverEvent.loads_binary(data)
+        self.assertIsInstance(new_event, MCOStartEvent)
+        self.assertListEqual(["p1"], new_event.parameter_names)
+
+    def test_invalid_data(self):
+        data = dumps_binary(MCOFinishEvent())
+
+        with self.assertRaisesRegex(BinaryEventCodecError, "not in the"):
+            loads_binary(b"JSON" + data[4:])
+        with self.assertRaisesRegex(BinaryEventCodecError, "version"):
+            loads_binary(b"FBE\x09" + data[4:])
+        with self.assertRaisesRegex(BinaryEventCodecError, "Truncated"):
+            loads_binary(data[:-1])
+        with self.assertRaisesRegex(BinaryEventCodecError, "trailing"):
+            loads_binary(data + b"\x00")
+        with self.assertRaisesRegex(BinaryEventCodecError, "Unknown"):
+            loads_binary(data[:5] + b"\xff\xfe" + data[7:])
+        with self.assertRaisesRegex(BinaryEventCodecError, "Expected"):
+            loads_binary(data[:4] + b"\x00")
+
+    def test_invalid_values(self):
+        with self.assertRaises(BinaryEventCodecError):
+            dumps_binary(CustomEvent(values=[object()]))
+        with self.assertRaises(BinaryEventCodecError):
+            dumps_binary(CustomEvent(values=[{1: 2}]))
+
+    def test_deserialization_error(self):
+        event = CustomEvent(values=[1])
+        data = bytearray(dumps_binary(event))
+        # Replace the "label" trait name, to cause a failure upon
+        # instantiation of the event
+        index = data.index(b"label")
+        data[index:index + 5] = b"lapel"
+        with self.assertRaises(DriverEventDeserializationError):
+            loads_binary(bytes(data))
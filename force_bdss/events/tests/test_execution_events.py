@@ -0,0 +1,48 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from unittest import TestCase
+
+from force_bdss.events.base_driver_event import BaseDriverEvent
+from force_bdss.events.execution_events import (
+    CachedEvaluationEvent,
+    ExecutionLayerFinishEvent,
+    WorkflowExecutionFinishEvent,
+)
+from force_bdss.events.mco_events import MCORuntimeEvent
+
+
+class TestExecutionEvents(TestCase):
+
+    def test_layer_finish_event(self):
+        event = ExecutionLayerFinishEvent(
+            layer_index=2, wall_time=1.5, cpu_time=1.0, peak_rss_delta=1024
+        )
+        self.assertIsInstance(event, MCORuntimeEvent)
+        self.assertEqual([1.5, 1.0, 1024], event.serialize())
+        self.assertDictEqual(
+            {
+                "id": "force_bdss.events.execution_events."
+                      "ExecutionLayerFinishEvent",
+                "model_data": {
+                    "layer_index": 2,
+                    "wall_time": 1.5,
+                    "cpu_time": 1.0,
+                    "peak_rss_delta": 1024,
+                },
+            },
+            event.__getstate__()
+        )
+
+    def test_round_trip(self):
+        for event in [
+            ExecutionLayerFinishEvent(layer_index=1, wall_time=0.5),
+            WorkflowExecutionFinishEvent(cpu_time=0.25, peak_rss_delta=8),
+            CachedEvaluationEvent(),
+        ]:
+            for loaded in [
+                BaseDriverEvent.loads_json(event.dumps_json()),
+                BaseDriverEvent.loads_binary(event.dumps_binary()),
+            ]:
+                self.assertIsInstance(loaded, type(event))
+                self.assertEqual(event.__getstate__(), loaded.__getstate__())
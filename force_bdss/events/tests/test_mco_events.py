@@ -8,6 +8,7 @@ from force_bdss.core.data_value import DataValue
 from force_bdss.events.base_driver_event import BaseDriverEvent
 from force_bdss.events.mco_events import (
     MCOProgressEvent,
+    MCOProgressBatchEvent,
     WeightedMCOProgressEvent,
     MCOStartEvent,
     WeightedMCOStartEvent,
@@ -141,6 +142,26 @@ class TestMCOEvents(unittest.TestCase):
 
         self.assertListEqual([12, 13, 10, 1.0], event.serialize())
 
+    def test_serialize_progress_batch_event(self):
+        event = MCOProgressBatchEvent(
+            progress_events=[
+                MCOProgressEvent(
+                    optimal_kpis=[DataValue(value=10)],
+                    optimal_point=[DataValue(value=12)],
+                ),
+                WeightedMCOProgressEvent(
+                    optimal_kpis=[DataValue(value=20)],
+                    optimal_point=[DataValue(value=22)],
+                    weights=[1.0],
+                ),
+            ]
+        )
+        self.assertIsInstance(event, UIEventMixin)
+        self.assertListEqual([[12, 10], [22, 20, 1.0]], event.serialize())
+
+        event = MCOProgressBatchEvent()
+        self.assertListEqual([], event.serialize())
+
     def test_default_weights_weighted_progress_event(self):
         event = WeightedMCOProgressEvent(
             optimal_kpis=[DataValue(value=10)],
@@ -290,3 +311,40 @@ class TestMCOEvents(unittest.TestCase):
             '"id": "force_bdss.events.mco_events.MCOStartEvent"', json_dump
         )
         self.assertEqual(len(str(start_data)), len(json_dump))
+
+    def test_progress_batch_event_json(self):
+        event = MCOProgressBatchEvent(
+            progress_events=[
+                MCOProgressEvent(
+                    optimal_kpis=[DataValue(value=10)],
+                    optimal_point=[DataValue(name="p1", value=12)],
+                ),
+                WeightedMCOProgressEvent(
+                    optimal_kpis=[DataValue(value=20)],
+                    optimal_point=[DataValue(name="p1", value=22)],
+                    weights=[0.5],
+                ),
+            ]
+        )
+        state = event.__getstate__()
+        self.assertEqual(
+            "force_bdss.events.mco_events.MCOProgressBatchEvent",
+            state["id"]
+        )
+        self.assertEqual(
+            ["force_bdss.events.mco_events.MCOProgressEvent",
+             "force_bdss.events.mco_events.WeightedMCOProgressEvent"],
+            [data["id"] for data in state["model_data"]["progress_events"]]
+        )
+
+        new_event = BaseDriverEvent.loads_json(event.dumps_json())
+        self.assertIsInstance(new_event, MCOProgressBatchEvent)
+        self.assertEqual(2, len(new_event.progress_events))
+        self.assertIsInstance(
+            new_event.progress_events[1], WeightedMCOProgressEvent
+        )
+        self.assertEqual(
+            "p1", new_event.progress_events[0].optimal_point[0].name
+        )
+        self.assertListEqual(event.serialize(), new_event.serialize())
+        self.assertDictEqual(state, new_event.__getstate__())
@@ -0,0 +1,171 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Incremental parsing of JSON documents, so that large documents can be
+processed one part at a time, without holding the whole parsed document
+in memory.
+"""
+
+import json
+
+#: Size, in characters, of the chunks read from the file
+DEFAULT_CHUNK_SIZE = 2 ** 16
+
+_WHITESPACE = " \t\n\r"
+
+_NUMBER_CHARACTERS = "0123456789+-.eE"
+
+
+class JSONStream:
+    """ Reads a JSON document from a text file, one value at a time.
+
+    The structure of the document is walked with `iter_object` and
+    `iter_array`, which stop before each member or element, so that the
+    caller can either parse it completely with `read_value`, or walk its
+    structure further. Only the values parsed with `read_value`, and the
+    unparsed text of the current chunk, are held in memory.
+
+    Example
+    -------
+    ::
+
+        stream = JSONStream(fp)
+        for key in stream.iter_object():
+            if key == "items":
+                for _ in stream.iter_array():
+                    process(stream.read_value())
+            else:
+                stream.read_value()
+    """
+
+    def __init__(self, fp, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def read_value(self):
+        """ Parses the next value of the document completely, and returns
+        it.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the document is not valid JSON.
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer, self._position
+                )
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # The value may be incomplete: read more of the document.
+                # The amount read grows with the buffer, so that large
+                # values are parsed in a linear time overall.
+                self._read_chunk(max(self._chunk_size, len(self._buffer)))
+                continue
+
+            # A number at the end of the buffer may be truncated, possibly
+            # into a shorter valid number ("1.5e-10" into "1.5"). In a
+            # valid document, a value is followed by a delimiter, unless
+            # it is the whole document.
+            if not self._eof and (
+                end == len(self._buffer)
+                or self._buffer[end] in _NUMBER_CHARACTERS
+            ):
+                self._read_chunk(max(self._chunk_size, len(self._buffer)))
+                continue
+
+            self._position = end
+            return value
+
+    def iter_object(self):
+        """ Walks the members of the next value of the document, which must
+        be an object. Yields the key of each member, leaving the stream
+        before its value, which must be consumed before the iteration
+        continues.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                self._error("Expecting property name")
+            self._expect(":")
+            yield key
+            delimiter = self.peek()
+            self._position += 1
+            if delimiter == "}":
+                return
+            if delimiter != ",":
+                self._error("Expecting ',' delimiter", self._position - 1)
+
+    def iter_array(self):
+        """ Walks the elements of the next value of the document, which must
+        be an array. Yields the index of each element, leaving the stream
+        before it. Each element must be consumed before the iteration
+        continues.
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+
+        index = 0
+        while True:
+            yield index
+            index += 1
+            delimiter = self.peek()
+            self._position += 1
+            if delimiter == "]":
+                return
+            if delimiter != ",":
+                self._error("Expecting ',' delimiter", self._position - 1)
+
+    def peek(self):
+        """ Returns the next non whitespace character, without consuming
+        it, or an empty string at the end of the document. It identifies
+        the type of the next value, e.g. "{" for an object."""
+        self._skip_whitespace()
+        if self._position < len(self._buffer):
+            return self._buffer[self._position]
+        return ""
+
+    def _expect(self, character):
+        if self.peek() != character:
+            self._error(f"Expecting '{character}'")
+        self._position += 1
+
+    def _skip_whitespace(self):
+        while True:
+            buffer = self._buffer
+            position = self._position
+            length = len(buffer)
+            while position < length and buffer[position] in _WHITESPACE:
+                position += 1
+            self._position = position
+            if position < length or self._eof:
+                return
+            self._read_chunk(self._chunk_size)
+
+    def _read_chunk(self, size):
+        """ Appends `size` characters of the file to the buffer, discarding
+        the part of the buffer that was already parsed."""
+        chunk = self._fp.read(size)
+        if not chunk:
+            self._eof = True
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+
+    def _error(self, message, position=None):
+        if position is None:
+            position = self._position
+        raise json.JSONDecodeError(message, self._buffer, position)
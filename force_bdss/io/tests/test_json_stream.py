@@ -0,0 +1,65 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import io
+import json
+import unittest
+
+from force_bdss.io.json_stream import JSONStream
+
+DOCUMENT = {
+    "version": "1.1",
+    "numbers": [0, -12345, 1.5e-10, 123456789012345678901234567890],
+    "literals": [True, False, None],
+    "empty": {"object": {}, "array": []},
+    "nested": [{"text": "a \"quoted\" string, with: delimiters ]}"}],
+}
+
+
+def walk(stream):
+    """ Parses the next value of the stream by walking its structure."""
+    character = stream.peek()
+    if character == "{":
+        return {key: walk(stream) for key in stream.iter_object()}
+    if character == "[":
+        return [walk(stream) for _ in stream.iter_array()]
+    return stream.read_value()
+
+
+class TestJSONStream(unittest.TestCase):
+
+    def test_read_value(self):
+        for indent in [None, 4]:
+            text = json.dumps(DOCUMENT, indent=indent)
+            for chunk_size in [1, 3, 1024]:
+                stream = JSONStream(io.StringIO(text), chunk_size=chunk_size)
+                self.assertEqual(DOCUMENT, stream.read_value())
+
+    def test_walk(self):
+        for indent in [None, 4]:
+            text = json.dumps(DOCUMENT, indent=indent)
+            for chunk_size in [1, 3, 1024]:
+                stream = JSONStream(io.StringIO(text), chunk_size=chunk_size)
+                self.assertEqual(DOCUMENT, walk(stream))
+
+    def test_top_level_number(self):
+        stream = JSONStream(io.StringIO(" 12345 "), chunk_size=2)
+        self.assertEqual(12345, stream.read_value())
+
+    def test_invalid_documents(self):
+        for text in ['{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}', "[1 2]",
+                     "{1: 2}", '["a", }']:
+            with self.subTest(text=text):
+                stream = JSONStream(io.StringIO(text), chunk_size=2)
+                with self.assertRaises(json.JSONDecodeError):
+                    walk(stream)
+
+    def test_reads_incrementally(self):
+        text = json.dumps({"items": [{"value": i} for i in range(1000)]})
+        fp = io.StringIO(text)
+        stream = JSONStream(fp, chunk_size=64)
+        for key in stream.iter_object():
+            for index in stream.iter_array():
+                self.assertEqual({"value": index}, stream.read_value())
+                self.assertLess(len(stream._buffer), 256)
+        self.assertEqual(len(text), fp.tell())
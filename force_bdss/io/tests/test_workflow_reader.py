@@ -1,7 +1,11 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 import logging
 
 import testfixtures
@@ -12,9 +16,15 @@ from force_bdss.io.workflow_reader import (
     InvalidVersionException,
     InvalidFileException,
 )
+from force_bdss.data_sources.base_data_source_model import (
+    BaseDataSourceModel
+)
+from force_bdss.mco.base_mco_model import BaseMCOModel
+from force_bdss.tests.dummy_classes.data_source import DummyDataSourceModel
 from force_bdss.tests.dummy_classes.factory_registry import (
     DummyFactoryRegistry,
 )
+from force_bdss.tests.dummy_classes.mco import DummyMCOModel
 from force_bdss.tests import fixtures
 
 
@@ -89,6 +99,97 @@ class TestWorkflowReader(unittest.TestCase):
 
         self.assertIsInstance(workflow, Workflow)
 
+    def test_read_without_copies(self):
+        modules = [
+            "force_bdss.core.workflow",
+            "force_bdss.core.execution_layer",
+            "force_bdss.mco.base_mco_model",
+            "force_bdss.data_sources.base_data_source_model",
+        ]
+        patchers = [mock.patch(f"{module}.deepcopy") for module in modules]
+        mock_copies = [patcher.start() for patcher in patchers]
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+
+        workflow = self.wfreader.read(self.working_data)
+
+        self.assertEqual(1, len(workflow.execution_layers))
+        for mock_copy in mock_copies:
+            mock_copy.assert_not_called()
+
+    def test_read_former_from_json_signature(self):
+        # Plugins may override from_json without the copy argument
+        calls = []
+
+        def data_source_from_json(cls, factory, json_data):
+            calls.append(cls)
+            return BaseDataSourceModel.from_json.__func__(
+                cls, factory, json_data
+            )
+
+        def mco_from_json(cls, factory, json_data):
+            calls.append(cls)
+            return BaseMCOModel.from_json.__func__(cls, factory, json_data)
+
+        with mock.patch.object(
+                DummyDataSourceModel, "from_json",
+                classmethod(data_source_from_json)), \
+                mock.patch.object(
+                    DummyMCOModel, "from_json", classmethod(mco_from_json)):
+            for read in [self.wfreader.read, self.wfreader.read_incremental]:
+                del calls[:]
+                workflow = read(self.working_data)
+                self.assertIsInstance(workflow.mco_model, DummyMCOModel)
+                self.assertIsInstance(
+                    workflow.execution_layers[0].data_sources[0],
+                    DummyDataSourceModel
+                )
+                self.assertIn(DummyMCOModel, calls)
+                self.assertIn(DummyDataSourceModel, calls)
+
+    def test_read_incremental(self):
+        for name in ["test_workflow_reader.json",
+                     "test_workflow_reader_v1.json"]:
+            path = fixtures.get(name)
+            reference = WorkflowReader(self.registry).read(path)
+            workflow = self.wfreader.read_incremental(path)
+            self.assertEqual(
+                reference.__getstate__(), workflow.__getstate__()
+            )
+
+    def test_read_incremental_version_last(self):
+        data = self.wfreader.load_data(self.working_data)
+        data = {"workflow": data["workflow"], "version": data["version"]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "workflow.json")
+            with open(path, "w") as fp:
+                json.dump(data, fp)
+            workflow = self.wfreader.read_incremental(path)
+
+        reference = self.wfreader.read(self.working_data)
+        self.assertEqual(reference.__getstate__(), workflow.__getstate__())
+        self.assertEqual("1.1", self.wfreader.workflow_format_version)
+
+    def test_read_incremental_invalid(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "workflow.json")
+            with open(path, "w") as fp:
+                json.dump({"workflow": {}}, fp)
+            with testfixtures.LogCapture():
+                with self.assertRaises(InvalidFileException):
+                    self.wfreader.read_incremental(path)
+
+    def test_read_large_file(self):
+        self.wfreader.incremental_size = 0
+        with mock.patch.object(
+            WorkflowReader, "read_incremental",
+            side_effect=WorkflowReader.read_incremental,
+            autospec=True,
+        ) as mock_read:
+            workflow = self.wfreader.read(self.working_data)
+        mock_read.assert_called_once_with(self.wfreader, self.working_data)
+        self.assertEqual(1, len(workflow.execution_layers))
+
     def test_read_version_1(self):
         old_json = fixtures.get("test_workflow_reader_v1.json")
         workflow = self.wfreader.read(old_json)
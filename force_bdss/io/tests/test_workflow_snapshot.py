@@ -0,0 +1,143 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import testfixtures
+
+from force_bdss.io.workflow_reader import WorkflowReader
+from force_bdss.io.workflow_snapshot import (
+    SNAPSHOT_MAGIC,
+    default_snapshot_file,
+    factory_fingerprint,
+    find_factory,
+    source_hash,
+    workflow_factories,
+)
+from force_bdss.io.workflow_writer import WorkflowWriter
+from force_bdss.tests import fixtures
+from force_bdss.tests.dummy_classes.factory_registry import (
+    DummyFactoryRegistry,
+)
+
+
+class TestWorkflowSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.workflow_path = os.path.join(tmpdir, "workflow.json")
+        shutil.copy(
+            fixtures.get("test_workflow_reader.json"), self.workflow_path
+        )
+        self.snapshot_path = default_snapshot_file(self.workflow_path)
+
+        self.registry = DummyFactoryRegistry()
+        self.reader = WorkflowReader(self.registry)
+        self.workflow = self.reader.read(self.workflow_path)
+        self.hash = source_hash(self.workflow_path)
+
+    def test_default_snapshot_file(self):
+        self.assertEqual(
+            "foo.json.snapshot", default_snapshot_file("foo.json")
+        )
+
+    def test_source_hash(self):
+        with open(self.workflow_path, "a") as fp:
+            fp.write(" ")
+        self.assertNotEqual(self.hash, source_hash(self.workflow_path))
+
+    def test_workflow_factories(self):
+        factories = workflow_factories(self.workflow)
+        # MCO, MCO parameter, data source and notification listener
+        self.assertEqual(4, len(factories))
+        for id, factory in factories.items():
+            self.assertIs(factory, find_factory(self.registry, id))
+
+        with self.assertRaises(KeyError):
+            find_factory(self.registry, "foo")
+
+    def test_factory_fingerprint(self):
+        factory = self.registry.data_source_factories[0]
+        fingerprint = factory_fingerprint(factory)
+        self.assertIn(type(factory).__qualname__, fingerprint)
+        self.assertIn(factory.model_class.__qualname__, fingerprint)
+        self.assertEqual(fingerprint, factory_fingerprint(factory))
+
+    def test_round_trip(self):
+        WorkflowWriter().write_snapshot(
+            self.workflow, self.snapshot_path, self.hash
+        )
+
+        workflow = self.reader.read_snapshot(self.snapshot_path, self.hash)
+
+        self.assertEqual(
+            self.workflow.__getstate__(), workflow.__getstate__()
+        )
+        self.assertEqual("1.1", self.reader.workflow_format_version)
+
+    def test_missing_snapshot(self):
+        self.assertIsNone(
+            self.reader.read_snapshot(self.snapshot_path, self.hash)
+        )
+
+    def test_outdated_snapshot(self):
+        WorkflowWriter().write_snapshot(
+            self.workflow, self.snapshot_path, self.hash
+        )
+
+        with testfixtures.LogCapture() as capture:
+            self.assertIsNone(
+                self.reader.read_snapshot(self.snapshot_path, "changed")
+            )
+            with mock.patch(
+                "force_bdss.io.workflow_reader.factory_fingerprint",
+                return_value="changed"
+            ):
+                self.assertIsNone(
+                    self.reader.read_snapshot(self.snapshot_path, self.hash)
+                )
+        messages = [record.getMessage() for record in capture.records]
+        self.assertIn("the workflow file changed", messages[0])
+        self.assertIn("changed", messages[1])
+
+    def test_invalid_snapshot(self):
+        for content in [b"foo", SNAPSHOT_MAGIC + b"foo"]:
+            with open(self.snapshot_path, "wb") as fp:
+                fp.write(content)
+            with testfixtures.LogCapture() as capture:
+                self.assertIsNone(
+                    self.reader.read_snapshot(self.snapshot_path, self.hash)
+                )
+            self.assertEqual("WARNING", capture.records[0].levelname)
+
+    def test_pickle_snapshot_not_loaded(self):
+        with open(self.snapshot_path, "wb") as fp:
+            fp.write(SNAPSHOT_MAGIC)
+            pickle.dump({"version": 1}, fp)
+
+        with mock.patch("pickle.load") as mock_load, \
+                mock.patch("pickle.loads") as mock_loads:
+            with testfixtures.LogCapture():
+                self.assertIsNone(
+                    self.reader.read_snapshot(self.snapshot_path, self.hash)
+                )
+        mock_load.assert_not_called()
+        mock_loads.assert_not_called()
+
+    def test_write_snapshot_not_plain_data(self):
+        writer = WorkflowWriter()
+        with mock.patch.object(
+            WorkflowWriter, "get_workflow_data", return_value=object()
+        ):
+            with self.assertRaises(ValueError):
+                writer.write_snapshot(
+                    self.workflow, self.snapshot_path, self.hash
+                )
+        self.assertFalse(os.path.exists(self.snapshot_path))
+        self.assertFalse(os.path.exists(self.snapshot_path + ".tmp"))
@@ -2,8 +2,13 @@
 #  All rights reserved.
 
 import json
+import os
+import shutil
 import unittest
 import tempfile
+from unittest import mock
+
+from traits.api import Dict, Int
 
 from force_bdss.core.execution_layer import ExecutionLayer
 from force_bdss.core.kpi_specification import KPISpecification
@@ -16,6 +21,22 @@ from force_bdss.io.workflow_writer import (
 )
 from force_bdss.core.workflow import Workflow
 from force_bdss.core.input_slot_info import InputSlotInfo
+from force_bdss.core.output_slot_info import OutputSlotInfo
+from force_bdss.tests import fixtures
+from force_bdss.tests.dummy_classes.data_source import DummyDataSourceModel
+
+
+class ConfiguredModel(DummyDataSourceModel):
+    configuration = Dict()
+
+
+class CustomStateModel(DummyDataSourceModel):
+    value = Int(1)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["model_data"]["value"] *= 2
+        return state
 
 
 class TestWorkflowWriter(unittest.TestCase):
@@ -106,3 +127,73 @@ class TestWorkflowWriter(unittest.TestCase):
             "input_slot_info"
         ]
         self.assertNotIn("__traits_version__", new_slotdata)
+
+    def test_get_workflow_data_single_pass(self):
+        wfwriter = WorkflowWriter()
+        workflow = self.sample_workflow()
+        factory = self.data_source_factory
+        workflow.execution_layers[0].data_sources += [
+            ConfiguredModel(
+                factory,
+                input_slot_info=[InputSlotInfo(name="a")],
+                output_slot_info=[OutputSlotInfo(name="b")],
+                configuration={"a": [1, {"b": 2.0}], "c": "d"},
+            ),
+            CustomStateModel(factory),
+        ]
+
+        data = wfwriter.get_workflow_data(workflow)
+
+        self.assertDictEqual(workflow.__getstate__(), data)
+        self.assertEqual(
+            2,
+            data["execution_layers"][0]["data_sources"][3]["model_data"][
+                "value"]
+        )
+
+        registry = DummyFactoryRegistry()
+        workflow = WorkflowReader(registry).read(
+            fixtures.get("test_workflow_reader.json")
+        )
+        self.assertDictEqual(
+            workflow.__getstate__(), wfwriter.get_workflow_data(workflow)
+        )
+
+    def test_write_compact(self):
+        workflow = self.sample_workflow()
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "workflow.json")
+
+        WorkflowWriter().write(workflow, path)
+        with open(path) as f:
+            indented = f.read()
+        WorkflowWriter(compact=True).write(workflow, path)
+        with open(path) as f:
+            compact = f.read()
+
+        self.assertNotIn("\n", compact)
+        self.assertLess(len(compact), len(indented))
+        self.assertEqual(json.loads(indented), json.loads(compact))
+
+    def test_write_atomic(self):
+        workflow = self.sample_workflow()
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "workflow.json")
+        with open(path, "w") as f:
+            f.write("original")
+
+        wfwriter = WorkflowWriter()
+        with mock.patch(
+                "force_bdss.io.workflow_writer.os.replace",
+                side_effect=OSError("No space left")):
+            with self.assertRaises(OSError):
+                wfwriter.write(workflow, path)
+        with open(path) as f:
+            self.assertEqual("original", f.read())
+
+        wfwriter.write(workflow, path)
+        self.assertEqual(["workflow.json"], os.listdir(tmpdir))
+        with open(path) as f:
+            self.assertEqual("1.1", json.load(f)["version"])
@@ -3,11 +3,21 @@
 
 import json
 import logging
+import marshal
+import os
 
-from traits.api import HasStrictTraits, Instance, Str
+from traits.api import HasStrictTraits, Instance, Int, Str
 
+from force_bdss.core.execution_layer import ExecutionLayer
 from force_bdss.core.i_factory_registry import IFactoryRegistry
 from force_bdss.core.workflow import Workflow
+from force_bdss.io.json_stream import JSONStream
+from force_bdss.io.workflow_snapshot import (
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    factory_fingerprint,
+    find_factory,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +59,10 @@ class WorkflowReader(HasStrictTraits):
     #: The version of the workflow data file format
     workflow_format_version = Str()
 
+    #: Size, in bytes, from which the workflow files are read
+    #: incrementally by `read` (see `read_incremental`).
+    incremental_size = Int(32 * 2 ** 20)
+
     def __init__(self, factory_registry, *args, **kwargs):
         """Initializes the reader.
 
@@ -75,6 +89,9 @@ class WorkflowReader(HasStrictTraits):
         Workflow
             An instance of the model tree, rooted at Workflow.
         """
+        if os.path.getsize(path) >= self.incremental_size:
+            return self.read_incremental(path)
+
         json_data = self.load_data(path)
 
         self.workflow_format_version = self._extract_version(json_data)
@@ -83,9 +100,154 @@ class WorkflowReader(HasStrictTraits):
             json_data, self.workflow_format_version
         )
 
-        workflow = Workflow.from_json(self.factory_registry, workflow_data)
+        # The data was just loaded from the file, so its ownership is
+        # transferred to the workflow instead of copying it.
+        workflow = Workflow.from_json(
+            self.factory_registry, workflow_data, copy=False
+        )
+        return workflow
+
+    def read_incremental(self, path):
+        """Reads the file and returns a Workflow object, as `read` does,
+        but creates the execution layers while the file is parsed, one
+        layer at a time. The parsed JSON data of the whole workflow is
+        never held in memory, which bounds the memory needed to read very
+        large workflow files.
+
+        Parameters
+        ----------
+        path: str
+            A path to file containing the serialized data of the workflow.
+
+        Returns
+        -------
+        Workflow
+            An instance of the model tree, rooted at Workflow.
+        """
+        json_data = {}
+        workflow = None
+        with open(path, "r") as input_file:
+            stream = JSONStream(input_file)
+            for key in stream.iter_object():
+                # The version is needed to interpret the workflow data. It
+                # is written first, but if it is not, the workflow data is
+                # loaded completely, as by `read`.
+                if key == "workflow" and "version" in json_data:
+                    self.workflow_format_version = self._extract_version(
+                        json_data
+                    )
+                    workflow = self._read_workflow_stream(
+                        stream, self.workflow_format_version
+                    )
+                else:
+                    json_data[key] = stream.read_value()
+
+        self.workflow_format_version = self._extract_version(json_data)
+        if workflow is None:
+            workflow_data = self._preprocess_workflow_data(
+                json_data, self.workflow_format_version
+            )
+            workflow = Workflow.from_json(
+                self.factory_registry, workflow_data, copy=False
+            )
         return workflow
 
+    def _read_workflow_stream(self, stream, format_version):
+        """ Creates the Workflow from the workflow data in the `stream`.
+        The execution layers are created while they are parsed, the rest
+        of the workflow data is loaded and handled as by `read`."""
+        workflow_data = {}
+        execution_layers = []
+        for key in stream.iter_object():
+            if key == "execution_layers":
+                execution_layers = [
+                    self._read_execution_layer_stream(stream, format_version)
+                    for _ in stream.iter_array()
+                ]
+            else:
+                workflow_data[key] = stream.read_value()
+
+        workflow_data = self._preprocess_workflow_data(
+            {"workflow": workflow_data}, format_version
+        )
+        workflow = Workflow.from_json(
+            self.factory_registry, workflow_data, copy=False
+        )
+        workflow.execution_layers = execution_layers
+        return workflow
+
+    def _read_execution_layer_stream(self, stream, format_version):
+        """ Creates an ExecutionLayer from the layer data in the `stream`.
+        In format version 1, the layer is the list of its data sources."""
+        layer_data = stream.read_value()
+        if format_version == "1":
+            layer_data = {"data_sources": layer_data}
+        # The data was just parsed, so its ownership is transferred to the
+        # layer instead of copying it.
+        return ExecutionLayer.from_json(
+            self.factory_registry, layer_data, copy=False
+        )
+
+    def read_snapshot(self, path, source_hash):
+        """Reads a compiled snapshot of a workflow (see
+        `force_bdss.io.workflow_snapshot`), if it is up to date.
+
+        Parameters
+        ----------
+        path: str
+            The path of the snapshot file
+        source_hash: str
+            The hash of the current content of the workflow file
+
+        Returns
+        -------
+        workflow: Workflow or None
+            The workflow, which does not need to be verified again, or None
+            if the snapshot does not exist, can not be read, or is outdated
+            with respect to the workflow file or the installed plugins.
+        """
+        try:
+            with open(path, "rb") as input_file:
+                if input_file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                    logger.warning(f"Ignoring invalid snapshot '{path}'")
+                    return None
+                snapshot = marshal.load(input_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring invalid snapshot '{path}': {e}")
+            return None
+
+        if (not isinstance(snapshot, dict)
+                or snapshot.get("version") != SNAPSHOT_VERSION):
+            logger.info(f"Ignoring snapshot '{path}' of another version")
+            return None
+
+        if snapshot["source_hash"] != source_hash:
+            logger.info(
+                f"Ignoring snapshot '{path}': the workflow file changed"
+            )
+            return None
+
+        for id, fingerprint in snapshot["factories"].items():
+            try:
+                factory = find_factory(self.factory_registry, id)
+            except KeyError:
+                factory = None
+            if factory is None or factory_fingerprint(factory) != fingerprint:
+                logger.info(
+                    f"Ignoring snapshot '{path}': the factory {id} changed"
+                )
+                return None
+
+        self.workflow_format_version = snapshot["format_version"]
+        workflow_data = self._preprocess_workflow_data(
+            {"workflow": snapshot["workflow"]}, self.workflow_format_version
+        )
+        return Workflow.from_json(
+            self.factory_registry, workflow_data, copy=False
+        )
+
     @staticmethod
     def load_data(filepath):
         """ Loads the data from file located at `filepath` in json
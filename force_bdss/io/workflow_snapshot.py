@@ -0,0 +1,109 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Compiled snapshots of verified workflows.
+
+A snapshot stores the serialized data of a workflow in the marshal format,
+which is faster to load than JSON, together with what the workflow was
+created from: the hash of the JSON workflow file, and a fingerprint of the
+classes of every factory used by the workflow. A snapshot is only written
+for a workflow without verification errors, so that a workflow loaded from
+an up to date snapshot does not need to be verified again.
+
+Snapshots are written by `WorkflowWriter.write_snapshot`, and read by
+`WorkflowReader.read_snapshot`. Unlike pickle, marshal only stores plain
+data (dicts, lists, strings and numbers), so that loading a snapshot can
+not execute code. The marshal format depends on the Python version: a
+snapshot that the running version can not load is ignored, and written
+again.
+"""
+
+import hashlib
+import inspect
+import os
+
+#: Version of the snapshot file format
+SNAPSHOT_VERSION = 2
+
+#: Magic bytes at the start of the snapshot files
+SNAPSHOT_MAGIC = b"FBDSSNAP"
+
+#: Attributes of the factories holding the classes that are fingerprinted
+_FINGERPRINTED_CLASSES = [
+    "model_class",
+    "data_source_class",
+    "optimizer_class",
+    "communicator_class",
+    "listener_class",
+]
+
+
+def default_snapshot_file(path):
+    """ Returns the default path of the snapshot of the workflow file at
+    `path`."""
+    return path + ".snapshot"
+
+
+def source_hash(path):
+    """ Returns the SHA-256 hash of the content of the file at `path`."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(2 ** 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def factory_fingerprint(factory):
+    """ Returns a string identifying the classes provided by `factory`, and
+    the state of the modules defining them, so that the fingerprint
+    changes when a plugin is updated.
+    """
+    parts = []
+    for cls in [type(factory)] + [
+        getattr(factory, name) for name in _FINGERPRINTED_CLASSES
+        if getattr(factory, name, None) is not None
+    ]:
+        parts.append(f"{cls.__module__}.{cls.__qualname__}")
+        try:
+            stat = os.stat(inspect.getfile(cls))
+        except (TypeError, OSError):
+            continue
+        parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(parts)
+
+
+def workflow_factories(workflow):
+    """ Returns the factories of all the models of `workflow`, by id."""
+    models = []
+    if workflow.mco_model is not None:
+        models.append(workflow.mco_model)
+        models.extend(workflow.mco_model.parameters)
+    for layer in workflow.execution_layers:
+        models.extend(layer.data_sources)
+    models.extend(workflow.notification_listeners)
+    return {model.factory.id: model.factory for model in models}
+
+
+def find_factory(factory_registry, id):
+    """ Finds the factory of any kind with the given `id` in the
+    `factory_registry`.
+
+    Raises
+    ------
+    KeyError
+        If no factory has the given `id`.
+    """
+    mco_id, separator, _ = id.partition(".parameter.")
+    if separator:
+        return factory_registry.mco_parameter_factory_by_id(mco_id, id)
+
+    for lookup in [
+        factory_registry.data_source_factory_by_id,
+        factory_registry.mco_factory_by_id,
+        factory_registry.notification_listener_factory_by_id,
+    ]:
+        try:
+            return lookup(id)
+        except KeyError:
+            pass
+    raise KeyError(f"No factory with id {id}")
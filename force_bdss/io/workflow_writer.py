@@ -2,7 +2,46 @@
 #  All rights reserved.
 
 import json
-from traits.api import HasStrictTraits, ReadOnly
+import marshal
+import os
+
+from traits.api import Bool, HasStrictTraits, HasTraits, ReadOnly
+
+from force_bdss.core.base_model import BaseModel
+from force_bdss.core.data_value import DataValue
+from force_bdss.core.execution_layer import ExecutionLayer
+from force_bdss.core.input_slot_info import InputSlotInfo
+from force_bdss.core.kpi_specification import KPISpecification
+from force_bdss.core.output_slot_info import OutputSlotInfo
+from force_bdss.core.slot import Slot
+from force_bdss.core.workflow import Workflow
+from force_bdss.io.workflow_snapshot import (
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    factory_fingerprint,
+    workflow_factories,
+)
+
+#: The default implementation of __getstate__, if any (Python >= 3.11)
+_OBJECT_GETSTATE = getattr(object, "__getstate__", None)
+
+#: The __getstate__ implementations of the workflow classes reproduced by
+#: `_get_state`. For each implementation, whether it gets the state of the
+#: nested objects, and whether it wraps the state with the factory id.
+_GETSTATE_IMPLEMENTATIONS = {
+    BaseModel.__getstate__: (True, True),
+    Workflow.__getstate__: (True, False),
+    ExecutionLayer.__getstate__: (True, False),
+    DataValue.__getstate__: (False, False),
+    InputSlotInfo.__getstate__: (False, False),
+    OutputSlotInfo.__getstate__: (False, False),
+    KPISpecification.__getstate__: (False, False),
+    Slot.__getstate__: (False, False),
+}
+
+#: The names of the persisted traits of each class, as saved by
+#: `HasTraits.__getstate__`
+_persisted_trait_names = {}
 
 
 class WorkflowWriter(HasStrictTraits):
@@ -11,8 +50,15 @@ class WorkflowWriter(HasStrictTraits):
 
     version = ReadOnly("1.1")
 
+    #: Whether to write the JSON data without indentation, which is
+    #: smaller, and several times faster to write
+    compact = Bool(False)
+
     def write(self, workflow, path, *, mode="w"):
         """Writes the workflow model object to a file f in JSON format.
+        When the file is (over)written, the data is written to a temporary
+        file first, which then replaces the file, so that the file is never
+        left partially written.
 
         Parameters
         ----------
@@ -30,9 +76,128 @@ class WorkflowWriter(HasStrictTraits):
             "workflow": self.get_workflow_data(workflow),
         }
 
-        with open(path, mode) as f:
-            json.dump(data, f, indent=4)
+        # Unlike json.dump, json.dumps uses the C encoder of the json
+        # module for compact output.
+        if self.compact:
+            text = json.dumps(data, separators=(",", ":"))
+        else:
+            text = json.dumps(data, indent=4)
+
+        if mode != "w":
+            with open(path, mode) as f:
+                f.write(text)
+            return
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+    def write_snapshot(self, workflow, path, source_hash):
+        """Writes a compiled snapshot of the workflow (see
+        `force_bdss.io.workflow_snapshot`). The workflow must have been
+        verified without errors. The file is written atomically.
+
+        Raises
+        ------
+        ValueError
+            If the serialized workflow holds values other than plain data,
+            which can not be stored in the snapshot
+
+        Parameters
+        ----------
+        workflow: Workflow
+            The verified Workflow instance
+
+        path: string
+            The path of the snapshot file
+
+        source_hash: string
+            The hash of the workflow file the workflow was read from, as
+            returned by `workflow_snapshot.source_hash`
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "format_version": self.version,
+            "source_hash": source_hash,
+            "factories": {
+                id: factory_fingerprint(factory)
+                for id, factory in workflow_factories(workflow).items()
+            },
+            "workflow": self.get_workflow_data(workflow),
+        }
+
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(SNAPSHOT_MAGIC)
+                marshal.dump(snapshot, f, marshal.version)
+        except ValueError:
+            os.remove(temp_path)
+            raise
+        os.replace(temp_path, path)
 
     def get_workflow_data(self, workflow):
-        """ Public method to get a serialized form of workflow"""
-        return workflow.__getstate__()
+        """ Public method to get a serialized form of workflow.
+
+        The result is equal to `workflow.__getstate__()`, but is computed in
+        a single pass over the objects of the workflow. The state of the
+        objects is built without the `__traits_version__` key, instead of
+        removing it from every nested dictionary afterwards, so the
+        dictionaries and lists of plain data held by the models are not
+        walked, and are shared with the result. Objects with a custom
+        __getstate__ implementation are serialized by it.
+        """
+        return _get_state(workflow)
+
+
+def _get_state(obj):
+    """ Returns the state of the HasTraits `obj`, as returned by its
+    __getstate__ method."""
+    cls = type(obj)
+    try:
+        nested, wrapped = _GETSTATE_IMPLEMENTATIONS[cls.__getstate__]
+    except KeyError:
+        return obj.__getstate__()
+
+    names = _persisted_trait_names.get(cls)
+    if names is None:
+        names = [
+            name for name in HasTraits.__getstate__(obj)
+            if name != "__traits_version__"
+        ]
+        _persisted_trait_names[cls] = names
+
+    if nested:
+        state = {name: _get_nested_state(getattr(obj, name)) for name in names}
+    else:
+        state = {name: getattr(obj, name) for name in names}
+
+    if wrapped:
+        state = {"id": obj.factory.id, "model_data": state}
+    return state
+
+
+def _get_nested_state(value):
+    """ Returns the state of a trait value, as done by
+    `utilities.nested_getstate`."""
+    if isinstance(value, (tuple, list)):
+        if all(_has_getstate(element) for element in value):
+            return [_get_element_state(element) for element in value]
+        return value
+    if isinstance(value, dict):
+        return value
+    if _has_getstate(value):
+        return _get_element_state(value)
+    return value
+
+
+def _get_element_state(value):
+    if isinstance(value, HasTraits):
+        return _get_state(value)
+    return value.__getstate__()
+
+
+def _has_getstate(value):
+    getstate = getattr(type(value), "__getstate__", None)
+    return getstate is not None and getstate is not _OBJECT_GETSTATE
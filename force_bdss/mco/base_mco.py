@@ -5,10 +5,11 @@ import abc
 import logging
 
 from traits.api import (
-    ABCHasStrictTraits, Instance
+    ABCHasStrictTraits, File, Instance, List
 )
 
 from .i_mco_factory import IMCOFactory
+from .optimizer_engines.optimizer_checkpoint import OptimizerCheckpoint
 
 
 log = logging.getLogger(__name__)
@@ -22,6 +23,20 @@ class BaseMCO(ABCHasStrictTraits):
     #: A reference to the factory
     factory = Instance(IMCOFactory)
 
+    #: Checkpoint of the optimization, if the operation running the MCO
+    #: requested checkpointing. Implementations that use an optimizer
+    #: engine should pass it to the engine, so that the optimization
+    #: state is saved periodically and restored when resuming.
+    checkpoint = Instance(OptimizerCheckpoint)
+
+    #: Result files of previous runs (see
+    #: `BaseOptimizerEngine.load_evaluation_history`), whose evaluated
+    #: points should be reused instead of evaluating the workflow again.
+    #: Their points are already loaded in the `checkpoint` by the
+    #: optimize operation: only the implementations that do not pass the
+    #: checkpoint to an optimizer engine need to read them.
+    evaluation_history = List(File)
+
     def __init__(self, factory, **traits):
         """Initializes the MCO.
 
@@ -3,9 +3,12 @@
 
 import logging
 
-from traits.api import provides, Type, List, Instance
+from traits.api import (
+    cached_property, provides, Type, List, Instance, Property
+)
 
 from force_bdss.core.base_factory import BaseFactory
+from force_bdss.core.factory_registry import index_by_id
 from force_bdss.mco.base_mco import BaseMCO
 from force_bdss.mco.base_mco_communicator import BaseMCOCommunicator
 from force_bdss.mco.base_mco_model import BaseMCOModel
@@ -41,6 +44,11 @@ class BaseMCOFactory(BaseFactory):
     #: The instantiated parameter factories.
     parameter_factories = List(Instance(IMCOParameterFactory))
 
+    #: The parameter factories by id, rebuilt when the list changes.
+    _parameter_factories_by_id = Property(
+        depends_on="parameter_factories[]", transient=True
+    )
+
     def __init__(self, plugin, *args, **kwargs):
         super(BaseMCOFactory, self).__init__(plugin=plugin, *args, **kwargs)
 
@@ -132,12 +140,15 @@ class BaseMCOFactory(BaseFactory):
         ]
 
     def parameter_factory_by_id(self, parameter_id):
-        for factory in self.parameter_factories:
-            if factory.id == parameter_id:
-                return factory
-
-        raise KeyError(
-            f"Invalid Parameter Factory id {parameter_id} for "
-            f"the specified MCO Factory {self.__class__}. "
-            "No plugin responsible for the id is found."
-        )
+        try:
+            return self._parameter_factories_by_id[parameter_id]
+        except KeyError:
+            raise KeyError(
+                f"Invalid Parameter Factory id {parameter_id} for "
+                f"the specified MCO Factory {self.__class__}. "
+                "No plugin responsible for the id is found."
+            ) from None
+
+    @cached_property
+    def _get__parameter_factories_by_id(self):
+        return index_by_id(self.parameter_factories)
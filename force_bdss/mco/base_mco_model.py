@@ -4,9 +4,10 @@
 from copy import deepcopy
 import logging
 
-from traits.api import Instance, List, Type
+from traits.api import Enum, Instance, List, Type
 
 from force_bdss.core.base_model import BaseModel
+from force_bdss.core.data_value import DataValue
 from force_bdss.events.mco_events import (
     MCOStartEvent,
     MCOFinishEvent,
@@ -39,6 +40,12 @@ class BaseMCOModel(BaseModel):
     #: A list of KPI specification objects and their objective.
     kpis = List(KPISpecification, visible=False)
 
+    #: What happens when an evaluation of the workflow fails. With "ABORT",
+    #: the error is raised, and the MCO stops. With "CONTINUE", the
+    #: `failure_value` of each KPI is returned instead, so that the MCO
+    #: continues.
+    on_evaluation_failure = Enum("ABORT", "CONTINUE")
+
     #: Type of the MCO Start event
     _start_event_type = Type(MCOStartEvent, visible=False, transient=True)
 
@@ -109,6 +116,27 @@ class BaseMCOModel(BaseModel):
 
         return kpi_results
 
+    def failure_kpis(self):
+        """ Returns the KPI data values of a failed evaluation of the
+        workflow: the `failure_value` of each KPI, or NaN if it is not
+        set.
+
+        Returns
+        -------
+        data_values : list of DataValues
+            The data values corresponding to the KPIs.
+        """
+        return [
+            DataValue(
+                name=kpi.name,
+                value=(
+                    float("nan") if kpi.failure_value is None
+                    else kpi.failure_value
+                ),
+            )
+            for kpi in self.kpis
+        ]
+
     def verify(self):
         """ Verify the MCO model.
 
@@ -186,7 +214,7 @@ class BaseMCOModel(BaseModel):
         )
 
     @classmethod
-    def from_json(cls, factory, json_data):
+    def from_json(cls, factory, json_data, copy=True):
         """ Instantiate an BaseMCOModel object from a `json_data`
         dictionary and the generating `factory` object.
 
@@ -196,6 +224,10 @@ class BaseMCOModel(BaseModel):
             Generating factory object
         json_data: dict
             Dictionary with an MCOModel  serialized data
+        copy: bool
+            If True (default), `json_data` is deep copied before use. If
+            False, the ownership of `json_data` is transferred: the created
+            objects use its content directly, and it may be modified.
 
         Returns
         ----------
@@ -203,7 +235,7 @@ class BaseMCOModel(BaseModel):
             BaseMCOModel instance with attributes values from
             the `json_data` dict
         """
-        data = deepcopy(json_data)
+        data = deepcopy(json_data) if copy else json_data
 
         parameters = []
         for parameter_data in data["parameters"]:
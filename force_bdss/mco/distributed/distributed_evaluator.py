@@ -0,0 +1,561 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from collections import deque
+import hmac
+import itertools
+import logging
+import os
+import socket
+import threading
+import time
+
+from traits.api import (
+    Any,
+    Bool,
+    Float,
+    HasStrictTraits,
+    Instance,
+    Int,
+    List,
+    Property,
+    Str,
+    provides,
+)
+
+from force_bdss.core.failed_evaluation import FailedEvaluation
+from force_bdss.core.workflow import Workflow
+from force_bdss.io.workflow_writer import WorkflowWriter
+from force_bdss.local_traits import PositiveInt
+from force_bdss.mco.base_mco_model import BaseMCOModel
+from force_bdss.mco.i_evaluator import IEvaluator
+
+from .protocol import (
+    TOKEN_ENVIRONMENT_VARIABLE,
+    ProtocolError,
+    check_fields,
+    is_loopback,
+    receive_message,
+    send_message,
+)
+
+log = logging.getLogger(__name__)
+
+
+class RemoteEvaluationError(Exception):
+    """ Raised when the evaluation of a point by the workers failed."""
+
+
+class _Job(HasStrictTraits):
+    """ The evaluation of a point."""
+
+    #: Identifier of the job, unique for an evaluator
+    id = Int()
+
+    #: The parameter values of the point
+    parameters = List()
+
+    #: The KPI values, once the point was evaluated
+    kpis = List()
+
+    #: Whether the KPI values are the failure values of a failed
+    #: evaluation
+    failed = Bool(False)
+
+    #: The error raised by the evaluation, if any
+    error = Str()
+
+    #: Number of times the point was submitted to a worker
+    n_submissions = Int()
+
+    #: Set once the job is done, with the KPIs or an error
+    done = Any()
+
+
+class _Worker(HasStrictTraits):
+    """ A worker connected to the evaluator."""
+
+    #: The connection to the worker
+    connection = Any()
+
+    #: The name of the worker, as sent by the worker
+    name = Str()
+
+    #: Whether the worker loaded the workflow, and accepts points
+    ready = Bool(False)
+
+    #: The job evaluated by the worker, if any
+    job = Instance(_Job)
+
+    #: Time of the last message received from the worker
+    last_seen = Float()
+
+    #: Whether the worker was lost
+    lost = Bool(False)
+
+    #: Serializes the messages sent to the worker
+    send_lock = Any()
+
+    def send(self, message):
+        with self.send_lock:
+            send_message(self.connection, message)
+
+
+@provides(IEvaluator)
+class DistributedEvaluator(HasStrictTraits):
+    """ Evaluates a workflow on remote worker processes.
+
+    The evaluator listens on `host` and `port` for the connections of
+    `EvaluationWorker` processes, which can run on other nodes. The workers
+    must send the `token` of the evaluator, and the evaluator refuses to
+    listen on an interface reachable from other nodes without a token. The
+    serialized workflow, as returned by `WorkflowWriter.get_workflow_data`,
+    is sent to each worker once upon connection. The points to evaluate
+    are then dispatched to the idle workers, which send back the KPI
+    values.
+
+    The workers send a heartbeat periodically. A worker is lost if its
+    connection is closed, or if nothing was received from it for
+    `heartbeat_timeout` seconds: its point is then submitted again to
+    another worker, up to `max_submissions` times in total. The points
+    fail if no worker is ready to evaluate them for `worker_timeout`
+    seconds.
+
+    `evaluate` can be called from several threads at once, e.g. by an
+    optimizer evaluating a population in parallel, and `evaluate_many`
+    evaluates several points concurrently. The evaluations block until
+    the workers are available.
+    """
+
+    #: The workflow to evaluate
+    workflow = Instance(Workflow)
+
+    #: The MCO model of the workflow
+    mco_model = Property(
+        Instance(BaseMCOModel), depends_on="workflow.mco_model"
+    )
+
+    #: Interface on which the evaluator listens for the workers
+    host = Str("127.0.0.1")
+
+    #: Port on which the evaluator listens for the workers. If 0, a free
+    #: port is chosen when the evaluator is started.
+    port = Int(0)
+
+    #: The (host, port) address on which the evaluator listens, once
+    #: started
+    address = Any()
+
+    #: Token that the workers must send to be accepted, by default the
+    #: value of the FORCE_BDSS_TOKEN environment variable. Required unless
+    #: the evaluator listens on a loopback interface.
+    token = Str()
+
+    #: Interval, in seconds, between the heartbeats of the workers
+    heartbeat_interval = Float(5.0)
+
+    #: Time, in seconds, after which a silent worker is lost
+    heartbeat_timeout = Float(30.0)
+
+    #: Maximum number of submissions of a point to the workers
+    max_submissions = PositiveInt(3)
+
+    #: Time, in seconds, after which the pending points fail if no worker
+    #: is ready to evaluate them. If 0, the points wait for the workers
+    #: indefinitely.
+    worker_timeout = Float(300.0)
+
+    #: The connected workers
+    workers = List(Instance(_Worker))
+
+    #: Number of points submitted again after the loss of a worker
+    n_resubmissions = Int()
+
+    #: Guards the workers and the pending jobs, and is notified when a
+    #: worker becomes ready, or is lost
+    _condition = Any()
+
+    #: The jobs waiting for a worker
+    _pending = Any()
+
+    #: Time since which jobs are pending while no worker is ready, if any
+    _waiting_since = Any()
+
+    #: Generates the identifiers of the jobs
+    _job_ids = Any()
+
+    #: The serialized workflow sent to the workers
+    _workflow_data = Any()
+
+    #: The listening socket
+    _server = Any()
+
+    #: Set when the evaluator is stopped
+    _stopped = Any()
+
+    #: The threads of the evaluator
+    _threads = List()
+
+    def _token_default(self):
+        return os.environ.get(TOKEN_ENVIRONMENT_VARIABLE, "")
+
+    def _get_mco_model(self):
+        if self.workflow is None:
+            return None
+        return self.workflow.mco_model
+
+    def start(self):
+        """ Starts listening for the workers.
+
+        Raises
+        ------
+        ValueError
+            If the evaluator would listen on an interface reachable from
+            other nodes without a token
+        """
+        if not self.token and not is_loopback(self.host):
+            raise ValueError(
+                f"A token is required to accept the workers on {self.host}: "
+                f"set the {TOKEN_ENVIRONMENT_VARIABLE} environment variable "
+                f"of the evaluator and of the workers"
+            )
+        workflow_data = WorkflowWriter().get_workflow_data(self.workflow)
+        # The workers only evaluate the workflow: they do not need the
+        # plugins of the notification listeners
+        self._workflow_data = dict(
+            workflow_data, notification_listeners=[]
+        )
+        self._condition = threading.Condition()
+        self._pending = deque()
+        self._waiting_since = None
+        self._job_ids = itertools.count()
+        self._stopped = threading.Event()
+
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((self.host, self.port))
+        self._server.listen()
+        self._server.settimeout(0.2)
+        self.address = self._server.getsockname()[:2]
+        log.info("Waiting for evaluation workers on {}:{}".format(
+            *self.address))
+
+        self._threads = [
+            threading.Thread(
+                target=self._accept_workers,
+                name="BDSS distributed evaluator",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._monitor_workers,
+                name="BDSS distributed evaluator monitor",
+                daemon=True,
+            ),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """ Shuts down the workers, and stops listening. The evaluations in
+        progress fail."""
+        if self._stopped is None or self._stopped.is_set():
+            return
+        self._stopped.set()
+        # No worker connects once the first thread, accepting the
+        # connections, exited
+        accept_thread, *threads = self._threads
+        accept_thread.join()
+        self._server.close()
+        with self._condition:
+            workers = list(self.workers)
+        for worker in workers:
+            try:
+                worker.send({"type": "shutdown"})
+            except OSError:
+                pass
+            self._lose_worker(worker, "the evaluator was stopped")
+        for thread in threads:
+            thread.join()
+        with self._condition:
+            pending, self._pending = list(self._pending), deque()
+        for job in pending:
+            self._fail_job(job, "the evaluator was stopped")
+
+    def wait_for_workers(self, n_workers=1, timeout=None):
+        """ Waits until at least `n_workers` workers are ready. Returns
+        whether they are."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: sum(worker.ready for worker in self.workers)
+                >= n_workers,
+                timeout,
+            )
+
+    def evaluate(self, parameter_values):
+        """ Evaluates the workflow at the given MCO parameter values on a
+        worker.
+
+        Parameters
+        ----------
+        parameter_values: list
+            List of values to assign to each BaseMCOParameter defined
+            in the workflow
+
+        Returns
+        -------
+        kpi_results: list
+            List of values corresponding to each MCO KPI in the
+            workflow, or a FailedEvaluation of their failure values
+
+        Raises
+        ------
+        RemoteEvaluationError
+            If the evaluation failed on the worker, or the point could not
+            be evaluated by `max_submissions` workers
+        """
+        job = self._submit(parameter_values)
+        return self._result(job)
+
+    def evaluate_many(self, points):
+        """ Evaluates several points concurrently, on all the available
+        workers. Returns the list of the KPI values of each point."""
+        jobs = [self._submit(parameter_values) for parameter_values in points]
+        return [self._result(job) for job in jobs]
+
+    def _submit(self, parameter_values):
+        if self._stopped is None:
+            raise RemoteEvaluationError("The evaluator is not running")
+        with self._condition:
+            if self._stopped.is_set():
+                raise RemoteEvaluationError("The evaluator is not running")
+            job = _Job(
+                id=next(self._job_ids),
+                parameters=list(parameter_values),
+                done=threading.Event(),
+            )
+            self._pending.append(job)
+            self._dispatch()
+        return job
+
+    def _result(self, job):
+        job.done.wait()
+        if job.error:
+            raise RemoteEvaluationError(
+                f"Evaluation of point {job.parameters} failed: {job.error}"
+            )
+        if job.failed:
+            return FailedEvaluation(job.kpis)
+        return job.kpis
+
+    def _dispatch(self):
+        """ Sends the pending jobs to the idle workers. Must be called with
+        the condition held."""
+        for worker in self.workers:
+            if not self._pending:
+                return
+            if not worker.ready or worker.job is not None:
+                continue
+            job = self._pending.popleft()
+            job.n_submissions += 1
+            worker.job = job
+            try:
+                worker.send({
+                    "type": "evaluate",
+                    "id": job.id,
+                    "parameters": job.parameters,
+                })
+            except OSError:
+                # The reader of the worker will detect the loss of the
+                # connection, and submit the job again
+                pass
+
+    def _accept_workers(self):
+        while not self._stopped.is_set():
+            try:
+                connection, address = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            worker = _Worker(
+                connection=connection,
+                name="{}:{}".format(*address[:2]),
+                last_seen=time.monotonic(),
+                send_lock=threading.Lock(),
+            )
+            with self._condition:
+                self.workers.append(worker)
+            thread = threading.Thread(
+                target=self._read_worker,
+                args=(worker,),
+                name=f"BDSS evaluation worker {worker.name}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _read_worker(self, worker):
+        """ Handles the messages of a worker until it is lost."""
+        try:
+            self._accept_worker(worker)
+            while not worker.lost:
+                message = receive_message(worker.connection)
+                worker.last_seen = time.monotonic()
+                self._handle_message(worker, message)
+        except EOFError:
+            self._lose_worker(worker, "the connection was closed")
+        except (OSError, ProtocolError) as error:
+            self._lose_worker(worker, str(error))
+        except Exception as error:
+            log.exception(
+                f"Unexpected error with the evaluation worker {worker.name}"
+            )
+            self._lose_worker(worker, f"{type(error).__name__}: {error}")
+
+    def _accept_worker(self, worker):
+        """ Checks the hello message of a worker, and sends it the
+        workflow."""
+        message = receive_message(worker.connection)
+        worker.last_seen = time.monotonic()
+        if message["type"] != "hello":
+            raise ProtocolError(
+                f"Expected the hello message, received '{message['type']}'"
+            )
+        check_fields(message, worker=str)
+        token = message.get("token", "")
+        if not isinstance(token, str) or not hmac.compare_digest(
+                token.encode("utf-8"), self.token.encode("utf-8")):
+            try:
+                worker.send({"type": "error", "error": "invalid token"})
+            except OSError:
+                pass
+            raise ProtocolError("invalid token")
+
+        worker.name = message["worker"]
+        log.info(f"Evaluation worker {worker.name} connected")
+        worker.send({
+            "type": "workflow",
+            "data": self._workflow_data,
+            "heartbeat_interval": self.heartbeat_interval,
+        })
+
+    def _handle_message(self, worker, message):
+        message_type = message["type"]
+        if message_type == "ready":
+            with self._condition:
+                worker.ready = True
+                self._dispatch()
+                self._condition.notify_all()
+        elif message_type == "result":
+            check_fields(message, id=int)
+            if "error" in message:
+                check_fields(message, error=str)
+            else:
+                check_fields(message, kpis=list)
+                if "failed" in message:
+                    check_fields(message, failed=bool)
+            with self._condition:
+                job = worker.job
+                if job is None or job.id != message["id"]:
+                    raise ProtocolError(
+                        f"Unexpected result of job {message['id']}"
+                    )
+                worker.job = None
+                self._dispatch()
+            if "error" in message:
+                job.error = message["error"]
+            else:
+                job.kpis = message["kpis"]
+                job.failed = message.get("failed", False)
+            job.done.set()
+        elif message_type == "error":
+            check_fields(message, error=str)
+            raise ProtocolError(
+                f"The worker failed to load the workflow: "
+                f"{message['error']}"
+            )
+        elif message_type != "heartbeat":
+            raise ProtocolError(f"Unexpected message type '{message_type}'")
+
+    def _monitor_workers(self):
+        """ Loses the workers from which nothing was received for
+        `heartbeat_timeout` seconds, and fails the pending jobs if no
+        worker was ready for `worker_timeout` seconds."""
+        while not self._stopped.wait(self._monitor_interval()):
+            now = time.monotonic()
+            with self._condition:
+                silent = [
+                    worker for worker in self.workers
+                    if now - worker.last_seen > self.heartbeat_timeout
+                ]
+            for worker in silent:
+                self._lose_worker(
+                    worker,
+                    f"no heartbeat for {self.heartbeat_timeout} seconds"
+                )
+            self._expire_pending_jobs(now)
+
+    def _monitor_interval(self):
+        interval = min(self.heartbeat_interval, self.heartbeat_timeout)
+        if self.worker_timeout > 0:
+            interval = min(interval, self.worker_timeout)
+        return interval / 2
+
+    def _expire_pending_jobs(self, now):
+        """ Fails the pending jobs if no worker was ready to evaluate them
+        for `worker_timeout` seconds."""
+        with self._condition:
+            if not self._pending or any(
+                    worker.ready for worker in self.workers):
+                self._waiting_since = None
+                return
+            if self._waiting_since is None:
+                self._waiting_since = now
+            if (self.worker_timeout <= 0
+                    or now - self._waiting_since < self.worker_timeout):
+                return
+            pending, self._pending = list(self._pending), deque()
+            self._waiting_since = None
+
+        error = f"no worker was ready for {self.worker_timeout} seconds"
+        log.warning(f"{len(pending)} pending evaluations failed: {error}")
+        for job in pending:
+            self._fail_job(job, error)
+
+    def _lose_worker(self, worker, reason):
+        """ Closes the connection of a worker, and submits its job again."""
+        with self._condition:
+            if worker.lost:
+                return
+            worker.lost = True
+            self.workers.remove(worker)
+            if self._stopped.is_set():
+                log.info(f"Evaluation worker {worker.name} disconnected")
+                reason = "the evaluator was stopped"
+            else:
+                log.warning(f"Evaluation worker {worker.name} lost: {reason}")
+
+            job, worker.job = worker.job, None
+            if job is not None and not self._stopped.is_set():
+                if job.n_submissions < self.max_submissions:
+                    self.n_resubmissions += 1
+                    self._pending.appendleft(job)
+                    job = None
+            self._dispatch()
+            self._condition.notify_all()
+        try:
+            worker.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        worker.connection.close()
+
+        if job is not None:
+            self._fail_job(
+                job,
+                f"the worker {worker.name} was lost after "
+                f"{job.n_submissions} submissions ({reason})"
+            )
+
+    def _fail_job(self, job, error):
+        job.error = error
+        job.done.set()
@@ -0,0 +1,175 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import os
+import socket
+import threading
+import time
+
+from traits.api import Any, Float, HasStrictTraits, Instance, Int, Str
+
+from force_bdss.core.failed_evaluation import FailedEvaluation
+from force_bdss.core.i_factory_registry import IFactoryRegistry
+from force_bdss.core.workflow import Workflow
+
+from .protocol import (
+    TOKEN_ENVIRONMENT_VARIABLE,
+    ProtocolError,
+    check_fields,
+    receive_message,
+    send_message,
+)
+
+log = logging.getLogger(__name__)
+
+
+class EvaluationWorker(HasStrictTraits):
+    """ Worker process of a DistributedEvaluator.
+
+    The worker connects to the evaluator, receives the workflow once, and
+    then evaluates the points it receives until the evaluator shuts it
+    down or closes the connection. A heartbeat is sent periodically by a
+    background thread, so that the evaluator can detect the workers that
+    died or became unreachable, whatever the duration of the evaluations.
+
+    The factories of the workflow are looked up in the `factory_registry`,
+    so the plugins of the workflow must be installed on every node.
+    """
+
+    #: The registry of the factories of the workflow
+    factory_registry = Instance(IFactoryRegistry)
+
+    #: Address of the DistributedEvaluator: a (host, port) tuple
+    address = Any()
+
+    #: Name identifying the worker, by default "host:pid"
+    name = Str()
+
+    #: Token of the evaluator, by default the value of the FORCE_BDSS_TOKEN
+    #: environment variable
+    token = Str()
+
+    #: Time, in seconds, during which the connection to the evaluator is
+    #: retried, e.g. if the worker starts before the evaluator
+    connect_timeout = Float(60.0)
+
+    #: The workflow received from the evaluator
+    workflow = Instance(Workflow)
+
+    #: Number of points evaluated
+    n_evaluations = Int()
+
+    #: Lock between the evaluations and the heartbeat thread
+    _send_lock = Any()
+
+    def _name_default(self):
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def _token_default(self):
+        return os.environ.get(TOKEN_ENVIRONMENT_VARIABLE, "")
+
+    def run(self):
+        """ Connects to the evaluator, and evaluates points until the
+        connection is closed."""
+        connection = self.connect()
+        try:
+            self.serve(connection)
+        finally:
+            connection.close()
+        log.info(f"Worker {self.name} evaluated {self.n_evaluations} "
+                 f"points")
+
+    def connect(self):
+        """ Returns a connection to the evaluator, retrying until the
+        `connect_timeout` elapses."""
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return socket.create_connection(self.address)
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.5)
+
+    def serve(self, connection):
+        """ Receives the workflow, and evaluates points until the
+        evaluator shuts down the worker or closes the connection."""
+        self._send_lock = threading.Lock()
+        self._send(connection, {
+            "type": "hello", "worker": self.name, "token": self.token
+        })
+
+        message = receive_message(connection)
+        if message["type"] == "error":
+            raise ProtocolError(
+                f"The evaluator refused the worker: {message.get('error')}"
+            )
+        if message["type"] != "workflow":
+            raise ProtocolError(
+                f"Expected the workflow, received '{message['type']}'"
+            )
+        check_fields(message, data=dict, heartbeat_interval=(int, float))
+        try:
+            self.workflow = Workflow.from_json(
+                self.factory_registry, message["data"], copy=False
+            )
+        except Exception as error:
+            log.exception("Unable to load the workflow")
+            self._send(connection, {"type": "error", "error": str(error)})
+            return
+
+        stopped = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._send_heartbeats,
+            args=(connection, message["heartbeat_interval"], stopped),
+            name="BDSS worker heartbeat",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            self._send(connection, {"type": "ready"})
+            log.info(f"Worker {self.name} ready")
+            self._evaluate_points(connection)
+        finally:
+            stopped.set()
+            heartbeat.join()
+
+    def _evaluate_points(self, connection):
+        while True:
+            try:
+                message = receive_message(connection)
+            except EOFError:
+                return
+            if message["type"] == "shutdown":
+                return
+            if message["type"] != "evaluate":
+                raise ProtocolError(
+                    f"Unexpected message type '{message['type']}'"
+                )
+            check_fields(message, id=int, parameters=list)
+
+            result = {"type": "result", "id": message["id"]}
+            try:
+                kpis = self.workflow.evaluate(message["parameters"])
+                result["kpis"] = kpis
+                if isinstance(kpis, FailedEvaluation):
+                    result["failed"] = True
+            except Exception as error:
+                log.exception(
+                    f"Evaluation of point {message['parameters']} failed"
+                )
+                result["error"] = f"{type(error).__name__}: {error}"
+            self.n_evaluations += 1
+            self._send(connection, result)
+
+    def _send_heartbeats(self, connection, interval, stopped):
+        while not stopped.wait(interval):
+            try:
+                self._send(connection, {"type": "heartbeat"})
+            except OSError:
+                return
+
+    def _send(self, connection, message):
+        with self._send_lock:
+            send_message(connection, message)
@@ -0,0 +1,170 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Messages exchanged between the DistributedEvaluator and the
+EvaluationWorkers.
+
+Each message is a JSON object, sent as a frame made of a `FRAME_HEADER`
+(the payload length in bytes) followed by the UTF-8 encoded payload. The
+``type`` key of each message is one of:
+
+From a worker to the evaluator:
+
+- ``hello``: sent upon connection, with the ``worker`` name and the
+  ``token`` shared with the evaluator.
+- ``ready``: the workflow was loaded, and the worker accepts points.
+- ``result``: the ``kpis`` of the point with the given ``id``, or the
+  ``error`` raised by its evaluation. ``failed`` is true if the KPIs are
+  the failure values of an evaluation that failed (see
+  `FailedEvaluation`).
+- ``heartbeat``: sent periodically, whatever the worker is doing.
+- ``error``: the workflow could not be loaded, with the ``error``.
+
+From the evaluator to a worker:
+
+- ``error``: the worker was refused, with the ``error``.
+- ``workflow``: the workflow ``data``, as returned by
+  `WorkflowWriter.get_workflow_data`, and the ``heartbeat_interval``.
+- ``evaluate``: the ``parameters`` of the point with the given ``id``.
+- ``shutdown``: the worker must exit.
+
+The values of the parameters and of the KPIs must be JSON serializable.
+Arrays are converted to lists.
+"""
+
+import ipaddress
+import json
+import struct
+
+#: Header of each frame: payload length in bytes
+FRAME_HEADER = struct.Struct("<I")
+
+#: Maximum size of a message payload, in bytes
+MAX_MESSAGE_SIZE = 256 * 2 ** 20
+
+#: Environment variable holding the token shared by the evaluator and its
+#: workers, by default
+TOKEN_ENVIRONMENT_VARIABLE = "FORCE_BDSS_TOKEN"
+
+
+class ProtocolError(Exception):
+    """ Raised when an invalid message is received."""
+
+
+def send_message(connection, message):
+    """ Sends a message on a socket.
+
+    Parameters
+    ----------
+    connection: socket.socket
+        The connected socket
+    message: dict
+        The JSON serializable message
+    """
+    payload = json.dumps(message, default=_json_default).encode("utf-8")
+    connection.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def receive_message(connection):
+    """ Receives a message from a socket.
+
+    Parameters
+    ----------
+    connection: socket.socket
+        The connected socket
+
+    Returns
+    -------
+    message: dict
+        The received message
+
+    Raises
+    ------
+    EOFError
+        If the connection was closed before a message was received
+    ProtocolError
+        If the message is invalid
+    """
+    header = _receive_exactly(connection, FRAME_HEADER.size, eof_ok=True)
+    size, = FRAME_HEADER.unpack(header)
+    if size > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Message of {size} bytes is too large")
+    payload = _receive_exactly(connection, size)
+    try:
+        message = json.loads(payload.decode("utf-8"))
+    except ValueError as error:
+        raise ProtocolError(f"Invalid message: {error}")
+    if not isinstance(message, dict) or "type" not in message:
+        raise ProtocolError("Invalid message: missing message type")
+    return message
+
+
+def check_fields(message, **fields):
+    """ Checks that the `message` holds the given fields, with values of
+    the given types.
+
+    Raises
+    ------
+    ProtocolError
+        If a field is missing, or has a value of another type
+    """
+    for name, types in fields.items():
+        if not isinstance(types, tuple):
+            types = (types,)
+        value = message.get(name)
+        # Booleans are only accepted where expected, not as integers
+        if not isinstance(value, types) or (
+                isinstance(value, bool) and bool not in types):
+            raise ProtocolError(
+                f"Invalid '{message['type']}' message: missing or invalid "
+                f"'{name}'"
+            )
+
+
+def is_loopback(host):
+    """ Returns whether `host` is a loopback interface, which is only
+    reachable from the local node."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def parse_address(address):
+    """ Returns the (host, port) tuple of a "host:port" address."""
+    host, separator, port = address.rpartition(":")
+    if not separator or not port.isdigit():
+        raise ValueError(
+            f"Invalid address '{address}': expected 'host:port'"
+        )
+    return host or "127.0.0.1", int(port)
+
+
+def _receive_exactly(connection, size, eof_ok=False):
+    """ Receives exactly `size` bytes. Raises EOFError if the connection
+    is closed before any byte is received and `eof_ok` is True, or
+    ProtocolError if it is closed in the middle of a message."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            if eof_ok and not data:
+                raise EOFError("Connection closed")
+            raise ProtocolError("Connection closed in the middle of a "
+                                "message")
+        data += chunk
+    return bytes(data)
+
+
+def _json_default(value):
+    """ Converts values that are not JSON serializable, such as numpy
+    arrays and scalars."""
+    try:
+        return value.tolist()
+    except AttributeError:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON "
+            f"serializable"
+        )
@@ -0,0 +1,271 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import unittest
+from unittest import mock
+
+import testfixtures
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.core.failed_evaluation import FailedEvaluation
+from force_bdss.mco.distributed.distributed_evaluator import (
+    DistributedEvaluator,
+    RemoteEvaluationError,
+)
+from force_bdss.mco.distributed.evaluation_worker import EvaluationWorker
+from force_bdss.mco.distributed.protocol import (
+    ProtocolError,
+    receive_message,
+    send_message,
+)
+from force_bdss.tests import fixtures
+from force_bdss.tests.probe_classes.factory_registry import (
+    ProbeFactoryRegistry
+)
+from force_bdss.tests.probe_classes.workflow_file import ProbeWorkflowFile
+
+LOGGER = "force_bdss.mco.distributed.distributed_evaluator"
+
+
+def run_worker(address, crash=False):
+    """ Runs a worker whose workflow doubles the parameter value. The
+    evaluation of negative values fails, and the worker process exits
+    abruptly at the first evaluation if `crash` is True."""
+    logging.getLogger("force_bdss").addHandler(logging.NullHandler())
+
+    def run_function(model, parameters):
+        if crash:
+            os._exit(1)
+        value = parameters[0].value
+        if value < 0:
+            raise ValueError("negative value")
+        return [DataValue(value=2 * value)]
+
+    registry = ProbeFactoryRegistry()
+    registry.data_source_factories[0].run_function = run_function
+    EvaluationWorker(
+        factory_registry=registry, address=address, connect_timeout=10.0
+    ).run()
+
+
+class TestDistributedEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.capture = testfixtures.LogCapture(LOGGER)
+        self.addCleanup(self.capture.uninstall)
+
+        workflow_file = ProbeWorkflowFile(path=fixtures.get("test_probe.json"))
+        workflow_file.read()
+        self.evaluator = DistributedEvaluator(
+            workflow=workflow_file.workflow,
+            heartbeat_interval=0.1,
+            heartbeat_timeout=2.0,
+        )
+        self.evaluator.start()
+        self.addCleanup(self.evaluator.stop)
+        self.context = multiprocessing.get_context("spawn")
+
+    def start_worker(self, crash=False):
+        process = self.context.Process(
+            target=run_worker, args=(self.evaluator.address, crash)
+        )
+        process.start()
+        self.addCleanup(process.join, 10)
+        self.addCleanup(self.kill, process)
+        return process
+
+    def connect(self, token=""):
+        """ Connects to the evaluator as a worker, and returns the
+        connection once the workflow was received."""
+        connection = socket.create_connection(self.evaluator.address)
+        self.addCleanup(connection.close)
+        send_message(
+            connection, {"type": "hello", "worker": "test", "token": token}
+        )
+        self.assertEqual("workflow", receive_message(connection)["type"])
+        return connection
+
+    def assertClosed(self, connection):
+        """ Asserts that the evaluator closes the connection."""
+        connection.settimeout(10.0)
+        with self.assertRaises(EOFError):
+            while True:
+                receive_message(connection)
+
+    def kill(self, process):
+        if process.is_alive():
+            process.kill()
+
+    def assertLost(self, reason):
+        warnings = [
+            record.getMessage() for record in self.capture.records
+            if record.levelname == "WARNING"
+        ]
+        self.assertEqual(1, len(warnings))
+        self.assertRegex(
+            warnings[0], f"^Evaluation worker .* lost: {reason}$"
+        )
+
+    def test_evaluate(self):
+        processes = [self.start_worker() for _ in range(3)]
+        self.assertIs(
+            self.evaluator.workflow.mco_model, self.evaluator.mco_model
+        )
+
+        self.assertEqual([2.0], self.evaluator.evaluate([1.0]))
+        self.assertTrue(self.evaluator.wait_for_workers(3, timeout=30))
+        points = [[float(value)] for value in range(10)]
+        self.assertEqual(
+            [[2.0 * value] for value in range(10)],
+            self.evaluator.evaluate_many(points)
+        )
+
+        with self.assertRaisesRegex(
+                RemoteEvaluationError, "ValueError: negative value"):
+            self.evaluator.evaluate([-1.0])
+        # The worker keeps evaluating after an error
+        self.assertEqual(
+            [[4.0], [6.0], [8.0]],
+            self.evaluator.evaluate_many([[2.0], [3.0], [4.0]])
+        )
+        self.assertEqual(0, self.evaluator.n_resubmissions)
+
+        self.evaluator.stop()
+        for process in processes:
+            process.join(10)
+            self.assertEqual(0, process.exitcode)
+
+        with self.assertRaises(RemoteEvaluationError):
+            self.evaluator.evaluate([1.0])
+
+    def test_lost_worker(self):
+        self.start_worker(crash=True)
+        self.assertTrue(self.evaluator.wait_for_workers(1, timeout=30))
+
+        # The point is submitted again to the second worker
+        self.start_worker()
+        self.assertEqual([10.0], self.evaluator.evaluate([5.0]))
+
+        self.assertEqual(1, self.evaluator.n_resubmissions)
+        self.assertEqual(1, len(self.evaluator.workers))
+        self.assertLost("the connection was closed")
+
+    def test_max_submissions(self):
+        self.evaluator.max_submissions = 1
+        self.start_worker(crash=True)
+        self.assertTrue(self.evaluator.wait_for_workers(1, timeout=30))
+
+        with self.assertRaisesRegex(
+                RemoteEvaluationError, "was lost after 1 submissions"):
+            self.evaluator.evaluate([5.0])
+        self.assertEqual(0, self.evaluator.n_resubmissions)
+
+    @unittest.skipUnless(hasattr(signal, "SIGSTOP"), "Requires SIGSTOP")
+    def test_heartbeat_timeout(self):
+        process = self.start_worker()
+        self.assertTrue(self.evaluator.wait_for_workers(1, timeout=30))
+        # The worker becomes unresponsive, without closing its connection
+        os.kill(process.pid, signal.SIGSTOP)
+
+        self.start_worker()
+        self.assertEqual([10.0], self.evaluator.evaluate([5.0]))
+
+        self.assertEqual(1, self.evaluator.n_resubmissions)
+        self.assertLost("no heartbeat for 2.0 seconds")
+
+    def test_token(self):
+        self.evaluator.stop()
+        self.evaluator = DistributedEvaluator(
+            workflow=self.evaluator.workflow, token="secret"
+        )
+        self.evaluator.start()
+        self.addCleanup(self.evaluator.stop)
+        self.connect(token="secret")
+
+        connection = socket.create_connection(self.evaluator.address)
+        self.addCleanup(connection.close)
+        send_message(connection, {"type": "hello", "worker": "test"})
+        self.assertEqual(
+            {"type": "error", "error": "invalid token"},
+            receive_message(connection)
+        )
+        self.assertClosed(connection)
+        self.assertLost("invalid token")
+
+        worker = EvaluationWorker(
+            factory_registry=ProbeFactoryRegistry(),
+            address=self.evaluator.address,
+            token="wrong",
+        )
+        with self.assertRaisesRegex(ProtocolError, "refused the worker"):
+            worker.run()
+
+    def test_token_required(self):
+        evaluator = DistributedEvaluator(
+            workflow=self.evaluator.workflow, host="0.0.0.0"
+        )
+        with mock.patch.dict(os.environ, {"FORCE_BDSS_TOKEN": ""}):
+            with self.assertRaisesRegex(ValueError, "token is required"):
+                evaluator.start()
+
+        with mock.patch.dict(os.environ, {"FORCE_BDSS_TOKEN": "secret"}):
+            evaluator = DistributedEvaluator(
+                workflow=self.evaluator.workflow, host="0.0.0.0"
+            )
+            self.assertEqual("secret", evaluator.token)
+            self.assertEqual(
+                "secret", EvaluationWorker(address=("", 0)).token
+            )
+        evaluator.start()
+        evaluator.stop()
+
+    def test_invalid_message(self):
+        connection = self.connect()
+        send_message(connection, {"type": "ready"})
+        send_message(connection, {"type": "result", "kpis": [1.0]})
+        self.assertClosed(connection)
+        self.assertLost("Invalid 'result' message: missing or invalid 'id'")
+
+    def test_unexpected_error(self):
+        with mock.patch.object(
+                DistributedEvaluator, "_handle_message",
+                side_effect=RuntimeError("unexpected")):
+            connection = self.connect()
+            send_message(connection, {"type": "ready"})
+            self.assertClosed(connection)
+        self.assertLost("RuntimeError: unexpected")
+        self.assertIn(
+            "ERROR", [record.levelname for record in self.capture.records]
+        )
+
+    def test_failed_evaluation(self):
+        connection = self.connect()
+        send_message(connection, {"type": "ready"})
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(self.evaluator.evaluate([1.0]))
+        )
+        thread.start()
+        self.addCleanup(thread.join)
+        message = receive_message(connection)
+        send_message(connection, {
+            "type": "result",
+            "id": message["id"],
+            "kpis": [1e6],
+            "failed": True,
+        })
+        thread.join()
+        self.assertIsInstance(result[0], FailedEvaluation)
+        self.assertEqual([1e6], result[0])
+
+    def test_worker_timeout(self):
+        self.evaluator.worker_timeout = 0.2
+        with self.assertRaisesRegex(
+                RemoteEvaluationError, "no worker was ready for 0.2 seconds"):
+            self.evaluator.evaluate([1.0])
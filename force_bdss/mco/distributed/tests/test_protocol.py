@@ -0,0 +1,82 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import socket
+import unittest
+
+import numpy as np
+
+from force_bdss.mco.distributed.protocol import (
+    FRAME_HEADER,
+    ProtocolError,
+    check_fields,
+    is_loopback,
+    parse_address,
+    receive_message,
+    send_message,
+)
+
+
+class TestProtocol(unittest.TestCase):
+
+    def setUp(self):
+        self.sender, self.receiver = socket.socketpair()
+        self.addCleanup(self.sender.close)
+        self.addCleanup(self.receiver.close)
+
+    def test_round_trip(self):
+        send_message(self.sender, {
+            "type": "evaluate",
+            "id": 3,
+            "parameters": [1.0, np.array([2.0, 3.0]), np.int64(4)],
+        })
+        send_message(self.sender, {"type": "shutdown"})
+        self.assertEqual(
+            {"type": "evaluate", "id": 3, "parameters": [1.0, [2.0, 3.0], 4]},
+            receive_message(self.receiver)
+        )
+        self.assertEqual({"type": "shutdown"}, receive_message(self.receiver))
+
+        self.sender.close()
+        with self.assertRaises(EOFError):
+            receive_message(self.receiver)
+
+    def test_not_serializable(self):
+        with self.assertRaises(TypeError):
+            send_message(self.sender, {"type": "result", "kpis": [object()]})
+
+    def test_invalid_messages(self):
+        for payload in [b"[1, 2]", b"{\"id\": 1}", b"{invalid"]:
+            self.sender.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+            with self.assertRaises(ProtocolError):
+                receive_message(self.receiver)
+
+    def test_truncated_message(self):
+        self.sender.sendall(FRAME_HEADER.pack(10) + b"{}")
+        self.sender.close()
+        with self.assertRaisesRegex(ProtocolError, "middle of a message"):
+            receive_message(self.receiver)
+
+    def test_check_fields(self):
+        message = {"type": "result", "id": 3, "kpis": [1.0]}
+        check_fields(message, id=int, kpis=list)
+        for fields in [{"error": str}, {"id": str}, {"kpis": dict}]:
+            with self.assertRaisesRegex(
+                    ProtocolError, "Invalid 'result' message"):
+                check_fields(message, **fields)
+        with self.assertRaises(ProtocolError):
+            check_fields({"type": "result", "id": True}, id=int)
+        check_fields({"type": "result", "failed": True}, failed=bool)
+
+    def test_is_loopback(self):
+        for host in ["localhost", "127.0.0.1", "127.0.1.1", "::1"]:
+            self.assertTrue(is_loopback(host))
+        for host in ["0.0.0.0", "192.168.1.2", "::", "node1", ""]:
+            self.assertFalse(is_loopback(host))
+
+    def test_parse_address(self):
+        self.assertEqual(("node1", 9000), parse_address("node1:9000"))
+        self.assertEqual(("127.0.0.1", 9000), parse_address(":9000"))
+        for address in ["node1", "node1:port"]:
+            with self.assertRaises(ValueError):
+                parse_address(address)
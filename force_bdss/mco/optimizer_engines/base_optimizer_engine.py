@@ -7,9 +7,19 @@ import logging
 from traits.api import (
     ABCHasStrictTraits, List, Instance, Bool, Property, Dict)
 
+from force_bdss.core.evaluation_trace import trace_enabled, trace_evaluation
+from force_bdss.core.failed_evaluation import FailedEvaluation
 from force_bdss.core.kpi_specification import KPISpecification
+from force_bdss.events.event_notifier_mixin import EventNotifierMixin
+from force_bdss.events.execution_events import CachedEvaluationEvent
 from force_bdss.mco.parameters.base_mco_parameter import BaseMCOParameter
 from force_bdss.mco.i_evaluator import IEvaluator
+from force_bdss.mco.optimizer_engines.evaluation_history import (
+    read_evaluation_history
+)
+from force_bdss.mco.optimizer_engines.optimizer_checkpoint import (
+    OptimizerCheckpoint
+)
 from force_bdss.mco.optimizer_engines.utilities import convert_to_score
 from force_bdss.utilities import pop_dunder_recursive
 
@@ -40,9 +50,28 @@ class BaseOptimizerEngine(ABCHasStrictTraits):
         IEvaluator, visible=False, transient=True
     )
 
+    #: Checkpoint used to save the engine state during the optimization,
+    #: and to restore it when resuming an interrupted optimization
+    checkpoint = Instance(
+        OptimizerCheckpoint, visible=False, transient=True
+    )
+
     #: Caches KPI values between optimization runs
     _kpi_cache = Dict(transient=True)
 
+    #: KPI values of all the points evaluated since the start of the
+    #: optimization, saved in the checkpoint
+    _evaluated_kpis = Dict(transient=True)
+
+    #: KPI values restored from a checkpoint or pre-loaded from previous
+    #: runs, which are reused instead of evaluating the workflow again
+    _restored_kpis = Dict(transient=True)
+
+    #: Failure values of the KPIs of the points whose evaluation failed,
+    #: which are neither cached nor saved in the checkpoint, so that the
+    #: points are evaluated again if they are revisited
+    _failed_kpis = Dict(transient=True)
+
     #: Default (initial) guess on input parameter values
     initial_parameter_value = Property(
         depends_on="parameters.[initial_value]", visible=False
@@ -102,7 +131,11 @@ class BaseOptimizerEngine(ABCHasStrictTraits):
         """Returns the evaluated set KPI values for a given set of
         corresponding of MCO parameters"""
         key = self._get_kpi_cache_key(input_point)
-        return self._kpi_cache[key]
+        try:
+            return self._kpi_cache[key]
+        except KeyError:
+            # The evaluation of the point failed
+            return self._failed_kpis[key]
 
     def _get_kpi_cache_key(self, input_point):
         """Returns a hashable key object based on a set of MCO parameter
@@ -125,15 +158,38 @@ class BaseOptimizerEngine(ABCHasStrictTraits):
         from the rest of the OptimizerEngine methods and the user.
         This is also useful for the testing purposes, when the `evaluate`
         method is mocked.
+
+        The failure values of the KPIs of a failed evaluation (a
+        FailedEvaluation) are scored, but not cached, nor saved in the
+        checkpoint.
         """
 
-        # Calculate and cache the raw KPI values
-        kpi_values = self.single_point_evaluator.evaluate(input_point)
-        self.cache_result(input_point, kpi_values)
+        # Calculate and cache the raw KPI values, unless they were
+        # restored from a checkpoint
+        key = self._get_kpi_cache_key(input_point)
+        try:
+            kpi_values = self._restored_kpis[key]
+        except KeyError:
+            kpi_values = self.single_point_evaluator.evaluate(input_point)
+        else:
+            if isinstance(self.single_point_evaluator, EventNotifierMixin):
+                self.single_point_evaluator.notify(CachedEvaluationEvent())
+            if trace_enabled():
+                trace_evaluation(list(input_point), kpi_values, cached=True)
+
+        if isinstance(kpi_values, FailedEvaluation):
+            self._failed_kpis[key] = kpi_values
+        else:
+            self._failed_kpis.pop(key, None)
+            self.cache_result(input_point, kpi_values)
+            if self._saves_checkpoint():
+                self._evaluated_kpis[key] = kpi_values
+
+        self.save_checkpoint()
 
         # Return the score to be minimized
         score = self._minimization_score(kpi_values)
-        log.info("Objective score: {}".format(score))
+        log.info("Objective score: %s", score)
         return score
 
     def _minimization_score(self, score):
@@ -142,5 +198,92 @@ class BaseOptimizerEngine(ABCHasStrictTraits):
         are subject to minimization."""
         return convert_to_score(score, self.kpis)
 
+    def get_checkpoint_state(self):
+        """ Returns the JSON serializable state of the optimization, to be
+        saved in the checkpoint. Subclasses that hold additional state
+        should extend the returned dictionary."""
+        return {
+            "kpi_cache": [
+                [list(key), kpi_values]
+                for key, kpi_values in self._evaluated_kpis.items()
+            ]
+        }
+
+    def set_checkpoint_state(self, state):
+        """ Restores the optimization `state` loaded from a checkpoint.
+        Subclasses that hold additional state should extend this
+        method."""
+        restored = {
+            self._get_kpi_cache_key(point): kpi_values
+            for point, kpi_values in state.get("kpi_cache", [])
+        }
+        self._restored_kpis.update(restored)
+        if self._saves_checkpoint():
+            self._evaluated_kpis.update(restored)
+        log.info(
+            f"Restored {len(restored)} evaluated points from checkpoint"
+        )
+
+    def preload_results(self, history):
+        """ Pre-loads the KPI values of points evaluated before the
+        optimization, so that the workflow is evaluated only at new
+        points.
+
+        Parameters
+        ----------
+        history: iterable of tuple(list, list)
+            Input points and the corresponding KPI values, in the order
+            of the `parameters` and `kpis`
+        """
+        count = 0
+        for input_point, kpi_values in history:
+            key = self._get_kpi_cache_key(input_point)
+            self._restored_kpis[key] = kpi_values
+            count += 1
+        log.info(f"Pre-loaded {count} evaluated points")
+
+    def load_evaluation_history(self, path):
+        """ Pre-loads the KPI values from the result file of a previous
+        run, written by the `BaseCSVWriter` or in the binary events
+        format. The columns are matched by the names of the `parameters`
+        and `kpis`.
+
+        Parameters
+        ----------
+        path: str
+            Path of the result file
+
+        Raises
+        ------
+        EvaluationHistoryError
+            If the file does not contain values for all the parameters
+            and KPIs.
+        """
+        history = read_evaluation_history(
+            path,
+            [parameter.name for parameter in self.parameters],
+            [kpi.name for kpi in self.kpis],
+        )
+        self.preload_results(history)
+
+    def save_checkpoint(self, force=False):
+        """ Saves the optimization state to the `checkpoint`, if a save
+        is due or `force` is True."""
+        if not self._saves_checkpoint():
+            return
+        if force or self.checkpoint.is_due():
+            self.checkpoint.save(self.get_checkpoint_state(), force=True)
+
+    def _saves_checkpoint(self):
+        """ Whether the optimization state is saved to the `checkpoint`.
+        A checkpoint without path only hands an evaluation history over
+        to the engine."""
+        return self.checkpoint is not None and bool(self.checkpoint.path)
+
+    def _checkpoint_changed(self, checkpoint):
+        if checkpoint is not None and checkpoint.state:
+            self.set_checkpoint_state(checkpoint.state)
+            checkpoint.restored = True
+
     def __getstate__(self):
         return pop_dunder_recursive(super().__getstate__())
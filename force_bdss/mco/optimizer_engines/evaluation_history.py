@@ -0,0 +1,165 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+""" Readers of the results of previous MCO runs, used to pre-load the KPI
+values of already evaluated points into an optimizer engine.
+
+Two formats are supported:
+
+- CSV files written by the `BaseCSVWriter`, whose header contains the
+  names of the MCO parameters and KPIs.
+- Binary files containing the BDSS events of a run, as serialized by
+  `force_bdss.events.event_codec.dumps_binary_batch`.
+
+In both cases, the columns are matched by the names of the parameters and
+KPIs, so that the order of the columns, and any additional column, do not
+matter.
+"""
+
+import ast
+import csv
+
+from force_bdss.events.event_codec import is_binary_data, loads_binary_batch
+from force_bdss.events.mco_events import (
+    MCOProgressBatchEvent,
+    MCOProgressEvent,
+    MCOStartEvent
+)
+
+
+class EvaluationHistoryError(ValueError):
+    """ Raised when the evaluation history can not be read from a file,
+    or does not contain the requested parameters and KPIs."""
+
+
+def read_evaluation_history(path, parameter_names, kpi_names):
+    """ Reads the evaluated points from the result file of a previous
+    MCO run. The format of the file (CSV or binary) is detected from its
+    content.
+
+    Parameters
+    ----------
+    path: str
+        Path of the result file
+    parameter_names: List(str)
+        Names of the MCO parameters, in the order of the input points
+    kpi_names: List(str)
+        Names of the KPIs, in the order of the KPI values
+
+    Returns
+    -------
+    history: List(tuple(list, list))
+        Input points and corresponding KPI values
+
+    Raises
+    ------
+    EvaluationHistoryError
+        If the file can not be parsed, or does not contain a column for
+        each of the parameters and KPIs.
+    """
+    with open(path, "rb") as fp:
+        is_binary = is_binary_data(fp.read(4))
+
+    if is_binary:
+        names, rows = _read_binary_rows(path)
+    else:
+        names, rows = _read_csv_rows(path)
+
+    return _select_columns(path, names, rows, parameter_names, kpi_names)
+
+
+def _read_csv_rows(path):
+    """ Returns the header and the rows of a CSV result file, converting
+    the values to Python objects."""
+    with open(path, "r", newline="") as fp:
+        reader = csv.reader(fp)
+        try:
+            names = next(reader)
+        except StopIteration:
+            return [], []
+        rows = [
+            [_parse_csv_value(value) for value in row]
+            for row in reader if row
+        ]
+    return names, rows
+
+
+def _parse_csv_value(text):
+    """ Converts a value written by the CSV writer back to a Python
+    object. Text that can not be parsed is returned as it is, as for
+    categorical parameters."""
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def _read_binary_rows(path):
+    """ Returns the column names and the rows of the MCOProgressEvents in
+    a binary events file. The column names are taken from the last
+    MCOStartEvent preceding the progress events, or from the names of the
+    DataValues if there is none."""
+    with open(path, "rb") as fp:
+        try:
+            events = loads_binary_batch(fp.read())
+        except ValueError as e:
+            raise EvaluationHistoryError(
+                f"Unable to read the events in '{path}': {e}"
+            ) from e
+
+    names = []
+    rows = []
+    for event in events:
+        if isinstance(event, MCOStartEvent):
+            names = event.parameter_names + event.kpi_names
+            continue
+        if isinstance(event, MCOProgressBatchEvent):
+            progress_events = event.progress_events
+        elif isinstance(event, MCOProgressEvent):
+            progress_events = [event]
+        else:
+            continue
+
+        for progress_event in progress_events:
+            data_values = (
+                progress_event.optimal_point + progress_event.optimal_kpis
+            )
+            if not names:
+                names = [data_value.name for data_value in data_values]
+            rows.append([data_value.value for data_value in data_values])
+
+    return names, rows
+
+
+def _select_columns(path, names, rows, parameter_names, kpi_names):
+    """ Extracts the parameter and KPI values from the `rows`, by matching
+    the column `names`."""
+    missing = [
+        name for name in parameter_names + kpi_names if name not in names
+    ]
+    if missing:
+        raise EvaluationHistoryError(
+            f"The result file '{path}' has no values for "
+            f"{', '.join(repr(name) for name in missing)}."
+        )
+
+    parameter_indices = [names.index(name) for name in parameter_names]
+    kpi_indices = [names.index(name) for name in kpi_names]
+    n_columns = len(names)
+
+    history = []
+    for row in rows:
+        if len(row) != n_columns:
+            raise EvaluationHistoryError(
+                f"The result file '{path}' has {len(row)} values in a "
+                f"row, but {n_columns} columns."
+            )
+        history.append((
+            [row[index] for index in parameter_indices],
+            [row[index] for index in kpi_indices],
+        ))
+    return history
@@ -0,0 +1,199 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import hashlib
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+from traits.api import Bool, Dict, File, Float, HasStrictTraits, Str
+
+log = logging.getLogger(__name__)
+
+#: Version of the checkpoint file format
+CHECKPOINT_VERSION = "1"
+
+
+class OptimizerCheckpointError(Exception):
+    """ Raised when a checkpoint file can not be loaded."""
+
+
+class OptimizerCheckpoint(HasStrictTraits):
+    """ Stores the state of an optimizer engine in a JSON file, so that
+    an interrupted optimization can be resumed.
+
+    The state is provided by `BaseOptimizerEngine.get_checkpoint_state`,
+    and is saved at most every `interval` seconds, unless the engine
+    forces the save (e.g. at the end of a weight sweep step). The file is
+    written atomically, so that a crash during the save never corrupts
+    the previous checkpoint.
+
+    A checkpoint without `path` is never saved: it only hands the loaded
+    `state`, e.g. the points of an evaluation history, over to the engine.
+
+    The `fingerprint` of the optimization is saved with the state, and
+    checked when loading it, so that a checkpoint of a workflow is not
+    restored after its parameters or KPIs were changed.
+    """
+
+    #: Path of the checkpoint file. If empty, the state is not saved.
+    path = File()
+
+    #: Minimum time interval, in seconds, between two periodic saves
+    interval = Float(60.0)
+
+    #: State loaded from the checkpoint file, to be restored by the
+    #: optimizer engine. Empty if the optimization starts afresh.
+    state = Dict()
+
+    #: Whether an optimizer engine restored the loaded `state`
+    restored = Bool(False)
+
+    #: Fingerprint of the optimized parameters and KPIs, as returned by
+    #: `optimization_fingerprint`. If empty, it is not checked on load.
+    fingerprint = Str()
+
+    #: Time of the last save
+    _last_save = Float(-float("inf"))
+
+    def load(self):
+        """ Loads the state from the checkpoint file, if the file exists.
+
+        Returns
+        -------
+        state: dict
+            The loaded state, or an empty dictionary if there is no
+            checkpoint file.
+
+        Raises
+        ------
+        OptimizerCheckpointError
+            If the checkpoint file can not be read, has an unsupported
+            format version, or was saved for a different `fingerprint`.
+        """
+        if not os.path.exists(self.path):
+            log.warning(
+                f"No checkpoint file '{self.path}' found. "
+                "Starting the optimization from scratch."
+            )
+            self.state = {}
+            return self.state
+
+        try:
+            with open(self.path, "r") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError) as e:
+            raise OptimizerCheckpointError(
+                f"Unable to read checkpoint file '{self.path}': {e}"
+            ) from e
+
+        version = data.get("version")
+        if version != CHECKPOINT_VERSION:
+            raise OptimizerCheckpointError(
+                f"Unsupported checkpoint file version '{version}'."
+            )
+
+        if self.fingerprint and data.get("fingerprint") != self.fingerprint:
+            raise OptimizerCheckpointError(
+                f"The checkpoint file '{self.path}' was saved for different "
+                "MCO parameters or KPIs. Remove it to start the "
+                "optimization from scratch."
+            )
+
+        self.state = data["state"]
+        log.info(f"Loaded optimizer checkpoint '{self.path}'")
+        return self.state
+
+    def save(self, state, force=False):
+        """ Saves the `state` to the checkpoint file.
+
+        Parameters
+        ----------
+        state: dict
+            JSON serializable state of the optimizer engine.
+        force: bool
+            If False, the state is saved only if `interval` seconds
+            passed since the last save.
+
+        Returns
+        -------
+        saved: bool
+            Whether the state was written to the file
+        """
+        now = time.monotonic()
+        if not self.path:
+            return False
+        if not force and now - self._last_save < self.interval:
+            return False
+
+        data = json.dumps(
+            {
+                "version": CHECKPOINT_VERSION,
+                "fingerprint": self.fingerprint,
+                "state": state,
+            },
+            default=_json_default
+        )
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as fp:
+            fp.write(data)
+        os.replace(temp_path, self.path)
+
+        self._last_save = now
+        log.debug(f"Saved optimizer checkpoint '{self.path}'")
+        return True
+
+    def is_due(self):
+        """ Whether a periodic save is due."""
+        return time.monotonic() - self._last_save >= self.interval
+
+
+def optimization_fingerprint(parameters, kpis):
+    """ Returns a hash of the definition of an optimization, which changes
+    if a point evaluated by the optimization may not be valid anymore.
+
+    Parameters
+    ----------
+    parameters: list of BaseMCOParameter
+        The MCO parameters, identified by their name, type and bounds
+    kpis: list of KPISpecification
+        The KPIs, identified by their name and objective
+
+    Returns
+    -------
+    fingerprint: str
+        The hexadecimal SHA-256 hash of the definition
+    """
+    definition = {
+        "parameters": [
+            dict(
+                parameter.trait_get(
+                    "lower_bound", "upper_bound", "levels", "categories"
+                ),
+                name=parameter.name,
+                type=type(parameter).__name__,
+            )
+            for parameter in parameters
+        ],
+        "kpis": [
+            {"name": kpi.name, "objective": kpi.objective} for kpi in kpis
+        ],
+    }
+    data = json.dumps(definition, sort_keys=True, default=_json_default)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _json_default(value):
+    """ Converts numpy objects in the checkpoint state to their JSON
+    compatible equivalents."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(
+        f"Object of type {type(value).__name__} can not be saved in "
+        "an optimizer checkpoint"
+    )
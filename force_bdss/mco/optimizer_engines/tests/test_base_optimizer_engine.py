@@ -1,13 +1,24 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from unittest import TestCase
+import os
+import tempfile
+from unittest import TestCase, mock
 
-from force_bdss.api import KPISpecification, RangedMCOParameterFactory
+from force_bdss.api import (
+    CachedEvaluationEvent,
+    FailedEvaluation,
+    KPISpecification,
+    RangedMCOParameterFactory,
+)
+from force_bdss.mco.optimizer_engines.optimizer_checkpoint import (
+    OptimizerCheckpoint
+)
 from force_bdss.tests.dummy_classes.mco import DummyMCOFactory
 from force_bdss.tests.dummy_classes.optimizer_engine import (
     DummyOptimizerEngine,
 )
+from force_bdss.tests.probe_classes.evaluator import ProbeEvaluator
 from force_bdss.tests.probe_classes.workflow_file import ProbeWorkflowFile
 from force_bdss.tests import fixtures
 
@@ -124,3 +135,142 @@ class TestBaseOptimizerEngine(TestCase):
         state_dict = self.optimizer_engine.__getstate__()
         self.assertEqual(1, len(state_dict))
         self.assertEqual(False, state_dict["verbose_run"])
+
+    def test_checkpoint_state(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        checkpoint = OptimizerCheckpoint(
+            path=os.path.join(temp_dir.name, "checkpoint.json")
+        )
+        self.optimizer_engine.checkpoint = checkpoint
+        self.assertFalse(checkpoint.restored)
+
+        evaluator = ProbeEvaluator()
+        evaluator.evaluate = evaluate = mock.Mock(side_effect=[[2.0], [3.0]])
+        self.optimizer_engine.single_point_evaluator = evaluator
+        self.optimizer_engine._score([1.0, [2.0, 3.0]])
+        self.optimizer_engine._score([4.0, [5.0, 6.0]])
+        self.assertEqual(2, evaluate.call_count)
+
+        # The first score saved the checkpoint, the second did not since
+        # the checkpoint interval did not elapse
+        checkpoint.load()
+        self.assertDictEqual(
+            {"kpi_cache": [[[1.0, [2.0, 3.0]], [2.0]]]}, checkpoint.state
+        )
+        self.optimizer_engine.save_checkpoint(force=True)
+        state = checkpoint.load()
+        self.assertEqual(2, len(state["kpi_cache"]))
+
+        # Evaluated points are restored and not evaluated again
+        engine = DummyOptimizerEngine(
+            single_point_evaluator=evaluator,
+            checkpoint=checkpoint
+        )
+        self.assertTrue(checkpoint.restored)
+        engine._score([4.0, [5.0, 6.0]])
+        self.assertEqual(2, evaluate.call_count)
+        self.assertDictEqual(
+            {(4.0, (5.0, 6.0)): [3.0]}, engine._kpi_cache
+        )
+        engine.save_checkpoint(force=True)
+        self.assertEqual(state, checkpoint.load())
+
+    def test_checkpoint_without_path(self):
+        # A checkpoint without path only restores the evaluated points
+        checkpoint = OptimizerCheckpoint(
+            state={"kpi_cache": [[[1.0], [2.0]]]}
+        )
+        self.optimizer_engine.checkpoint = checkpoint
+        self.assertTrue(checkpoint.restored)
+
+        evaluator = ProbeEvaluator()
+        evaluator.evaluate = evaluate = mock.Mock(return_value=[3.0])
+        self.optimizer_engine.single_point_evaluator = evaluator
+        with mock.patch.object(
+                DummyOptimizerEngine, "get_checkpoint_state") as get_state:
+            self.optimizer_engine._score([1.0])
+            self.optimizer_engine._score([2.0])
+            self.optimizer_engine.save_checkpoint(force=True)
+        get_state.assert_not_called()
+        self.assertEqual(1, evaluate.call_count)
+        self.assertEqual({}, self.optimizer_engine._evaluated_kpis)
+        self.assertEqual(
+            {(1.0,): [2.0], (2.0,): [3.0]}, self.optimizer_engine._kpi_cache
+        )
+
+    def test_failed_evaluation(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        checkpoint = OptimizerCheckpoint(
+            path=os.path.join(temp_dir.name, "checkpoint.json")
+        )
+        self.optimizer_engine.checkpoint = checkpoint
+
+        evaluator = ProbeEvaluator()
+        evaluator.evaluate = evaluate = mock.Mock(
+            side_effect=[FailedEvaluation([1e6]), [3.0], [2.0]]
+        )
+        self.optimizer_engine.single_point_evaluator = evaluator
+        self.optimizer_engine._score([1.0])
+        self.optimizer_engine._score([2.0])
+
+        # The failure values are scored, but neither cached nor saved in
+        # the checkpoint
+        self.assertEqual([1e6], self.optimizer_engine.retrieve_result([1.0]))
+        self.assertEqual({(2.0,): [3.0]}, self.optimizer_engine._kpi_cache)
+        self.optimizer_engine.save_checkpoint(force=True)
+        self.assertEqual({"kpi_cache": [[[2.0], [3.0]]]}, checkpoint.load())
+
+        # The failed point is evaluated again
+        self.optimizer_engine._score([1.0])
+        self.assertEqual(3, evaluate.call_count)
+        self.assertEqual([2.0], self.optimizer_engine.retrieve_result([1.0]))
+        self.assertEqual({}, self.optimizer_engine._failed_kpis)
+
+    def test_cached_evaluation_event(self):
+        events = []
+        self.workflow.on_trait_change(
+            lambda event: events.append(event), "event"
+        )
+        self.optimizer_engine.preload_results([([1.0], [2.0])])
+
+        self.optimizer_engine._score([1.0])
+        self.assertEqual(1, len(events))
+        self.assertIsInstance(events[0], CachedEvaluationEvent)
+
+        self.optimizer_engine._score([2.0])
+        self.assertFalse(
+            any(isinstance(event, CachedEvaluationEvent)
+                for event in events[1:])
+        )
+
+    def test_load_evaluation_history(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "output.csv")
+        with open(path, "w") as fp:
+            fp.write("k,y,x,weight\n1.5,0.2,0.1,0.5\n2.5,0.4,0.3,0.5\n")
+
+        self.optimizer_engine.parameters = [
+            RangedMCOParameterFactory(self.factory).create_model(
+                {"name": name, "lower_bound": 0.0, "upper_bound": 1.0}
+            )
+            for name in ["x", "y"]
+        ]
+        self.optimizer_engine.kpis = [KPISpecification(name="k")]
+        self.optimizer_engine.load_evaluation_history(path)
+
+        evaluator = ProbeEvaluator()
+        evaluator.evaluate = evaluate = mock.Mock(return_value=[9.0])
+        self.optimizer_engine.single_point_evaluator = evaluator
+
+        self.optimizer_engine._score([0.3, 0.4])
+        self.assertEqual(0, evaluate.call_count)
+        self.assertEqual([2.5], self.optimizer_engine.retrieve_result(
+            [0.3, 0.4]))
+
+        self.optimizer_engine._score([0.5, 0.4])
+        self.assertEqual(1, evaluate.call_count)
+        self.assertEqual([9.0], self.optimizer_engine.retrieve_result(
+            [0.5, 0.4]))
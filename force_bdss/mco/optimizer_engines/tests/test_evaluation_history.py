@@ -0,0 +1,132 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import tempfile
+from unittest import TestCase
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.events.event_codec import dumps_binary_batch
+from force_bdss.events.mco_events import (
+    MCOFinishEvent,
+    MCOProgressBatchEvent,
+    MCOProgressEvent,
+    WeightedMCOProgressEvent,
+    WeightedMCOStartEvent
+)
+from force_bdss.mco.optimizer_engines.evaluation_history import (
+    EvaluationHistoryError,
+    read_evaluation_history
+)
+from force_bdss.notification_listeners.base_csv_writer import (
+    BaseCSVWriterFactory
+)
+
+
+class TestEvaluationHistory(TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+
+        self.events = [
+            WeightedMCOStartEvent(
+                parameter_names=["x", "y", "label"],
+                kpi_names=["k1", "k2"]
+            ),
+            WeightedMCOProgressEvent(
+                optimal_point=[
+                    DataValue(value=0.1), DataValue(value=[1.0, 2.5]),
+                    DataValue(value="red"),
+                ],
+                optimal_kpis=[DataValue(value=1.5), DataValue(value=-2)],
+                weights=[0.5, 0.5],
+            ),
+            WeightedMCOProgressEvent(
+                optimal_point=[
+                    DataValue(value=1 / 3), DataValue(value=[0.0, 1e-7]),
+                    DataValue(value="blue"),
+                ],
+                optimal_kpis=[DataValue(value=2.0), DataValue(value=3.0)],
+                weights=[0.25, 0.75],
+            ),
+            MCOFinishEvent(),
+        ]
+        self.history = [
+            ([[1.0, 2.5], 0.1], [-2, 1.5]),
+            ([[0.0, 1e-7], 1 / 3], [3.0, 2.0]),
+        ]
+
+    def write_csv(self):
+        factory = BaseCSVWriterFactory(
+            plugin={"id": "pid", "name": "Plugin"}
+        )
+        writer = factory.create_listener()
+        model = factory.create_model()
+        model.path = os.path.join(self.temp_dir, "output.csv")
+        writer.initialize(model)
+        for event in self.events:
+            writer.deliver(event)
+        return model.path
+
+    def write_binary(self, events):
+        path = os.path.join(self.temp_dir, "output.bin")
+        with open(path, "wb") as fp:
+            fp.write(dumps_binary_batch(events))
+        return path
+
+    def test_read_csv(self):
+        path = self.write_csv()
+        history = read_evaluation_history(path, ["y", "x"], ["k2", "k1"])
+        self.assertEqual(self.history, history)
+
+        history = read_evaluation_history(path, ["label"], ["k1"])
+        self.assertEqual([(["red"], [1.5]), (["blue"], [2.0])], history)
+
+    def test_read_binary(self):
+        path = self.write_binary(self.events)
+        history = read_evaluation_history(path, ["y", "x"], ["k2", "k1"])
+        self.assertEqual(self.history, history)
+
+    def test_read_binary_batches(self):
+        progress_events = [
+            MCOProgressEvent(
+                optimal_point=[DataValue(name="x", value=index)],
+                optimal_kpis=[DataValue(name="k", value=index * 2)],
+            )
+            for index in range(3)
+        ]
+        path = self.write_binary([
+            progress_events[0],
+            MCOProgressBatchEvent(progress_events=progress_events[1:]),
+        ])
+        history = read_evaluation_history(path, ["x"], ["k"])
+        self.assertEqual([([0], [0]), ([1], [2]), ([2], [4])], history)
+
+    def test_missing_columns(self):
+        path = self.write_csv()
+        with self.assertRaisesRegex(
+                EvaluationHistoryError, "no values for 'z', 'k3'"):
+            read_evaluation_history(path, ["x", "z"], ["k3"])
+
+    def test_inconsistent_rows(self):
+        path = os.path.join(self.temp_dir, "output.csv")
+        with open(path, "w") as fp:
+            fp.write("x,k\n1.0,2.0\n3.0\n")
+        with self.assertRaisesRegex(EvaluationHistoryError, "1 values"):
+            read_evaluation_history(path, ["x"], ["k"])
+
+    def test_empty_file(self):
+        path = os.path.join(self.temp_dir, "output.csv")
+        open(path, "w").close()
+        with self.assertRaises(EvaluationHistoryError):
+            read_evaluation_history(path, ["x"], ["k"])
+        self.assertEqual([], read_evaluation_history(path, [], []))
+
+    def test_corrupted_binary(self):
+        path = self.write_binary(self.events)
+        with open(path, "ab") as fp:
+            fp.write(b"\x00")
+        with self.assertRaisesRegex(EvaluationHistoryError, "Unable"):
+            read_evaluation_history(path, ["x"], ["k1"])
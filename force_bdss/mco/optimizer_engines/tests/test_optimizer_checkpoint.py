@@ -0,0 +1,138 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+import numpy as np
+
+from force_bdss.mco.optimizer_engines.optimizer_checkpoint import (
+    CHECKPOINT_VERSION,
+    OptimizerCheckpoint,
+    OptimizerCheckpointError,
+    optimization_fingerprint,
+)
+from force_bdss.core.kpi_specification import KPISpecification
+from force_bdss.mco.parameters.mco_parameters import (
+    RangedMCOParameterFactory,
+)
+from force_bdss.tests.dummy_classes.mco import DummyMCOFactory
+
+MONOTONIC_PATH = (
+    "force_bdss.mco.optimizer_engines.optimizer_checkpoint.time.monotonic"
+)
+
+
+class TestOptimizerCheckpoint(TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "workflow.checkpoint")
+        self.checkpoint = OptimizerCheckpoint(path=self.path, interval=10.0)
+
+    def test_save_load(self):
+        state = {
+            "kpi_cache": [[[0.5, [1, 2]], np.array([1.0, 2.0])]],
+            "count": np.int64(3),
+        }
+        self.assertTrue(self.checkpoint.save(state))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        with open(self.path) as fp:
+            data = json.load(fp)
+        self.assertEqual(CHECKPOINT_VERSION, data["version"])
+
+        checkpoint = OptimizerCheckpoint(path=self.path)
+        loaded = checkpoint.load()
+        self.assertEqual(
+            {"kpi_cache": [[[0.5, [1, 2]], [1.0, 2.0]]], "count": 3},
+            loaded
+        )
+        self.assertIs(loaded, checkpoint.state)
+        self.assertFalse(checkpoint.restored)
+
+    def test_save_interval(self):
+        with mock.patch(MONOTONIC_PATH, return_value=100.0):
+            self.assertTrue(self.checkpoint.is_due())
+            self.assertTrue(self.checkpoint.save({"step": 1}))
+            self.assertFalse(self.checkpoint.is_due())
+            self.assertFalse(self.checkpoint.save({"step": 2}))
+            self.assertTrue(self.checkpoint.save({"step": 3}, force=True))
+        with mock.patch(MONOTONIC_PATH, return_value=110.0):
+            self.assertTrue(self.checkpoint.is_due())
+            self.assertTrue(self.checkpoint.save({"step": 4}))
+
+        self.assertEqual({"step": 4}, self.checkpoint.load())
+
+    def test_save_without_path(self):
+        checkpoint = OptimizerCheckpoint(state={"kpi_cache": []})
+        self.assertFalse(checkpoint.save({"step": 1}, force=True))
+        self.assertEqual({"kpi_cache": []}, checkpoint.state)
+
+    def test_load_missing_file(self):
+        with self.assertLogs(
+                "force_bdss.mco.optimizer_engines.optimizer_checkpoint",
+                "WARNING"):
+            self.assertEqual({}, self.checkpoint.load())
+
+    def test_load_invalid_file(self):
+        with open(self.path, "w") as fp:
+            fp.write("{")
+        with self.assertRaisesRegex(OptimizerCheckpointError, "Unable"):
+            self.checkpoint.load()
+
+        with open(self.path, "w") as fp:
+            json.dump({"version": "0", "state": {}}, fp)
+        with self.assertRaisesRegex(OptimizerCheckpointError, "version"):
+            self.checkpoint.load()
+
+    def test_unsupported_state(self):
+        with self.assertRaises(TypeError):
+            self.checkpoint.save({"value": object()})
+
+    def test_fingerprint(self):
+        self.checkpoint.fingerprint = "abc"
+        self.checkpoint.save({"step": 1})
+
+        checkpoint = OptimizerCheckpoint(path=self.path, fingerprint="abc")
+        self.assertEqual({"step": 1}, checkpoint.load())
+
+        # The fingerprint is not checked if it is not defined
+        checkpoint = OptimizerCheckpoint(path=self.path)
+        self.assertEqual({"step": 1}, checkpoint.load())
+
+        checkpoint = OptimizerCheckpoint(path=self.path, fingerprint="def")
+        with self.assertRaisesRegex(
+                OptimizerCheckpointError, "different MCO parameters"):
+            checkpoint.load()
+
+    def test_optimization_fingerprint(self):
+        factory = RangedMCOParameterFactory(
+            DummyMCOFactory({"id": "pid", "name": "Plugin"})
+        )
+        parameters = [
+            factory.create_model(
+                {"name": "x", "lower_bound": 0.0, "upper_bound": 1.0}
+            )
+        ]
+        kpis = [KPISpecification(name="k")]
+        fingerprint = optimization_fingerprint(parameters, kpis)
+        self.assertEqual(64, len(fingerprint))
+
+        # The initial values do not change the fingerprint
+        parameters[0].initial_value = 0.2
+        self.assertEqual(
+            fingerprint, optimization_fingerprint(parameters, kpis)
+        )
+
+        parameters[0].upper_bound = 2.0
+        changed = optimization_fingerprint(parameters, kpis)
+        self.assertNotEqual(fingerprint, changed)
+
+        kpis[0].objective = "MAXIMISE"
+        self.assertNotEqual(
+            changed, optimization_fingerprint(parameters, kpis)
+        )
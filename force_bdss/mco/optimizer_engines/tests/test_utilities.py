@@ -18,3 +18,15 @@ class TestConvertUtil(TestCase):
         values = [10.0, 20.0, 15.0]
         inv_values = convert_to_score(values, kpis)
         self.assertListEqual(list(inv_values), [10.0, -20.0, 5.0])
+
+    def test_convert_to_score_nan(self):
+        kpis = [
+            KPISpecification(objective="MINIMISE"),
+            KPISpecification(objective="MAXIMISE"),
+            KPISpecification(objective="TARGET", target_value=10)
+        ]
+        nan = float("nan")
+        inv_values = convert_to_score([nan, nan, nan], kpis)
+        self.assertListEqual(list(inv_values), [float("inf")] * 3)
+        inv_values = convert_to_score([1.0, nan, 1e6], kpis)
+        self.assertListEqual(list(inv_values), [1.0, float("inf"), 1e6 - 10])
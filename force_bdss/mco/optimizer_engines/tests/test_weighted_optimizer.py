@@ -1,7 +1,12 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
-from unittest import TestCase
+import itertools
+import os
+import tempfile
+from unittest import TestCase, mock
+
+import numpy as np
 
 from force_bdss.api import (
     KPISpecification,
@@ -21,6 +26,9 @@ from force_bdss.mco.optimizer_engines.space_sampling import (
 from force_bdss.mco.optimizer_engines.weighted_optimizer_engine import (
     WeightedOptimizerEngine
 )
+from force_bdss.mco.optimizer_engines.optimizer_checkpoint import (
+    OptimizerCheckpoint
+)
 from force_bdss.mco.optimizers.scipy_optimizer import ScipyOptimizer
 from force_bdss.tests.probe_classes.evaluator import GaussProbeEvaluator
 
@@ -37,6 +45,26 @@ class DummyOptimizerEngine(MixinProbeOptimizerEngine, WeightedScipyEngine):
     pass
 
 
+class CountingGaussProbeEvaluator(GaussProbeEvaluator):
+    """ Counts the number of evaluations."""
+
+    def __init__(self):
+        self.count = 0
+
+    def evaluate(self, input_point):
+        self.count += 1
+        return super().evaluate(input_point)
+
+
+class RandomGaussProbeEvaluator(GaussProbeEvaluator):
+    """ Draws a random number at each evaluation, as a stochastic data
+    source would."""
+
+    def evaluate(self, input_point):
+        np.random.random()
+        return super().evaluate(input_point)
+
+
 class TestSenScaling(TestCase):
     def setUp(self):
         self.plugin = {"id": "pid", "name": "Plugin"}
@@ -150,6 +178,15 @@ class TestWeightedOptimizer(TestCase):
             ),
         )
 
+    def test_weighted_score_failed_evaluation(self):
+        with mock.patch.object(
+                self.mocked_optimizer.single_point_evaluator, "evaluate",
+                return_value=[float("nan"), float("nan")]):
+            self.assertEqual(
+                float("inf"),
+                self.mocked_optimizer._weighted_score([1.0] * 4, [1.0, 0.0])
+            )
+
     def test__weighted_optimize(self):
         for point, kpis in self.mocked_optimizer._weighted_optimize(
                     [1.0 for _ in range(self.mocked_optimizer.dimension)]
@@ -178,3 +215,94 @@ class TestWeightedOptimizer(TestCase):
             self.assertAlmostEqual(0.67, optimal_point[1])
             for kpi in optimal_kpis:
                 self.assertAlmostEqual(0.0, kpi)
+
+    def test_checkpoint_resume(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "checkpoint.json")
+
+        def create_engine(checkpoint=None):
+            return DummyOptimizerEngine(
+                parameters=self.parameters, kpis=self.kpis,
+                num_points=4, space_search_mode="Dirichlet",
+                single_point_evaluator=CountingGaussProbeEvaluator(),
+                checkpoint=checkpoint,
+            )
+
+        # Uninterrupted optimization
+        engine_state = np.random.get_state()
+        np.random.seed(12)
+        engine = create_engine()
+        full_results = list(engine.optimize())
+        full_count = engine.single_point_evaluator.count
+        self.assertEqual(4, len(full_results))
+
+        # Optimization interrupted after the second result
+        engine = create_engine(
+            OptimizerCheckpoint(path=path, interval=3600.0)
+        )
+        np.random.seed(12)
+        interrupted_results = list(itertools.islice(engine.optimize(), 2))
+        interrupted_count = engine.single_point_evaluator.count
+
+        # Resumed optimization skips the first weight combination and
+        # reuses the evaluations of the second one
+        np.random.seed(34)
+        checkpoint = OptimizerCheckpoint(path=path)
+        checkpoint.load()
+        engine = create_engine(checkpoint)
+        self.assertTrue(checkpoint.restored)
+        resumed_results = list(engine.optimize())
+        resumed_count = engine.single_point_evaluator.count
+        np.random.set_state(engine_state)
+
+        self.assertEqual(3, len(resumed_results))
+        for result, resumed_result in zip(full_results[1:], resumed_results):
+            np.testing.assert_allclose(result[0], resumed_result[0])
+            self.assertEqual(result[2], resumed_result[2])
+        self.assertEqual(
+            interrupted_results[1][2], resumed_results[0][2]
+        )
+        # Points evaluated before the interruption are never evaluated
+        # again
+        self.assertLessEqual(interrupted_count + resumed_count, full_count)
+
+    def test_checkpoint_resume_random_evaluations(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "checkpoint.json")
+        engine_state = np.random.get_state()
+        self.addCleanup(np.random.set_state, engine_state)
+
+        def create_engine(checkpoint=None):
+            return DummyOptimizerEngine(
+                parameters=self.parameters, kpis=self.kpis,
+                num_points=5, space_search_mode="Dirichlet",
+                single_point_evaluator=RandomGaussProbeEvaluator(),
+                checkpoint=checkpoint,
+            )
+
+        np.random.seed(12)
+        full_weights = [
+            weights for _, _, weights in create_engine().optimize()
+        ]
+        self.assertEqual(5, len(full_weights))
+
+        # Optimization interrupted after the second result
+        engine = create_engine(
+            OptimizerCheckpoint(path=path, interval=3600.0)
+        )
+        np.random.seed(12)
+        list(itertools.islice(engine.optimize(), 2))
+
+        # The resumed optimization does not evaluate the same points, and
+        # thus does not draw the same random numbers, but optimizes the
+        # same weight combinations
+        np.random.seed(34)
+        checkpoint = OptimizerCheckpoint(path=path)
+        checkpoint.load()
+        resumed_weights = [
+            weights
+            for _, _, weights in create_engine(checkpoint).optimize()
+        ]
+        self.assertEqual(full_weights[1:], resumed_weights)
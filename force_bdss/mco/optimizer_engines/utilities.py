@@ -14,6 +14,10 @@ def convert_to_score(array, kpis):
     `array[i]` to the absolute distance between `array[i]` and
     `kpi[i].target`
 
+    NaN values, e.g. the KPI values of failed evaluations of the
+    workflow, are converted to infinite scores, the worst possible
+    scores for a minimization.
+
     Parameters
     ----------
     array: List[int, float], np.array
@@ -27,14 +31,16 @@ def convert_to_score(array, kpis):
         New array with the elements corresponding to
         kpi.objective == 'MAXIMISE' are inverted by _a -> -_a,
         those with kpi.objective == 'TARGET' are converted by
-        abs(_a - kpi.target_value)
+        abs(_a - kpi.target_value), and NaN values are replaced by inf
     """
     np_kpi_mask = np.array([kpi.objective for kpi in kpis])
     np_array = np.array(
         [value if kpi.target_value is None
          else value - kpi.target_value
-         for value, kpi in zip(array, kpis)]
+         for value, kpi in zip(array, kpis)],
+        dtype=float,
     )
 
     np_array = np.where(np_kpi_mask == "MAXIMISE", -np_array, np_array)
-    return np.where(np_kpi_mask == "TARGET", np.abs(np_array), np_array)
+    np_array = np.where(np_kpi_mask == "TARGET", np.abs(np_array), np_array)
+    return np.where(np.isnan(np_array), np.inf, np_array)
@@ -6,7 +6,7 @@ from functools import partial
 
 import numpy as np
 
-from traits.api import Enum, Str, Instance
+from traits.api import Dict, Enum, Str, Instance
 
 from force_bdss.api import PositiveInt
 from force_bdss.mco.optimizer_engines.space_sampling import (
@@ -96,21 +96,63 @@ class WeightedOptimizerEngine(BaseOptimizerEngine):
     #: callable
     optimizer = Instance(IOptimizer, transient=True)
 
+    #: Progress of the weight sweep: KPI scaling factors, weight
+    #: combinations and number of completed weight combinations. Saved in
+    #: the checkpoint.
+    _sweep_state = Dict(transient=True)
+
+    #: Sweep state restored from a checkpoint, used by the next call
+    #: to `optimize`
+    _restored_sweep_state = Dict(transient=True)
+
     def optimize(self, **kwargs):
         """ Generates optimization results.
 
+        If the sweep state was restored from a checkpoint, the scaling
+        factors and weight combinations are not calculated again, and the
+        weight combinations whose optimization had completed are skipped.
+
         Yields
         ----------
         optimization result: tuple(np.array, np.array, list)
             Point of evaluation, objective value, weights
         """
+        restored = self._restored_sweep_state
+        self._restored_sweep_state = {}
 
         #: Get non-zero weight combinations for each KPI
-        scaling_factors = self.get_scaling_factors()
+        scaling_factors = restored.get("scaling_factors")
+        if scaling_factors is None:
+            scaling_factors = self.get_scaling_factors()
+
+        #: Sample all the weight combinations before any optimization, so
+        #: that stochastic samplers are not affected by the random numbers
+        #: drawn by the evaluations, and save them in the checkpoint
+        weights_samples = restored.get("weights")
+        if weights_samples is None:
+            weights_samples = [
+                [float(weight) for weight in weights]
+                for weights in self.weights_samples()
+            ]
+
+        completed = restored.get("completed_weights", 0)
+        self._sweep_state = {
+            "scaling_factors": scaling_factors,
+            "weights": weights_samples,
+            "completed_weights": completed,
+        }
+        self.save_checkpoint(force=True)
 
         #: loop through weight combinations
-        for weights in self.weights_samples():
-            log.info("Doing MCO run with weights: {}".format(weights))
+        for index, weights in enumerate(weights_samples):
+            if index < completed:
+                log.info(
+                    "Skipping MCO run with weights: {}, completed before "
+                    "the checkpoint".format(weights)
+                )
+                continue
+
+            log.info("Doing MCO run with weights: %s", weights)
 
             #: multiply weights by scales
             scaled_weights = [
@@ -123,6 +165,18 @@ class WeightedOptimizerEngine(BaseOptimizerEngine):
                     scaled_weights, **kwargs):
                 yield point, kpis, scaled_weights
 
+            self._sweep_state["completed_weights"] = index + 1
+            self.save_checkpoint(force=True)
+
+    def get_checkpoint_state(self):
+        state = super().get_checkpoint_state()
+        state["sweep"] = self._sweep_state
+        return state
+
+    def set_checkpoint_state(self, state):
+        super().set_checkpoint_state(state)
+        self._restored_sweep_state = state.get("sweep", {})
+
     def weights_samples(self, **kwargs):
         """ Generates necessary number of search space sample points
         from the `space_search_mode` search strategy."""
@@ -181,9 +235,12 @@ class WeightedOptimizerEngine(BaseOptimizerEngine):
         # Calculate the value of the raw objective function
         score = self._score(input_point)
 
-        # Return the score to be minimized
+        # Return the score to be minimized. The infinite scores of failed
+        # evaluations remain infinite, even for KPIs with a zero weight.
         score = np.dot(weights, score)
-        log.info("Weighted score: {}".format(score))
+        if np.isnan(score):
+            score = np.inf
+        log.info("Weighted score: %s", score)
         return score
 
     def get_scaling_factors(self):
@@ -16,8 +16,6 @@ from force_bdss.mco.parameters.mco_parameters import (
 
 from force_bdss.mco.optimizers.i_optimizer import IOptimizer
 
-from scipy import optimize as scipy_optimize
-
 SCIPY_ALGORITHMS_KEYS = [
     "SLSQP", "Nelder-Mead", "Powell", "CG", "BFGS",
     "Newton-CG", "L-BFGS-B", "TNC", "COBYLA",
@@ -74,7 +72,10 @@ class ScipyOptimizer(HasStrictTraits):
         # get the initial parameter values and their bounds.
         x0, bounds = self.get_initial_and_bounds(params)
 
-        # optimize the function
+        # optimize the function. scipy is imported here, since importing
+        # it takes longer than importing the rest of the BDSS.
+        from scipy import optimize as scipy_optimize
+
         optimization_result = scipy_optimize.minimize(
             tfunc,
             x0,
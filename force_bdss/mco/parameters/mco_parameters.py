@@ -4,14 +4,6 @@
 import numpy as np
 
 from traits.api import List, Str, Property, Float, Any, Int, on_trait_change
-from traitsui.api import (
-    ListEditor,
-    Item,
-    View,
-    HGroup,
-    RangeEditor,
-    TextEditor,
-)
 
 from force_bdss.local_traits import PositiveInt
 from force_bdss.core.verifier import VerifierError
@@ -19,6 +11,14 @@ from .base_mco_parameter import BaseMCOParameter
 from .base_mco_parameter_factory import BaseMCOParameterFactory
 
 
+def _list_editor():
+    """ Returns the editor of the list traits. The traitsui import is
+    deferred until a UI is created, to keep headless imports light."""
+    from traitsui.api import ListEditor
+
+    return ListEditor()
+
+
 class FixedMCOParameter(BaseMCOParameter):
     """ Fixed MCO parameter for (dummy) constant-valued data. The value
     must be specified before use: the value is <undefined> by default."""
@@ -88,6 +88,8 @@ class RangedMCOParameter(BaseMCOParameter):
         )
 
     def default_traits_view(self):
+        from traitsui.api import Item, RangeEditor, TextEditor, View
+
         return View(
             Item(
                 "lower_bound",
@@ -222,6 +224,8 @@ class RangedVectorMCOParameter(RangedMCOParameter):
                 bound_vector[:] = bound_vector[: self.dimension]
 
     def default_traits_view(self):
+        from traitsui.api import HGroup, Item, View
+
         return View(
             Item("dimension"),
             HGroup(
@@ -360,7 +364,7 @@ class CategoricalMCOParameter(BaseMCOParameter):
     """ Categorical MCO Parameter implements unordered, discrete valued,
     categorical data. Available categorical values are strings. """
 
-    categories = List(Str, editor=ListEditor())
+    categories = List(Str, editor=_list_editor)
     sample_values = Property(depends_on="categories", visible=False)
 
     def _get_sample_values(self):
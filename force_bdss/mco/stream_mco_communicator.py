@@ -0,0 +1,106 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import sys
+
+from traits.api import Any
+
+from force_bdss.core.data_value import DataValue
+
+from .base_mco_communicator import BaseMCOCommunicator
+
+
+class StreamMCOCommunicator(BaseMCOCommunicator):
+    """ MCO communicator implementing a line protocol over text streams,
+    by default the standard input and output.
+
+    Each request is a single line containing the values of the MCO
+    parameters, separated by whitespace. Each response is a single line
+    containing the values of the KPIs, separated by spaces. The end of
+    the input stream terminates the evaluations, which makes the
+    communicator suitable for a persistent evaluation worker
+    (``force_bdss --evaluate --serve``), as well as for the evaluation of
+    a single point.
+
+    Subclasses can reimplement `parse_request` and `format_response` to
+    support other line formats.
+    """
+
+    #: Text stream the requests are read from. Defaults to the standard
+    #: input if None.
+    input_stream = Any()
+
+    #: Text stream the responses are written to. Defaults to the standard
+    #: output if None.
+    output_stream = Any()
+
+    def receive_from_mco(self, model):
+        """ Reads the next request line, and returns the DataValues of the
+        MCO parameters.
+
+        Raises
+        ------
+        EOFError
+            If the input stream reached its end.
+        """
+        stream = self.input_stream
+        if stream is None:
+            stream = sys.stdin
+
+        line = stream.readline()
+        if not line:
+            raise EOFError("No more MCO requests")
+        return self.parse_request(line.strip(), model)
+
+    def send_to_mco(self, model, kpi_results):
+        """ Writes the KPI values as a response line."""
+        stream = self.output_stream
+        if stream is None:
+            stream = sys.stdout
+
+        stream.write(self.format_response(kpi_results) + "\n")
+        stream.flush()
+
+    def parse_request(self, line, model):
+        """ Converts a request line to the DataValues of the MCO
+        parameters. Values are converted to floats where possible.
+
+        Parameters
+        ----------
+        line: str
+            The request, without the line terminator
+        model: BaseMCOModel
+            The MCO model, defining the parameters
+
+        Returns
+        -------
+        List(DataValue)
+            The values of the MCO parameters
+        """
+        values = line.split()
+        if len(values) != len(model.parameters):
+            raise ValueError(
+                f"The MCO request has {len(values)} values, but "
+                f"{len(model.parameters)} parameters are defined."
+            )
+
+        return [
+            DataValue(
+                type=parameter.type,
+                name=parameter.name,
+                value=_parse_value(value),
+            )
+            for parameter, value in zip(model.parameters, values)
+        ]
+
+    def format_response(self, kpi_results):
+        """ Converts the KPI results to a response line, without the line
+        terminator."""
+        return " ".join(str(kpi.value) for kpi in kpi_results)
+
+
+def _parse_value(text):
+    try:
+        return float(text)
+    except ValueError:
+        return text
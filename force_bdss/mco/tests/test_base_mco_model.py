@@ -1,11 +1,13 @@
 #  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
 #  All rights reserved.
 
+import math
 import unittest
 
 from traits.testing.api import UnittestTools
 
 from force_bdss.core.data_value import DataValue
+from force_bdss.core.kpi_specification import KPISpecification
 from force_bdss.tests.dummy_classes.factory_registry import (
     DummyFactoryRegistry,
 )
@@ -48,6 +50,7 @@ class TestBaseMCOModel(unittest.TestCase, UnittestTools):
                         }
                     ],
                     "kpis": [],
+                    "on_evaluation_failure": "ABORT",
                 },
             },
         )
@@ -94,3 +97,14 @@ class TestBaseMCOModel(unittest.TestCase, UnittestTools):
                     [DataValue(value=2), DataValue(value=3)],
                     [DataValue(value=4), DataValue(value=5)]
                 )
+
+    def test_failure_kpis(self):
+        model = self.mcomodel_factory.create_model()
+        model.kpis = [
+            KPISpecification(name="foo"),
+            KPISpecification(name="bar", failure_value=1e6),
+        ]
+        kpis = model.failure_kpis()
+        self.assertEqual(["foo", "bar"], [kpi.name for kpi in kpis])
+        self.assertTrue(math.isnan(kpis[0].value))
+        self.assertEqual(1e6, kpis[1].value)
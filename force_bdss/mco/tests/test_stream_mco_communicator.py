@@ -0,0 +1,62 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import io
+import unittest
+from unittest import mock
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.mco.i_mco_factory import IMCOFactory
+from force_bdss.mco.stream_mco_communicator import StreamMCOCommunicator
+from force_bdss.tests.dummy_classes.mco import DummyMCOModel
+from force_bdss.tests.probe_classes.mco import ProbeParameter
+
+
+class TestStreamMCOCommunicator(unittest.TestCase):
+
+    def setUp(self):
+        factory = mock.Mock(spec=IMCOFactory)
+        self.model = DummyMCOModel(factory)
+        self.model.parameters = [
+            ProbeParameter(None, name="x", type="LENGTH"),
+            ProbeParameter(None, name="label", type="COLOR"),
+        ]
+        self.input_stream = io.StringIO("1.5 red\n-2 blue\n")
+        self.output_stream = io.StringIO()
+        self.communicator = StreamMCOCommunicator(
+            factory,
+            input_stream=self.input_stream,
+            output_stream=self.output_stream
+        )
+
+    def test_receive_from_mco(self):
+        data_values = self.communicator.receive_from_mco(self.model)
+        self.assertEqual(
+            [("x", "LENGTH", 1.5), ("label", "COLOR", "red")],
+            [(dv.name, dv.type, dv.value) for dv in data_values]
+        )
+        data_values = self.communicator.receive_from_mco(self.model)
+        self.assertEqual([-2.0, "blue"], [dv.value for dv in data_values])
+
+        with self.assertRaises(EOFError):
+            self.communicator.receive_from_mco(self.model)
+
+    def test_receive_invalid_request(self):
+        self.communicator.input_stream = io.StringIO("1.0\n")
+        with self.assertRaisesRegex(ValueError, "1 values"):
+            self.communicator.receive_from_mco(self.model)
+
+    def test_send_to_mco(self):
+        self.communicator.send_to_mco(
+            self.model, [DataValue(value=1.5), DataValue(value=3)]
+        )
+        self.communicator.send_to_mco(self.model, [DataValue(value=None)])
+        self.assertEqual("1.5 3\nNone\n", self.output_stream.getvalue())
+
+    def test_standard_streams(self):
+        communicator = StreamMCOCommunicator(mock.Mock(spec=IMCOFactory))
+        with mock.patch("sys.stdin", io.StringIO("1.0 a\n")), \
+                mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            data_values = communicator.receive_from_mco(self.model)
+            communicator.send_to_mco(self.model, data_values)
+        self.assertEqual("1.0 a\n", stdout.getvalue())
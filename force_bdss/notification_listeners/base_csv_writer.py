@@ -3,9 +3,13 @@
 
 import csv
 
-from traits.api import Str, Instance, List, Dict, File
+from traits.api import Bool, Str, Instance, List, Dict, File
 
-from force_bdss.events.mco_events import MCOStartEvent, MCOProgressEvent
+from force_bdss.events.mco_events import (
+    MCOStartEvent,
+    MCOProgressEvent,
+    MCOProgressBatchEvent
+)
 from force_bdss.notification_listeners.base_notification_listener import BaseNotificationListener # noqa
 from force_bdss.notification_listeners.base_notification_listener_factory import BaseNotificationListenerFactory # noqa
 from force_bdss.notification_listeners.base_notification_listener_model import BaseNotificationListenerModel # noqa
@@ -37,6 +41,9 @@ class BaseCSVWriter(BaseNotificationListener):
     # Data entries in CSV rows
     row_data = Dict(key_trait=Str)
 
+    # Batches of progress events are written with a single file access
+    accepts_progress_batches = Bool(True)
+
     def _row_data_default(self):
         return dict.fromkeys(self.header)
 
@@ -57,6 +64,21 @@ class BaseCSVWriter(BaseNotificationListener):
             writer = csv.writer(f)
             writer.writerow(data)
 
+    def write_rows_to_file(self, rows, *, mode):
+        with open(self.model.path, mode) as f:
+            writer = csv.writer(f)
+            writer.writerows(rows)
+
+    def _progress_row(self, event):
+        """ Fills the `row_data` with the MCOProgressEvent data, and
+        returns the finished row. The `row_data` is then reset."""
+        progress_data = self.parse_progress_event(event)
+        for column, value in zip(self.header, progress_data):
+            self.row_data[column] = value
+        row = [self.row_data[el] for el in self.header]
+        self.row_data = self._row_data_default()
+        return row
+
     def deliver(self, event):
         if isinstance(event, MCOStartEvent):
             # MCOStartEvent is considered to be an "initialization" event
@@ -69,13 +91,15 @@ class BaseCSVWriter(BaseNotificationListener):
             # MCOProgressEvent is considered to output the row data to
             # file, therefore the current row is finished and no additional
             # data will be accepted after this event.
-            progress_data = self.parse_progress_event(event)
-            for column, value in zip(self.header, progress_data):
-                self.row_data[column] = value
-            self.write_to_file(
-                [self.row_data[el] for el in self.header], mode="a"
-            )
-            self.row_data = self._row_data_default()
+            self.write_to_file(self._progress_row(event), mode="a")
+        elif isinstance(event, MCOProgressBatchEvent):
+            # Each coalesced MCOProgressEvent is a separate row, but all
+            # rows are written to file at once.
+            rows = [
+                self._progress_row(progress_event)
+                for progress_event in event.progress_events
+            ]
+            self.write_rows_to_file(rows, mode="a")
 
     def initialize(self, model):
         """ Assign `model` to the writer."""
@@ -3,7 +3,7 @@
 
 import abc
 
-from traits.api import ABCHasStrictTraits, Instance
+from traits.api import ABCHasStrictTraits, Bool, Float, Instance
 
 from .i_notification_listener_factory import INotificationListenerFactory
 
@@ -16,6 +16,17 @@ class BaseNotificationListener(ABCHasStrictTraits):
     #: A reference to the factory
     factory = Instance(INotificationListenerFactory)
 
+    #: Whether the listener opts in to receive MCOProgressBatchEvents,
+    #: containing several coalesced MCOProgressEvents, rather than each
+    #: MCOProgressEvent individually.
+    accepts_progress_batches = Bool(False)
+
+    #: Minimum time (in seconds) between two consecutive deliveries of
+    #: MCOProgressBatchEvents, if `accepts_progress_batches` is True.
+    #: This effectively limits the rate at which progress events reach
+    #: the listener.
+    progress_batch_interval = Float(0.1)
+
     def __init__(self, factory, *args, **kwargs):
         """Initializes the notification listener.
 
@@ -0,0 +1,217 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import logging
+import os
+import socket
+import struct
+
+from traits.api import (
+    Any, Bool, Enum, HasStrictTraits, Instance, Int, List, Str
+)
+
+from force_bdss.events.event_codec import dumps_binary
+from force_bdss.local_traits import PositiveInt
+from force_bdss.notification_listeners.base_notification_listener import BaseNotificationListener # noqa
+from force_bdss.notification_listeners.base_notification_listener_factory import BaseNotificationListenerFactory # noqa
+from force_bdss.notification_listeners.base_notification_listener_model import BaseNotificationListenerModel # noqa
+
+log = logging.getLogger(__name__)
+
+#: Header of each frame sent to the subscribers: payload length in bytes
+#: and payload format
+FRAME_HEADER = struct.Struct("<IB")
+
+#: Codes of the payload formats
+JSON_FORMAT = 0
+BINARY_FORMAT = 1
+
+
+class EventStreamListenerModel(BaseNotificationListenerModel):
+    """ Model class for the EventStreamListener."""
+
+    #: Socket family used to stream the events
+    transport = Enum("tcp", "unix")
+
+    #: Host address to bind to, if `transport` is "tcp". It should be
+    #: a local address, since the stream is neither authenticated nor
+    #: encrypted.
+    host = Str("127.0.0.1")
+
+    #: Port to bind to, if `transport` is "tcp". If 0, a free port is
+    #: chosen by the operating system.
+    port = Int(5757)
+
+    #: File path of the socket, if `transport` is "unix"
+    path = Str("bdss_events.sock")
+
+    #: Serialization format of the events
+    serialization = Enum("json", "binary")
+
+    #: Maximum number of bytes buffered for a subscriber. Events that
+    #: would exceed it are dropped for that subscriber, so that a slow
+    #: subscriber never blocks the MCO. An event is never dropped if
+    #: the buffer is empty.
+    max_buffer_size = PositiveInt(4 * 1024 * 1024)
+
+
+class _Subscription(HasStrictTraits):
+    """ Connection with a single subscriber."""
+
+    #: The connected socket
+    connection = Instance(socket.socket)
+
+    #: Serialized frames waiting to be sent
+    buffer = Instance(bytearray, ())
+
+    #: Number of events dropped because the buffer was full
+    dropped = Int(0)
+
+
+class EventStreamListener(BaseNotificationListener):
+    """ Notification listener that streams the serialized events over a
+    local TCP or Unix socket, to any number of subscribers.
+
+    The listener never blocks: connections are accepted and data is sent
+    using non-blocking sockets whenever an event is delivered, and events
+    are dropped for the subscribers that can not keep up with the stream.
+    Each event is sent as a frame made of a `FRAME_HEADER` followed by
+    the payload. See `EventStreamSubscriber` for a client implementation.
+    """
+
+    #: A reference to the associated model
+    model = Instance(EventStreamListenerModel)
+
+    #: The listening socket
+    server = Instance(socket.socket)
+
+    #: The address the listening socket is bound to
+    address = Any()
+
+    #: The connected subscribers
+    subscriptions = List(Instance(_Subscription))
+
+    #: Total number of events dropped for slow subscribers
+    dropped = Int(0)
+
+    #: Whether the listener created the Unix socket file, and must
+    #: remove it upon finalization
+    _owns_path = Bool(False)
+
+    def initialize(self, model):
+        """ Opens the listening socket."""
+        self.model = model
+
+        if model.transport == "tcp":
+            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind((model.host, model.port))
+        else:
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(model.path)
+            self._owns_path = True
+
+        server.listen()
+        server.setblocking(False)
+        self.server = server
+        self.address = server.getsockname()
+        log.info(f"Streaming BDSS events on {self.address}")
+
+    def deliver(self, event):
+        """ Serializes the event and sends it to all subscribers."""
+        self._accept_subscribers()
+        if not self.subscriptions:
+            return
+
+        frame = self.serialize_event(event)
+        for subscription in self.subscriptions[:]:
+            buffer = subscription.buffer
+            if buffer and (
+                    len(buffer) + len(frame) > self.model.max_buffer_size):
+                subscription.dropped += 1
+                self.dropped += 1
+            else:
+                buffer += frame
+            self._send_buffer(subscription)
+
+    def finalize(self):
+        """ Sends the remaining buffered data to the subscribers, and
+        closes all the sockets."""
+        for subscription in self.subscriptions:
+            connection = subscription.connection
+            try:
+                connection.settimeout(1.0)
+                connection.sendall(subscription.buffer)
+            except OSError:
+                pass
+            connection.close()
+        self.subscriptions = []
+
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+        if self._owns_path:
+            try:
+                os.unlink(self.model.path)
+            except OSError:
+                pass
+            self._owns_path = False
+
+    def serialize_event(self, event):
+        """ Returns the frame, including the header, of a serialized
+        event."""
+        if self.model.serialization == "binary":
+            payload = dumps_binary(event)
+            format_code = BINARY_FORMAT
+        else:
+            payload = event.dumps_json().encode("utf-8")
+            format_code = JSON_FORMAT
+        return FRAME_HEADER.pack(len(payload), format_code) + payload
+
+    def _accept_subscribers(self):
+        """ Accepts all pending connections, without blocking."""
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            connection.setblocking(False)
+            self.subscriptions.append(_Subscription(connection=connection))
+            log.info(f"New BDSS event subscriber on {self.address}")
+
+    def _send_buffer(self, subscription):
+        """ Sends as much buffered data as possible, without blocking.
+        Subscribers that disconnected are removed."""
+        buffer = subscription.buffer
+        if not buffer:
+            return
+        try:
+            sent = subscription.connection.send(buffer)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            log.info(f"BDSS event subscriber on {self.address} disconnected")
+            subscription.connection.close()
+            self.subscriptions.remove(subscription)
+            return
+        del buffer[:sent]
+
+
+class EventStreamListenerFactory(BaseNotificationListenerFactory):
+    def get_identifier(self):
+        return "event_stream_listener"
+
+    def get_name(self):
+        return "Event Stream Listener"
+
+    def get_description(self):
+        return (
+            "Streams the BDSS events over a local socket, for remote "
+            "monitoring of the MCO."
+        )
+
+    def get_model_class(self):
+        return EventStreamListenerModel
+
+    def get_listener_class(self):
+        return EventStreamListener
@@ -0,0 +1,117 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import socket
+
+from traits.api import Any, HasStrictTraits, Instance
+
+from force_bdss.events.base_driver_event import BaseDriverEvent
+from force_bdss.events.event_codec import loads_binary
+
+from .event_stream_listener import BINARY_FORMAT, FRAME_HEADER, JSON_FORMAT
+
+
+class EventStreamSubscriber(HasStrictTraits):
+    """ Client of the EventStreamListener. Connects to the listener
+    socket and reconstructs the streamed BaseDriverEvents.
+
+    Usage example::
+
+        subscriber = EventStreamSubscriber(address=("127.0.0.1", 5757))
+        subscriber.connect()
+        for event in subscriber:
+            print(event)
+
+    """
+
+    #: Address of the EventStreamListener socket: a (host, port) tuple
+    #: for TCP sockets, or a file path for Unix sockets.
+    address = Any()
+
+    #: The connected socket
+    connection = Instance(socket.socket)
+
+    #: Received data not yet decoded into events
+    _buffer = Instance(bytearray, ())
+
+    def connect(self, timeout=None):
+        """ Connects to the EventStreamListener.
+
+        Parameters
+        ----------
+        timeout: float or None
+            Connection timeout in seconds. Blocks if None.
+        """
+        if isinstance(self.address, str):
+            family = socket.AF_UNIX
+        else:
+            family = socket.AF_INET
+        connection = socket.socket(family, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        connection.connect(self.address)
+        self.connection = connection
+
+    def close(self):
+        """ Closes the connection."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def receive(self, timeout=None):
+        """ Receives the next event from the stream.
+
+        Parameters
+        ----------
+        timeout: float or None
+            Time in seconds to wait for an event. Blocks if None.
+
+        Returns
+        -------
+        event: BaseDriverEvent or None
+            The received event, or None if the listener closed the
+            stream.
+
+        Raises
+        ------
+        socket.timeout
+            If no event is received within `timeout`
+        """
+        self.connection.settimeout(timeout)
+        while True:
+            event = self._decode_buffered_event()
+            if event is not None:
+                return event
+            data = self.connection.recv(65536)
+            if not data:
+                return None
+            self._buffer += data
+
+    def __iter__(self):
+        """ Iterates over the received events, until the listener closes
+        the stream."""
+        while True:
+            event = self.receive()
+            if event is None:
+                return
+            yield event
+
+    def _decode_buffered_event(self):
+        """ Decodes an event from the received data, if a complete frame
+        is available."""
+        buffer = self._buffer
+        if len(buffer) < FRAME_HEADER.size:
+            return None
+
+        length, format_code = FRAME_HEADER.unpack_from(buffer)
+        end = FRAME_HEADER.size + length
+        if len(buffer) < end:
+            return None
+
+        payload = bytes(buffer[FRAME_HEADER.size:end])
+        del buffer[:end]
+
+        if format_code == JSON_FORMAT:
+            return BaseDriverEvent.loads_json(payload)
+        if format_code == BINARY_FORMAT:
+            return loads_binary(payload)
+        raise ValueError(f"Unknown event stream format {format_code}")
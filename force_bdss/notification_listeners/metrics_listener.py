@@ -0,0 +1,307 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import bisect
+import collections
+import http.server
+import logging
+import threading
+
+from traits.api import (
+    Any, Bool, Dict, Float, HasStrictTraits, Instance, Int, List, Str
+)
+
+from force_bdss.events.data_source_events import DataSourceFinishEvent
+from force_bdss.events.execution_events import (
+    CachedEvaluationEvent,
+    WorkflowExecutionFinishEvent,
+)
+from force_bdss.events.mco_events import MCOFinishEvent, MCOStartEvent
+from force_bdss.notification_listeners.base_notification_listener import BaseNotificationListener # noqa
+from force_bdss.notification_listeners.base_notification_listener_factory import BaseNotificationListenerFactory # noqa
+from force_bdss.notification_listeners.base_notification_listener_model import BaseNotificationListenerModel # noqa
+
+log = logging.getLogger(__name__)
+
+#: Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: Path of the metrics on the HTTP server
+METRICS_PATH = "/metrics"
+
+#: Default upper bounds, in seconds, of the buckets of the duration
+#: histograms
+DEFAULT_BUCKETS = [
+    0.001, 0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0
+]
+
+
+class MetricsListenerModel(BaseNotificationListenerModel):
+    """ Model class for the MetricsListener."""
+
+    #: Host address to bind to. It should be a local address, since the
+    #: metrics are served without authentication.
+    host = Str("127.0.0.1")
+
+    #: Port to bind to. If 0, a free port is chosen by the operating
+    #: system.
+    port = Int(9757)
+
+    #: Upper bounds, in seconds, of the buckets of the histograms of the
+    #: evaluation and data source durations
+    buckets = List(Float, DEFAULT_BUCKETS)
+
+
+class _Histogram(HasStrictTraits):
+    """ Histogram of observed values, with cumulative buckets as in the
+    Prometheus histograms."""
+
+    #: Sorted upper bounds of the buckets, excluding +Inf
+    bounds = List(Float)
+
+    #: Number of observations in each bucket, including +Inf, not
+    #: cumulated
+    counts = List(Int)
+
+    #: Sum of the observed values
+    sum = Float()
+
+    def _bounds_changed(self, bounds):
+        self.counts = [0] * (len(bounds) + 1)
+
+    def observe(self, value):
+        """ Adds an observation to the histogram."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def format(self, name, labels=""):
+        """ Returns the lines of the histogram in the Prometheus text
+        format, with the `labels` of the series, if any."""
+        separator = "," if labels else ""
+        lines = []
+        count = 0
+        for bound, bucket_count in zip(
+                self.bounds + [float("inf")], self.counts):
+            count += bucket_count
+            lines.append(
+                f'{name}_bucket{{{labels}{separator}'
+                f'le="{_format_number(bound)}"}} {count}'
+            )
+        labels = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{labels} {_format_number(self.sum)}")
+        lines.append(f"{name}_count{labels} {count}")
+        return lines
+
+
+class _MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    """ Serves the metrics of the MetricsListener of the server."""
+
+    def do_GET(self):
+        if self.path.split("?")[0] != METRICS_PATH:
+            self.send_error(404)
+            return
+        body = self.server.listener.format_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        log.debug("%s - " + format, self.address_string(), *args)
+
+
+class MetricsListener(BaseNotificationListener):
+    """ Notification listener that maintains counters and histograms of
+    the MCO run, and serves them over HTTP in the Prometheus text
+    format, so that a long running MCO can be monitored live.
+
+    The metrics are served at ``/metrics`` by a background thread, while
+    the events are delivered in the thread of the MCO. The metrics are
+    only updated in memory when an event is delivered, so that the
+    listener adds no measurable overhead to the evaluations.
+    """
+
+    #: A reference to the associated model
+    model = Instance(MetricsListenerModel)
+
+    #: The HTTP server of the metrics
+    server = Instance(http.server.HTTPServer)
+
+    #: The address the HTTP server is bound to
+    address = Any()
+
+    #: Number of workflow evaluations completed, including the failed
+    #: evaluations
+    evaluations = Int()
+
+    #: Number of workflow evaluations that failed
+    failed_evaluations = Int()
+
+    #: Number of evaluations whose KPI values were reused from a
+    #: checkpoint or from a previous run
+    cached_evaluations = Int()
+
+    #: Number of events delivered, by event class name
+    events = Instance(collections.Counter, ())
+
+    #: Histogram of the evaluation durations
+    evaluation_duration = Instance(_Histogram)
+
+    #: Histograms of the data source durations, by data source name
+    data_source_durations = Dict(Str, Instance(_Histogram))
+
+    #: Whether the MCO is running
+    running = Bool(False)
+
+    #: The thread running the HTTP server
+    _thread = Instance(threading.Thread)
+
+    #: Lock between the delivery of the events and the HTTP server
+    _lock = Any()
+
+    def initialize(self, model):
+        """ Starts the HTTP server of the metrics."""
+        self.model = model
+        self._lock = threading.Lock()
+        self.evaluation_duration = _Histogram(bounds=sorted(model.buckets))
+
+        server = http.server.HTTPServer(
+            (model.host, model.port), _MetricsRequestHandler
+        )
+        server.listener = self
+        self.server = server
+        self.address = server.server_address
+        self._thread = threading.Thread(
+            target=server.serve_forever,
+            name="BDSS metrics server",
+            daemon=True,
+        )
+        self._thread.start()
+        host, port = self.address[:2]
+        log.info(f"Serving BDSS metrics on http://{host}:{port}"
+                 f"{METRICS_PATH}")
+
+    def deliver(self, event):
+        """ Updates the metrics with the event."""
+        with self._lock:
+            self.events[type(event).__name__] += 1
+            if isinstance(event, DataSourceFinishEvent):
+                name = event.data_source_name
+                try:
+                    histogram = self.data_source_durations[name]
+                except KeyError:
+                    histogram = _Histogram(
+                        bounds=self.evaluation_duration.bounds
+                    )
+                    self.data_source_durations[name] = histogram
+                histogram.observe(event.wall_time)
+            elif isinstance(event, WorkflowExecutionFinishEvent):
+                self.evaluations += 1
+                if event.failed:
+                    self.failed_evaluations += 1
+                self.evaluation_duration.observe(event.wall_time)
+            elif isinstance(event, CachedEvaluationEvent):
+                self.cached_evaluations += 1
+            elif isinstance(event, MCOStartEvent):
+                self.running = True
+            elif isinstance(event, MCOFinishEvent):
+                self.running = False
+
+    def finalize(self):
+        """ Stops the HTTP server."""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self._thread.join()
+            self.server = None
+            self._thread = None
+
+    def format_metrics(self):
+        """ Returns the metrics in the Prometheus text format."""
+        with self._lock:
+            total = self.evaluations + self.cached_evaluations
+            hit_ratio = self.cached_evaluations / total if total else 0.0
+            lines = [
+                "# HELP bdss_mco_running Whether the MCO is running.",
+                "# TYPE bdss_mco_running gauge",
+                f"bdss_mco_running {int(self.running)}",
+                "# HELP bdss_evaluations_total Number of workflow "
+                "evaluations completed.",
+                "# TYPE bdss_evaluations_total counter",
+                f"bdss_evaluations_total {self.evaluations}",
+                "# HELP bdss_failed_evaluations_total Number of workflow "
+                "evaluations that failed.",
+                "# TYPE bdss_failed_evaluations_total counter",
+                f"bdss_failed_evaluations_total {self.failed_evaluations}",
+                "# HELP bdss_cached_evaluations_total Number of points "
+                "whose KPIs were reused instead of evaluating the workflow.",
+                "# TYPE bdss_cached_evaluations_total counter",
+                f"bdss_cached_evaluations_total {self.cached_evaluations}",
+                "# HELP bdss_cache_hit_ratio Fraction of the points whose "
+                "KPIs were reused.",
+                "# TYPE bdss_cache_hit_ratio gauge",
+                f"bdss_cache_hit_ratio {_format_number(hit_ratio)}",
+                "# HELP bdss_evaluation_duration_seconds Wall clock time "
+                "of the workflow evaluations.",
+                "# TYPE bdss_evaluation_duration_seconds histogram",
+            ]
+            lines += self.evaluation_duration.format(
+                "bdss_evaluation_duration_seconds"
+            )
+            lines += [
+                "# HELP bdss_data_source_duration_seconds Wall clock time "
+                "of the data source runs.",
+                "# TYPE bdss_data_source_duration_seconds histogram",
+            ]
+            for name, histogram in sorted(
+                    self.data_source_durations.items()):
+                lines += histogram.format(
+                    "bdss_data_source_duration_seconds",
+                    f'data_source="{_escape_label(name)}"',
+                )
+            lines += [
+                "# HELP bdss_events_total Number of events delivered, by "
+                "event class.",
+                "# TYPE bdss_events_total counter",
+            ]
+            for name, count in sorted(self.events.items()):
+                lines.append(
+                    f'bdss_events_total{{event="{_escape_label(name)}"}} '
+                    f'{count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value):
+    """ Escapes a label value of the Prometheus text format."""
+    return (
+        value.replace("\\", r"\\").replace('"', r'\"').replace("\n", r"\n")
+    )
+
+
+def _format_number(value):
+    """ Formats a number in the Prometheus text format."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class MetricsListenerFactory(BaseNotificationListenerFactory):
+    def get_identifier(self):
+        return "metrics_listener"
+
+    def get_name(self):
+        return "Metrics Listener"
+
+    def get_description(self):
+        return (
+            "Serves counters and histograms of the MCO run over HTTP, in "
+            "the Prometheus text format, for live monitoring of the MCO."
+        )
+
+    def get_model_class(self):
+        return MetricsListenerModel
+
+    def get_listener_class(self):
+        return MetricsListener
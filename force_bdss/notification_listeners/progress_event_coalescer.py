@@ -0,0 +1,87 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import time
+
+from traits.api import Float, HasStrictTraits, Instance, List, Type
+
+from force_bdss.events.mco_events import (
+    MCOProgressEvent,
+    MCOProgressBatchEvent
+)
+from force_bdss.local_traits import PositiveInt
+
+
+class ProgressEventCoalescer(HasStrictTraits):
+    """ Accumulates MCOProgressEvents and releases them as a single
+    MCOProgressBatchEvent at most once every `interval` seconds, or
+    as soon as `max_batch_size` events have been accumulated.
+
+    The coalescer does not run any background thread: batches are only
+    released when a new event is added, or when `flush` is called
+    explicitly (e.g. before delivering a non-progress event, before
+    finalizing the listener, or periodically when `is_due`, so that the
+    pending events are not held back until the next event).
+    """
+
+    #: Minimum time (in seconds) between two consecutive batches
+    interval = Float(0.1)
+
+    #: Maximum number of events held before a batch is released,
+    #: regardless of the `interval`
+    max_batch_size = PositiveInt(1000)
+
+    #: Type of the batch event that is generated
+    batch_event_type = Type(MCOProgressBatchEvent)
+
+    #: Progress events waiting to be released
+    _pending = List(Instance(MCOProgressEvent))
+
+    #: Monotonic time at which the last batch was released
+    _last_release = Float(float("-inf"))
+
+    def add(self, event):
+        """ Adds a progress event to the pending batch.
+
+        Parameters
+        ----------
+        event: MCOProgressEvent
+            The progress event to coalesce
+
+        Returns
+        -------
+        batch: MCOProgressBatchEvent or None
+            The batch of pending events, if it is due for delivery.
+            None otherwise.
+        """
+        self._pending.append(event)
+
+        if len(self._pending) >= self.max_batch_size:
+            return self.flush()
+        if time.monotonic() - self._last_release >= self.interval:
+            return self.flush()
+        return None
+
+    def is_due(self):
+        """ Whether there are pending events, and the last batch was
+        released at least `interval` seconds ago."""
+        return bool(self._pending) and (
+            time.monotonic() - self._last_release >= self.interval
+        )
+
+    def flush(self):
+        """ Releases all pending progress events as a batch.
+
+        Returns
+        -------
+        batch: MCOProgressBatchEvent or None
+            The batch of pending events, or None if there are no
+            pending events.
+        """
+        if not self._pending:
+            return None
+
+        batch = self.batch_event_type(progress_events=self._pending)
+        self._pending = []
+        self._last_release = time.monotonic()
+        return batch
@@ -9,6 +9,7 @@ from force_bdss.core.data_value import DataValue
 from force_bdss.events.mco_events import (
     MCOStartEvent,
     MCOProgressEvent,
+    MCOProgressBatchEvent,
     WeightedMCOStartEvent
 )
 from force_bdss.notification_listeners.base_csv_writer import (
@@ -156,3 +157,40 @@ class TestCSVWriter(TestCase, UnittestTools):
             )
 
         mock_open.reset_mock()
+
+    def test_deliver_progress_batch_event(self):
+        self.assertTrue(self.notification_listener.accepts_progress_batches)
+
+        mock_open = mock.mock_open()
+
+        with mock.patch(_CSVWRITER_OPEN, mock_open, create=True):
+            self.notification_listener.deliver(
+                MCOStartEvent(
+                    parameter_names=[p.name for p in self.parameters],
+                    kpi_names=[k.name for k in self.kpis],
+                )
+            )
+            mock_open.reset_mock()
+
+            event = MCOProgressBatchEvent(
+                progress_events=[
+                    MCOProgressEvent(
+                        optimal_point=self.parameters, optimal_kpis=self.kpis
+                    ),
+                    MCOProgressEvent(
+                        optimal_point=self.kpis, optimal_kpis=self.parameters
+                    )
+                ]
+            )
+            self.notification_listener.deliver(event)
+
+            mock_open.assert_called_once_with("output.csv", "a")
+            handle = mock_open()
+            self.assertEqual(
+                ["1.0,5.0,5.7,10\r\n", "5.7,10,1.0,5.0\r\n"],
+                [call[0][0] for call in handle.write.call_args_list]
+            )
+            self.assertDictEqual(
+                {"p1": None, "p2": None, "kpi1": None, "kpi2": None},
+                self.notification_listener.row_data,
+            )
@@ -0,0 +1,157 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import os
+import socket
+import tempfile
+import unittest
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.events.mco_events import (
+    MCOStartEvent,
+    MCOProgressEvent,
+    MCOFinishEvent
+)
+from force_bdss.notification_listeners.event_stream_listener import (
+    EventStreamListener,
+    EventStreamListenerFactory,
+    EventStreamListenerModel
+)
+from force_bdss.notification_listeners.event_stream_subscriber import (
+    EventStreamSubscriber
+)
+
+
+class TestEventStreamListener(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = EventStreamListenerFactory(
+            plugin={"id": "pid", "name": "Plugin"}
+        )
+        self.listener = self.factory.create_listener()
+        self.model = self.factory.create_model({"port": 0})
+        self.addCleanup(self.listener.finalize)
+
+        self.events = [
+            MCOStartEvent(parameter_names=["p1"], kpi_names=["k1"]),
+            MCOProgressEvent(
+                optimal_point=[DataValue(name="p1", value=1.0)],
+                optimal_kpis=[DataValue(name="k1", value=2.0)],
+            ),
+            MCOFinishEvent(),
+        ]
+
+    def subscribe(self):
+        subscriber = EventStreamSubscriber(address=self.listener.address)
+        subscriber.connect(timeout=5.0)
+        self.addCleanup(subscriber.close)
+        return subscriber
+
+    def assertEventsReceived(self, subscriber, events):
+        for event in events:
+            received = subscriber.receive(timeout=5.0)
+            self.assertIs(type(event), type(received))
+            self.assertDictEqual(
+                event.__getstate__(), received.__getstate__()
+            )
+
+    def test_factory(self):
+        self.assertEqual("event_stream_listener",
+                         self.factory.get_identifier())
+        self.assertIs(EventStreamListener, self.factory.listener_class)
+        self.assertIs(EventStreamListenerModel, self.factory.model_class)
+
+    def test_no_subscribers(self):
+        self.listener.initialize(self.model)
+        for event in self.events:
+            self.listener.deliver(event)
+        self.assertEqual([], self.listener.subscriptions)
+
+    def test_stream_json(self):
+        self.listener.initialize(self.model)
+        host, port = self.listener.address
+        self.assertEqual("127.0.0.1", host)
+        self.assertNotEqual(0, port)
+
+        subscribers = [self.subscribe(), self.subscribe()]
+        for event in self.events:
+            self.listener.deliver(event)
+
+        self.assertEqual(2, len(self.listener.subscriptions))
+        for subscriber in subscribers:
+            self.assertEventsReceived(subscriber, self.events)
+
+        # Subscribers joining later receive the following events only
+        late_subscriber = self.subscribe()
+        self.listener.deliver(self.events[0])
+        self.assertEventsReceived(late_subscriber, self.events[:1])
+
+        self.listener.finalize()
+        for subscriber in subscribers:
+            self.assertEventsReceived(subscriber, self.events[:1])
+            self.assertIsNone(subscriber.receive(timeout=5.0))
+
+    def test_stream_binary(self):
+        self.model.serialization = "binary"
+        self.listener.initialize(self.model)
+        subscriber = self.subscribe()
+
+        for event in self.events:
+            self.listener.deliver(event)
+        self.listener.finalize()
+
+        self.assertEventsReceived(subscriber, self.events)
+        self.assertEqual([], list(subscriber))
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Requires Unix sockets")
+    def test_stream_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.model.transport = "unix"
+            self.model.path = os.path.join(tmp_dir, "events.sock")
+            self.listener.initialize(self.model)
+            self.assertTrue(os.path.exists(self.model.path))
+
+            subscriber = self.subscribe()
+            for event in self.events:
+                self.listener.deliver(event)
+            self.assertEventsReceived(subscriber, self.events)
+
+            self.listener.finalize()
+            self.assertFalse(os.path.exists(self.model.path))
+
+    def test_drop_on_slow_subscriber(self):
+        self.model.max_buffer_size = 4096
+        self.listener.initialize(self.model)
+
+        slow_subscriber = self.subscribe()
+        slow_subscriber.connection.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 1024
+        )
+        event = MCOProgressEvent(
+            optimal_point=[DataValue(name="p1", value="x" * 1000)],
+        )
+
+        # The subscriber is not reading: once the socket buffers are
+        # full, events are dropped without blocking the delivery.
+        for _ in range(5000):
+            self.listener.deliver(event)
+        self.assertGreater(self.listener.dropped, 0)
+        subscription = self.listener.subscriptions[0]
+        self.assertEqual(self.listener.dropped, subscription.dropped)
+        self.assertLessEqual(len(subscription.buffer), 4096)
+
+        # Events are still received in whole
+        self.assertEventsReceived(slow_subscriber, [event])
+
+    def test_disconnected_subscriber(self):
+        self.listener.initialize(self.model)
+        subscriber = self.subscribe()
+        self.listener.deliver(self.events[0])
+        self.assertEqual(1, len(self.listener.subscriptions))
+
+        subscriber.close()
+        for _ in range(100):
+            self.listener.deliver(self.events[1])
+            if not self.listener.subscriptions:
+                break
+        self.assertEqual([], self.listener.subscriptions)
@@ -0,0 +1,121 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import unittest
+import urllib.error
+import urllib.request
+
+from force_bdss.events.data_source_events import DataSourceFinishEvent
+from force_bdss.events.execution_events import (
+    CachedEvaluationEvent,
+    WorkflowExecutionFinishEvent,
+)
+from force_bdss.events.mco_events import MCOFinishEvent, MCOStartEvent
+from force_bdss.notification_listeners.metrics_listener import (
+    CONTENT_TYPE,
+    MetricsListener,
+    MetricsListenerFactory,
+    MetricsListenerModel,
+)
+
+
+class TestMetricsListener(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = MetricsListenerFactory(
+            plugin={"id": "pid", "name": "Plugin"}
+        )
+        self.listener = self.factory.create_listener()
+        self.model = self.factory.create_model(
+            {"port": 0, "buckets": [1.0, 0.1]}
+        )
+        self.addCleanup(self.listener.finalize)
+
+    def fetch(self, path="/metrics"):
+        host, port = self.listener.address
+        with urllib.request.urlopen(
+                f"http://{host}:{port}{path}", timeout=5.0) as response:
+            self.assertEqual(CONTENT_TYPE, response.headers["Content-Type"])
+            return response.read().decode("utf-8")
+
+    def test_factory(self):
+        self.assertEqual("metrics_listener", self.factory.get_identifier())
+        self.assertIs(MetricsListener, self.factory.listener_class)
+        self.assertIs(MetricsListenerModel, self.factory.model_class)
+
+    def test_metrics(self):
+        self.listener.initialize(self.model)
+        host, port = self.listener.address
+        self.assertEqual("127.0.0.1", host)
+        self.assertNotEqual(0, port)
+
+        for event in [
+            MCOStartEvent(),
+            DataSourceFinishEvent(data_source_name="ds", wall_time=0.05),
+            DataSourceFinishEvent(data_source_name="ds", wall_time=0.5),
+            WorkflowExecutionFinishEvent(wall_time=0.6),
+            CachedEvaluationEvent(),
+            DataSourceFinishEvent(data_source_name="ds", wall_time=2.0),
+            WorkflowExecutionFinishEvent(wall_time=2.0, failed=True),
+        ]:
+            self.listener.deliver(event)
+
+        lines = self.fetch().splitlines()
+        for line in [
+            "bdss_mco_running 1",
+            "bdss_evaluations_total 2",
+            "bdss_failed_evaluations_total 1",
+            "bdss_cached_evaluations_total 1",
+            "bdss_cache_hit_ratio 0.3333333333333333",
+            'bdss_evaluation_duration_seconds_bucket{le="0.1"} 0',
+            'bdss_evaluation_duration_seconds_bucket{le="1.0"} 1',
+            'bdss_evaluation_duration_seconds_bucket{le="+Inf"} 2',
+            "bdss_evaluation_duration_seconds_sum 2.6",
+            "bdss_evaluation_duration_seconds_count 2",
+            'bdss_data_source_duration_seconds_bucket{data_source="ds",'
+            'le="0.1"} 1',
+            'bdss_data_source_duration_seconds_bucket{data_source="ds",'
+            'le="1.0"} 2',
+            'bdss_data_source_duration_seconds_bucket{data_source="ds",'
+            'le="+Inf"} 3',
+            'bdss_data_source_duration_seconds_count{data_source="ds"} 3',
+            'bdss_events_total{event="DataSourceFinishEvent"} 3',
+            'bdss_events_total{event="CachedEvaluationEvent"} 1',
+            "# TYPE bdss_evaluation_duration_seconds histogram",
+        ]:
+            self.assertIn(line, lines)
+
+        self.listener.deliver(MCOFinishEvent())
+        self.assertIn("bdss_mco_running 0", self.fetch().splitlines())
+
+    def test_no_events(self):
+        self.listener.initialize(self.model)
+        lines = self.fetch().splitlines()
+        self.assertIn("bdss_evaluations_total 0", lines)
+        self.assertIn("bdss_cache_hit_ratio 0.0", lines)
+
+    def test_escape_labels(self):
+        self.listener.initialize(self.model)
+        self.listener.deliver(
+            DataSourceFinishEvent(data_source_name='a"b\\c\nd')
+        )
+        self.assertIn(
+            r'bdss_data_source_duration_seconds_count'
+            r'{data_source="a\"b\\c\nd"} 1',
+            self.fetch().splitlines(),
+        )
+
+    def test_not_found(self):
+        self.listener.initialize(self.model)
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.fetch("/foo")
+        self.assertEqual(404, context.exception.code)
+
+    def test_finalize(self):
+        self.listener.initialize(self.model)
+        self.listener.finalize()
+        self.assertIsNone(self.listener.server)
+        with self.assertRaises(urllib.error.URLError):
+            self.fetch()
+        # Finalizing twice does nothing
+        self.listener.finalize()
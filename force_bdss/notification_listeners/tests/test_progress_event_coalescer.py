@@ -0,0 +1,78 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+from unittest import TestCase, mock
+
+from force_bdss.core.data_value import DataValue
+from force_bdss.events.mco_events import (
+    MCOProgressEvent,
+    MCOProgressBatchEvent
+)
+from force_bdss.notification_listeners.progress_event_coalescer import (
+    ProgressEventCoalescer
+)
+
+_MONOTONIC = ("force_bdss.notification_listeners."
+              "progress_event_coalescer.time.monotonic")
+
+
+class TestProgressEventCoalescer(TestCase):
+
+    def setUp(self):
+        self.coalescer = ProgressEventCoalescer(interval=1.0)
+        self.events = [
+            MCOProgressEvent(
+                optimal_point=[DataValue(value=index)],
+                optimal_kpis=[DataValue(value=2 * index)],
+            )
+            for index in range(5)
+        ]
+
+    def test_first_event_released(self):
+        with mock.patch(_MONOTONIC, return_value=100.0):
+            batch = self.coalescer.add(self.events[0])
+
+        self.assertIsInstance(batch, MCOProgressBatchEvent)
+        self.assertListEqual([self.events[0]], batch.progress_events)
+        self.assertIsNone(self.coalescer.flush())
+
+    def test_rate_limit(self):
+        with mock.patch(_MONOTONIC, return_value=100.0):
+            self.coalescer.add(self.events[0])
+            self.assertIsNone(self.coalescer.add(self.events[1]))
+
+        with mock.patch(_MONOTONIC, return_value=100.5):
+            self.assertIsNone(self.coalescer.add(self.events[2]))
+
+        with mock.patch(_MONOTONIC, return_value=101.0):
+            batch = self.coalescer.add(self.events[3])
+
+        self.assertListEqual(self.events[1:4], batch.progress_events)
+
+        with mock.patch(_MONOTONIC, return_value=101.2):
+            self.assertIsNone(self.coalescer.add(self.events[4]))
+            batch = self.coalescer.flush()
+
+        self.assertListEqual(self.events[4:], batch.progress_events)
+        self.assertIsNone(self.coalescer.flush())
+
+    def test_is_due(self):
+        self.assertFalse(self.coalescer.is_due())
+        with mock.patch(_MONOTONIC, return_value=100.0):
+            self.coalescer.add(self.events[0])
+            self.assertFalse(self.coalescer.is_due())
+            self.coalescer.add(self.events[1])
+            self.assertFalse(self.coalescer.is_due())
+
+        with mock.patch(_MONOTONIC, return_value=101.0):
+            self.assertTrue(self.coalescer.is_due())
+
+    def test_max_batch_size(self):
+        self.coalescer.max_batch_size = 2
+
+        with mock.patch(_MONOTONIC, return_value=100.0):
+            self.coalescer.add(self.events[0])
+            self.assertIsNone(self.coalescer.add(self.events[1]))
+            batch = self.coalescer.add(self.events[2])
+
+        self.assertListEqual(self.events[1:3], batch.progress_events)
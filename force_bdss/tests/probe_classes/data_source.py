@@ -97,16 +97,15 @@ class ProbeDataSourceFactory(BaseDataSourceFactory):
         if self.raises_on_create_model:
             raise Exception("ProbeDataSourceFactory.create_model")
 
-        if model_data is None:
-            model_data = {}
-        return self.model_class(
-            factory=self,
+        traits = dict(
             input_slots_type=self.input_slots_type,
             output_slots_type=self.output_slots_type,
             input_slots_size=self.input_slots_size,
             output_slots_size=self.output_slots_size,
-            **model_data
         )
+        if model_data is not None:
+            traits.update(model_data)
+        return self.model_class(factory=self, **traits)
 
     def create_data_source(self):
         if self.raises_on_create_data_source:
@@ -0,0 +1,50 @@
+#  (C) Copyright 2010-2020 Enthought, Inc., Austin, TX
+#  All rights reserved.
+
+import subprocess
+import sys
+import unittest
+
+from force_bdss import api
+
+
+class TestApi(unittest.TestCase):
+
+    def test_lazy_attributes(self):
+        from force_bdss.notification_listeners.event_stream_subscriber \
+            import EventStreamSubscriber
+
+        self.assertIs(EventStreamSubscriber, api.EventStreamSubscriber)
+        self.assertIn("EventStreamSubscriber", dir(api))
+        for name in api._LAZY_ATTRIBUTES:
+            self.assertIsNotNone(getattr(api, name))
+
+    def test_all(self):
+        self.assertIn("ScipyOptimizer", api.__all__)
+        self.assertIn("SCIPY_ALGORITHMS_KEYS", api.__all__)
+        self.assertIn("MCOProgressEvent", api.__all__)
+        self.assertIn("DistributedEvaluator", api.__all__)
+        self.assertIn("Identifier", api.__all__)
+        self.assertNotIn("importlib", api.__all__)
+        self.assertNotIn("deepcopy", api.__all__)
+        self.assertNotIn("Bool", api.__all__)
+        for name in api.__all__:
+            self.assertTrue(hasattr(api, name), name)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            api.NotAnAttribute
+
+    def test_headless_import(self):
+        code = (
+            "import sys; import force_bdss.api; "
+            "print(' '.join(sorted(sys.modules)))"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", code],
+            universal_newlines=True,
+            stderr=subprocess.DEVNULL,
+        )
+        modules = output.split()
+        self.assertNotIn("traitsui.api", modules)
+        self.assertNotIn("scipy", modules)
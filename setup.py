@@ -30,6 +30,7 @@ setup(
     entry_points={
         'console_scripts': [
             'force_bdss = force_bdss.cli.force_bdss:run',
+            'force_bdss_worker = force_bdss.cli.force_bdss_worker:run',
         ],
     },
     packages=find_packages(),